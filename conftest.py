@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.util
+import os
 import sys
 from pathlib import Path
 
@@ -11,6 +12,28 @@ if str(root) not in sys.path:
     sys.path.insert(0, str(root))
 
 
+# Caches persistentes que, sin override, viven bajo ``$HOME``.
+_CACHE_ENV = {
+    "PRONUNCIAPA_TEXTREF_CACHE_DB": "textref.sqlite3",
+    "PRONUNCIAPA_DISTANCE_CACHE_DIR": "distance",
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_caches(tmp_path_factory: pytest.TempPathFactory):
+    """Los caches persistentes de los tests no escriben en ``$HOME``."""
+    root = tmp_path_factory.mktemp("caches")
+    previous = {name: os.environ.get(name) for name in _CACHE_ENV}
+    for name, target in _CACHE_ENV.items():
+        os.environ[name] = str(root / target)
+    yield
+    for name, value in previous.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+
 @pytest.fixture
 def anyio_backend() -> str:
     return "asyncio"
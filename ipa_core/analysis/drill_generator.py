@@ -253,6 +253,9 @@ def group_phones_by_articulatory_proximity(
     if not phones:
         return []
 
+    from ipa_core.compare.distance_matrix import get_distance_matrix
+
+    matrix = get_distance_matrix("categorical")
     remaining = list(phones)
     groups: list[list[str]] = []
 
@@ -261,7 +264,7 @@ def group_phones_by_articulatory_proximity(
         group = [seed]
         still_remaining = []
         for candidate in remaining:
-            dist = calculate_articulatory_distance(seed, candidate)
+            dist = matrix.distance(seed, candidate)
             if dist <= threshold:
                 group.append(candidate)
             else:
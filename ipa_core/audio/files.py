@@ -33,7 +33,7 @@ def _scan_wav_chunks(raw: bytes) -> dict:
         return result
     pos = 12
     while pos + 8 <= len(raw):
-        chunk_id = raw[pos : pos + 4]
+        chunk_id = bytes(raw[pos : pos + 4])
         chunk_size = struct.unpack_from("<I", raw, pos + 4)[0]
         content_offset = pos + 8
         key = chunk_id.decode("latin-1", errors="replace").rstrip("\x00")
@@ -0,0 +1,216 @@
+"""Audio PCM en memoria como alternativa a ``AudioInput.path``.
+
+Un upload WAV que ya viene en PCM 16-bit a 16 kHz (el formato que esperan
+los backends) no necesita pasar por disco ni por ffmpeg: basta con ubicar
+el chunk ``data`` y ver sus bytes como un array ``int16`` (sin copia).
+
+``AudioInput`` puede llevar entonces ``pcm`` en lugar de (o además de)
+``path``.  Los pasos de análisis (VAD, quality gates, AGC) y los backends
+que aceptan arrays trabajan directamente sobre las muestras; sólo las
+librerías que exigen un archivo lo materializan con :func:`audio_file`.
+"""
+from __future__ import annotations
+
+import io
+import os
+import struct
+import tempfile
+import wave
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from ipa_core.audio.analysis import PCMData, pcm16_view
+from ipa_core.audio.files import _scan_wav_chunks
+from ipa_core.types import AudioInput
+
+TARGET_SAMPLE_RATE = 16000
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+AudioSource = Union[str, Path, Mapping[str, Any]]
+
+
+def decode_wav_pcm16(
+    raw: Union[bytes, bytearray, memoryview],
+    *,
+    sample_rate: int = TARGET_SAMPLE_RATE,
+) -> Optional[np.ndarray]:
+    """Decodificar un WAV PCM 16-bit a ``sample_rate`` sin ffmpeg.
+
+    Retorna las muestras mono ``int16`` (los WAV estéreo se mezclan) o
+    ``None`` si el buffer requiere conversión (otro contenedor, otra
+    frecuencia, otra profundidad, un chunk ``fmt`` ilegible) o no trae
+    muestras; en ese caso se sigue por la ruta en disco + ffmpeg.
+
+    Como :func:`ipa_core.audio.files._fix_wav_data_chunk`, ignora el tamaño
+    declarado del chunk ``data`` (Flutter/record lo escribe mal) y lee
+    hasta el final del buffer.
+    """
+    view = memoryview(raw)
+    chunks = _scan_wav_chunks(view)
+    fmt, data = chunks["fmt"], chunks["data"]
+    if fmt is None or data is None or fmt["size"] < 16:
+        return None
+
+    audio_format, channels, rate, _, block_align, bits = struct.unpack_from(
+        "<HHIIHH", view, fmt["offset"]
+    )
+    if audio_format == _WAVE_FORMAT_EXTENSIBLE and fmt["size"] >= 26:
+        audio_format = struct.unpack_from("<H", view, fmt["offset"] + 24)[0]
+    if (
+        audio_format != _WAVE_FORMAT_PCM
+        or bits != 16
+        or rate != sample_rate
+        or channels not in (1, 2)
+        or block_align != 2 * channels
+    ):
+        return None
+
+    payload = view[data["offset"]:]
+    usable = len(payload) - len(payload) % block_align
+    if usable == 0:
+        return None
+    samples = np.frombuffer(payload[:usable], dtype="<i2")
+    if channels == 2:
+        # Mismo criterio que ``ffmpeg -ac 1``: promedio de ambos canales.
+        samples = samples.reshape(-1, 2).mean(axis=1).astype(np.int16)
+    return samples
+
+
+def pcm_input(samples: np.ndarray, *, sample_rate: int = TARGET_SAMPLE_RATE) -> AudioInput:
+    """Construir un ``AudioInput`` mono en memoria."""
+    return {"pcm": samples, "sample_rate": sample_rate, "channels": 1}
+
+
+def has_pcm(audio: Any) -> bool:
+    """Indica si ``audio`` lleva muestras en memoria."""
+    return isinstance(audio, Mapping) and audio.get("pcm") is not None
+
+
+def is_canonical_pcm(audio: Any, *, sample_rate: int = TARGET_SAMPLE_RATE) -> bool:
+    """``True`` si ``audio`` lleva PCM mono a ``sample_rate`` (no requiere ensure_wav)."""
+    return (
+        has_pcm(audio)
+        and audio.get("sample_rate") == sample_rate
+        and audio.get("channels") == 1
+    )
+
+
+def pcm_samples(audio: Mapping[str, Any]) -> np.ndarray:
+    """Muestras ``int16`` (intercaladas si hay varios canales) del campo ``pcm``."""
+    pcm = audio["pcm"]
+    if isinstance(pcm, (bytes, bytearray, memoryview, np.ndarray)):
+        return pcm16_view(pcm)
+    raise TypeError(f"AudioInput.pcm no soportado: {type(pcm).__name__}")
+
+
+def read_wav_frames(source: AudioSource) -> Tuple[PCMData, int, int, int, int]:
+    """Leer ``(frames, sample_rate, sample_width, channels, n_frames)``.
+
+    ``source`` puede ser una ruta WAV o un ``AudioInput``; si este lleva
+    ``pcm`` no se toca el disco y ``frames`` es el propio array ``int16``
+    (cualquier buffer PCM se lee igual con :func:`pcm16_view`).
+    """
+    if has_pcm(source):
+        audio = source
+        samples = pcm_samples(audio)  # type: ignore[arg-type]
+        channels = int(audio.get("channels") or 1)  # type: ignore[union-attr]
+        return (
+            np.ascontiguousarray(samples),
+            int(audio["sample_rate"]),  # type: ignore[index]
+            2,
+            channels,
+            len(samples) // channels,
+        )
+    path = source["path"] if isinstance(source, Mapping) else source
+    if not Path(path).exists():
+        raise FileNotFoundError(f"Audio no encontrado: {path}")
+    with wave.open(str(path), "rb") as wf:
+        n_frames = wf.getnframes()
+        return (
+            wf.readframes(n_frames),
+            wf.getframerate(),
+            wf.getsampwidth(),
+            wf.getnchannels(),
+            n_frames,
+        )
+
+
+def pad_samples(
+    samples: np.ndarray,
+    sample_rate: int,
+    *,
+    min_ms: int,
+    pad_ms: int,
+) -> np.ndarray:
+    """Añadir ``pad_ms`` de silencio a cada lado si el audio dura menos de ``min_ms``."""
+    duration_ms = int(len(samples) * 1000 / sample_rate) if sample_rate > 0 else 0
+    if duration_ms >= min_ms:
+        return samples
+    pad = int(pad_ms * sample_rate / 1000)
+    return np.pad(samples, (pad, pad))
+
+
+def pcm_to_wav_bytes(samples: np.ndarray, *, sample_rate: int, channels: int = 1) -> bytes:
+    """Serializar muestras ``int16`` como un WAV PCM completo."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(np.asarray(samples, dtype="<i2").tobytes())
+    return buffer.getvalue()
+
+
+@contextmanager
+def audio_file(audio: Mapping[str, Any]) -> Iterator[str]:
+    """Ruta WAV para librerías que sólo leen archivos.
+
+    Si ``audio`` ya tiene ``path`` y no lleva ``pcm``, se usa tal cual; si
+    no, se escribe un temporal que se elimina al salir del bloque.
+    """
+    if not has_pcm(audio):
+        yield audio["path"]
+        return
+    with tempfile.NamedTemporaryFile(prefix="pronunciapa_pcm_", suffix=".wav", delete=False) as tmp:
+        tmp.write(
+            pcm_to_wav_bytes(
+                pcm_samples(audio),
+                sample_rate=int(audio["sample_rate"]),
+                channels=int(audio.get("channels") or 1),
+            )
+        )
+        tmp_name = tmp.name
+    try:
+        yield tmp_name
+    finally:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+
+
+def without_pcm(audio: Mapping[str, Any]) -> dict[str, Any]:
+    """Copia de ``audio`` sin el buffer PCM (para serializar/persistir)."""
+    payload = dict(audio)
+    payload.pop("pcm", None)
+    return payload
+
+
+__all__ = [
+    "TARGET_SAMPLE_RATE",
+    "audio_file",
+    "decode_wav_pcm16",
+    "has_pcm",
+    "is_canonical_pcm",
+    "pad_samples",
+    "pcm_input",
+    "pcm_samples",
+    "pcm_to_wav_bytes",
+    "read_wav_frames",
+    "without_pcm",
+]
@@ -14,6 +14,9 @@ Uso::
     # ctx.audio contiene el audio procesado
     # ctx.quality_result contiene el resultado de calidad
     ctx.cleanup()  # elimina archivos temporales
+
+Si ``ctx.audio`` lleva ``pcm`` (16 kHz mono, ver ``ipa_core.audio.pcm``)
+los pasos operan sobre las muestras en memoria y no crean temporales.
 """
 from __future__ import annotations
 
@@ -22,7 +25,20 @@ import os
 from dataclasses import dataclass, field
 from typing import Any, List, Optional
 
+import numpy as np
+
+from ipa_core.audio.analysis import pcm16_view, signal_rms
 from ipa_core.audio.markers import is_audio_preprocessed
+from ipa_core.audio.pcm import (
+    audio_file,
+    has_pcm,
+    is_canonical_pcm,
+    pcm_samples,
+    pcm_to_wav_bytes,
+    read_wav_frames,
+    without_pcm,
+)
+from ipa_core.kernel.executors import get_executor
 from ipa_core.types import AudioInput
 
 logger = logging.getLogger(__name__)
@@ -71,24 +87,28 @@ class EnsureWavStep:
     async def process(self, ctx: AudioContext) -> AudioContext:
         if ctx.was_step_applied(self.name):
             return ctx
-        if is_audio_preprocessed(ctx.audio):
+        if is_audio_preprocessed(ctx.audio) or is_canonical_pcm(ctx.audio):
             return self._mark_skipped(ctx)
-        
-        return self._run_conversion(ctx)
+        # ffmpeg bloquea: la conversión corre en el pool ``audio``.
+        return await get_executor("audio").run(self._run_conversion, ctx)
 
     def _mark_skipped(self, ctx: AudioContext) -> AudioContext:
         ctx.meta["ensure_wav"] = {"skipped": True, "path": ctx.audio.get("path")}
+        if has_pcm(ctx.audio):
+            ctx.meta["ensure_wav"]["in_memory"] = True
         ctx.mark_step(self.name)
         return ctx
 
     def _run_conversion(self, ctx: AudioContext) -> AudioContext:
         try:
             from ipa_core.audio.files import ensure_wav
-            new_path, is_temp = ensure_wav(ctx.audio["path"], target_sample_rate=16000, target_channels=1)
+            # PCM en otro formato: ffmpeg necesita un archivo de entrada.
+            with audio_file(ctx.audio) as source:
+                new_path, is_temp = ensure_wav(source, target_sample_rate=16000, target_channels=1)
             if is_temp:
                 ctx.add_temp_file(new_path)
             
-            ctx.audio = {**ctx.audio, "path": new_path, "sample_rate": 16000, "channels": 1} # type: ignore
+            ctx.audio = {**without_pcm(ctx.audio), "path": new_path, "sample_rate": 16000, "channels": 1} # type: ignore
             ctx.meta["ensure_wav"] = {"converted": is_temp, "path": new_path}
         except Exception as exc:
             logger.warning("EnsureWavStep falló: %s", exc)
@@ -117,7 +137,7 @@ class VADTrimStep:
     def _run_vad(self, ctx: AudioContext) -> AudioContext:
         try:
             from ipa_core.audio.vad import analyze_vad_best
-            vad = analyze_vad_best(ctx.audio["path"], backend=self.backend)
+            vad = analyze_vad_best(_analysis_source(ctx.audio), backend=self.backend)
             ctx.vad_result = vad
             ctx.meta["vad"] = _build_vad_meta(vad)
 
@@ -131,12 +151,26 @@ class VADTrimStep:
         return ctx
 
     def _apply_trim(self, ctx: AudioContext, end_ms: int):
+        if has_pcm(ctx.audio):
+            trimmed = self._trim_pcm(ctx.audio, 0, end_ms)
+            if trimmed is not None:
+                ctx.audio = {**ctx.audio, "pcm": trimmed}
+                ctx.meta["vad"].update({"trimmed": True, "in_memory": True})
+            return
         trimmed_path = self._trim_wav(ctx.audio["path"], 0, end_ms)
         if trimmed_path:
             ctx.add_temp_file(trimmed_path)
-            ctx.audio = {**ctx.audio, "path": trimmed_path} # type: ignore
+            ctx.audio = {**ctx.audio, "path": trimmed_path}
             ctx.meta["vad"].update({"trimmed": True, "path": trimmed_path})
 
+    @staticmethod
+    def _trim_pcm(audio: AudioInput, start_ms: int, end_ms: int) -> Optional[np.ndarray]:
+        """Recortar las muestras en memoria (vista, sin copia) o None si queda vacío."""
+        samples = pcm_samples(audio)
+        sr, nc = int(audio["sample_rate"]), int(audio.get("channels") or 1)
+        trimmed = samples[int(start_ms * sr / 1000) * nc:int(end_ms * sr / 1000) * nc]
+        return trimmed if trimmed.size else None
+
     @staticmethod
     def _trim_wav(path: str, start_ms: int, end_ms: int) -> Optional[str]:
         """Recortar WAV entre start_ms y end_ms, retorna ruta temporal o None."""
@@ -166,6 +200,17 @@ class VADTrimStep:
             return None
 
 
+def _analysis_source(audio: AudioInput) -> Any:
+    """El propio ``AudioInput`` si lleva PCM en memoria; si no, su ruta."""
+    return audio if has_pcm(audio) else audio["path"]
+
+
+def _audio_label(audio: AudioInput) -> Any:
+    if has_pcm(audio):
+        return f"<pcm {len(pcm_samples(audio))} samples>"
+    return audio.get("path")
+
+
 def _build_vad_meta(vad: Any) -> dict:
     return {
         "speech_ratio": vad.speech_ratio,
@@ -209,6 +254,8 @@ class AGCStep:
             ctx.mark_step(self.name)
             return ctx
         try:
+            if has_pcm(ctx.audio):
+                return self._process_pcm(ctx)
             new_path = self._apply_agc(ctx.audio["path"])
             if new_path:
                 ctx.add_temp_file(new_path)
@@ -224,35 +271,37 @@ class AGCStep:
         ctx.mark_step(self.name)
         return ctx
 
-    def _apply_agc(self, path: str) -> Optional[str]:
-        """Aplicar ganancia al WAV y retornar ruta temporal."""
-        samples, sr, sw, nc = self._read_samples(path)
-        if not samples or sw != 2:
-            return None
+    def _process_pcm(self, ctx: AudioContext) -> AudioContext:
+        scaled = self._apply_agc_pcm(pcm_samples(ctx.audio))
+        if scaled is not None:
+            ctx.audio = {**ctx.audio, "pcm": scaled}
+            ctx.meta["agc"] = {"applied": True, "target_dbfs": self.target_dbfs, "in_memory": True}
+        else:
+            ctx.meta["agc"] = {"applied": False}
+        ctx.mark_step(self.name)
+        return ctx
 
-        gain_linear = self._calculate_linear_gain(samples)
+    def _apply_agc_pcm(self, samples: np.ndarray) -> Optional[np.ndarray]:
+        """Aplicar la ganancia AGC a muestras ``int16`` en memoria."""
+        if not samples.size:
+            return None
+        gain_linear = self._gain_for_rms(signal_rms(samples))
         if gain_linear is None:
             return None
+        return np.clip(np.trunc(samples * gain_linear), -32767, 32767).astype(np.int16)
 
-        scaled = [max(-32767, min(32767, int(s * gain_linear))) for s in samples]
-        return self._write_agc_wav(scaled, sr, sw, nc)
-
-    def _read_samples(self, path: str) -> tuple[list[int], int, int, int]:
-        import struct
-        import wave
-        with wave.open(path, "rb") as wf:
-            sr, sw, nc = wf.getframerate(), wf.getsampwidth(), wf.getnchannels()
-            frames = wf.readframes(wf.getnframes())
-        
+    def _apply_agc(self, path: str) -> Optional[str]:
+        """Aplicar ganancia al WAV y retornar ruta temporal."""
+        raw, sr, sw, nc, _ = read_wav_frames(path)
         if sw != 2:
-            return [], sr, sw, nc
-        fmt = f"<{len(frames) // 2}h"
-        return list(struct.unpack(fmt, frames)), sr, sw, nc
+            return None
+        scaled = self._apply_agc_pcm(pcm16_view(raw))
+        if scaled is None:
+            return None
+        return self._write_agc_wav(scaled, sr, nc)
 
-    def _calculate_linear_gain(self, samples: list[int]) -> Optional[float]:
+    def _gain_for_rms(self, rms: float) -> Optional[float]:
         import math
-        sum_sq = sum(s * s for s in samples)
-        rms = (sum_sq / len(samples)) ** 0.5
         if rms < 1.0:
             return None
 
@@ -263,20 +312,11 @@ class AGCStep:
         gain_db = max(-self.max_gain_db, min(self.max_gain_db, gain_db))
         return 10.0 ** (gain_db / 20.0)
 
-    def _write_agc_wav(self, samples: list[int], sr: int, sw: int, nc: int) -> str:
-        import struct
+    def _write_agc_wav(self, samples: np.ndarray, sr: int, nc: int) -> str:
         import tempfile
-        import wave
         with tempfile.NamedTemporaryFile(prefix="pronunciapa_agc_", suffix=".wav", delete=False) as tmp:
-            tmp_name = tmp.name
-        
-        packed = struct.pack(f"<{len(samples)}h", *samples)
-        with wave.open(tmp_name, "wb") as out_wf:
-            out_wf.setnchannels(nc)
-            out_wf.setsampwidth(sw)
-            out_wf.setframerate(sr)
-            out_wf.writeframes(packed)
-        return tmp_name
+            tmp.write(pcm_to_wav_bytes(samples, sample_rate=sr, channels=nc))
+            return tmp.name
 
 
 class QualityCheckStep:
@@ -295,7 +335,7 @@ class QualityCheckStep:
             from ipa_core.services.audio_quality import assess_audio_quality
             
             segments = ctx.vad_result.speech_segments if ctx.vad_result else None
-            quality_res, warns, _ = assess_audio_quality(ctx.audio["path"], speech_segments=segments)
+            quality_res, warns, _ = assess_audio_quality(_analysis_source(ctx.audio), speech_segments=segments)
             
             ctx.quality_result = quality_res
             ctx.meta["quality"] = {"passed": quality_res.passed if quality_res else None, "warnings": warns}
@@ -319,14 +359,14 @@ class AudioProcessingChain:
         """Ejecutar todos los pasos en orden."""
         logger.debug(
             "[AudioChain] START  audio=%s sr=%s ch=%s",
-            ctx.audio.get("path"),
+            _audio_label(ctx.audio),
             ctx.audio.get("sample_rate"),
             ctx.audio.get("channels"),
         )
         for step in self.steps:
-            path_before = ctx.audio.get("path")
+            path_before = _audio_label(ctx.audio)
             ctx = await step.process(ctx)
-            path_after = ctx.audio.get("path")
+            path_after = _audio_label(ctx.audio)
             if path_after != path_before:
                 logger.debug(
                     "[AudioChain] %-14s  %s  →  %s",
@@ -342,7 +382,7 @@ class AudioProcessingChain:
                 )
                 logger.debug(
             "[AudioChain] DONE   audio=%s  steps=%s",
-            ctx.audio.get("path"),
+            _audio_label(ctx.audio),
             ctx.steps_applied,
         )
         return ctx
@@ -11,13 +11,15 @@ Si falla validación, se retorna feedback operativo en lugar de análisis fonét
 from __future__ import annotations
 
 import logging
-import math
-import wave
 from dataclasses import dataclass, field
 from enum import Enum
-from pathlib import Path
 from typing import List, Optional
 
+import numpy as np
+
+from ipa_core.audio.analysis import SignalStats, analyze_signal, pcm16_view
+from ipa_core.audio.pcm import AudioSource, read_wav_frames
+
 logger = logging.getLogger(__name__)
 
 
@@ -153,63 +155,8 @@ _FEEDBACK_MESSAGES = {
 }
 
 
-def _compute_snr(
-    samples: tuple,
-    sample_rate: int,
-    speech_segments: Optional[List[tuple]],
-    rms: float,
-    max_val: int,
-) -> tuple[float, str]:
-    """Calcular SNR en dB (VAD o proxy)."""
-    if speech_segments:
-        res = _compute_real_vad_snr(samples, sample_rate, speech_segments, max_val)
-        if res is not None:
-            return res[0], "real_vad"
-
-    return _compute_proxy_snr(samples, rms, max_val), "proxy"
-
-
-def _compute_real_vad_snr(samples: tuple, sr: int, segments: list[tuple], max_val: int) -> Optional[tuple[float, str]]:
-    speech_sq, silence_sq, speech_c, silence_c = _sum_squares_by_vad(samples, sr, segments)
-
-    if silence_c < int(0.05 * len(samples)) or silence_c == 0:
-        return None
-
-    noise_rms = (silence_sq / silence_c) ** 0.5 / max_val
-    signal_rms = (speech_sq / max(speech_c, 1)) ** 0.5 / max_val
-    
-    if noise_rms <= 0.0001:
-        return 60.0, "real_vad"
-        
-    snr_db = 20.0 * math.log10(max(signal_rms, 1e-9) / noise_rms)
-    return snr_db, "real_vad"
-
-
-def _sum_squares_by_vad(samples: tuple, sr: int, segments: list[tuple]) -> tuple[float, float, int, int]:
-    speech_sq, silence_sq, speech_c, silence_c = 0.0, 0.0, 0, 0
-    for i, s in enumerate(samples):
-        ms = i * 1000.0 / sr
-        in_speech = any(start <= ms < end for start, end in segments)
-        sq = s * s
-        if in_speech:
-            speech_sq += sq
-            speech_c += 1
-        else:
-            silence_sq += sq
-            silence_c += 1
-    return speech_sq, silence_sq, speech_c, silence_c
-
-
-def _compute_proxy_snr(samples: tuple, rms: float, max_val: int) -> float:
-    sorted_abs = sorted(abs(s) for s in samples)
-    noise_floor = sorted_abs[len(sorted_abs) // 10] / max_val
-    if noise_floor > 0.001:
-        return 20.0 * math.log10(rms / noise_floor)
-    return 60.0
-
-
 def check_quality(
-    audio_path: str,
+    audio_path: AudioSource,
     *,
     min_duration_ms: int = DEFAULT_MIN_DURATION_MS,
     max_duration_ms: int = DEFAULT_MAX_DURATION_MS,
@@ -219,41 +166,28 @@ def check_quality(
     speech_ratio: Optional[float] = None,
     speech_segments: Optional[List[tuple]] = None,
 ) -> QualityGateResult:
-    """Validar calidad del audio."""
+    """Validar calidad del audio (ruta WAV o ``AudioInput``, también con ``pcm``)."""
     samples, sr, duration_ms = _read_audio_data(audio_path)
-    if not samples:
+    if not samples.size:
         return _empty_audio_result(duration_ms)
     
+    stats = analyze_signal(samples, sr, speech_segments)
     issues = _collect_quality_issues(
-        samples, sr, duration_ms, min_duration_ms, max_duration_ms,
+        stats, duration_ms, min_duration_ms, max_duration_ms,
         max_clipping_ratio, min_rms, speech_ratio
     )
-    
-    metrics = _calculate_audio_metrics(samples, sr, speech_segments)
-    if metrics["snr_db"] < min_snr_db:
+    if stats.snr_db < min_snr_db:
         issues.append(QualityIssue.LOW_SNR)
         
-    return _build_quality_gate_result(issues, duration_ms, metrics)
+    return _build_quality_gate_result(issues, duration_ms, stats)
 
 
-def _read_audio_data(path: str) -> tuple[tuple, int, int]:
-    import struct
-    p = Path(path)
-    if not p.exists():
-        raise FileNotFoundError(f"Audio no encontrado: {path}")
-    
-    with wave.open(str(p), "rb") as w:
-        sr = w.getframerate()
-        sw = w.getsampwidth()
-        nf = w.getnframes()
-        raw = w.readframes(nf)
-    
+def _read_audio_data(source: AudioSource) -> tuple[np.ndarray, int, int]:
+    raw, sr, sw, _, nf = read_wav_frames(source)
     duration_ms = int(nf * 1000 / sr)
     if sw != 2:
-        return (), sr, duration_ms
-        
-    fmt = f"<{len(raw) // 2}h"
-    return struct.unpack(fmt, raw), sr, duration_ms
+        return np.zeros(0, dtype=np.int16), sr, duration_ms
+    return pcm16_view(raw), sr, duration_ms
 
 
 def _empty_audio_result(duration: int) -> QualityGateResult:
@@ -263,10 +197,10 @@ def _empty_audio_result(duration: int) -> QualityGateResult:
     )
 
 
-def _collect_quality_issues(samples, sr, duration, min_d, max_d, max_clip, min_rms, speech_ratio) -> list[QualityIssue]:
+def _collect_quality_issues(stats: SignalStats, duration, min_d, max_d, max_clip, min_rms, speech_ratio) -> list[QualityIssue]:
     issues = []
     _check_duration_issues(issues, duration, min_d, max_d)
-    _check_amplitude_issues(issues, samples, min_rms, max_clip)
+    _check_amplitude_issues(issues, stats, min_rms, max_clip)
     
     if speech_ratio is not None and speech_ratio < 0.1:
         issues.append(QualityIssue.NO_SPEECH)
@@ -280,39 +214,14 @@ def _check_duration_issues(issues: list, duration: int, min_d: int, max_d: int):
         issues.append(QualityIssue.TOO_LONG)
 
 
-def _check_amplitude_issues(issues: list, samples: tuple, min_rms: float, max_clip: float):
-    if _calculate_rms(samples) < min_rms:
+def _check_amplitude_issues(issues: list, stats: SignalStats, min_rms: float, max_clip: float):
+    if stats.rms < min_rms:
         issues.append(QualityIssue.TOO_QUIET)
-    if _calculate_clipping_ratio(samples) > max_clip:
+    if stats.clipping_ratio > max_clip:
         issues.append(QualityIssue.CLIPPING)
 
 
-def _calculate_rms(samples: tuple) -> float:
-    max_val = 32767
-    sum_sq = sum(s * s for s in samples)
-    return (sum_sq / len(samples)) ** 0.5 / max_val
-
-
-def _calculate_clipping_ratio(samples: tuple) -> float:
-    threshold = int(32767 * 0.99)
-    clipped = sum(1 for s in samples if abs(s) >= threshold)
-    return clipped / len(samples)
-
-
-def _calculate_audio_metrics(samples: tuple, sr: int, segments: Optional[list]) -> dict:
-    max_val = 32767
-    peak = max(abs(s) for s in samples)
-    rms = _calculate_rms(samples)
-    snr_db, snr_method = _compute_snr(samples, sr, segments, rms, max_val)
-    
-    return {
-        "snr_db": snr_db, "snr_method": snr_method,
-        "peak": peak / max_val, "rms": rms,
-        "clipping": _calculate_clipping_ratio(samples)
-    }
-
-
-def _build_quality_gate_result(issues: list[QualityIssue], duration: int, metrics: dict) -> QualityGateResult:
+def _build_quality_gate_result(issues: list[QualityIssue], duration: int, stats: SignalStats) -> QualityGateResult:
     user_feedback = None
     if issues:
         priority = primary_quality_issue(issues)
@@ -321,9 +230,9 @@ def _build_quality_gate_result(issues: list[QualityIssue], duration: int, metric
             
     return QualityGateResult(
         passed=not issues, issues=issues, duration_ms=duration,
-        snr_db=metrics["snr_db"], snr_method=metrics["snr_method"],
-        clipping_ratio=metrics["clipping"], peak_amplitude=metrics["peak"],
-        rms_amplitude=metrics["rms"], user_feedback=user_feedback
+        snr_db=stats.snr_db, snr_method=stats.snr_method,
+        clipping_ratio=stats.clipping_ratio, peak_amplitude=stats.peak,
+        rms_amplitude=stats.rms, user_feedback=user_feedback
     )
 
 
@@ -3,6 +3,12 @@
 Módulo para procesamiento de audio en tiempo real con buffer acumulativo
 y detección de pausas usando VAD (Voice Activity Detection).
 
+El audio se escribe en un ring buffer ``int16`` preasignado
+(``max_buffer_seconds``), así que la memoria por sesión es constante y
+agregar un chunk no crea objetos nuevos.  Cada segmento se entrega como una
+vista sobre el ring (``AudioSegment.pcm``) que va directo al ASR como
+``AudioInput`` en memoria: sin ``b"".join`` ni WAV temporal.
+
 Uso:
     buffer = AudioBuffer(on_segment_ready=callback, silence_timeout_ms=1000)
     buffer.add_chunk(audio_bytes)  # Llamar repetidamente con chunks de audio
@@ -11,15 +17,18 @@ Uso:
 from __future__ import annotations
 
 import asyncio
-import io
 import logging
-import struct
 import tempfile
 import time
 import wave
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Awaitable, Callable, List, Optional
+from typing import Awaitable, Callable, Optional
+
+import numpy as np
+
+from ipa_core.audio.analysis import pcm16_view, signal_rms
+from ipa_core.types import AudioInput
 
 logger = logging.getLogger(__name__)
 
@@ -31,12 +40,18 @@ DEFAULT_SILENCE_TIMEOUT_MS = 1000  # 1 segundo de silencio
 DEFAULT_ENERGY_THRESHOLD = 0.01
 DEFAULT_FRAME_MS = 30
 DEFAULT_MAX_BUFFER_SECONDS = 30
+DEFAULT_STATE_INTERVAL_MS = 100
 
 
 @dataclass
 class StreamConfig:
-    """Configuración del buffer de streaming."""
-    
+    """Configuración del buffer de streaming.
+
+    ``state_interval_ms`` limita la frecuencia de ``on_state_change``: entre
+    dos notificaciones sólo se notifica antes si cambia ``status`` o
+    ``is_speaking`` (0 = notificar cada chunk).
+    """
+
     sample_rate: int = DEFAULT_SAMPLE_RATE
     channels: int = DEFAULT_CHANNELS
     sample_width: int = DEFAULT_SAMPLE_WIDTH
@@ -44,22 +59,48 @@ class StreamConfig:
     energy_threshold: float = DEFAULT_ENERGY_THRESHOLD
     frame_ms: int = DEFAULT_FRAME_MS
     max_buffer_seconds: int = DEFAULT_MAX_BUFFER_SECONDS
+    state_interval_ms: int = DEFAULT_STATE_INTERVAL_MS
 
 
 @dataclass
 class AudioSegment:
-    """Segmento de audio listo para procesamiento."""
-    
-    audio_path: Path
+    """Segmento de audio listo para procesamiento.
+
+    ``pcm`` es una vista sobre el ring buffer: sigue siendo válida mientras
+    lleguen menos de ``max_buffer_seconds / 2`` de audio nuevo (los
+    segmentos más largos o partidos por el borde del ring se copian).
+    """
+
+    pcm: np.ndarray
     duration_ms: int
     speech_ratio: float
+    sample_rate: int = DEFAULT_SAMPLE_RATE
+    channels: int = DEFAULT_CHANNELS
     timestamp: float = field(default_factory=time.time)
+    audio_path: Optional[Path] = None
+
+    def audio_input(self) -> AudioInput:
+        """``AudioInput`` en memoria (sin disco) para los servicios y el ASR."""
+        return {"pcm": self.pcm, "sample_rate": self.sample_rate, "channels": self.channels}
+
+    def save_wav(self, path: Optional[Path] = None) -> Path:
+        """Escribir el segmento como WAV (temporal si no se da ``path``)."""
+        if path is None:
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".wav", prefix="realtime_") as tmp:
+                path = Path(tmp.name)
+        with wave.open(str(path), "wb") as w:
+            w.setnchannels(self.channels)
+            w.setsampwidth(DEFAULT_SAMPLE_WIDTH)
+            w.setframerate(self.sample_rate)
+            w.writeframes(np.ascontiguousarray(self.pcm, dtype="<i2").tobytes())
+        self.audio_path = path
+        return path
 
 
 @dataclass
 class StreamState:
     """Estado actual del buffer de streaming."""
-    
+
     is_speaking: bool = False
     volume_level: float = 0.0  # 0.0 a 1.0
     buffer_duration_ms: int = 0
@@ -72,19 +113,76 @@ SegmentCallback = Callable[[AudioSegment], Awaitable[None]]
 StateCallback = Callable[[StreamState], Awaitable[None]]
 
 
+class PCMRingBuffer:
+    """Ring buffer ``int16`` de capacidad fija.
+
+    Guarda el segmento en curso entre los índices absolutos ``start`` y
+    ``end``; escribir nunca realoca y :meth:`take` entrega el segmento como
+    vista cuando es contiguo.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        # np.zeros reserva páginas en cero: sólo ocupan RAM al escribirse.
+        self._data = np.zeros(max(1, int(capacity)), dtype=np.int16)
+        self.capacity = self._data.size
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def free(self) -> int:
+        return self.capacity - (self._end - self._start)
+
+    def write(self, samples: np.ndarray) -> int:
+        """Copiar tantas muestras como quepan; retorna cuántas se escribieron."""
+        capacity = self.capacity
+        n = min(samples.size, capacity - (self._end - self._start))
+        if n <= 0:
+            return 0
+        pos = self._end % capacity
+        first = min(n, capacity - pos)
+        self._data[pos:pos + first] = samples[:first]
+        if first < n:
+            self._data[: n - first] = samples[first:n]
+        self._end += n
+        return n
+
+    def take(self, *, max_view: Optional[int] = None) -> np.ndarray:
+        """Retirar el segmento en curso.
+
+        Vista sin copia si no cruza el borde del ring y no supera
+        ``max_view`` muestras; copia en otro caso.
+        """
+        n = len(self)
+        pos = self._start % self.capacity
+        if pos + n <= self.capacity and (max_view is None or n <= max_view):
+            segment = self._data[pos:pos + n]
+        else:
+            segment = np.concatenate(
+                (self._data[pos:min(pos + n, self.capacity)], self._data[: max(0, pos + n - self.capacity)])
+            )
+        self._start = self._end
+        return segment
+
+    def clear(self) -> None:
+        self._start = self._end
+
+
 class AudioBuffer:
     """Buffer de audio con detección de silencio para streaming.
-    
+
     Acumula chunks de audio y detecta pausas para determinar cuándo
     un segmento está completo y listo para procesamiento.
-    
+
     Features:
     - Detección de volumen en tiempo real
     - Detección de voz/silencio por energía
     - Callback cuando se detecta pausa de 1+ segundo
-    - Estado observable para UI
+    - Estado observable para UI (limitado a ``state_interval_ms``)
     """
-    
+
     def __init__(
         self,
         on_segment_ready: Optional[SegmentCallback] = None,
@@ -94,75 +192,84 @@ class AudioBuffer:
         self._config = config or StreamConfig()
         self._on_segment_ready = on_segment_ready
         self._on_state_change = on_state_change
-        
-        # Buffer de audio acumulado
-        self._chunks: List[bytes] = []
-        self._total_bytes = 0
-        
+
+        # Ring buffer preasignado (muestras intercaladas si hay varios canales)
+        self._ring = PCMRingBuffer(
+            self._config.max_buffer_seconds * self._config.sample_rate * self._config.channels
+        )
+        self._samples_per_ms = self._config.sample_rate * self._config.channels / 1000
+
         # Estado de VAD
         self._is_speaking = False
         self._last_speech_time = 0.0
         self._silence_start_time: Optional[float] = None
-        
+
         # Volumen actual (para UI)
         self._current_volume = 0.0
-        
+
         # Control de procesamiento
         self._processing_lock = asyncio.Lock()
         self._silence_timer: Optional[asyncio.Task] = None
-    
+
+        # Throttling de notificaciones de estado
+        self._last_state_at = 0.0
+        self._last_state_key: Optional[tuple[str, bool]] = None
+
     @property
     def state(self) -> StreamState:
         """Obtener estado actual del buffer."""
-        buffer_bytes = self._total_bytes
-        bytes_per_ms = (self._config.sample_rate * 
-                       self._config.sample_width * 
-                       self._config.channels) / 1000
-        
         return StreamState(
             is_speaking=self._is_speaking,
             volume_level=self._current_volume,
-            buffer_duration_ms=int(buffer_bytes / bytes_per_ms) if bytes_per_ms > 0 else 0,
+            buffer_duration_ms=self._duration_ms(len(self._ring)),
             last_speech_time=self._last_speech_time,
             status=self._get_status(),
         )
-    
+
+    def _duration_ms(self, samples: int) -> int:
+        return int(samples / self._samples_per_ms) if self._samples_per_ms > 0 else 0
+
     def _get_status(self) -> str:
         """Determinar status actual."""
         if self._silence_timer and not self._silence_timer.done():
             return "processing"
         if self._is_speaking:
             return "speaking"
-        if self._total_bytes > 0:
+        if len(self._ring) > 0:
             return "listening"
         return "idle"
-    
+
     async def add_chunk(self, audio_data: bytes) -> StreamState:
         """Agregar un chunk de audio al buffer.
-        
+
         Args:
             audio_data: Bytes de audio PCM 16-bit
-            
+
         Returns:
             Estado actual del buffer
         """
-        if not audio_data:
+        samples = pcm16_view(audio_data)
+        if not samples.size:
             return self.state
-        
-        self._chunks.append(audio_data)
-        self._total_bytes += len(audio_data)
-        
+
         # Calcular volumen y detectar voz
-        volume, is_speech = self._analyze_chunk(audio_data)
+        volume, is_speech = self._analyze_chunk(samples)
         self._current_volume = volume
-        
+
+        # Copiar al ring; si se llena, forzar procesamiento y seguir
+        written = self._ring.write(samples)
+        while written < samples.size:
+            logger.warning("Buffer máximo alcanzado, forzando procesamiento")
+            await self._process_segment()
+            written += self._ring.write(samples[written:])
+
         now = time.time()
-        
+
         if is_speech:
             self._is_speaking = True
             self._last_speech_time = now
             self._silence_start_time = None
-            
+
             # Cancelar timer de silencio si existe
             if self._silence_timer and not self._silence_timer.done():
                 self._silence_timer.cancel()
@@ -171,157 +278,118 @@ class AudioBuffer:
             # Detectar inicio de silencio
             if self._is_speaking and self._silence_start_time is None:
                 self._silence_start_time = now
-            
+
             # Verificar si pasó el timeout de silencio
-            if (self._silence_start_time and 
-                self._total_bytes > 0 and
+            if (self._silence_start_time and
+                len(self._ring) > 0 and
                 (now - self._silence_start_time) * 1000 >= self._config.silence_timeout_ms):
                 # Iniciar procesamiento asíncrono
                 if self._silence_timer is None or self._silence_timer.done():
                     self._silence_timer = asyncio.create_task(self._process_segment())
-        
-        # Verificar máximo de buffer
-        max_bytes = (self._config.max_buffer_seconds * 
-                    self._config.sample_rate * 
-                    self._config.sample_width * 
-                    self._config.channels)
-        
-        if self._total_bytes >= max_bytes:
+
+        if self._ring.free == 0:
             logger.warning("Buffer máximo alcanzado, forzando procesamiento")
             await self._process_segment()
-        
+
         # Notificar cambio de estado
         current_state = self.state
-        if self._on_state_change:
+        if self._on_state_change and self._should_notify(current_state):
             await self._on_state_change(current_state)
-        
+
         return current_state
-    
-    def _analyze_chunk(self, audio_data: bytes) -> tuple[float, bool]:
+
+    def _should_notify(self, state: StreamState) -> bool:
+        """Notificar si cambió status/voz o pasó ``state_interval_ms``."""
+        now = time.monotonic()
+        key = (state.status, state.is_speaking)
+        if (
+            key != self._last_state_key
+            or (now - self._last_state_at) * 1000 >= self._config.state_interval_ms
+        ):
+            self._last_state_key = key
+            self._last_state_at = now
+            return True
+        return False
+
+    def _analyze_chunk(self, samples: np.ndarray) -> tuple[float, bool]:
         """Analizar chunk para volumen y detección de voz.
-        
+
         Returns:
             Tuple de (volumen normalizado 0-1, es_voz bool)
         """
-        if len(audio_data) < 2:
-            return 0.0, False
-        
-        # Calcular RMS
-        try:
-            n_samples = len(audio_data) // self._config.sample_width
-            if n_samples == 0:
-                return 0.0, False
-            
-            fmt = f"<{n_samples}h"
-            samples = struct.unpack(fmt, audio_data[:n_samples * 2])
-            
-            sum_sq = sum(s * s for s in samples)
-            rms = (sum_sq / n_samples) ** 0.5
-            
-            # Normalizar a 0-1 (16-bit max = 32767)
-            volume = min(1.0, rms / 32767.0 * 10)  # x10 para mejor visualización
-            
-            # Detectar voz por umbral de energía
-            # Umbral absoluto mínimo para 16-bit
-            is_speech = rms > 100 and (rms / 32767.0) > self._config.energy_threshold
-            
-            return volume, is_speech
-            
-        except (struct.error, ZeroDivisionError):
+        if samples.size == 0:
             return 0.0, False
-    
+
+        # Calcular RMS (vista int16 sin copia; ver ipa_core.audio.analysis)
+        rms = signal_rms(samples)
+
+        # Normalizar a 0-1 (16-bit max = 32767)
+        volume = min(1.0, rms / 32767.0 * 10)  # x10 para mejor visualización
+
+        # Detectar voz por umbral de energía
+        # Umbral absoluto mínimo para 16-bit
+        is_speech = rms > 100 and (rms / 32767.0) > self._config.energy_threshold
+
+        return volume, is_speech
+
     async def _process_segment(self) -> None:
         """Procesar el buffer actual como un segmento completo."""
         async with self._processing_lock:
-            if not self._chunks or self._total_bytes == 0:
+            if len(self._ring) == 0:
                 return
-            
-            # Guardar audio a archivo temporal
-            audio_data = b"".join(self._chunks)
-            audio_path = await self._save_to_wav(audio_data)
-            
-            # Calcular duración
-            bytes_per_ms = (self._config.sample_rate * 
-                          self._config.sample_width * 
-                          self._config.channels) / 1000
-            duration_ms = int(len(audio_data) / bytes_per_ms) if bytes_per_ms > 0 else 0
-            
+
+            # Vista sobre el ring (copia si cruza el borde o es muy largo)
+            pcm = self._ring.take(max_view=self._ring.capacity // 2)
+            duration_ms = self._duration_ms(pcm.size)
+
             # Estimar speech ratio (simplificado)
             speech_ratio = 0.8 if self._is_speaking else 0.2
-            
+
             # Crear segmento
             segment = AudioSegment(
-                audio_path=audio_path,
+                pcm=pcm,
                 duration_ms=duration_ms,
                 speech_ratio=speech_ratio,
+                sample_rate=self._config.sample_rate,
+                channels=self._config.channels,
             )
-            
-            # Limpiar buffer
-            self._chunks.clear()
-            self._total_bytes = 0
+
+            # Limpiar estado de VAD
             self._is_speaking = False
             self._silence_start_time = None
-            
+
             logger.info(f"Segmento listo: {duration_ms}ms, speech_ratio={speech_ratio:.2f}")
-            
+
             # Notificar callback
             if self._on_segment_ready:
                 try:
                     await self._on_segment_ready(segment)
                 except Exception as e:
                     logger.error(f"Error en callback de segmento: {e}")
-    
-    async def _save_to_wav(self, audio_data: bytes) -> Path:
-        """Guardar audio PCM a archivo WAV temporal."""
-        with tempfile.NamedTemporaryFile(
-            delete=False,
-            suffix=".wav",
-            prefix="realtime_",
-        ) as tmp:
-            tmp_path = Path(tmp.name)
-        
-        # Escribir WAV
-        with wave.open(str(tmp_path), "wb") as w:
-            w.setnchannels(self._config.channels)
-            w.setsampwidth(self._config.sample_width)
-            w.setframerate(self._config.sample_rate)
-            w.writeframes(audio_data)
-        
-        return tmp_path
-    
+
     async def flush(self) -> Optional[AudioSegment]:
         """Forzar procesamiento del buffer actual.
-        
+
         Útil cuando el usuario termina de grabar manualmente.
-        
+
         Returns:
             AudioSegment si había datos, None si buffer vacío
         """
         if self._silence_timer and not self._silence_timer.done():
             self._silence_timer.cancel()
-        
-        if self._total_bytes > 0:
+
+        if len(self._ring) > 0:
             await self._process_segment()
             return None  # El callback ya fue llamado
         return None
-    
+
     def reset(self) -> None:
         """Limpiar buffer sin procesar."""
         if self._silence_timer and not self._silence_timer.done():
             self._silence_timer.cancel()
-        
-        self._chunks.clear()
-        self._total_bytes = 0
+
+        self._ring.clear()
         self._is_speaking = False
         self._silence_start_time = None
         self._current_volume = 0.0
-
-
-__all__ = [
-    "AudioBuffer",
-    "AudioSegment",
-    "StreamConfig",
-    "StreamState",
-    "SegmentCallback",
-    "StateCallback",
-]
+        self._last_state_key = None
@@ -0,0 +1,243 @@
+"""ASR incremental con hipótesis parciales.
+
+:class:`StreamingTranscriber` recibe el PCM del micrófono a medida que llega
+y, cada ``step_ms`` de audio nuevo, produce una hipótesis parcial; al
+detectar el final del enunciado (:meth:`StreamingTranscriber.finish`)
+produce la hipótesis final y se reinicia.
+
+- Con backends CTC (:class:`ipa_core.ports.asr.CTCStreamingBackend`:
+  Allosaurus por logits, plugin ONNX) cada paso calcula logits sólo sobre
+  el audio nuevo más ``left_context_ms`` de contexto izquierdo, descarta los
+  frames del contexto y los nuevos alimentan un
+  :class:`~ipa_core.backends.ctc.CTCGreedyDecoder` cuyo estado se conserva
+  entre pasos: nunca se re-decodifica el enunciado completo y el audio ya
+  decodificado se descarta (sólo se guarda el contexto).
+- Con el resto de backends cada paso re-transcribe el audio acumulado,
+  acotado a los últimos ``max_buffer_seconds``.
+
+``step_ms`` nunca baja de ``MIN_STEP_MS``: un intervalo de 0 haría una
+inferencia por chunk.
+
+Uso
+---
+::
+
+    stream = StreamingTranscriber(kernel.asr, lang="es")
+    if stream.feed(chunk):              # PCM 16-bit mono 16 kHz
+        partial = await stream.partial()
+    final = await stream.finish()
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, Optional
+
+import numpy as np
+
+from ipa_core.audio.pcm import pcm_input
+from ipa_core.backends.ctc import CTCGreedyDecoder
+from ipa_core.pipeline.ipa_cleaning import clean_asr_tokens
+from ipa_core.ports.asr import ASRBackend
+
+DEFAULT_STEP_MS = 300
+DEFAULT_LEFT_CONTEXT_MS = 500
+DEFAULT_MAX_BUFFER_SECONDS = 30
+MIN_STEP_MS = 100
+
+InferenceLease = Callable[[], AsyncContextManager[Any]]
+
+
+@asynccontextmanager
+async def _no_lease() -> AsyncIterator[None]:
+    yield None
+
+
+def supports_ctc_streaming(asr: Any) -> bool:
+    """``True`` si el backend expone logits CTC y etiquetas."""
+    return callable(getattr(asr, "ctc_logits", None)) and bool(getattr(asr, "ctc_labels", None))
+
+
+@dataclass
+class StreamHypothesis:
+    """Hipótesis (parcial o final) del enunciado en curso."""
+
+    tokens: list[str]
+    lang: str
+    final: bool
+    audio_ms: int
+    latency_ms: float
+    incremental: bool
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "ipa": " ".join(self.tokens),
+            "tokens": list(self.tokens),
+            "lang": self.lang,
+            "final": self.final,
+            "meta": {
+                "audio_ms": self.audio_ms,
+                "latency_ms": round(self.latency_ms, 2),
+                "decoder": "ctc-incremental" if self.incremental else "full",
+            },
+        }
+
+
+class StreamingTranscriber:
+    """Transcripción por ventana deslizante de un enunciado en curso.
+
+    Parameters
+    ----------
+    asr:
+        Backend ASR ya inicializado.
+    lang:
+        Idioma de la transcripción.
+    step_ms:
+        Audio nuevo necesario para una hipótesis parcial (mínimo ``MIN_STEP_MS``).
+    left_context_ms:
+        Contexto izquierdo que acompaña a cada ventana CTC.
+    max_buffer_seconds:
+        Audio máximo retenido; lo más antiguo se descarta.
+    lease:
+        Fábrica de context managers que envuelve cada inferencia (p.ej. el
+        ``lease`` del pool de kernels, para compartir su semáforo).
+    """
+
+    def __init__(
+        self,
+        asr: ASRBackend,
+        *,
+        lang: str,
+        sample_rate: int = 16000,
+        step_ms: int = DEFAULT_STEP_MS,
+        left_context_ms: int = DEFAULT_LEFT_CONTEXT_MS,
+        max_buffer_seconds: int = DEFAULT_MAX_BUFFER_SECONDS,
+        lease: Optional[InferenceLease] = None,
+    ) -> None:
+        self._asr = asr
+        self.lang = lang
+        self._sample_rate = sample_rate
+        self._step = max(1, sample_rate * max(MIN_STEP_MS, step_ms) // 1000)
+        self._max_samples = max(self._step, sample_rate * max_buffer_seconds)
+        self._context = max(0, sample_rate * left_context_ms // 1000)
+        self._lease = lease or _no_lease
+        self._decoder: Optional[CTCGreedyDecoder] = None
+        if supports_ctc_streaming(asr):
+            ctc: Any = asr
+            self._decoder = CTCGreedyDecoder(ctc.ctc_labels, blank_id=ctc.ctc_blank_id)
+        self._lock = asyncio.Lock()
+        self._reset()
+
+    @property
+    def incremental(self) -> bool:
+        return self._decoder is not None
+
+    @property
+    def audio_ms(self) -> int:
+        """Duración del enunciado en curso."""
+        samples = self._dropped + len(self._pcm) // 2
+        return int(samples * 1000 / self._sample_rate)
+
+    def _reset(self) -> None:
+        self._pcm = bytearray()
+        self._dropped = 0  # muestras ya decodificadas y descartadas del buffer
+        self._decoded = 0  # muestras del buffer ya decodificadas (CTC)
+        self._last_step = 0
+        if self._decoder is not None:
+            self._decoder.reset()
+
+    def reset(self) -> None:
+        """Descartar el enunciado en curso."""
+        self._reset()
+
+    def feed(self, pcm: bytes) -> bool:
+        """Agregar PCM; retorna ``True`` si ya toca una hipótesis parcial."""
+        self._pcm.extend(pcm[: len(pcm) - len(pcm) % 2])
+        excess = len(self._pcm) // 2 - self._max_samples
+        if excess > 0:
+            del self._pcm[: excess * 2]
+            self._dropped += excess
+            self._decoded = max(0, self._decoded - excess)
+            self._last_step = max(0, self._last_step - excess)
+        return len(self._pcm) // 2 - self._last_step >= self._step
+
+    async def partial(self) -> Optional[StreamHypothesis]:
+        """Hipótesis parcial (``None`` si no hay audio nuevo suficiente)."""
+        async with self._lock:
+            if len(self._pcm) // 2 - self._last_step < self._step:
+                return None
+            return await self._run(final=False)
+
+    async def finish(self) -> StreamHypothesis:
+        """Hipótesis final del enunciado; el transcriptor queda listo para el siguiente."""
+        async with self._lock:
+            try:
+                return await self._run(final=True)
+            finally:
+                self._reset()
+
+    async def _run(self, *, final: bool) -> StreamHypothesis:
+        started = time.perf_counter()
+        audio_ms = self.audio_ms
+        total = len(self._pcm) // 2
+        self._last_step = total
+        async with self._lease():
+            if self._decoder is not None:
+                tokens = await self._decode_new(total)
+            else:
+                tokens = await self._transcribe_all(total)
+        tokens = clean_asr_tokens(tokens, lang=self.lang) if tokens else []
+        return StreamHypothesis(
+            tokens=tokens,
+            lang=self.lang,
+            final=final,
+            audio_ms=audio_ms,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            incremental=self._decoder is not None,
+        )
+
+    def _samples(self, start: int, end: int) -> np.ndarray:
+        return np.frombuffer(bytes(self._pcm[start * 2 : end * 2]), dtype=np.int16)
+
+    async def _decode_new(self, total: int) -> list[str]:
+        decoder = self._decoder
+        assert decoder is not None
+        if total > self._decoded:
+            start = max(0, self._decoded - self._context)
+            window = self._samples(start, total)
+            logits = await self._asr.ctc_logits(  # type: ignore[attr-defined]
+                pcm_input(window, sample_rate=self._sample_rate), lang=self.lang
+            )
+            if logits is None:
+                # El modelo no expone logits: seguir re-transcribiendo el buffer.
+                self._decoder = None
+                return await self._transcribe_all(total)
+            logits = np.asarray(logits)
+            if logits.ndim == 3:
+                logits = logits[0]
+            skip = int(round(logits.shape[0] * (self._decoded - start) / max(1, len(window))))
+            decoder.push(logits[skip:])
+            self._decoded = total
+            drop = max(0, total - self._context)
+            del self._pcm[: drop * 2]
+            self._dropped += drop
+            self._decoded -= drop
+            self._last_step -= drop
+        return list(decoder.tokens)
+
+    async def _transcribe_all(self, total: int) -> list[str]:
+        if total == 0:
+            return []
+        audio = pcm_input(self._samples(0, total), sample_rate=self._sample_rate)
+        result = await self._asr.transcribe(audio, lang=self.lang)
+        return list(result.get("tokens") or [])
+
+
+__all__ = [
+    "MIN_STEP_MS",
+    "StreamHypothesis",
+    "StreamingTranscriber",
+    "supports_ctc_streaming",
+]
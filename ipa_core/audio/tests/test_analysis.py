@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from ipa_core.audio.analysis import analyze_signal, frame_energies, speech_mask
+from ipa_core.audio.pcm import pcm_input
+from ipa_core.audio.quality_gates import check_quality
+
+
+def _legacy_vad_sums(samples, sr, segments):
+    speech_sq = silence_sq = speech_c = silence_c = 0
+    for i, s in enumerate(samples):
+        ms = i * 1000.0 / sr
+        if any(start <= ms < end for start, end in segments):
+            speech_sq += s * s
+            speech_c += 1
+        else:
+            silence_sq += s * s
+            silence_c += 1
+    return speech_sq, silence_sq, speech_c, silence_c
+
+
+@pytest.mark.unit
+def test_speech_mask_matches_per_sample_segment_scan() -> None:
+    rng = np.random.default_rng(3)
+    samples = rng.integers(-2000, 2000, 4410, dtype=np.int16)
+    segments = [(10, 33.3), (25, 40), (71.9, 99.99)]
+
+    mask = speech_mask(samples.size, 44100, segments)
+    wide = samples.astype(np.int64) ** 2
+
+    assert _legacy_vad_sums(samples.tolist(), 44100, segments) == (
+        int(wide[mask].sum()), int(wide[~mask].sum()), int(mask.sum()), int((~mask).sum())
+    )
+
+
+@pytest.mark.unit
+def test_frame_energies_skip_last_exact_frame_like_legacy_loop() -> None:
+    samples = np.full(960, 300, dtype=np.int16)
+    assert frame_energies(samples, 480).tolist() == [300.0]
+    assert frame_energies(samples[:481], 480).tolist() == [300.0]
+    assert frame_energies(samples[:480], 480).size == 0
+
+
+@pytest.mark.functional
+def test_quality_gate_reads_pcm_metrics_from_shared_analysis() -> None:
+    t = np.arange(16000) / 16000
+    samples = np.zeros(16000, dtype=np.int16)
+    samples[4000:12000] = (8000 * np.sin(2 * np.pi * 220 * t[4000:12000])).astype(np.int16)
+
+    result = check_quality(pcm_input(samples), speech_segments=[(250, 750)])
+    stats = analyze_signal(samples, 16000, [(250, 750)])
+
+    assert result.snr_method == "real_vad" and result.snr_db == 60.0
+    assert result.rms_amplitude == stats.rms
+    assert result.peak_amplitude is not None
+    assert math.isclose(result.peak_amplitude, 8000 / 32767, rel_tol=1e-3)
+    assert result.clipping_ratio == 0.0
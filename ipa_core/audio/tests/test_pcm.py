@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import struct
+import wave
+
+import numpy as np
+import pytest
+
+from ipa_core.audio.pcm import decode_wav_pcm16, pcm_input, read_wav_frames
+from ipa_core.audio.processing_chain import AudioContext, AudioProcessingChain
+from ipa_core.backends.asr_stub import StubASR
+from ipa_core.services.transcription import TranscriptionService
+from tests.utils.audio import write_sine_wave
+
+
+@pytest.fixture
+def sine_wav(tmp_path):
+    return write_sine_wave(tmp_path / "sine.wav", seconds=0.8)
+
+
+@pytest.mark.unit
+def test_decode_matches_wave_module_and_tolerates_bad_data_size(sine_wav) -> None:
+    raw = open(sine_wav, "rb").read()
+    with wave.open(sine_wav, "rb") as wf:
+        expected = np.frombuffer(wf.readframes(wf.getnframes()), dtype="<i2")
+
+    decoded = decode_wav_pcm16(raw)
+    assert decoded is not None and np.array_equal(decoded, expected)
+
+    # Header con tamaño de data erróneo (Flutter/record): se lee hasta el final.
+    broken = bytearray(raw)
+    struct.pack_into("<I", broken, 40, 0xFFFFFFFF)
+    decoded = decode_wav_pcm16(bytes(broken))
+    assert decoded is not None and np.array_equal(decoded, expected)
+
+
+@pytest.mark.unit
+def test_decode_rejects_formats_that_need_ffmpeg(tmp_path) -> None:
+    resampled = write_sine_wave(tmp_path / "44k.wav", seconds=0.2, sample_rate=44100)
+    assert decode_wav_pcm16(open(resampled, "rb").read()) is None
+    assert decode_wav_pcm16(b"not-a-real-wav") is None
+    assert decode_wav_pcm16(b"") is None
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+async def test_processing_chain_runs_in_memory_without_temp_files(sine_wav, monkeypatch) -> None:
+    def _no_ffmpeg(*_args, **_kwargs):
+        raise AssertionError("ensure_wav no debe ejecutarse para PCM 16 kHz mono")
+
+    monkeypatch.setattr("ipa_core.audio.files.ensure_wav", _no_ffmpeg)
+    samples = decode_wav_pcm16(open(sine_wav, "rb").read())
+    assert samples is not None
+    ctx = AudioContext(audio=pcm_input(samples))
+
+    ctx = await AudioProcessingChain.default(vad_backend="energy").process(ctx)
+
+    assert ctx.temp_files == []
+    assert "path" not in ctx.audio
+    assert ctx.meta["ensure_wav"]["in_memory"] is True
+    assert ctx.meta["agc"]["applied"] is True
+    assert ctx.quality_result is not None
+    _, sr, _, channels, n_frames = read_wav_frames(ctx.audio)
+    assert (sr, channels) == (16000, 1)
+    assert n_frames > 0
+
+
+@pytest.mark.functional
+async def test_transcribe_bytes_fast_path_matches_file_path(sine_wav, monkeypatch) -> None:
+    service = TranscriptionService(asr=StubASR(), textref=object())  # type: ignore[arg-type]
+    from_file = await service.transcribe_file(sine_wav, lang="es")
+
+    def _no_disk(*_args, **_kwargs):
+        raise AssertionError("el upload 16 kHz mono no debe escribirse a disco")
+
+    monkeypatch.setattr("ipa_core.services.transcription.persist_bytes", _no_disk)
+    monkeypatch.setattr("ipa_core.services.transcription.ensure_wav", _no_disk)
+    in_memory = await service.transcribe_bytes(open(sine_wav, "rb").read(), lang="es")
+
+    assert in_memory.tokens == from_file.tokens
+    assert "pcm" not in in_memory.audio
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ipa_core.audio.stream import AudioBuffer, AudioSegment, PCMRingBuffer, StreamConfig
+
+
+@pytest.mark.unit
+def test_ring_buffer_views_contiguous_segments_and_copies_wrapped() -> None:
+    ring = PCMRingBuffer(10)
+    assert ring.write(np.arange(6, dtype=np.int16)) == 6
+    first = ring.take()
+    assert np.shares_memory(first, ring._data) and first.tolist() == [0, 1, 2, 3, 4, 5]
+
+    assert ring.write(np.arange(10, 20, dtype=np.int16)) == 10  # cruza el borde del ring
+    wrapped = ring.take()
+    assert not np.shares_memory(wrapped, ring._data)
+    assert wrapped.tolist() == list(range(10, 20))
+    assert ring.write(np.arange(12, dtype=np.int16)) == 10 and ring.free == 0
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+async def test_audio_buffer_hands_segments_as_views_and_throttles_state() -> None:
+    segments: list[AudioSegment] = []
+    states: list[str] = []
+
+    async def on_segment(segment: AudioSegment) -> None:
+        segments.append(segment)
+
+    async def on_state(state) -> None:
+        states.append(state.status)
+
+    buffer = AudioBuffer(
+        on_segment_ready=on_segment,
+        on_state_change=on_state,
+        config=StreamConfig(max_buffer_seconds=2, state_interval_ms=10_000),
+    )
+    chunk = (np.full(480, 4000, dtype=np.int16)).tobytes()  # 30 ms de "voz"
+    for _ in range(20):
+        await buffer.add_chunk(chunk)
+    await buffer.flush()
+
+    assert states == ["speaking"]  # un solo envío: el estado no cambió
+    (segment,) = segments
+    assert segment.duration_ms == 600 and segment.audio_path is None
+    assert np.shares_memory(segment.pcm, buffer._ring._data)
+    assert segment.audio_input()["pcm"].size == 9600
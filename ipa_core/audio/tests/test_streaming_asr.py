@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+import pytest
+
+from ipa_core.audio.pcm import pcm_samples
+from ipa_core.audio.streaming_asr import StreamingTranscriber
+from ipa_core.backends.ctc import ctc_greedy_decode
+from ipa_core.pipeline.ipa_cleaning import clean_asr_tokens
+
+_FRAME = 160  # 10 ms a 16 kHz
+_LABELS = ["", "p", "a", "t", "o"]
+
+
+class FakeCTCBackend:
+    """Un frame de logits por cada 10 ms; la etiqueta va codificada en la muestra."""
+
+    output_type = "ipa"
+    ctc_labels = _LABELS
+    ctc_blank_id = 0
+
+    def __init__(self) -> None:
+        self.samples_seen = 0
+
+    async def ctc_logits(self, audio: Any, *, lang: Optional[str] = None) -> np.ndarray:
+        samples = pcm_samples(audio)
+        self.samples_seen += len(samples)
+        ids = samples[::_FRAME].astype(int)
+        return np.eye(len(_LABELS))[ids]
+
+    async def transcribe(self, audio: Any, **kw: Any) -> dict:
+        raise AssertionError("el streaming CTC no debe re-transcribir")
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+async def test_streaming_ctc_carries_decoder_state_across_windows() -> None:
+    rng = np.random.default_rng(3)
+    frame_ids = np.repeat(rng.integers(0, len(_LABELS), 120), rng.integers(1, 9, 120))
+    pcm = np.repeat(frame_ids, _FRAME).astype(np.int16).tobytes()
+    expected = clean_asr_tokens(ctc_greedy_decode(np.eye(len(_LABELS))[frame_ids], _LABELS), lang="es")
+
+    asr = FakeCTCBackend()
+    stream = StreamingTranscriber(asr, lang="es", step_ms=300, left_context_ms=100)  # type: ignore[arg-type]
+    partials = []
+    for i in range(0, len(pcm), 960):
+        if stream.feed(pcm[i:i + 960]):
+            partials.append(await stream.partial())
+    final = await stream.finish()
+
+    assert final.final and final.incremental and final.tokens == expected
+    assert partials and all(p is not None and not p.final for p in partials)
+    assert partials[-1].tokens == expected[: len(partials[-1].tokens)]  # type: ignore[union-attr]
+    # Cada ventana sólo lleva el audio nuevo más 100 ms de contexto.
+    total = len(pcm) // 2
+    assert asr.samples_seen <= total + 1600 * (len(partials) + 1)
+    assert stream.audio_ms == 0
+
+
+class FullASR:
+    output_type = "ipa"
+
+    def __init__(self) -> None:
+        self.samples: list[int] = []
+
+    async def transcribe(self, audio: Any, **kw: Any) -> dict:
+        self.samples.append(len(pcm_samples(audio)))
+        return {"tokens": ["a"]}
+
+
+@pytest.mark.unit
+async def test_full_retranscription_is_capped_and_step_clamped() -> None:
+    asr = FullASR()
+    stream = StreamingTranscriber(asr, lang="es", step_ms=0, max_buffer_seconds=1)  # type: ignore[arg-type]
+    chunk = np.ones(800, dtype=np.int16).tobytes()  # 50 ms
+    ready = [stream.feed(chunk) for _ in range(60)]
+    assert ready[0] is False  # step mínimo de 100 ms, no uno por chunk
+    await stream.partial()
+    assert asr.samples == [16000]
+    assert stream.audio_ms == 3000
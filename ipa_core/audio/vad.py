@@ -13,11 +13,15 @@ from __future__ import annotations
 
 import logging
 import warnings
-import wave
 from dataclasses import dataclass, field
 from pathlib import Path
 import threading
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from ipa_core.audio.analysis import PCMData, frame_energies, pcm16_view
+from ipa_core.audio.pcm import AudioSource, has_pcm, read_wav_frames
 
 logger = logging.getLogger(__name__)
 
@@ -52,58 +56,43 @@ class VADResult:
 
     
 def analyze_vad(
-    audio_path: str,
+    audio_path: AudioSource,
     *,
     frame_ms: int = DEFAULT_FRAME_MS,
     energy_threshold: float = DEFAULT_ENERGY_THRESHOLD,
     min_speech_ms: int = DEFAULT_MIN_SPEECH_MS,
     silence_trim_ms: int = DEFAULT_SILENCE_TRIM_MS,
 ) -> VADResult:
-    """Analizar audio para detectar segmentos de voz."""
-    path = Path(audio_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Audio no encontrado: {audio_path}")
-    
-    raw_data, sr, sw, nc, n_frames = _read_wav_raw(path)
+    """Analizar audio (ruta WAV o ``AudioInput``) para detectar segmentos de voz."""
+    raw_data, sr, sw, nc, n_frames = _read_wav_raw(audio_path)
     duration_ms = int(n_frames * 1000 / sr)
     
-    frame_energies = _calculate_frame_energies(raw_data, sr, sw, nc, frame_ms)
-    if not frame_energies or max(frame_energies) < 100.0:
+    energies = _calculate_frame_energies(raw_data, sr, sw, nc, frame_ms)
+    if not energies.size or energies.max() < 100.0:
         return VADResult(speech_segments=[], speech_ratio=0.0, duration_ms=duration_ms)
     
-    segments = _detect_speech_segments(frame_energies, frame_ms, energy_threshold, min_speech_ms)
+    segments = _detect_speech_segments(energies, frame_ms, energy_threshold, min_speech_ms)
     return _build_vad_result(segments, duration_ms, silence_trim_ms)
 
 
-def _read_wav_raw(path: Path) -> tuple[bytes, int, int, int, int]:
-    with wave.open(str(path), "rb") as w:
-        sr = w.getframerate()
-        sw = w.getsampwidth()
-        nc = w.getnchannels()
-        nf = w.getnframes()
-        data = w.readframes(nf)
-    
+def _read_wav_raw(source: AudioSource) -> tuple[PCMData, int, int, int, int]:
+    data, sr, sw, nc, nf = read_wav_frames(source)
     if sw != 2:
         raise ValueError(f"Solo soporta WAV 16-bit, recibido: {sw * 8}-bit")
     return data, sr, sw, nc, nf
 
 
-def _detect_speech_segments(energies: list[float], frame_ms: int, threshold: float, min_ms: int) -> list[tuple[int, int]]:
-    max_e = max(energies)
-    is_speech = [e / max_e > threshold for e in energies]
+def _detect_speech_segments(energies: np.ndarray, frame_ms: int, threshold: float, min_ms: int) -> list[tuple[int, int]]:
+    is_speech = (energies / energies.max() > threshold).tolist()
     segments = _extract_segments(is_speech, frame_ms)
     return [s for s in segments if s[1] - s[0] >= min_ms]
 
 
-def _calculate_frame_energies(raw_data: bytes, sr: int, sw: int, nc: int, frame_ms: int) -> list[float]:
+def _calculate_frame_energies(raw_data: PCMData, sr: int, sw: int, nc: int, frame_ms: int) -> np.ndarray:
     samples_per_frame = int(sr * frame_ms / 1000)
-    bytes_per_frame = samples_per_frame * sw * nc
-    
-    energies = []
-    for i in range(0, len(raw_data) - bytes_per_frame, bytes_per_frame):
-        frame = raw_data[i:i + bytes_per_frame]
-        energies.append(_compute_frame_energy(frame, sw))
-    return energies
+    if sw != 2:
+        return np.zeros(0, dtype=np.float64)
+    return frame_energies(pcm16_view(raw_data), samples_per_frame * nc)
 
 
 def _build_vad_result(segments: list[tuple[int, int]], duration_ms: int, trim_ms: int) -> VADResult:
@@ -142,20 +131,6 @@ def _detect_internal_pauses(segments: list[tuple[int, int]]) -> list[tuple[int,
     return pauses
 
 
-def _compute_frame_energy(frame: bytes, sample_width: int) -> float:
-    """Calcular energía RMS de un frame de audio."""
-    import struct
-    
-    if sample_width == 2:
-        fmt = f"<{len(frame) // 2}h"
-        samples = struct.unpack(fmt, frame)
-        if not samples:
-            return 0.0
-        sum_sq = sum(s * s for s in samples)
-        return (sum_sq / len(samples)) ** 0.5
-    return 0.0
-
-
 def _extract_segments(
     is_speech: List[bool],
     frame_ms: int,
@@ -185,12 +160,12 @@ def _process_segment_frame(i: int, speech: bool, in_seg: bool, start: int, ms: i
     return in_seg, start
 
 
-def _read_audio_wav(audio_path: str, sampling_rate: int = 16000) -> Any:
+def _read_audio_wav(audio_path: AudioSource, sampling_rate: int = 16000) -> Any:
     """Leer WAV como tensor float32 sin depender de torchaudio."""
     import numpy as np
     import torch
 
-    raw, sr, sw, nc = _read_wav_metadata(audio_path)
+    raw, sr, sw, nc, _ = read_wav_frames(audio_path)
     samples = _raw_to_float32(raw, sw)
 
     if nc > 1:
@@ -202,15 +177,9 @@ def _read_audio_wav(audio_path: str, sampling_rate: int = 16000) -> Any:
     return torch.from_numpy(samples)
 
 
-def _read_wav_metadata(path: str) -> tuple[bytes, int, int, int]:
-    with wave.open(path, "rb") as wf:
-        return wf.readframes(wf.getnframes()), wf.getframerate(), wf.getsampwidth(), wf.getnchannels()
-
-
-def _raw_to_float32(raw: bytes, sw: int) -> Any:
-    import numpy as np
+def _raw_to_float32(raw: PCMData, sw: int) -> Any:
     if sw == 2:
-        return np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+        return pcm16_view(raw).astype(np.float32) / 32768.0
     if sw == 4:
         return np.frombuffer(raw, dtype=np.int32).astype(np.float32) / 2_147_483_648.0
     raise ValueError(f"Sample width {sw * 8}-bit no soportado")
@@ -266,7 +235,7 @@ def _get_silero_model() -> Any:
 
 
 def analyze_vad_silero(
-    audio_path: str,
+    audio_path: AudioSource,
     *,
     sampling_rate: int = 16000,
     threshold: float = 0.5,
@@ -275,14 +244,15 @@ def analyze_vad_silero(
     silence_trim_ms: int = DEFAULT_SILENCE_TRIM_MS,
 ) -> VADResult:
     """Analizar audio usando Silero VAD (modelo neural)."""
-    path = Path(audio_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Audio no encontrado: {audio_path}")
+    if not has_pcm(audio_path):
+        path = audio_path["path"] if isinstance(audio_path, Mapping) else audio_path
+        if not Path(path).exists():
+            raise FileNotFoundError(f"Audio no encontrado: {path}")
 
     from silero_vad import get_speech_timestamps
 
     model = _get_silero_model()
-    wav = _read_audio_wav(str(path), sampling_rate=sampling_rate)
+    wav = _read_audio_wav(audio_path, sampling_rate=sampling_rate)
     duration_ms = int(len(wav) * 1000 / sampling_rate)
 
     timestamps = get_speech_timestamps(
@@ -309,7 +279,7 @@ _ENERGY_KWARGS = frozenset({"frame_ms", "energy_threshold", "min_speech_ms", "si
 
 
 def analyze_vad_best(
-    audio_path: str,
+    audio_path: AudioSource,
     *,
     backend: str = "auto",
     **kwargs: Any,
@@ -327,7 +297,7 @@ def _filter_kwargs(kwargs: dict, allowed: frozenset) -> dict:
     return {k: v for k, v in kwargs.items() if k in allowed}
 
 
-def _dispatch_auto_vad(audio_path: str, **kwargs) -> VADResult:
+def _dispatch_auto_vad(audio_path: AudioSource, **kwargs) -> VADResult:
     try:
         res = analyze_vad_silero(audio_path, **_filter_kwargs(kwargs, _SILERO_KWARGS))
         logger.debug("analyze_vad_best: usando Silero VAD")
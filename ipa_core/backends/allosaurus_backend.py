@@ -2,20 +2,43 @@
 
 Allosaurus es un modelo de reconocimiento fonético multilingüe
 que produce transcripciones IPA directamente desde audio.
+
+Los logits salen del frontend (``pm``) y del modelo acústico (``am``)
+corridos directamente sobre la forma de onda; la máscara del inventario se
+cachea por idioma y se decodifica una sola vez con CTC (pyctcdecode o
+greedy). Si el modelo no expone ``pm``/``am`` se usa ``recognize()``
+nativo, sin interceptar ``lm.compute``.
+
+``transcribe_many`` pasa varios audios en memoria por el modelo acústico
+en un solo forward (secuencias con padding + longitudes) y decodifica cada
+uno por separado; lo usa
+:class:`ipa_core.pipeline.scheduler.InferenceScheduler`.
 """
 from __future__ import annotations
 
 import asyncio
 import logging
+import math
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Iterator, Optional, TYPE_CHECKING
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+from ipa_core.audio.pcm import (
+    audio_file,
+    has_pcm,
+    is_canonical_pcm,
+    pad_samples,
+    pcm_input,
+    pcm_samples,
+)
+from ipa_core.backends.ctc import ctc_greedy_decode
 from ipa_core.errors import NotReadyError, ValidationError
+from ipa_core.kernel.executors import get_executor, worker_resource
 from ipa_core.plugins.base import BasePlugin
 from ipa_core.types import ASRResult, AudioInput
 
@@ -34,6 +57,31 @@ except (ImportError, TypeError) as e:
     _ALLOSAURUS_ERROR = str(e)
 
 
+@contextmanager
+def _wav_file_for(source: "str | np.ndarray") -> Iterator[str]:
+    """Ruta WAV para las APIs de Allosaurus que sólo aceptan archivos."""
+    if isinstance(source, np.ndarray):
+        with audio_file(pcm_input(source)) as path:
+            yield path
+    else:
+        yield source
+
+
+def _worker_backend(model_name: str, emit_timestamps: bool) -> "AllosaurusBackend":
+    """Backend con el modelo cargado, uno por proceso trabajador."""
+    def load() -> AllosaurusBackend:
+        backend = AllosaurusBackend(model_name=model_name, emit_timestamps=emit_timestamps)
+        backend._attach_model(read_recognizer(model_name))
+        return backend
+
+    return worker_resource(("allosaurus", model_name, emit_timestamps), load)
+
+
+def _run_in_worker(model_name: str, emit_timestamps: bool, method: str, *args: Any) -> Any:
+    """Punto de entrada serializable del pool ``asr`` en modo proceso."""
+    return getattr(_worker_backend(model_name, emit_timestamps), method)(*args)
+
+
 class AllosaurusBackend(BasePlugin):
     """Backend ASR usando Allosaurus para transcripción fonética.
     
@@ -274,8 +322,7 @@ class AllosaurusBackend(BasePlugin):
         self._lm = None
         self._ctc_decoder = None
         self._ctc_labels: list[str] = []
-        self._active_mask = None
-        self._active_lang: Optional[str] = None
+        self._masks: dict[Optional[str], Any] = {}
         self._blank_index = 0
         self._ready = False
     
@@ -293,14 +340,28 @@ class AllosaurusBackend(BasePlugin):
             return None
         
         loop = asyncio.get_running_loop()
-        self._model = await loop.run_in_executor(None, load_model)
-        self._pm = getattr(self._model, "pm", None)
-        self._am = getattr(self._model, "am", None)
-        self._lm = getattr(self._model, "lm", None)
-        self._active_lang = self._resolve_lang(self._lang)
-        self._ensure_decoder_and_mask(self._active_lang)
+        self._attach_model(await loop.run_in_executor(None, load_model))
+        self._ensure_decoder_and_mask(self._resolve_lang(self._lang))
         self._ready = True
     
+    def _attach_model(self, model: Any) -> None:
+        self._model = model
+        self._pm = getattr(model, "pm", None)
+        self._am = getattr(model, "am", None)
+        self._lm = getattr(model, "lm", None)
+
+    async def _offload(self, method: str, *args: Any) -> Any:
+        """Ejecutar un método síncrono de inferencia en el pool ``asr``.
+
+        En modo proceso el método corre sobre el backend del worker (el
+        modelo se carga una vez por proceso); máscara y decodificación
+        siguen en el proceso principal.
+        """
+        pool = get_executor("asr")
+        if pool.is_process:
+            return await pool.run(_run_in_worker, self._model_name, self._emit_timestamps, method, *args)
+        return await pool.run(getattr(self, method), *args)
+
     async def teardown(self) -> None:
         """Liberar recursos del modelo."""
         self._model = None
@@ -309,8 +370,7 @@ class AllosaurusBackend(BasePlugin):
         self._lm = None
         self._ctc_decoder = None
         self._ctc_labels = []
-        self._active_mask = None
-        self._active_lang = None
+        self._masks = {}
         self._ready = False
     
     def _resolve_lang(self, lang: Optional[str]) -> Optional[str]:
@@ -349,10 +409,14 @@ class AllosaurusBackend(BasePlugin):
         garantía Allosaurus recibe audio mal formateado y produce tokens
         basura o un string vacío.
 
+        Si ``audio`` lleva ``pcm`` a 16 kHz mono, el padding y la extracción
+        de features se hacen sobre el array en memoria; sólo el fallback
+        nativo de Allosaurus (que lee archivos) escribe un temporal.
+
         Parámetros
         ----------
         audio : AudioInput
-            Diccionario con path, sample_rate y channels.
+            Diccionario con path o pcm, sample_rate y channels.
         lang : str | None
             Código de idioma para restringir inventario.
 
@@ -364,19 +428,30 @@ class AllosaurusBackend(BasePlugin):
         if not self._ready or self._model is None:
             raise NotReadyError("AllosaurusBackend no inicializado. Llama setup() primero.")
 
-        audio_path = Path(audio["path"])
-        if not audio_path.exists():
-            raise ValidationError(f"Archivo de audio no existe: {audio_path}")
+        if not has_pcm(audio):
+            audio_path = Path(audio["path"])
+            if not audio_path.exists():
+                raise ValidationError(f"Archivo de audio no existe: {audio_path}")
 
         resolved_lang = self._resolve_lang(lang)
         self._ensure_decoder_and_mask(resolved_lang)
 
+        if is_canonical_pcm(audio):
+            samples = pad_samples(pcm_samples(audio), 16000, min_ms=700, pad_ms=150)
+            tokens, raw_output, timestamps, decoder_used = await self._transcribe_source(
+                samples, resolved_lang
+            )
+            return self._build_result(tokens, raw_output, timestamps, resolved_lang, decoder_used)
+
         # Garantizar WAV PCM 16 kHz mono antes de invocar Allosaurus.
         # Allosaurus internamente usa wave.open() y asume 16 kHz; cualquier
         # otra frecuencia produce transcripciones incorrectas.
         from ipa_core.audio.files import ensure_wav
         import os
-        clean_path, is_tmp = ensure_wav(str(audio_path), target_sample_rate=16000, target_channels=1)
+        with audio_file(audio) as source:
+            clean_path, is_tmp = await get_executor("audio").run(
+                ensure_wav, source, target_sample_rate=16000, target_channels=1
+            )
 
         # Rellenar con silencio si el audio es demasiado corto.
         # Allosaurus usa ventanas de contexto de ~250 ms; clips < 700 ms producen
@@ -384,14 +459,10 @@ class AllosaurusBackend(BasePlugin):
         # Se añaden 150 ms de silencio al inicio Y al final (= +300 ms total).
         clean_path, is_tmp = self._pad_audio_if_short(clean_path, is_tmp, min_ms=700, pad_ms=150)
 
-        decoder_used = "pyctcdecode" if self._ctc_decoder is not None else "greedy"
         try:
-            tokens, raw_output, timestamps = await self._run_logits_pipeline(clean_path, resolved_lang)
-            if not tokens:
-                # Safety fallback: if custom path could not decode, keep legacy behavior.
-                raw_output = await self._run_recognize(clean_path, resolved_lang)
-                tokens, timestamps = self._parse_output(raw_output)
-                decoder_used = "allosaurus-native"
+            tokens, raw_output, timestamps, decoder_used = await self._transcribe_source(
+                clean_path, resolved_lang
+            )
         finally:
             if is_tmp:
                 try:
@@ -399,10 +470,79 @@ class AllosaurusBackend(BasePlugin):
                 except OSError:
                     pass
 
-        return {
+        return self._build_result(tokens, raw_output, timestamps, resolved_lang, decoder_used)
+
+    async def transcribe_many(
+        self,
+        audios: list[AudioInput],
+        *,
+        lang: Optional[str] = None,
+        **kw: Any,
+    ) -> list[ASRResult]:
+        """Transcribir varios audios con un solo forward del modelo acústico.
+
+        Sólo aplica a PCM 16 kHz mono en memoria con el camino directo de
+        logits disponible; en otro caso (o si un audio no decodifica) se
+        usa el camino individual de :meth:`transcribe`.
+        """
+        if not self._ready or self._model is None:
+            raise NotReadyError("AllosaurusBackend no inicializado. Llama setup() primero.")
+        if len(audios) < 2 or self._am is None or not all(is_canonical_pcm(a) for a in audios):
+            return [await self.transcribe(audio, lang=lang) for audio in audios]
+
+        resolved_lang = self._resolve_lang(lang)
+        self._ensure_decoder_and_mask(resolved_lang)
+        sources = [pad_samples(pcm_samples(a), 16000, min_ms=700, pad_ms=150) for a in audios]
+
+        logits = await self._offload("_batch_logits", sources)
+        if logits is None:
+            return [await self.transcribe(audio, lang=lang) for audio in audios]
+
+        decoder_used = "pyctcdecode" if self._ctc_decoder is not None else "greedy"
+        mask = self._inventory_mask(resolved_lang)
+        results: list[ASRResult] = []
+        for source, item_logits in zip(sources, logits):
+            tokens = self._decode_with_ctc(self._apply_mask(item_logits, mask))
+            if tokens:
+                results.append(self._build_result(tokens, " ".join(tokens), None, resolved_lang, decoder_used))
+                continue
+            tokens, raw_output, timestamps, used = await self._transcribe_source(source, resolved_lang)
+            results.append(self._build_result(tokens, raw_output, timestamps, resolved_lang, used))
+        return results
+
+    async def _transcribe_source(
+        self,
+        source: "str | np.ndarray",
+        resolved_lang: Optional[str],
+    ) -> tuple[list[str], Any, Optional[list[tuple[float, float]]], str]:
+        """Logits + CTC sobre una ruta WAV o muestras 16 kHz; fallback nativo si no decodifica."""
+        decoder_used = "pyctcdecode" if self._ctc_decoder is not None else "greedy"
+        tokens, raw_output, timestamps = await self._run_logits_pipeline(source, resolved_lang)
+        if not tokens:
+            # Safety fallback: if custom path could not decode, keep legacy behavior.
+            with _wav_file_for(source) as path:
+                raw_output = await self._run_recognize(path, resolved_lang)
+            tokens, timestamps = self._parse_output(raw_output)
+            decoder_used = "allosaurus-native"
+        return tokens, raw_output, timestamps, decoder_used
+
+    def _batch_logits(self, sources: list[np.ndarray]) -> Optional[list[np.ndarray]]:
+        feats = [self._direct_features(source) for source in sources]
+        if any(feat is None for feat in feats):
+            return None
+        return self._am_logits(feats)  # type: ignore[arg-type]
+
+    def _build_result(
+        self,
+        tokens: list[str],
+        raw_output: Any,
+        timestamps: Optional[list[tuple[float, float]]],
+        resolved_lang: Optional[str],
+        decoder_used: str,
+    ) -> ASRResult:
+        result: ASRResult = {
             "tokens": tokens,
             "raw_text": raw_output if isinstance(raw_output, str) else " ".join(tokens),
-            "time_stamps": timestamps,
             "meta": {
                 "backend": "allosaurus",
                 "model": self._model_name,
@@ -412,22 +552,34 @@ class AllosaurusBackend(BasePlugin):
                 "decoder": decoder_used,
             },
         }
+        if timestamps is not None:
+            result["time_stamps"] = timestamps
+        return result
 
     def _ensure_decoder_and_mask(self, resolved_lang: Optional[str]) -> None:
-        """Ensure language-specific mask and CTC decoder are ready."""
+        """Ensure language-specific mask and CTC decoder are ready.
+
+        Las etiquetas CTC son las unidades universales del modelo (no
+        dependen del idioma): etiquetas y decoder se construyen una vez y
+        cambiar de idioma sólo consulta la caché de máscaras.
+        """
         if self._lm is None:
             return
-        if self._active_lang == resolved_lang and self._active_mask is not None:
+        self._inventory_mask(resolved_lang)
+        if self._ctc_labels:
             return
-
-        self._active_lang = resolved_lang
-        self._active_mask = self._build_inventory_mask(resolved_lang)
         self._ctc_labels = self._extract_labels_from_inventory()
         if self._ctc_labels:
             self._blank_index = 0
             self._ctc_labels[0] = ""
         self._ctc_decoder = self._build_ctc_decoder(self._ctc_labels)
 
+    def _inventory_mask(self, resolved_lang: Optional[str]) -> Any:
+        """Máscara del inventario de ``resolved_lang``, construida una vez por idioma."""
+        if resolved_lang not in self._masks:
+            self._masks[resolved_lang] = self._build_inventory_mask(resolved_lang)
+        return self._masks[resolved_lang]
+
     def _build_inventory_mask(self, resolved_lang: Optional[str]) -> Any:
         """Build language mask from Allosaurus inventory internals."""
         if self._lm is None:
@@ -483,109 +635,100 @@ class AllosaurusBackend(BasePlugin):
 
     async def _run_logits_pipeline(
         self,
-        audio_path: str,
+        audio_path: "str | np.ndarray",
         resolved_lang: Optional[str],
     ) -> tuple[list[str], str, Optional[list[tuple[float, float]]]]:
-        """Run logits interception + masking + CTC decode pipeline."""
-        logits = await self._extract_logits(audio_path, resolved_lang)
+        """Frontend + AM directos, máscara del idioma y una sola decodificación CTC."""
+        logits = await self._extract_logits(audio_path)
         if logits is None:
             return [], "", None
 
-        masked_logits = self._apply_mask(logits)
+        masked_logits = self._apply_mask(logits, self._inventory_mask(resolved_lang))
         tokens = self._decode_with_ctc(masked_logits)
         raw_text = " ".join(tokens)
         return tokens, raw_text, None
 
-    async def _extract_logits(self, audio_path: str, resolved_lang: Optional[str]) -> Optional[np.ndarray]:
-        """Extract raw logits tensor (T x V).
+    async def _extract_logits(self, audio_path: "str | np.ndarray") -> Optional[np.ndarray]:
+        """Logits ``T x V`` sin enmascarar, o ``None`` si el modelo no expone pm/am.
 
-        Tries direct AM forward pass first. If internals are not available,
-        falls back to intercepting logits from lm.compute during recognize().
+        Con ``None`` el llamador recurre a ``recognize()`` nativo, que ya
+        decodifica por su cuenta: nunca se corre el reconocedor completo
+        sólo para capturar logits.
         """
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._extract_logits_sync, audio_path, resolved_lang)
+        return await self._offload("_extract_logits_sync", audio_path)
 
-    def _extract_logits_sync(self, audio_path: str, resolved_lang: Optional[str]) -> Optional[np.ndarray]:
+    def _extract_logits_sync(self, audio_path: "str | np.ndarray") -> Optional[np.ndarray]:
         if self._model is None:
             return None
+        feat = self._direct_features(audio_path)
+        if feat is None:
+            return None
+        logits = self._am_logits([feat])
+        return logits[0] if logits else None
 
-        # Preferred path: direct forward pass over AM.
-        direct = self._extract_logits_direct(audio_path)
-        if direct is not None:
-            return direct
-
-        # Fallback path: intercept logits right before internal decode.
-        return self._extract_logits_via_intercept(audio_path, resolved_lang)
+    def _direct_features(self, audio_path: "str | np.ndarray") -> Optional[np.ndarray]:
+        """Features ``T x F`` del frontend de Allosaurus, o ``None``.
 
-    def _extract_logits_direct(self, audio_path: str) -> Optional[np.ndarray]:
+        Las muestras en memoria son ``int16`` a 16 kHz, igual que lo que
+        ``read_audio`` entrega a ``pm.compute`` en ``recognize()``; el
+        frontend remuestrea si su configuración usa otra frecuencia.
+        """
         if self._pm is None or self._am is None:
             return None
         try:
-            import torch  # type: ignore
-            from allosaurus.audio import read_audio  # type: ignore
-
-            sample_rate = 16000
-            pm_cfg = getattr(self._pm, "config", None)
-            if pm_cfg is not None:
-                sample_rate = int(getattr(pm_cfg, "sample_rate", 16000))
+            from allosaurus.audio import Audio, read_audio
 
-            audio = read_audio(audio_path, sample_rate)
+            if isinstance(audio_path, np.ndarray):
+                audio = Audio(audio_path, 16000)
+            else:
+                audio = read_audio(audio_path)
             feat = self._pm.compute(audio)
             if feat is None:
                 return None
 
             feat_np = np.asarray(feat)
-            if feat_np.ndim != 2:
-                return None
-
-            # Allosaurus AM expects (T, B, F) with lengths for packed sequence.
-            feat_tensor = torch.from_numpy(feat_np).float().unsqueeze(1)
-            feat_len = torch.tensor([feat_np.shape[0]], dtype=torch.long)
-
-            with torch.no_grad():
-                output = self._am(feat_tensor, feat_len)
-
-            logits = np.asarray(output[0].cpu().numpy())
-            return logits if logits.ndim == 2 else None
+            return feat_np if feat_np.ndim == 2 else None
         except Exception:
             return None
 
-    def _extract_logits_via_intercept(self, audio_path: str, resolved_lang: Optional[str]) -> Optional[np.ndarray]:
-        if self._model is None or self._lm is None:
+    def _am_logits(self, feats: list[np.ndarray]) -> Optional[list[np.ndarray]]:
+        """Logits ``T x V`` de cada secuencia en un solo forward del AM."""
+        if self._am is None or not feats:
             return None
+        try:
+            import torch
+
+            # Secuencias empaquetadas: orden por longitud descendente.
+            order = sorted(range(len(feats)), key=lambda i: feats[i].shape[0], reverse=True)
+            lengths = [feats[i].shape[0] for i in order]
+            max_len = lengths[0]
+            # Como Recognizer.recognize: batch primero, (B, T, F) + longitudes.
+            batch = np.zeros((len(feats), max_len, feats[0].shape[1]), dtype=np.float32)
+            for row, i in enumerate(order):
+                batch[row, : lengths[row]] = feats[i]
+            feat_tensor = torch.from_numpy(batch)
+            feat_len = torch.tensor(lengths, dtype=torch.long)
 
-        compute_fn = getattr(self._lm, "compute", None)
-        if compute_fn is None:
-            return None
-
-        captured: dict[str, np.ndarray] = {}
-
-        def wrapped_compute(logits: Any, *args: Any, **kwargs: Any) -> Any:
-            try:
-                captured["logits"] = np.asarray(logits).copy()
-            except Exception:
-                pass
-            return compute_fn(logits, *args, **kwargs)
+            with torch.no_grad():
+                output = self._am(feat_tensor, feat_len)
 
-        setattr(self._lm, "compute", wrapped_compute)
-        try:
-            if resolved_lang:
-                self._model.recognize(audio_path, lang_id=resolved_lang, timestamp=self._emit_timestamps)
-            else:
-                self._model.recognize(audio_path, timestamp=self._emit_timestamps)
+            output_np = np.asarray(output.cpu().numpy())
+            if output_np.ndim != 3:
+                return None
+            out_frames = output_np.shape[1]
+            logits: list[Optional[np.ndarray]] = [None] * len(feats)
+            for row, i in enumerate(order):
+                frames = math.ceil(out_frames * lengths[row] / max_len)
+                logits[i] = output_np[row, :frames]
+            return logits
         except Exception:
             return None
-        finally:
-            setattr(self._lm, "compute", compute_fn)
-
-        logits = captured.get("logits")
-        return logits if isinstance(logits, np.ndarray) and logits.ndim == 2 else None
 
-    def _apply_mask(self, logits: np.ndarray) -> np.ndarray:
-        if self._active_mask is None:
+    def _apply_mask(self, logits: np.ndarray, mask: Any) -> np.ndarray:
+        if mask is None:
             return logits
         try:
-            return np.asarray(self._active_mask.mask_logits(logits.copy()))
+            return np.asarray(mask.mask_logits(logits.copy()))
         except Exception:
             return logits
 
@@ -605,25 +748,38 @@ class AllosaurusBackend(BasePlugin):
         return self._decode_greedy_ctc(logits)
 
     def _decode_greedy_ctc(self, logits: np.ndarray) -> list[str]:
-        labels = self._ctc_labels
-        if not labels:
+        if not self._ctc_labels:
             return []
-        ids = np.argmax(logits, axis=1)
-        tokens: list[str] = []
-        prev = -1
-        for idx in ids:
-            i = int(idx)
-            if i == self._blank_index:
-                prev = i
-                continue
-            if i == prev:
-                continue
-            prev = i
-            if 0 <= i < len(labels):
-                token = labels[i]
-                if token:
-                    tokens.append(token)
-        return tokens
+        return ctc_greedy_decode(logits, self._ctc_labels, blank_id=self._blank_index)
+
+    # ------------------------------------------------------------------
+    # Streaming (ver ipa_core.audio.streaming_asr)
+    # ------------------------------------------------------------------
+
+    @property
+    def ctc_labels(self) -> list[str]:
+        return self._ctc_labels
+
+    @property
+    def ctc_blank_id(self) -> int:
+        return self._blank_index
+
+    async def ctc_logits(self, audio: AudioInput, *, lang: Optional[str] = None) -> Optional[np.ndarray]:
+        """Logits enmascarados ``T x V`` del audio, sin padding ni decodificación.
+
+        Lo usa el streaming para decodificar sólo los frames nuevos de cada
+        ventana; retorna ``None`` si el modelo no expone los logits.
+        """
+        if not self._ready or self._model is None:
+            raise NotReadyError("AllosaurusBackend no inicializado. Llama setup() primero.")
+        resolved_lang = self._resolve_lang(lang)
+        self._ensure_decoder_and_mask(resolved_lang)
+        if is_canonical_pcm(audio):
+            logits = await self._extract_logits(pcm_samples(audio))
+        else:
+            with audio_file(audio) as path:
+                logits = await self._extract_logits(path)
+        return None if logits is None else self._apply_mask(logits, self._inventory_mask(resolved_lang))
 
     @staticmethod
     def _pad_audio_if_short(
@@ -704,24 +860,23 @@ class AllosaurusBackend(BasePlugin):
             return path, is_tmp
 
     async def _run_recognize(self, audio_path: str, resolved_lang: Optional[str]) -> Any:
-        """Ejecutar reconocimiento en thread separado (no bloquea el event loop)."""
-        def recognize() -> Any:
-            if not self._model:
-                raise NotReadyError()
-            if resolved_lang:
-                return self._model.recognize(
-                    audio_path,
-                    lang_id=resolved_lang,
-                    timestamp=self._emit_timestamps,
-                )
-            else:
-                return self._model.recognize(
-                    audio_path,
-                    timestamp=self._emit_timestamps,
-                )
-
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, recognize)
+        """Ejecutar reconocimiento en el pool ``asr`` (no bloquea el event loop)."""
+        return await self._offload("_recognize_sync", audio_path, resolved_lang)
+
+    def _recognize_sync(self, audio_path: str, resolved_lang: Optional[str]) -> Any:
+        if not self._model:
+            raise NotReadyError()
+        if resolved_lang:
+            return self._model.recognize(
+                audio_path,
+                lang_id=resolved_lang,
+                timestamp=self._emit_timestamps,
+            )
+        else:
+            return self._model.recognize(
+                audio_path,
+                timestamp=self._emit_timestamps,
+            )
     
     def _parse_output(
         self,
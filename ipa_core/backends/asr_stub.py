@@ -14,6 +14,7 @@ import wave
 from typing import Optional, Any, List
 from pathlib import Path
 
+from ipa_core.audio.pcm import has_pcm, pcm_samples
 from ipa_core.plugins.base import BasePlugin
 from ipa_core.types import ASRResult, AudioInput, Token
 
@@ -153,8 +154,17 @@ class StubASR(BasePlugin):
         # Audio-aware mode: read file and generate varied output
         effective_lang = lang or "es"
         audio_path = audio.get("path", "") if isinstance(audio, dict) else ""
-        if audio_path and Path(audio_path).exists():
-            duration, digest = self._audio_fingerprint(audio_path)
+        fingerprint = None
+        if has_pcm(audio):
+            # Mismo fingerprint que el WAV equivalente en disco.
+            samples = pcm_samples(audio)
+            rate = max(int(audio.get("sample_rate") or 16000), 1)
+            channels = max(int(audio.get("channels") or 1), 1)
+            fingerprint = (len(samples) / channels / rate, hashlib.sha256(samples.tobytes()).digest())
+        elif audio_path and Path(audio_path).exists():
+            fingerprint = self._audio_fingerprint(audio_path)
+        if fingerprint is not None:
+            duration, digest = fingerprint
             tokens = self._generate_tokens(duration, digest, effective_lang)
             logger.debug(
                 "StubASR: generated %d tokens from %.1fs audio (seed=%s)",
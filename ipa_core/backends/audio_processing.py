@@ -3,6 +3,7 @@
 Implementa la extracción de características acústicas para modelos ONNX.
 """
 import numpy as np
+from ipa_core.audio.pcm import audio_file, is_canonical_pcm, pcm_samples
 from ipa_core.types import AudioInput
 try:
     import librosa
@@ -21,10 +22,12 @@ class LibrosaFeatureExtractor:
     async def extract(self, audio: AudioInput) -> np.ndarray:
         """Carga y procesa el audio a un log-mel spectrogram."""
         # TODO: Handle 'microphone' input separately or assume path is a file for now
-        path = str(audio["path"])
-        
-        # Cargar audio
-        y, _ = librosa.load(path, sr=self.sample_rate)
+        if is_canonical_pcm(audio, sample_rate=self.sample_rate):
+            y = pcm_samples(audio).astype(np.float32) / 32768.0
+        else:
+            # Cargar audio
+            with audio_file(audio) as path:
+                y, _ = librosa.load(str(path), sr=self.sample_rate)
         
         # Calcular Mel Spectrogram
         mels = librosa.feature.melspectrogram(y=y, sr=self.sample_rate, n_mels=self.n_mels)
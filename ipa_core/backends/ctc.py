@@ -0,0 +1,65 @@
+"""Decodificación CTC greedy con estado.
+
+Colapsa repeticiones y elimina el *blank* sobre la secuencia ``argmax`` de
+los logits.  El estado (último id visto y tokens emitidos) se conserva entre
+llamadas a :meth:`CTCGreedyDecoder.push`, así que decodificar un audio por
+trozos consecutivos produce los mismos tokens que decodificarlo entero: una
+repetición que cruza el borde entre dos trozos no se emite dos veces.
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from ipa_core.errors import ValidationError
+
+
+def _argmax_ids(logits: np.ndarray) -> np.ndarray:
+    if logits.ndim == 3:
+        return np.argmax(logits, axis=-1)[0]
+    if logits.ndim == 2:
+        return np.argmax(logits, axis=-1)
+    raise ValidationError(f"Logits CTC con forma inesperada: {logits.shape}")
+
+
+class CTCGreedyDecoder:
+    """Decodificador greedy incremental (``T x V`` o ``1 x T x V``)."""
+
+    def __init__(self, labels: Sequence[str], *, blank_id: int = 0) -> None:
+        self.labels = list(labels)
+        self.blank_id = int(blank_id)
+        self.tokens: list[str] = []
+        self.frames = 0
+        self._prev = -1
+
+    def push(self, logits: np.ndarray) -> list[str]:
+        """Decodificar frames nuevos; retorna sólo los tokens que agregan."""
+        ids = _argmax_ids(logits)
+        new: list[str] = []
+        prev = self._prev
+        for idx in ids.tolist():
+            if idx == self.blank_id or idx == prev:
+                prev = idx
+                continue
+            prev = idx
+            token = self.labels[idx] if 0 <= idx < len(self.labels) else ""
+            if token:
+                new.append(token)
+        self._prev = prev
+        self.frames += len(ids)
+        self.tokens.extend(new)
+        return new
+
+    def reset(self) -> None:
+        self.tokens = []
+        self.frames = 0
+        self._prev = -1
+
+
+def ctc_greedy_decode(logits: np.ndarray, labels: Sequence[str], *, blank_id: int = 0) -> list[str]:
+    """Decodificación greedy de una secuencia completa."""
+    return CTCGreedyDecoder(labels, blank_id=blank_id).push(logits)
+
+
+__all__ = ["CTCGreedyDecoder", "ctc_greedy_decode"]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import contextlib
+import sys
+import types
+from typing import Any, Optional
+
+import numpy as np
+import pytest
+
+from ipa_core.backends.allosaurus_backend import AllosaurusBackend
+from ipa_core.types import AudioInput
+
+# Frames -> unidades (0 = blank): argmax sin máscara = "a _ b _".
+_LOGITS = np.array(
+    [[0.0, 2.0, 0.0], [2.0, 0.0, 0.0], [0.0, 0.0, 2.0], [2.0, 0.0, 0.0]], dtype=np.float32
+)
+
+
+class FakeInventory:
+    def __init__(self) -> None:
+        self.unit = type("Unit", (), {"id_to_unit": {0: "<blk>", 1: "a", 2: "b"}})()
+        self.mask_calls: list[Optional[str]] = []
+        self.masked = False
+
+    def get_mask(self, lang: Optional[str], approximation: bool = False) -> Any:
+        self.mask_calls.append(lang)
+        return FakeMask(lang) if self.masked else None
+
+
+class FakeMask:
+    """Inventario del idioma: ``eng`` no tiene la unidad "b"."""
+
+    def __init__(self, lang: Optional[str]) -> None:
+        self.lang = lang
+
+    def mask_logits(self, logits: np.ndarray) -> np.ndarray:
+        if self.lang == "eng":
+            logits[:, 2] = -1e9
+        return logits
+
+
+class FakeFrontend:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def compute(self, audio: Any) -> np.ndarray:
+        self.calls += 1
+        return np.zeros((8, 5), dtype=np.float32)
+
+
+class FakeAcousticModel:
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+
+    def __call__(self, feats: np.ndarray, lengths: Any) -> Any:
+        self.batches.append(len(feats))
+        output = np.stack([_LOGITS] * len(feats))
+        return types.SimpleNamespace(cpu=lambda: types.SimpleNamespace(numpy=lambda: output))
+
+
+class FakeRecognizer:
+    def __init__(self) -> None:
+        self.lm = type("LM", (), {})()
+        self.lm.inventory = FakeInventory()
+        self.lm.compute = self.compute = lambda *a, **k: "a b"
+        self.pm: Any = None
+        self.am: Any = None
+        self.recognize_calls = 0
+
+    def recognize(self, path: str, lang_id: Optional[str] = None, timestamp: bool = False) -> str:
+        self.recognize_calls += 1
+        return "a b"
+
+
+@pytest.mark.unit
+async def test_native_fallback_runs_once_and_masks_are_cached_per_language() -> None:
+    model = FakeRecognizer()
+    backend = AllosaurusBackend(lang="es")
+    backend._attach_model(model)
+    backend._ready = True
+    audio: AudioInput = {"pcm": np.zeros(16000, dtype=np.int16), "sample_rate": 16000, "channels": 1}
+
+    for lang in ("es", "en", "es", "en"):
+        result = await backend.transcribe(audio, lang=lang)
+        assert result["tokens"] == ["a", "b"]
+        assert result["meta"]["decoder"] == "allosaurus-native"
+
+    # Sin pm/am no hay logits: un solo recognize() por audio, sin interceptar lm.compute.
+    assert model.recognize_calls == 4
+    assert model.lm.compute is model.compute
+    assert model.lm.inventory.mask_calls == ["spa", "eng"]
+    assert backend.ctc_labels == ["", "a", "b"]
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+async def test_direct_logits_are_masked_per_language_without_recognize(monkeypatch) -> None:
+    # Frontend y AM directos sin Allosaurus/torch reales.
+    audio_mod = types.ModuleType("allosaurus.audio")
+    audio_mod.Audio = lambda samples, rate: (samples, rate)  # type: ignore[attr-defined]
+    audio_mod.read_audio = lambda path: path  # type: ignore[attr-defined]
+    torch_mod = types.ModuleType("torch")
+    torch_mod.from_numpy = lambda array: array  # type: ignore[attr-defined]
+    torch_mod.tensor = lambda values, dtype=None: list(values)  # type: ignore[attr-defined]
+    torch_mod.long = "long"  # type: ignore[attr-defined]
+    torch_mod.no_grad = contextlib.nullcontext  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "allosaurus", types.ModuleType("allosaurus"))
+    monkeypatch.setitem(sys.modules, "allosaurus.audio", audio_mod)
+    monkeypatch.setitem(sys.modules, "torch", torch_mod)
+
+    model = FakeRecognizer()
+    model.lm.inventory.masked = True
+    model.pm = FakeFrontend()
+    model.am = FakeAcousticModel()
+    backend = AllosaurusBackend(lang="es")
+    backend._attach_model(model)
+    backend._ready = True
+    audio: AudioInput = {"pcm": np.zeros(16000, dtype=np.int16), "sample_rate": 16000, "channels": 1}
+
+    tokens = {}
+    for lang in ("es", "en", "es"):
+        result = await backend.transcribe(audio, lang=lang)
+        assert result["meta"]["decoder"] == "greedy"
+        tokens[lang] = result["tokens"]
+
+    assert tokens == {"es": ["a", "b"], "en": ["a"]}
+    assert model.recognize_calls == 0
+    assert model.pm.calls == 3 and model.am.batches == [1, 1, 1]
+    assert model.lm.inventory.mask_calls == ["spa", "eng"]
+
+    batch = await backend.transcribe_many([audio, audio], lang="en")
+    assert [r["tokens"] for r in batch] == [["a"], ["a"]]
+    assert model.am.batches[-1] == 2 and model.recognize_calls == 0
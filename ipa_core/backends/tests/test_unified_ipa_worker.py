@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pickle
+import sys
+import types
+from typing import Any, Optional
+
+import pytest
+
+from ipa_core.backends import unified_ipa_backend
+from ipa_core.backends.unified_ipa_backend import UnifiedIPABackend
+from ipa_core.kernel.executors import configure_executor, shutdown_executors
+
+
+class FakeRecognizer:
+    def recognize(self, path: str, lang_id: Optional[str] = None) -> str:
+        return f"o l a {lang_id}"
+
+
+@pytest.mark.unit
+@pytest.mark.reliability
+async def test_process_pool_receives_serializable_entry_point(monkeypatch: pytest.MonkeyPatch) -> None:
+    loads: list[str] = []
+
+    def read_recognizer(model_name: str) -> FakeRecognizer:
+        loads.append(model_name)
+        return FakeRecognizer()
+
+    app = types.ModuleType("allosaurus.app")
+    app.read_recognizer = read_recognizer  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "allosaurus", types.ModuleType("allosaurus"))
+    monkeypatch.setitem(sys.modules, "allosaurus.app", app)
+
+    submitted: list[Any] = []
+
+    async def fake_run(fn: Any, *args: Any) -> Any:
+        pickle.dumps((fn, args))  # lo que recibiría un ProcessPoolExecutor
+        submitted.append(fn)
+        return fn(*args)
+
+    shutdown_executors()
+    try:
+        pool = configure_executor("asr", max_workers=1, mode="process")
+        monkeypatch.setattr(pool, "run", fake_run)
+        backend = UnifiedIPABackend(engine="allosaurus", allosaurus_lang="uni-test")
+        backend._backend = object()  # no serializable: no debe viajar al worker
+        backend._ready = True
+
+        first = await backend._recognize_allosaurus("a.wav", "spa", "es")
+        second = await backend._recognize_allosaurus("b.wav", "spa", "es")
+    finally:
+        shutdown_executors()
+
+    assert submitted == [unified_ipa_backend._recognize_in_worker] * 2
+    assert first["tokens"] == second["tokens"] == ["o", "l", "a", "spa"]
+    assert loads == ["uni-test"]  # un reconocedor por proceso trabajador
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import contextlib
+import sys
+import threading
+import types
+from typing import Any
+
+import numpy as np
+import pytest
+
+from ipa_core.audio.pcm import pcm_input
+from ipa_core.backends.wav2vec2_backend import Wav2Vec2Backend
+
+
+class FakeTensor:
+    def __init__(self, value: Any) -> None:
+        self.value = np.asarray(value)
+
+    def to(self, device: str) -> "FakeTensor":
+        return self
+
+
+class FakeProcessor:
+    def __init__(self, *, return_attention_mask: bool) -> None:
+        self.feature_extractor = types.SimpleNamespace(return_attention_mask=return_attention_mask)
+        self.calls: list[dict[str, Any]] = []
+
+    def __call__(self, waveforms: Any, **kwargs: Any) -> Any:
+        self.calls.append(kwargs)
+        if not kwargs.get("padding"):
+            return types.SimpleNamespace(input_values=FakeTensor([waveforms]))
+        width = max(len(w) for w in waveforms)
+        values = np.stack([np.pad(w, (0, width - len(w))) for w in waveforms])
+        mask = np.stack([np.arange(width) < len(w) for w in waveforms]).astype(np.int64)
+        return types.SimpleNamespace(input_values=FakeTensor(values), attention_mask=FakeTensor(mask))
+
+
+class FakeModel:
+    """Un frame de logits por muestra: basta para comprobar el recorte por audio."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self.threads: list[str] = []
+
+    def __call__(self, values: FakeTensor, **kwargs: Any) -> Any:
+        self.calls.append(kwargs)
+        self.threads.append(threading.current_thread().name)
+        return types.SimpleNamespace(logits=values.value[..., None])
+
+    def _get_feat_extract_output_lengths(self, lengths: Any) -> Any:
+        return lengths
+
+
+@pytest.fixture
+def fake_torch(monkeypatch: pytest.MonkeyPatch) -> None:
+    torch = types.SimpleNamespace(no_grad=contextlib.nullcontext, tensor=np.asarray)
+    monkeypatch.setitem(sys.modules, "torch", torch)
+
+
+def _backend(*, return_attention_mask: bool) -> tuple[Wav2Vec2Backend, FakeModel, FakeProcessor]:
+    backend = Wav2Vec2Backend(model_name="fake/wav2vec2-ipa")
+    model, processor = FakeModel(), FakeProcessor(return_attention_mask=return_attention_mask)
+    backend._model, backend._processor, backend._ready = model, processor, True
+    # Tokens = número de frames decodificados, para comparar con transcribe().
+    backend._result_from_logits = lambda logits: {"tokens": ["x"] * logits.shape[1]}  # type: ignore[method-assign]
+    return backend, model, processor
+
+
+def _audios() -> list[Any]:
+    return [pcm_input(np.full(n, 1000, dtype=np.int16)) for n in (4, 6)]
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+async def test_batch_uses_attention_mask_off_the_event_loop(fake_torch) -> None:
+    backend, model, processor = _backend(return_attention_mask=True)
+
+    batch = await backend.transcribe_many(_audios())
+
+    assert [len(r["tokens"]) for r in batch] == [4, 6]
+    assert len(model.calls) == 1 and "attention_mask" in model.calls[0]
+    assert processor.calls[0]["padding"] is True
+    assert model.threads[0].startswith("pronunciapa-asr")
+
+
+@pytest.mark.unit
+@pytest.mark.functional
+async def test_models_without_attention_mask_are_not_padded(fake_torch) -> None:
+    backend, model, processor = _backend(return_attention_mask=False)
+
+    batch = await backend.transcribe_many(_audios())
+    single = [await backend.transcribe(audio) for audio in _audios()]
+
+    assert batch == single
+    assert all("attention_mask" not in call for call in model.calls)
+    assert all(not call.get("padding") for call in processor.calls)
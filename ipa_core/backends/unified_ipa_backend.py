@@ -14,6 +14,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+from ipa_core.audio.pcm import audio_file, is_canonical_pcm, pcm_samples
+from ipa_core.kernel.executors import get_executor, worker_resource
 from ipa_core.plugins.base import BasePlugin
 from ipa_core.types import ASRResult, AudioInput
 
@@ -49,6 +51,33 @@ ALLOSAURUS_LANG_MAP: Dict[str, str] = {
 }
 
 
+def _recognize_with(recognizer: Any, audio_path: str, allosaurus_lang: Optional[str]) -> Any:
+    # Reconocer (compat: signature posicional o keyword lang_id).
+    if allosaurus_lang:
+        try:
+            return recognizer.recognize(audio_path, allosaurus_lang)
+        except TypeError as first_error:
+            try:
+                return recognizer.recognize(audio_path, lang_id=allosaurus_lang)
+            except TypeError:
+                raise first_error
+    return recognizer.recognize(audio_path)
+
+
+def _recognize_in_worker(model_name: str, audio_path: str, allosaurus_lang: Optional[str]) -> Any:
+    """Punto de entrada serializable del pool ``asr`` en modo proceso.
+
+    El reconocedor se carga una vez por proceso trabajador.
+    """
+    def load() -> Any:
+        from allosaurus.app import read_recognizer
+
+        return read_recognizer(model_name)
+
+    recognizer = worker_resource(("unified-allosaurus", model_name), load)
+    return _recognize_with(recognizer, audio_path, allosaurus_lang)
+
+
 class UnifiedIPABackend(BasePlugin):
     """Backend unificado que soporta múltiples engines IPA.
     
@@ -237,19 +266,24 @@ class UnifiedIPABackend(BasePlugin):
         lang: Optional[str]
     ) -> ASRResult:
         """Transcribir usando Allosaurus."""
+        requested_lang = self._normalize_lang(lang) or self._default_lang
+        allosaurus_lang = self._resolve_allosaurus_lang(requested_lang)
+
+        # Allosaurus (app) sólo lee archivos: el PCM en memoria se materializa.
+        if is_canonical_pcm(audio):
+            with audio_file(audio) as wav_path:
+                return await self._recognize_allosaurus(wav_path, allosaurus_lang, requested_lang)
+
         # Obtener path del audio
         if isinstance(audio, dict) and "path" in audio:
             audio_path = audio["path"]
         else:
             raise ValueError("Allosaurus requires audio with 'path' key")
 
-        requested_lang = self._normalize_lang(lang) or self._default_lang
-        allosaurus_lang = self._resolve_allosaurus_lang(requested_lang)
-
         # Garantizar WAV PCM limpio: Flutter/Windows a veces genera WAVs con
         # sub-chunks extra (LIST/INFO) que rompen wave.open() de allosaurus.
         from ipa_core.audio.files import ensure_wav
-        clean_path, is_tmp = ensure_wav(audio_path)
+        clean_path, is_tmp = await get_executor("audio").run(ensure_wav, audio_path)
         try:
             return await self._recognize_allosaurus(clean_path, allosaurus_lang, requested_lang)
         finally:
@@ -266,18 +300,14 @@ class UnifiedIPABackend(BasePlugin):
         allosaurus_lang: Optional[str],
         requested_lang: Optional[str],
     ) -> "ASRResult":
-        # Reconocer (compat: signature posicional o keyword lang_id).
-        if allosaurus_lang:
-            try:
-                result = self._backend.recognize(audio_path, allosaurus_lang)
-            except TypeError as first_error:
-                try:
-                    result = self._backend.recognize(audio_path, lang_id=allosaurus_lang)
-                except TypeError:
-                    raise first_error
+        pool = get_executor("asr")
+        if pool.is_process:
+            result = await pool.run(
+                _recognize_in_worker, self._allosaurus_lang, audio_path, allosaurus_lang
+            )
         else:
-            result = self._backend.recognize(audio_path)
-        
+            result = await pool.run(_recognize_with, self._backend, audio_path, allosaurus_lang)
+
         # Parsear tokens (Allosaurus devuelve "f o n e m a s")
         tokens = result.strip().split() if result else []
         
@@ -347,6 +377,8 @@ class UnifiedIPABackend(BasePlugin):
         """Cargar audio desde diferentes formatos."""
         import numpy as np
         
+        if is_canonical_pcm(audio):
+            return pcm_samples(audio).astype(np.float32) / 32768.0
         if isinstance(audio, dict) and "path" in audio:
             path = audio["path"]
             try:
@@ -13,6 +13,7 @@ from typing import Any, List, Optional, Tuple, TYPE_CHECKING
 import numpy as np
 
 from ipa_core.errors import NotReadyError, ValidationError
+from ipa_core.kernel.executors import get_executor
 from ipa_core.plugins.base import BasePlugin
 
 if TYPE_CHECKING:
@@ -188,8 +189,7 @@ class SileroVAD(BasePlugin):
                 min_silence_duration_ms=int(self._min_silence_duration * 1000),
             )
         
-        loop = asyncio.get_event_loop()
-        speech_timestamps = await loop.run_in_executor(None, run_vad)
+        speech_timestamps = await get_executor("vad").run(run_vad)
         
         # Convertir a SpeechSegments
         segments = []
@@ -10,6 +10,7 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from ipa_core.audio.pcm import has_pcm, pcm_samples
 from ipa_core.plugins.base import BasePlugin
 from ipa_core.ports.asr import ASRBackend, ASRResult
 from ipa_core.types import AudioInput
@@ -146,6 +147,8 @@ class VoskBackend(BasePlugin, ASRBackend):
         """Cargar audio como bytes."""
         import wave
         
+        if has_pcm(audio):
+            return pcm_samples(audio).tobytes()
         if isinstance(audio, dict) and "path" in audio:
             path = audio["path"]
             with wave.open(path, "rb") as wf:
@@ -2,6 +2,14 @@
 
 Este backend permite reconocimiento fonético sin conexión a internet,
 usando modelos de HuggingFace Transformers cargados localmente.
+
+``transcribe_many`` procesa varios audios en un solo forward pass (con
+padding y ``attention_mask``); lo usa
+:class:`ipa_core.pipeline.scheduler.InferenceScheduler`.  Los modelos cuyo
+feature extractor no usa ``attention_mask`` (p. ej. wav2vec2-base, con
+group norm) no admiten padding sin cambiar la salida: ahí cada audio tiene
+su propio forward.  La inferencia corre en el pool ``asr``
+(:mod:`ipa_core.kernel.executors`), fuera del event loop.
 """
 from __future__ import annotations
 
@@ -9,6 +17,8 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ipa_core.audio.pcm import is_canonical_pcm, pcm_samples
+from ipa_core.kernel.executors import get_executor, worker_resource
 from ipa_core.plugins.base import BasePlugin
 from ipa_core.ports.asr import ASRBackend, ASRResult
 from ipa_core.types import AudioInput
@@ -25,6 +35,21 @@ MODEL_REGISTRY: Dict[str, str] = {
 }
 
 
+def _worker_backend(model_name: str, device: str, cache_dir: Optional[Path]) -> "Wav2Vec2Backend":
+    """Backend con el modelo cargado, uno por proceso trabajador."""
+    def load() -> Wav2Vec2Backend:
+        backend = Wav2Vec2Backend(model_name=model_name, device=device, cache_dir=cache_dir)
+        backend._load_model()
+        return backend
+
+    return worker_resource(("wav2vec2", model_name, device, cache_dir), load)
+
+
+def _run_in_worker(model_name: str, device: str, cache_dir: Optional[Path], method: str, *args: Any) -> Any:
+    """Punto de entrada serializable del pool ``asr`` en modo proceso."""
+    return getattr(_worker_backend(model_name, device, cache_dir), method)(*args)
+
+
 class Wav2Vec2Backend(BasePlugin, ASRBackend):
     """Backend de ASR usando Wav2Vec2.
     
@@ -68,8 +93,8 @@ class Wav2Vec2Backend(BasePlugin, ASRBackend):
         self._device = device
         self._cache_dir = cache_dir
         self._force_ipa = force_ipa
-        self._model = None
-        self._processor = None
+        self._model: Optional[Any] = None
+        self._processor: Optional[Any] = None
         self._ready = False
         
         # Detectar si el modelo es IPA basado en nombre
@@ -85,8 +110,8 @@ class Wav2Vec2Backend(BasePlugin, ASRBackend):
     async def setup(self) -> None:
         """Cargar modelo (requiere conexión solo la primera vez)."""
         try:
-            from transformers import Wav2Vec2ForCTC, Wav2Vec2Processor
-            import torch
+            import transformers  # noqa: F401
+            import torch  # noqa: F401
         except ImportError as e:
             raise ImportError(
                 "Wav2Vec2Backend requires 'transformers' and 'torch'. "
@@ -94,7 +119,12 @@ class Wav2Vec2Backend(BasePlugin, ASRBackend):
             ) from e
         
         logger.info(f"Loading Wav2Vec2 model: {self._model_name}")
-        
+        self._load_model()
+        logger.info(f"Wav2Vec2 loaded on {self._device}")
+
+    def _load_model(self) -> None:
+        from transformers import Wav2Vec2ForCTC, Wav2Vec2Processor
+
         self._processor = Wav2Vec2Processor.from_pretrained(
             self._model_name,
             cache_dir=self._cache_dir,
@@ -105,9 +135,7 @@ class Wav2Vec2Backend(BasePlugin, ASRBackend):
         )
         self._model.to(self._device)
         self._model.eval()
-        
         self._ready = True
-        logger.info(f"Wav2Vec2 loaded on {self._device}")
     
     async def teardown(self) -> None:
         """Liberar modelo de memoria."""
@@ -136,32 +164,104 @@ class Wav2Vec2Backend(BasePlugin, ASRBackend):
         ASRResult
             Resultado con tokens fonéticos.
         """
-        if not self._ready:
+        if not self._ready or self._model is None or self._processor is None:
             raise RuntimeError("Wav2Vec2Backend not initialized. Call setup() first.")
-        
+
+        return await self._offload("_transcribe_waveform", self._load_audio(audio))
+
+    async def transcribe_many(
+        self,
+        audios: List[AudioInput],
+        *,
+        lang: Optional[str] = None,
+        **kw: Any,
+    ) -> List[ASRResult]:
+        """Transcribir varios audios en un solo lote con padding.
+
+        Los logits de cada audio se recortan a sus frames reales antes de
+        decodificar, así el resultado es el mismo que con :meth:`transcribe`.
+        Si el modelo no usa ``attention_mask``, cada audio va por separado.
+        """
+        if not self._ready or self._model is None or self._processor is None:
+            raise RuntimeError("Wav2Vec2Backend not initialized. Call setup() first.")
+
+        waveforms = [self._load_audio(audio) for audio in audios]
+        return await self._offload("_transcribe_batch", waveforms)
+
+    async def _offload(self, method: str, *args: Any) -> Any:
+        """Ejecutar un método síncrono de inferencia en el pool ``asr``.
+
+        En modo proceso el método corre sobre el backend del worker (el
+        modelo se carga una vez por proceso).
+        """
+        pool = get_executor("asr")
+        if pool.is_process:
+            return await pool.run(
+                _run_in_worker, self._model_name, self._device, self._cache_dir, method, *args
+            )
+        return await pool.run(getattr(self, method), *args)
+
+    def _uses_attention_mask(self) -> bool:
+        extractor = getattr(self._processor, "feature_extractor", None)
+        return bool(getattr(extractor, "return_attention_mask", False))
+
+    def _transcribe_waveform(self, waveform: Any) -> ASRResult:
         import torch
-        import numpy as np
-        
-        # Cargar audio
-        waveform = self._load_audio(audio)
-        
-        # Preprocesar
+
+        if self._model is None or self._processor is None:
+            raise RuntimeError("Wav2Vec2Backend not initialized. Call setup() first.")
         inputs = self._processor(
             waveform,
             sampling_rate=16000,
             return_tensors="pt",
         )
-        
-        # Inference
-        import torch.nn.functional as F
+        with torch.no_grad():
+            logits = self._model(inputs.input_values.to(self._device)).logits
+        return self._result_from_logits(logits)
 
+    def _transcribe_batch(self, waveforms: List[Any]) -> List[ASRResult]:
+        if self._model is None or self._processor is None:
+            raise RuntimeError("Wav2Vec2Backend not initialized. Call setup() first.")
+        # Sin attention_mask (group norm) el padding cambia las activaciones
+        # de todo el audio: un forward por audio conserva el resultado.
+        if len(waveforms) == 1 or not self._uses_attention_mask():
+            return [self._transcribe_waveform(w) for w in waveforms]
+
+        import torch
+
+        inputs = self._processor(
+            waveforms,
+            sampling_rate=16000,
+            return_tensors="pt",
+            padding=True,
+            return_attention_mask=True,
+        )
         with torch.no_grad():
-            inputs = inputs.input_values.to(self._device)
-            logits = self._model(inputs).logits
+            logits = self._model(
+                inputs.input_values.to(self._device),
+                attention_mask=inputs.attention_mask.to(self._device),
+            ).logits
+
+        lengths = self._model._get_feat_extract_output_lengths(
+            torch.tensor([len(w) for w in waveforms])
+        )
+        return [
+            self._result_from_logits(logits[i : i + 1, : int(lengths[i])])
+            for i in range(len(waveforms))
+        ]
+
+    def _result_from_logits(self, logits: Any) -> ASRResult:
+        """Decodificar logits ``[1, T, vocab]`` a un ``ASRResult``."""
+        import torch
+        import torch.nn.functional as F
+
+        processor = self._processor
+        if processor is None:
+            raise RuntimeError("Wav2Vec2Backend not initialized. Call setup() first.")
 
         # Decodificar
         predicted_ids = torch.argmax(logits, dim=-1)
-        transcription = self._processor.batch_decode(predicted_ids)[0]
+        transcription = processor.batch_decode(predicted_ids)[0]
 
         # Tokenizar resultado
         tokens = list(transcription.replace(" ", ""))
@@ -170,7 +270,7 @@ class Wav2Vec2Backend(BasePlugin, ASRBackend):
         # y filtrar frames de blank (CTC padding token)
         probs = F.softmax(logits, dim=-1)          # [1, T, vocab]
         max_probs = probs.max(dim=-1).values[0]    # [T]
-        blank_id = self._processor.tokenizer.pad_token_id
+        blank_id = processor.tokenizer.pad_token_id
         non_blank_mask = predicted_ids[0] != blank_id
         non_blank_probs = max_probs[non_blank_mask].tolist()
 
@@ -202,6 +302,10 @@ class Wav2Vec2Backend(BasePlugin, ASRBackend):
         """Cargar audio desde diferentes formatos."""
         import numpy as np
         
+        # PCM 16 kHz mono en memoria: sin lectura de disco
+        if is_canonical_pcm(audio):
+            return pcm_samples(audio).astype(np.float32) / 32768.0
+
         # Si es dict con path
         if isinstance(audio, dict) and "path" in audio:
             path = audio["path"]
@@ -7,7 +7,7 @@ from __future__ import annotations
 from typing import Optional, TYPE_CHECKING
 
 from ipa_core.compare.levenshtein import LevenshteinComparator
-from ipa_core.compare.articulatory import articulatory_distance
+from ipa_core.compare.distance_matrix import get_distance_matrix
 from ipa_core.phonology.representation import (
     PhonologicalRepresentation,
     ComparisonResult,
@@ -126,7 +126,7 @@ async def compare_representations(
                         # Scale by articulatory distance so phonetically similar
                         # substitutions contribute less than completely different ones.
                         # Apply error_weights.articulatory scalar if provided.
-                        art_dist = articulatory_distance(ref, hyp)
+                        art_dist = get_distance_matrix().distance(ref, hyp)
                         weighted_errors += art_dist * art_scalar * profile.phoneme_error_weight
                     else:
                         weighted_errors += profile.phoneme_error_weight
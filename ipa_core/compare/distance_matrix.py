@@ -0,0 +1,291 @@
+"""Matriz precomputada de distancias fonéticas con cache en disco.
+
+Las métricas articulatorias (:func:`ipa_core.compare.articulatory.articulatory_distance`
+y la métrica categórica del reporte de errores) re-derivan rasgos en cada
+llamada.  :class:`PhoneDistanceMatrix` las evalúa una sola vez para todos
+los pares de un inventario y guarda el resultado como un array denso
+indexado por IDs de fonema internados; en el camino caliente una distancia
+es una indexación de array.
+
+La matriz se persiste en ``<cache_dir>/<métrica>-v<versión>-<hash>.npy`` y
+se abre con ``mmap_mode="r"``, por lo que varios procesos comparten las
+mismas páginas.  El nombre incluye la versión del formato/métrica y un hash
+de la lista de fonemas: cambiar cualquiera de los dos genera otro archivo.
+
+Variables de entorno
+--------------------
+``PRONUNCIAPA_DISTANCE_CACHE_DIR``
+    Directorio del cache (default: ``~/.cache/pronunciapa/distance``).
+    Una cadena vacía desactiva la persistencia (la matriz vive en memoria).
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Incrementar al cambiar cualquier métrica o el formato del archivo.
+MATRIX_VERSION = 1
+
+DistanceFn = Callable[[str, str], float]
+
+
+def _articulatory_metric() -> Tuple[DistanceFn, Iterable[str]]:
+    from ipa_core.compare.articulatory import (
+        CONSONANT_FEATURES,
+        VOWEL_FEATURES,
+        articulatory_distance,
+    )
+
+    return articulatory_distance, [*CONSONANT_FEATURES, *VOWEL_FEATURES]
+
+
+def _categorical_metric() -> Tuple[DistanceFn, Iterable[str]]:
+    from ipa_core.services import error_report
+
+    return (
+        error_report.categorical_distance,
+        [*error_report.CONSONANT_FEATURES, *error_report.VOWEL_FEATURES],
+    )
+
+
+# Métrica -> (función de distancia, fonemas cubiertos por defecto).
+_METRICS: Dict[str, Callable[[], Tuple[DistanceFn, Iterable[str]]]] = {
+    "articulatory": _articulatory_metric,
+    "categorical": _categorical_metric,
+}
+
+
+def _resolve_metric(metric: str) -> Tuple[DistanceFn, Iterable[str]]:
+    try:
+        return _METRICS[metric]()
+    except KeyError:
+        raise ValueError(f"Unknown distance metric: {metric}") from None
+
+
+@lru_cache(maxsize=65536)
+def _fallback_distance(metric: str, phone_a: str, phone_b: str) -> float:
+    """Distancia para pares fuera de la matriz (fonemas no internados)."""
+    fn, _ = _resolve_metric(metric)
+    return float(fn(phone_a, phone_b))
+
+
+def default_cache_dir() -> Optional[Path]:
+    """Directorio del cache en disco, o None si está desactivado."""
+    configured = os.environ.get("PRONUNCIAPA_DISTANCE_CACHE_DIR")
+    if configured is not None:
+        return Path(configured).expanduser() if configured.strip() else None
+    return Path.home() / ".cache" / "pronunciapa" / "distance"
+
+
+class PhoneDistanceMatrix:
+    """Distancias fonema×fonema precomputadas para un inventario.
+
+    Parámetros
+    ----------
+    phones : Sequence[str]
+        Fonemas internados; el ID de cada uno es su posición.
+    matrix : np.ndarray
+        Array ``len(phones) × len(phones)`` con ``matrix[a, b] = d(a, b)``.
+    metric : str
+        Nombre de la métrica (``"articulatory"`` o ``"categorical"``).
+
+    Los pares con algún fonema fuera del inventario se calculan con la
+    métrica original (memoizada), así que el resultado es siempre el mismo
+    que llamar a la función de distancia directamente.
+    """
+
+    def __init__(self, phones: Sequence[str], matrix: np.ndarray, metric: str) -> None:
+        if matrix.shape != (len(phones), len(phones)):
+            raise ValueError(
+                f"Matrix shape {matrix.shape} does not match {len(phones)} phones"
+            )
+        self.phones: Tuple[str, ...] = tuple(phones)
+        self.index: Dict[str, int] = {phone: i for i, phone in enumerate(self.phones)}
+        self.matrix = matrix
+        self.metric = metric
+
+    # ------------------------------------------------------------------
+    # Construcción
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, phones: Iterable[str], *, metric: str = "articulatory") -> "PhoneDistanceMatrix":
+        """Evalúa la métrica para todos los pares del inventario."""
+        fn, _ = _resolve_metric(metric)
+        ordered = _canonical_phones(phones)
+        size = len(ordered)
+        # float64: los costos derivados deben ser bit a bit iguales a los de
+        # la métrica original para no alterar desempates del backtrace.
+        matrix = np.zeros((size, size), dtype=np.float64)
+        for a, phone_a in enumerate(ordered):
+            row = matrix[a]
+            for b, phone_b in enumerate(ordered):
+                if a != b:
+                    row[b] = fn(phone_a, phone_b)
+        return cls(ordered, matrix, metric)
+
+    @classmethod
+    def load_or_build(
+        cls,
+        phones: Iterable[str],
+        *,
+        metric: str = "articulatory",
+        cache_dir: Optional[Path] = None,
+    ) -> "PhoneDistanceMatrix":
+        """Abre la matriz desde el cache (memory-mapped) o la construye y la guarda."""
+        ordered = _canonical_phones(phones)
+        if cache_dir is None:
+            return cls.build(ordered, metric=metric)
+
+        path = Path(cache_dir) / cache_filename(ordered, metric)
+        if path.exists():
+            try:
+                matrix = np.load(path, mmap_mode="r", allow_pickle=False)
+                return cls(ordered, matrix, metric)
+            except (OSError, ValueError) as exc:
+                logger.warning("Ignoring corrupt distance matrix cache %s: %s", path, exc)
+
+        built = cls.build(ordered, metric=metric)
+        try:
+            _atomic_save(path, built.matrix)
+            built.matrix = np.load(path, mmap_mode="r", allow_pickle=False)
+        except OSError as exc:
+            logger.warning("Could not persist distance matrix to %s: %s", path, exc)
+        return built
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def __contains__(self, phone: object) -> bool:
+        return phone in self.index
+
+    def __len__(self) -> int:
+        return len(self.phones)
+
+    def distance(self, phone_a: str, phone_b: str) -> float:
+        """Distancia entre dos fonemas (indexación si ambos están internados)."""
+        a = self.index.get(phone_a)
+        b = self.index.get(phone_b)
+        if a is not None and b is not None:
+            return float(self.matrix[a, b])
+        if phone_a == phone_b:
+            return 0.0
+        return _fallback_distance(self.metric, phone_a, phone_b)
+
+    def pairwise(self, phones_a: Sequence[str], phones_b: Sequence[str]) -> np.ndarray:
+        """Submatriz ``len(phones_a) × len(phones_b)`` de distancias."""
+        ids_a = np.fromiter((self.index.get(p, -1) for p in phones_a), dtype=np.intp, count=len(phones_a))
+        ids_b = np.fromiter((self.index.get(p, -1) for p in phones_b), dtype=np.intp, count=len(phones_b))
+        out = np.asarray(self.matrix[np.ix_(ids_a, ids_b)], dtype=np.float64)
+        missing_a = np.flatnonzero(ids_a < 0)
+        missing_b = np.flatnonzero(ids_b < 0)
+        if missing_a.size or missing_b.size:
+            for a in map(int, missing_a):
+                for b in range(len(phones_b)):
+                    out[a, b] = self.distance(phones_a[a], phones_b[b])
+            for b in map(int, missing_b):
+                for a in range(len(phones_a)):
+                    out[a, b] = self.distance(phones_a[a], phones_b[b])
+        return out
+
+
+def _canonical_phones(phones: Iterable[str]) -> Tuple[str, ...]:
+    """Orden estable (y sin duplicados) para que el hash del cache sea determinista."""
+    return tuple(sorted({p for p in phones if p}))
+
+
+def cache_filename(phones: Sequence[str], metric: str) -> str:
+    """Nombre versionado del archivo de cache para un inventario y métrica."""
+    digest = hashlib.sha1("\x1f".join(phones).encode("utf-8")).hexdigest()[:16]
+    return f"{metric}-v{MATRIX_VERSION}-{digest}.npy"
+
+
+def _atomic_save(path: Path, matrix: np.ndarray) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".npy")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            np.save(handle, matrix, allow_pickle=False)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+# ----------------------------------------------------------------------
+# Matrices del proceso
+# ----------------------------------------------------------------------
+
+_matrices: Dict[str, PhoneDistanceMatrix] = {}
+_lock = threading.Lock()
+
+
+def get_distance_matrix(metric: str = "articulatory") -> PhoneDistanceMatrix:
+    """Matriz compartida del proceso para la métrica indicada.
+
+    Cubre los fonemas con rasgos conocidos por la métrica más los de los
+    inventarios registrados con :func:`register_inventory`.
+    """
+    matrix = _matrices.get(metric)
+    if matrix is None:
+        with _lock:
+            matrix = _matrices.get(metric)
+            if matrix is None:
+                _, phones = _resolve_metric(metric)
+                matrix = PhoneDistanceMatrix.load_or_build(
+                    phones, metric=metric, cache_dir=default_cache_dir()
+                )
+                _matrices[metric] = matrix
+    return matrix
+
+
+def register_inventory(phones: Iterable[str]) -> None:
+    """Amplía las matrices del proceso con los fonemas de un inventario.
+
+    Se llama una vez por language pack al crear el kernel.  Los valores no
+    cambian (la métrica es la misma); sólo pasan a resolverse por
+    indexación en lugar de por el respaldo memoizado.
+    """
+    extra = set(phones)
+    with _lock:
+        for metric in _METRICS:
+            current = _matrices.get(metric)
+            if current is not None and extra.issubset(current.index):
+                continue
+            _, base = _resolve_metric(metric)
+            covered = set(base) | extra | set(current.phones if current else ())
+            _matrices[metric] = PhoneDistanceMatrix.load_or_build(
+                covered, metric=metric, cache_dir=default_cache_dir()
+            )
+
+
+def clear_distance_matrices() -> None:
+    """Olvida las matrices del proceso (los archivos en disco se conservan)."""
+    with _lock:
+        _matrices.clear()
+    _fallback_distance.cache_clear()
+
+
+__all__ = [
+    "MATRIX_VERSION",
+    "PhoneDistanceMatrix",
+    "cache_filename",
+    "clear_distance_matrices",
+    "default_cache_dir",
+    "get_distance_matrix",
+    "register_inventory",
+]
@@ -56,14 +56,12 @@ class LevenshteinComparator(BasePlugin):
         if not self._use_articulatory:
             return base_cost
         
-        # Import diferido para evitar dependencia circular
-        from ipa_core.compare.articulatory import articulatory_substitution_cost
-        return articulatory_substitution_cost(
-            ref_token,
-            hyp_token,
-            base_cost=base_cost,
-            min_cost=self._articulatory_min_cost,
-        )
+        # Misma escala que articulatory_substitution_cost, pero la distancia
+        # sale de la matriz precomputada (indexación en vez de re-derivar rasgos).
+        from ipa_core.compare.distance_matrix import get_distance_matrix
+        distance = get_distance_matrix().distance(ref_token, hyp_token)
+        min_cost = self._articulatory_min_cost
+        return min_cost + (base_cost - min_cost) * distance
 
     async def compare(
         self,
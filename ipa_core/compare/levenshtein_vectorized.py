@@ -0,0 +1,239 @@
+"""Motor vectorizado para el comparador Levenshtein.
+
+Produce exactamente las mismas ``ops``/``alignment``/``per`` que
+:class:`~ipa_core.compare.levenshtein.LevenshteinComparator`, pero sin el
+doble bucle Python por celda:
+
+- Los tokens se codifican a enteros una sola vez y la matriz n×m de costos
+  de sustitución se arma indexando la :class:`PhoneDistanceMatrix`
+  precomputada del proceso.
+- Con pesos arbitrarios (o costos articulatorios) la DP se llena por
+  anti-diagonales con NumPy: cada celda de la diagonal ``i + j = d`` sólo
+  depende de las diagonales ``d-1`` y ``d-2``.
+- Con pesos unitarios y sin costo articulatorio se usa el algoritmo
+  bit-paralelo de Myers/Hyyrö sobre enteros Python (bitsets de ancho
+  arbitrario); se guardan los vectores verticales de cada columna para
+  recuperar cualquier celda durante el backtrace.
+
+El backtrace recalcula la decisión de cada celda del camino con las mismas
+comparaciones y el mismo orden de desempate (eq > sub > ins > del) que el
+motor de referencia, por lo que la alineación es idéntica.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Literal, Optional
+
+import numpy as np
+
+from ipa_core.compare.distance_matrix import get_distance_matrix
+from ipa_core.compare.levenshtein import LevenshteinComparator, _Weights
+from ipa_core.types import CompareResult, CompareWeights, EditOp, Token, TokenSeq
+
+# Tamaño mínimo (n*m) a partir del cual compensa vectorizar con NumPy;
+# por debajo, el overhead de crear arrays supera al bucle Python.
+_NUMPY_MIN_CELLS = 64
+
+try:
+    _popcount: Callable[[int], int] = int.bit_count
+except AttributeError:  # pragma: no cover - Python < 3.10
+    def _popcount(value: int) -> int:
+        return bin(value).count("1")
+
+
+class VectorizedLevenshteinComparator(LevenshteinComparator):
+    """Comparador Levenshtein con DP vectorizada (NumPy) y ruta bit-paralela.
+
+    Acepta los mismos parámetros que :class:`LevenshteinComparator` y
+    devuelve el mismo ``CompareResult``; ``meta.engine`` indica qué motor
+    se usó (``"bitparallel"``, ``"numpy"`` o ``"python"``).
+    """
+
+    def _sub_cost_table(
+        self, vocab: list[str], w: _Weights
+    ) -> np.ndarray:
+        """Tabla V×V de costos de sustitución para el vocabulario del par."""
+        size = len(vocab)
+        if not self._use_articulatory:
+            return np.full((size, size), w.sub, dtype=np.float64)
+        distances = get_distance_matrix().pairwise(vocab, vocab)
+        min_cost = self._articulatory_min_cost
+        return min_cost + (w.sub - min_cost) * distances
+
+    async def compare(
+        self,
+        ref: TokenSeq,
+        hyp: TokenSeq,
+        *,
+        weights: Optional[CompareWeights] = None,
+        **kw: Any,
+    ) -> CompareResult:
+        """Comparación asíncrona de secuencias IPA."""
+        ref_tokens = list(ref)
+        hyp_tokens = list(hyp)
+        if not ref_tokens and not hyp_tokens:
+            raise ValueError("Cannot compare empty reference and hypothesis sequences")
+        w = _Weights.from_dict(weights)
+        n, m = len(ref_tokens), len(hyp_tokens)
+
+        unit = w.sub == 1.0 and w.ins == 1.0 and w.del_ == 1.0
+        if unit and not self._use_articulatory and n > 0:
+            engine = "bitparallel"
+            cell = _bitparallel_cells(ref_tokens, hyp_tokens)
+
+            def sub_cost(i: int, j: int) -> float:
+                return 1.0
+        elif n * m >= _NUMPY_MIN_CELLS:
+            engine = "numpy"
+            vocab_index: dict[str, int] = {}
+            ref_ids = np.fromiter(
+                (vocab_index.setdefault(t, len(vocab_index)) for t in ref_tokens),
+                dtype=np.intp, count=n,
+            )
+            hyp_ids = np.fromiter(
+                (vocab_index.setdefault(t, len(vocab_index)) for t in hyp_tokens),
+                dtype=np.intp, count=m,
+            )
+            table = self._sub_cost_table(list(vocab_index), w)
+            sub_matrix = table[ref_ids[:, None], hyp_ids[None, :]]
+            dp = _fill_antidiagonal(ref_ids, hyp_ids, sub_matrix, w)
+
+            def cell(i: int, j: int) -> float:
+                return float(dp[i, j])
+
+            def sub_cost(i: int, j: int) -> float:
+                return float(sub_matrix[i, j])
+        else:
+            result = await super().compare(ref_tokens, hyp_tokens, weights=weights, **kw)
+            result["meta"]["engine"] = "python"
+            return result
+
+        ops, alignment = _backtrace(ref_tokens, hyp_tokens, cell, sub_cost, w)
+        distance = cell(n, m)
+        per = self._calculate_per(distance, n, m)
+        return {
+            "per": per,
+            "ops": ops,
+            "alignment": alignment,
+            "meta": {
+                "distance": distance,
+                "use_articulatory": self._use_articulatory,
+                "engine": engine,
+            },
+        }
+
+
+def _fill_antidiagonal(
+    ref_ids: np.ndarray,
+    hyp_ids: np.ndarray,
+    sub_matrix: np.ndarray,
+    w: _Weights,
+) -> np.ndarray:
+    """Llena la matriz DP completa recorriendo anti-diagonales."""
+    n, m = len(ref_ids), len(hyp_ids)
+    dp = np.empty((n + 1, m + 1), dtype=np.float64)
+    # Mismos valores de borde que el motor de referencia (i * del_, j * ins).
+    dp[:, 0] = np.arange(n + 1, dtype=np.float64) * w.del_
+    dp[0, :] = np.arange(m + 1, dtype=np.float64) * w.ins
+    equal = ref_ids[:, None] == hyp_ids[None, :]
+
+    for d in range(2, n + m + 1):
+        i_lo = max(1, d - m)
+        i_hi = min(n, d - 1)
+        if i_lo > i_hi:
+            continue
+        i = np.arange(i_lo, i_hi + 1)
+        j = d - i
+        diag = dp[i - 1, j - 1]
+        best = np.minimum(
+            np.minimum(diag + sub_matrix[i - 1, j - 1], dp[i, j - 1] + w.ins),
+            dp[i - 1, j] + w.del_,
+        )
+        dp[i, j] = np.where(equal[i - 1, j - 1], diag, best)
+    return dp
+
+
+def _bitparallel_cells(ref_tokens: list[str], hyp_tokens: list[str]) -> Callable[[int, int], float]:
+    """Distancia unitaria bit-paralela (Myers/Hyyrö) con acceso a celdas.
+
+    La referencia se codifica en los bits (bit ``i-1`` ↔ fila ``i``) y se
+    avanza una columna por token de la hipótesis.  Tras la columna ``j``,
+    ``VP``/``VN`` marcan las filas cuyo delta vertical
+    ``dp[i][j] - dp[i-1][j]`` es +1/-1, así que
+    ``dp[i][j] = j + popcount(VP & low_i) - popcount(VN & low_i)``.
+    """
+    n = len(ref_tokens)
+    full = (1 << n) - 1
+    peq: dict[str, int] = {}
+    for idx, token in enumerate(ref_tokens):
+        peq[token] = peq.get(token, 0) | (1 << idx)
+
+    vp, vn = full, 0
+    columns: list[tuple[int, int]] = [(vp, vn)]
+    for token in hyp_tokens:
+        eq = peq.get(token, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | (~(xh | vp) & full)
+        hn = vp & xh
+        # Fila 0 (borde superior dp[0][j] = j): delta horizontal siempre +1.
+        hp = ((hp << 1) | 1) & full
+        hn = (hn << 1) & full
+        vp = hn | (~(xv | hp) & full)
+        vn = hp & xv
+        columns.append((vp, vn))
+
+    def cell(i: int, j: int) -> float:
+        col_vp, col_vn = columns[j]
+        low = (1 << i) - 1
+        return float(j + _popcount(col_vp & low) - _popcount(col_vn & low))
+
+    return cell
+
+
+def _backtrace(
+    ref_tokens: list[str],
+    hyp_tokens: list[str],
+    cell: Callable[[int, int], float],
+    sub_cost: Callable[[int, int], float],
+    w: _Weights,
+) -> tuple[list[EditOp], list[tuple[Optional[Token], Optional[Token]]]]:
+    """Reconstruye ops/alignment con el desempate del motor de referencia."""
+    ops_reversed: list[EditOp] = []
+    alignment_reversed: list[tuple[Optional[Token], Optional[Token]]] = []
+    i, j = len(ref_tokens), len(hyp_tokens)
+    op: Literal["eq", "sub", "ins", "del"]
+    while i > 0 or j > 0:
+        if i == 0:
+            op = "ins"
+        elif j == 0:
+            op = "del"
+        elif ref_tokens[i - 1] == hyp_tokens[j - 1]:
+            op = "eq"
+        else:
+            sub_c = cell(i - 1, j - 1) + sub_cost(i - 1, j - 1)
+            ins_c = cell(i, j - 1) + w.ins
+            del_c = cell(i - 1, j) + w.del_
+            best = min(sub_c, ins_c, del_c)
+            if best == sub_c:
+                op = "sub"
+            elif best == ins_c:
+                op = "ins"
+            else:
+                op = "del"
+
+        if op in ("eq", "sub"):
+            token_ref, token_hyp = ref_tokens[i - 1], hyp_tokens[j - 1]
+            i, j = i - 1, j - 1
+        elif op == "del":
+            token_ref, token_hyp = ref_tokens[i - 1], None
+            i -= 1
+        else:
+            token_ref, token_hyp = None, hyp_tokens[j - 1]
+            j -= 1
+        ops_reversed.append({"op": op, "ref": token_ref, "hyp": token_hyp})
+        alignment_reversed.append((token_ref, token_hyp))
+
+    return list(reversed(ops_reversed)), list(reversed(alignment_reversed))
+
+
+__all__ = ["VectorizedLevenshteinComparator"]
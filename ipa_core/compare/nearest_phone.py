@@ -0,0 +1,129 @@
+"""Índice de fonema más cercano por inventario (para el manejo OOV).
+
+:class:`NearestPhoneIndex` responde "¿qué fonema del inventario está más
+cerca de este símbolo y a qué distancia?" sin recorrer el inventario
+llamando a :func:`~ipa_core.compare.articulatory.articulatory_distance`
+par por par.  Usa la matriz de distancias del proceso
+(:mod:`ipa_core.compare.distance_matrix`):
+
+- Al primer uso precalcula la tabla ``símbolo → (vecino, distancia)`` para
+  todos los fonemas de la matriz que no están en el inventario, con una
+  sola submatriz ``símbolos × inventario`` y un ``argmin`` por fila.
+- Los símbolos no vistos se resuelven con una fila de esa submatriz (una
+  indexación vectorizada) y se memorizan hasta ``max_entries``.
+
+``argmin`` devuelve el primer mínimo, igual que el recorrido lineal, así
+que el vecino y la distancia son idénticos a los del cálculo original.
+"""
+from __future__ import annotations
+
+import threading
+from functools import lru_cache
+from typing import Optional, Sequence
+
+import numpy as np
+
+from ipa_core.compare.distance_matrix import PhoneDistanceMatrix, get_distance_matrix
+from ipa_core.types import Token
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+class NearestPhoneIndex:
+    """Vecino más cercano dentro de un inventario fijo.
+
+    Parámetros
+    ----------
+    inventory : Sequence[Token]
+        Fonemas del inventario; el orden decide los empates.
+    matrix : PhoneDistanceMatrix | None
+        Matriz de distancias (default: la articulatoria del proceso).
+    max_entries : int
+        Tope de símbolos memorizados fuera de la tabla precalculada.
+    """
+
+    def __init__(
+        self,
+        inventory: Sequence[Token],
+        *,
+        matrix: Optional[PhoneDistanceMatrix] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self.inventory: tuple[Token, ...] = tuple(inventory)
+        self._members = frozenset(self.inventory)
+        self._matrix = matrix
+        self._max_entries = max_entries
+        self._table: Optional[dict[Token, tuple[Token, float]]] = None
+        self._precomputed = 0
+        self._lock = threading.Lock()
+
+    @property
+    def matrix(self) -> PhoneDistanceMatrix:
+        if self._matrix is None:
+            self._matrix = get_distance_matrix("articulatory")
+        return self._matrix
+
+    def _build(self) -> dict[Token, tuple[Token, float]]:
+        with self._lock:
+            if self._table is None:
+                symbols = [p for p in self.matrix.phones if p not in self._members]
+                self._table = self._nearest_rows(symbols)
+                self._precomputed = len(self._table)
+        return self._table
+
+    def _nearest_rows(self, symbols: Sequence[Token]) -> dict[Token, tuple[Token, float]]:
+        if not symbols or not self.inventory:
+            return {}
+        distances = self.matrix.pairwise(symbols, self.inventory)
+        best = np.argmin(distances, axis=1)
+        best_dist = distances[np.arange(len(symbols)), best]
+        return {
+            symbol: (self.inventory[int(b)], float(d))
+            for symbol, b, d in zip(symbols, best, best_dist)
+        }
+
+    def lookup(self, token: Token) -> tuple[Token, float, bool]:
+        """``(vecino, distancia, hit)``; ``hit`` indica si ya estaba en el índice."""
+        table = self._table if self._table is not None else self._build()
+        found = table.get(token)
+        if found is not None:
+            return found[0], found[1], True
+        if not self.inventory:
+            return token, 1.0, False
+        nearest, distance = self._nearest_rows([token])[token]
+        if len(table) - self._precomputed < self._max_entries:
+            table[token] = (nearest, distance)
+        return nearest, distance, False
+
+    def nearest(self, token: Token) -> tuple[Token, float]:
+        """Fonema del inventario más cercano a ``token`` y su distancia."""
+        nearest, distance, _ = self.lookup(token)
+        return nearest, distance
+
+    def __contains__(self, token: object) -> bool:
+        return token in self._members
+
+    def __len__(self) -> int:
+        return len(self.inventory)
+
+
+@lru_cache(maxsize=64)
+def _shared_index(inventory: tuple[Token, ...]) -> NearestPhoneIndex:
+    return NearestPhoneIndex(inventory)
+
+
+def get_nearest_phone_index(inventory: Sequence[Token]) -> NearestPhoneIndex:
+    """Índice compartido del proceso para un inventario (mismo orden, mismo índice)."""
+    return _shared_index(tuple(inventory))
+
+
+def clear_nearest_phone_indexes() -> None:
+    """Olvidar los índices compartidos."""
+    _shared_index.cache_clear()
+
+
+__all__ = [
+    "NearestPhoneIndex",
+    "clear_nearest_phone_indexes",
+    "get_nearest_phone_index",
+]
@@ -18,13 +18,20 @@ El handler soporta ambos niveles:
 - **Fonético**: el inventario contiene alófonos concretos (``[β]``, ``[ð]``, …).
 
 El flag ``level`` en :class:`OOVHandler` indica qué nivel se está usando.
+
+Vecino más cercano
+------------------
+El fonema más cercano se busca en un
+:class:`~ipa_core.compare.nearest_phone.NearestPhoneIndex` compartido por
+inventario (tabla precalculada + memo), no recorriendo el inventario en
+cada token.  ``OOVStats`` reporta la tasa de aciertos del índice.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass, field
 from typing import Literal, Optional, Sequence
 
-from ipa_core.compare.articulatory import articulatory_distance
+from ipa_core.compare.nearest_phone import NearestPhoneIndex, get_nearest_phone_index
 from ipa_core.types import Token
 
 
@@ -75,6 +82,14 @@ class OOVStats:
     collapsed: int = 0
     marked_unknown: int = 0
     excluded_from_score: int = 0
+    index_hits: int = 0
+    index_misses: int = 0
+
+    def record_lookup(self, hit: bool) -> None:
+        if hit:
+            self.index_hits += 1
+        else:
+            self.index_misses += 1
 
     def record(self, result: OOVResult) -> None:
         self.total += 1
@@ -98,6 +113,13 @@ class OOVStats:
                 if self.total > 0
                 else 0.0
             ),
+            "index_hits": self.index_hits,
+            "index_misses": self.index_misses,
+            "index_hit_rate": (
+                self.index_hits / (self.index_hits + self.index_misses)
+                if self.index_hits + self.index_misses > 0
+                else 0.0
+            ),
         }
 
 
@@ -134,8 +156,7 @@ class OOVHandler:
             raise ValueError(
                 f"collapse_threshold debe estar en [0, 1], recibido: {collapse_threshold}"
             )
-        self._inventory: frozenset[Token] = frozenset(inventory)
-        self._inventory_list: list[Token] = list(inventory)
+        self._index: NearestPhoneIndex = get_nearest_phone_index(inventory)
         self.collapse_threshold = collapse_threshold
         self.level = level
         self._stats = OOVStats()
@@ -164,11 +185,10 @@ class OOVHandler:
 
     def resolve_detailed(self, token: Token, *, inventory: Optional[Sequence[Token]] = None) -> OOVResult:
         """Resolver un token y retornar el OOVResult completo con la decisión y distancia."""
-        inv_set = frozenset(inventory) if inventory is not None else self._inventory
-        inv_list = list(inventory) if inventory is not None else self._inventory_list
+        index = get_nearest_phone_index(inventory) if inventory is not None else self._index
 
         # Caso 1: Token ya en inventario → sin cambios
-        if token in inv_set:
+        if token in index:
             result = OOVResult(
                 original=token,
                 resolved=token,
@@ -180,7 +200,7 @@ class OOVHandler:
             return result
 
         # Caso 2: Inventario vacío → marcar como desconocido
-        if not inv_list:
+        if not len(index):
             result = OOVResult(
                 original=token,
                 resolved=UNKNOWN_TOKEN,
@@ -192,7 +212,8 @@ class OOVHandler:
             return result
 
         # Caso 3: Buscar el fonema más cercano en el inventario
-        nearest, min_dist = self._find_nearest(token, inv_list)
+        nearest, min_dist, hit = index.lookup(token)
+        self._stats.record_lookup(hit)
 
         if min_dist < self.collapse_threshold:
             result = OOVResult(
@@ -302,28 +323,6 @@ class OOVHandler:
         """Reiniciar contadores de estadísticas."""
         self._stats = OOVStats()
 
-    # ------------------------------------------------------------------
-    # Helpers internos
-    # ------------------------------------------------------------------
-
-    def _find_nearest(self, token: Token, inv_list: list[Token]) -> tuple[Token, float]:
-        """Encontrar el fonema del inventario con menor distancia articulatoria."""
-        if not inv_list:
-            return token, 1.0
-
-        best_token = inv_list[0]
-        best_dist = articulatory_distance(token, best_token)
-
-        for candidate in inv_list[1:]:
-            dist = articulatory_distance(token, candidate)
-            if dist < best_dist:
-                best_dist = dist
-                best_token = candidate
-            if best_dist == 0.0:
-                break  # No puede mejorar más
-
-        return best_token, best_dist
-
     # ------------------------------------------------------------------
     # Constructor desde LanguagePack
     # ------------------------------------------------------------------
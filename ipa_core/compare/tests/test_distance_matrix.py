@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ipa_core.compare.articulatory import articulatory_distance
+from ipa_core.compare.distance_matrix import (
+    PhoneDistanceMatrix,
+    cache_filename,
+    clear_distance_matrices,
+    get_distance_matrix,
+    register_inventory,
+)
+from ipa_core.services.error_report import calculate_articulatory_distance, categorical_distance
+
+_PHONES = ["p", "b", "t", "d", "s", "θ", "a", "e", "i", "o", "u", "ʃ"]
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("PRONUNCIAPA_DISTANCE_CACHE_DIR", str(tmp_path))
+    clear_distance_matrices()
+    yield
+    clear_distance_matrices()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("metric,fn", [
+    ("articulatory", articulatory_distance),
+    ("categorical", categorical_distance),
+])
+def test_matrix_matches_metric(metric, fn) -> None:
+    """Cada celda es exactamente el valor de la métrica original."""
+    matrix = PhoneDistanceMatrix.build(_PHONES, metric=metric)
+    for a in _PHONES:
+        for b in _PHONES:
+            assert matrix.distance(a, b) == fn(a, b)
+
+
+@pytest.mark.unit
+def test_unknown_phones_fall_back_to_metric() -> None:
+    matrix = PhoneDistanceMatrix.build(["p", "b"])
+    assert "ʀ" not in matrix
+    assert matrix.distance("p", "ʀ") == articulatory_distance("p", "ʀ")
+    table = matrix.pairwise(["p", "ʀ"], ["b", "ʀ"])
+    expected = [[articulatory_distance(a, b) for b in ("b", "ʀ")] for a in ("p", "ʀ")]
+    assert table.tolist() == expected
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+def test_cache_file_is_memory_mapped_and_versioned(tmp_path) -> None:
+    built = PhoneDistanceMatrix.load_or_build(_PHONES, cache_dir=tmp_path)
+    path = tmp_path / cache_filename(tuple(sorted(_PHONES)), "articulatory")
+    assert path.exists()
+
+    loaded = PhoneDistanceMatrix.load_or_build(reversed(_PHONES), cache_dir=tmp_path)
+    assert isinstance(loaded.matrix, np.memmap)
+    assert loaded.phones == built.phones
+    assert np.array_equal(loaded.matrix, built.matrix)
+    # Otra métrica u otro inventario no reutilizan el archivo.
+    assert cache_filename(loaded.phones, "categorical") != path.name
+    assert cache_filename(loaded.phones[:-1], "articulatory") != path.name
+
+
+@pytest.mark.unit
+def test_register_inventory_extends_process_matrices() -> None:
+    assert "ʀ" in get_distance_matrix("articulatory")
+    assert "ʀ" not in get_distance_matrix("categorical")
+
+    register_inventory(["ʀ"])
+
+    assert "ʀ" in get_distance_matrix("categorical")
+    assert calculate_articulatory_distance("ʀ", "p") == categorical_distance("ʀ", "p")
@@ -64,3 +64,42 @@ async def test_ops_include_eq_and_sub_in_order() -> None:
         {"op": "eq", "ref": "a", "hyp": "a"},
         {"op": "sub", "ref": "b", "hyp": "x"},
     ]
+
+
+_EQUIVALENCE_CASES = [
+    (["p", "a", "t", "o"], ["p", "a", "d", "o"], None),
+    (["k", "a", "s", "a"], ["k", "a", "θ", "a", "s"], {"sub": 1.5, "ins": 0.7, "del_": 1.2}),
+    (["o", "l", "a"], ["x", "o", "l", "a", "a"], None),
+    (["ɾ", "e", "tʃ", "o"], [], None),
+    ([], ["a", "b"], None),
+    (list("pataperomesakiluso") * 6, list("patapelomesaxilusso") * 6, None),
+]
+
+
+@pytest.mark.unit
+@pytest.mark.functional
+@pytest.mark.parametrize("use_articulatory", [True, False])
+@pytest.mark.parametrize("ref,hyp,weights", _EQUIVALENCE_CASES)
+async def test_vectorized_engine_matches_reference(ref, hyp, weights, use_articulatory: bool) -> None:
+    """El motor vectorizado produce ops/alignment/per idénticos al de referencia."""
+    from ipa_core.compare.levenshtein_vectorized import VectorizedLevenshteinComparator
+
+    expected = await LevenshteinComparator(use_articulatory=use_articulatory).compare(ref, hyp, weights=weights)
+    actual = await VectorizedLevenshteinComparator(use_articulatory=use_articulatory).compare(ref, hyp, weights=weights)
+
+    assert actual["ops"] == expected["ops"]
+    assert actual["alignment"] == expected["alignment"]
+    assert actual["per"] == expected["per"]
+    assert actual["meta"]["distance"] == expected["meta"]["distance"]
+
+
+@pytest.mark.unit
+async def test_vectorized_engine_selects_bitparallel_for_unit_costs() -> None:
+    """Pesos unitarios sin costo articulatorio usan la ruta bit-paralela."""
+    from ipa_core.compare.levenshtein_vectorized import VectorizedLevenshteinComparator
+
+    unit = await VectorizedLevenshteinComparator(use_articulatory=False).compare(["a", "b"], ["a", "x"])
+    weighted = await VectorizedLevenshteinComparator().compare(list("abcdefghij"), list("abxdefghiy"))
+
+    assert unit["meta"]["engine"] == "bitparallel"
+    assert weighted["meta"]["engine"] == "numpy"
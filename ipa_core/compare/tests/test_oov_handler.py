@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from ipa_core.compare.articulatory import CONSONANT_FEATURES, VOWEL_FEATURES, articulatory_distance
+from ipa_core.compare.distance_matrix import clear_distance_matrices
+from ipa_core.compare.nearest_phone import clear_nearest_phone_indexes
+from ipa_core.compare.oov_handler import OOVHandler
+
+_INVENTORY = ["p", "b", "t", "d", "k", "g", "m", "n", "ɲ", "s", "x", "l", "ɾ", "r", "tʃ", "ʝ", "a", "e", "i", "o", "u"]
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("PRONUNCIAPA_DISTANCE_CACHE_DIR", str(tmp_path))
+    clear_distance_matrices()
+    clear_nearest_phone_indexes()
+    yield
+    clear_distance_matrices()
+    clear_nearest_phone_indexes()
+
+
+def _linear_nearest(token, inventory):
+    """Recorrido original: primer fonema con distancia mínima."""
+    best, best_dist = inventory[0], articulatory_distance(token, inventory[0])
+    for candidate in inventory[1:]:
+        dist = articulatory_distance(token, candidate)
+        if dist < best_dist:
+            best, best_dist = candidate, dist
+    return best, best_dist
+
+
+@pytest.mark.unit
+def test_index_matches_linear_scan_and_reports_hit_rate() -> None:
+    symbols = [*CONSONANT_FEATURES, *VOWEL_FEATURES, "ai", "ʘ", "?", "ts"]
+    tokens = [random.Random(11).choice(symbols) for _ in range(500)]
+    handler = OOVHandler(_INVENTORY)
+
+    for token in tokens:
+        result = handler.resolve_detailed(token)
+        if token in _INVENTORY:
+            assert result.decision == "in_inventory"
+            continue
+        assert (result.nearest, result.distance) == _linear_nearest(token, _INVENTORY)
+
+    stats = handler.stats.as_dict()
+    oov = stats["collapsed"] + stats["marked_unknown"]
+    assert stats["index_hits"] + stats["index_misses"] == oov
+    # Sólo los símbolos sin rasgos ("ai", "ʘ", "?") se calculan fuera de la tabla, una vez.
+    assert stats["index_misses"] <= 3
+    assert stats["index_hit_rate"] > 0.9
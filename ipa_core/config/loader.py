@@ -96,6 +96,30 @@ def format_validation_error(exc: ValidationError) -> str:
     return "\n".join(lines)
 
 
+def resolve_config_path(path: str | None = None) -> Path | None:
+    """Resolver el YAML que usaría :func:`load_config` (``None`` si no hay)."""
+    if path:
+        p = Path(path)
+        if not p.exists():
+            raise FileNotFoundError(
+                f"Archivo de configuración no encontrado: {path}"
+            )
+        return p
+    env_path = os.environ.get("PRONUNCIAPA_CONFIG")
+    if env_path:
+        p = Path(env_path)
+        if not p.exists():
+            raise FileNotFoundError(
+                f"Archivo PRONUNCIAPA_CONFIG no encontrado: {env_path}"
+            )
+        return p
+    for candidate in ["config.yaml", "configs/local.yaml"]:
+        cp = Path(candidate)
+        if cp.exists():
+            return cp
+    return None
+
+
 def load_config(path: str | None = None) -> AppConfig:
     """Carga YAML y construye ``AppConfig``.
 
@@ -122,27 +146,7 @@ def load_config(path: str | None = None) -> AppConfig:
         Configuración validada.
     """
     # ── 1. Resolver archivo YAML ─────────────────────────────────
-    p: Path | None = None
-    if path:
-        p = Path(path)
-        if not p.exists():
-            raise FileNotFoundError(
-                f"Archivo de configuración no encontrado: {path}"
-            )
-    else:
-        env_path = os.environ.get("PRONUNCIAPA_CONFIG")
-        if env_path:
-            p = Path(env_path)
-            if not p.exists():
-                raise FileNotFoundError(
-                    f"Archivo PRONUNCIAPA_CONFIG no encontrado: {env_path}"
-                )
-        else:
-            for candidate in ["config.yaml", "configs/local.yaml"]:
-                cp = Path(candidate)
-                if cp.exists():
-                    p = cp
-                    break
+    p = resolve_config_path(path)
 
     # ── 2. Leer YAML ─────────────────────────────────────────────
     data: dict[str, Any] = {}
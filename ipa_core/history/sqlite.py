@@ -32,6 +32,22 @@ Esquema
     - correct     INTEGER NOT NULL
     PRIMARY KEY (user_id, lang, phoneme)
 
+Escritura diferida (write-behind)
+---------------------------------
+``record_attempt`` no escribe en el momento: encola la fila del intento y
+acumula en memoria los deltas de ``phoneme_stats`` (por usuario, idioma y
+fonema). La cola se vuelca en **una** transacción con ``executemany`` al
+llegar a ``batch_size`` intentos o ``flush_interval`` segundos después del
+primer intento pendiente, así muchas peticiones comparten un commit. Las
+lecturas vuelcan antes lo pendiente (se leen las propias escrituras) y
+``teardown()`` también. ``batch_size=1`` escribe en cada intento.
+
+Toda escritura sobre la conexión compartida toma el mismo candado que el
+volcado, y la inserción de intentos es idempotente: si un volcado falla,
+el lote vuelve a la cola sin riesgo de duplicar ni de bloquear la base.
+
+La conexión usa WAL, ``synchronous=NORMAL`` y un ``cache_size`` ajustable.
+
 Dependencias opcionales
 -----------------------
 Requiere ``aiosqlite`` para I/O asíncrono.  Si no está instalado,
@@ -40,13 +56,17 @@ con mensaje claro.  Instalar con: ``pip install aiosqlite``.
 """
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import time
 import uuid
 from pathlib import Path
 from collections import defaultdict
 from typing import Any, Optional
 
+logger = logging.getLogger(__name__)
+
 
 _AIOSQLITE_AVAILABLE = False
 try:
@@ -95,6 +115,40 @@ CREATE TABLE IF NOT EXISTS roadmap_progress (
 """
 
 
+# ``OR IGNORE``: un lote re-encolado tras un fallo no puede chocar con
+# intentos que ya llegaron a disco (``attempt_id`` es único).
+_INSERT_ATTEMPT = """
+INSERT OR IGNORE INTO attempts
+    (attempt_id, user_id, lang, text, score, per, ops, meta, timestamp)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPSERT_PHONEME = """
+INSERT INTO phoneme_stats (user_id, lang, phoneme, attempts, correct)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(user_id, lang, phoneme) DO UPDATE SET
+    attempts = attempts + excluded.attempts,
+    correct  = correct  + excluded.correct
+"""
+
+PhonemeKey = tuple[str, str, str]
+
+
+def _phoneme_deltas(ops: list[dict[str, Any]]) -> dict[str, list[int]]:
+    """``{fonema: [intentos, correctos]}`` a partir de las operaciones de edición."""
+    phoneme_data: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+    for op in ops:
+        ref = op.get("ref") or ""
+        op_type = op.get("op", "")
+        if op_type == "eq" and ref:
+            phoneme_data[ref][0] += 1
+            phoneme_data[ref][1] += 1
+        elif op_type in ("sub", "del") and ref:
+            phoneme_data[ref][0] += 1
+            # correct += 0 (error)
+    return phoneme_data
+
+
 def _mastery_level(error_rate: float) -> str:
     if error_rate < 0.05:
         return "mastered"
@@ -113,11 +167,32 @@ class SQLiteHistory:
     db_path : str | Path
         Ruta al fichero SQLite.  Se crea si no existe.
         Usar ``:memory:`` para almacenamiento volátil (tests).
+    batch_size : int
+        Intentos pendientes que fuerzan un volcado inmediato.
+    flush_interval : float
+        Segundos máximos que un intento espera en la cola.
+    cache_size_kib : int
+        ``PRAGMA cache_size`` en KiB.
     """
 
-    def __init__(self, db_path: str | Path = "data/pronunciapa_history.db") -> None:
+    def __init__(
+        self,
+        db_path: str | Path = "data/pronunciapa_history.db",
+        *,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        cache_size_kib: int = 16384,
+    ) -> None:
         self._db_path = str(db_path)
         self._conn: Optional[Any] = None  # aiosqlite.Connection
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._cache_size_kib = cache_size_kib
+        self._pending_attempts: list[tuple[Any, ...]] = []
+        self._pending_stats: dict[PhonemeKey, list[int]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task[None]] = None
+        self.flushes = 0
 
     async def setup(self) -> None:
         """Abrir conexión y crear tablas si no existen."""
@@ -141,15 +216,25 @@ class SQLiteHistory:
         self._conn = await _aio.connect(self._db_path)
         assert self._conn is not None  # narrow Optional[Any] → Any
         self._conn.row_factory = _aio.Row
+        if self._db_path != ":memory:":
+            await self._conn.execute("PRAGMA journal_mode=WAL")
+        await self._conn.execute("PRAGMA synchronous=NORMAL")
+        await self._conn.execute(f"PRAGMA cache_size=-{int(self._cache_size_kib)}")
         await self._conn.executescript(_CREATE_ATTEMPTS)
         await self._conn.executescript(_CREATE_PHONEME)
         await self._conn.executescript(_CREATE_ROADMAP)
         await self._conn.commit()
 
     async def teardown(self) -> None:
-        """Cerrar conexión."""
+        """Volcar lo pendiente y cerrar conexión."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
         if self._conn is not None:
-            await self._conn.close()
+            try:
+                await self.flush()
+            finally:
+                await self._conn.close()
             self._conn = None
 
     def _require_conn(self) -> Any:
@@ -172,63 +257,73 @@ class SQLiteHistory:
         ops: list[dict[str, Any]],
         meta: Optional[dict[str, Any]] = None,
     ) -> str:
-        conn = self._require_conn()
+        self._require_conn()
         attempt_id = str(uuid.uuid4())
-        await conn.execute(
-            """
-            INSERT INTO attempts
-                (attempt_id, user_id, lang, text, score, per, ops, meta, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                attempt_id,
-                user_id,
-                lang,
-                text,
-                round(score, 2),
-                round(per, 4),
-                json.dumps(ops, ensure_ascii=False),
-                json.dumps(meta or {}, ensure_ascii=False),
-                time.time(),
-            ),
-        )
-        # Actualizar estadísticas de fonemas
-        await self._update_phoneme_stats(conn, user_id=user_id, lang=lang, ops=ops)
-        await conn.commit()
+        self._pending_attempts.append((
+            attempt_id,
+            user_id,
+            lang,
+            text,
+            round(score, 2),
+            round(per, 4),
+            json.dumps(ops, ensure_ascii=False),
+            json.dumps(meta or {}, ensure_ascii=False),
+            time.time(),
+        ))
+        # Pre-agregar estadísticas de fonemas
+        for phoneme, (attempts, correct) in _phoneme_deltas(ops).items():
+            delta = self._pending_stats.setdefault((user_id, lang, phoneme), [0, 0])
+            delta[0] += attempts
+            delta[1] += correct
+        if len(self._pending_attempts) >= self._batch_size:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
         return attempt_id
 
-    async def _update_phoneme_stats(
-        self,
-        conn: Any,
-        *,
-        user_id: str,
-        lang: str,
-        ops: list[dict[str, Any]],
-    ) -> None:
-        """Actualizar contadores de fonemas a partir de las operaciones de edición."""
-        phoneme_data: dict[str, dict[str, int]] = defaultdict(lambda: {"attempts": 0, "correct": 0})
-        for op in ops:
-            ref = op.get("ref") or ""
-            hyp = op.get("hyp") or ""
-            op_type = op.get("op", "")
-            if op_type == "eq" and ref:
-                phoneme_data[ref]["attempts"] += 1
-                phoneme_data[ref]["correct"] += 1
-            elif op_type in ("sub", "del") and ref:
-                phoneme_data[ref]["attempts"] += 1
-                # correct += 0 (error)
-
-        for phoneme, counts in phoneme_data.items():
-            await conn.execute(
-                """
-                INSERT INTO phoneme_stats (user_id, lang, phoneme, attempts, correct)
-                VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(user_id, lang, phoneme) DO UPDATE SET
-                    attempts = attempts + excluded.attempts,
-                    correct  = correct  + excluded.correct
-                """,
-                (user_id, lang, phoneme, counts["attempts"], counts["correct"]),
-            )
+    async def _flush_later(self) -> None:
+        try:
+            await asyncio.sleep(self._flush_interval)
+            self._flush_task = None
+            await asyncio.shield(self.flush())
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("Volcado diferido del historial falló; se reintentará")
+
+    async def flush(self) -> int:
+        """Escribir los intentos pendientes en una transacción; retorna cuántos."""
+        if not self._pending_attempts and not self._pending_stats and not self._flush_lock.locked():
+            return 0
+        conn = self._require_conn()
+        async with self._flush_lock:
+            attempts, self._pending_attempts = self._pending_attempts, []
+            stats, self._pending_stats = self._pending_stats, {}
+            if not attempts and not stats:
+                return 0
+            try:
+                await conn.executemany(_INSERT_ATTEMPT, attempts)
+                await conn.executemany(
+                    _UPSERT_PHONEME,
+                    [(*key, delta[0], delta[1]) for key, delta in stats.items()],
+                )
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                # Devolver el lote a la cola para el próximo volcado.
+                self._pending_attempts[:0] = attempts
+                for key, delta in stats.items():
+                    pending = self._pending_stats.setdefault(key, [0, 0])
+                    pending[0] += delta[0]
+                    pending[1] += delta[1]
+                raise
+            self.flushes += 1
+            return len(attempts)
+
+    @property
+    def pending(self) -> int:
+        """Intentos aún no escritos en disco."""
+        return len(self._pending_attempts)
 
     async def get_attempts(
         self,
@@ -239,6 +334,7 @@ class SQLiteHistory:
         offset: int = 0,
     ) -> list[dict[str, Any]]:
         conn = self._require_conn()
+        await self.flush()
         if lang:
             cursor = await conn.execute(
                 "SELECT * FROM attempts WHERE user_id=? AND lang=? "
@@ -266,6 +362,7 @@ class SQLiteHistory:
         lang: str,
     ) -> list[dict[str, Any]]:
         conn = self._require_conn()
+        await self.flush()
         cursor = await conn.execute(
             "SELECT phoneme, attempts, correct FROM phoneme_stats "
             "WHERE user_id=? AND lang=? ORDER BY attempts DESC",
@@ -292,6 +389,7 @@ class SQLiteHistory:
     ) -> list[dict[str, Any]]:
         """Obtener historial de scores recientes para visualizar progreso."""
         conn = self._require_conn()
+        await self.flush()
         cursor = await conn.execute(
             "SELECT score, per, timestamp FROM attempts "
             "WHERE user_id=? AND lang=? ORDER BY timestamp DESC LIMIT ?",
@@ -310,17 +408,20 @@ class SQLiteHistory:
     ) -> None:
         """Insertar o actualizar el nivel de avance de un tema del roadmap."""
         conn = self._require_conn()
-        await conn.execute(
-            """
-            INSERT INTO roadmap_progress (user_id, lang, topic_id, level, updated_at)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(user_id, lang, topic_id) DO UPDATE SET
-                level      = excluded.level,
-                updated_at = excluded.updated_at
-            """,
-            (user_id, lang, topic_id, level, time.time()),
-        )
-        await conn.commit()
+        # Mismo candado que ``flush``: este commit no debe cerrar a medias
+        # la transacción de un lote en curso sobre la conexión compartida.
+        async with self._flush_lock:
+            await conn.execute(
+                """
+                INSERT INTO roadmap_progress (user_id, lang, topic_id, level, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(user_id, lang, topic_id) DO UPDATE SET
+                    level      = excluded.level,
+                    updated_at = excluded.updated_at
+                """,
+                (user_id, lang, topic_id, level, time.time()),
+            )
+            await conn.commit()
 
     async def get_roadmap_progress(
         self,
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from ipa_core.history.sqlite import SQLiteHistory  # noqa: E402
+
+_OPS: list[dict[str, Any]] = [
+    {"op": "eq", "ref": "r", "hyp": "r"},
+    {"op": "sub", "ref": "r", "hyp": "ɾ"},
+    {"op": "eq", "ref": "a", "hyp": "a"},
+    {"op": "ins", "ref": None, "hyp": "e"},
+]
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+async def test_attempts_are_coalesced_into_one_transaction(tmp_path) -> None:
+    db = tmp_path / "history.db"
+    history = SQLiteHistory(db, batch_size=1000, flush_interval=60)
+    await history.setup()
+    await asyncio.gather(*(
+        history.record_attempt(user_id="u1", lang="es", text="rara", score=80, per=0.2, ops=_OPS)
+        for _ in range(50)
+    ))
+    assert history.pending == 50 and history.flushes == 0
+
+    # Las lecturas vuelcan lo pendiente (una sola transacción).
+    stats = {s["phoneme"]: s for s in await history.get_phoneme_stats("u1", "es")}
+    assert history.flushes == 1 and history.pending == 0
+    assert (stats["r"]["attempts"], stats["r"]["correct"]) == (100, 50)
+    assert (stats["a"]["attempts"], stats["a"]["correct"]) == (50, 50)
+    assert len(await history.get_attempts("u1", limit=100)) == 50
+
+    await history.record_attempt(user_id="u1", lang="es", text="a", score=100, per=0, ops=_OPS[2:3])
+    await history.teardown()
+
+    reopened = SQLiteHistory(db)
+    await reopened.setup()
+    assert len(await reopened.get_attempts("u1", limit=100)) == 51
+    await reopened.teardown()
+
+
+@pytest.mark.unit
+async def test_flush_interval_and_batch_size_trigger_writes(tmp_path) -> None:
+    history = SQLiteHistory(tmp_path / "h.db", batch_size=3, flush_interval=0.05)
+    await history.setup()
+    for _ in range(3):
+        await history.record_attempt(user_id="u", lang="es", text="a", score=90, per=0.1, ops=_OPS[2:3])
+    assert history.flushes == 1 and history.pending == 0
+
+    await history.record_attempt(user_id="u", lang="es", text="a", score=90, per=0.1, ops=_OPS[2:3])
+    await asyncio.sleep(0.2)
+    assert history.flushes == 2 and history.pending == 0
+    await history.teardown()
+
+
+@pytest.mark.unit
+async def test_requeued_batch_and_roadmap_writes_do_not_wedge_the_store(tmp_path) -> None:
+    history = SQLiteHistory(tmp_path / "h.db", batch_size=1000, flush_interval=60)
+    await history.setup()
+    await history.record_attempt(user_id="u", lang="es", text="a", score=90, per=0.1, ops=_OPS[2:3])
+    batch = list(history._pending_attempts)
+    await asyncio.gather(
+        history.flush(),
+        history.record_roadmap_progress(user_id="u", lang="es", topic_id="t1", level="started"),
+    )
+    # Un lote re-encolado con filas ya escritas no rompe los volcados siguientes.
+    history._pending_attempts[:0] = batch
+    assert len(await history.get_attempts("u")) == 1
+    assert await history.get_roadmap_progress("u", "es") == {"t1": "started"}
+    await history.teardown()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+import asyncio
+from pathlib import Path
+from typing import Optional
+import typer
+from rich.table import Table
+
+from ipa_core.pipeline.batch import BatchPipelineRunner
+from .compare import _apply_compare_plugins
+from .helpers import console, _emit_json, _exit_code_for_error, _get_kernel
+
+def batch_compare(
+    manifest: Path = typer.Argument(..., help="Manifiesto JSONL: {audio, text[, id, lang, target_ipa]} por línea"),
+    output: Path = typer.Option(..., "--output", "-o", help="Resultados (.jsonl o .parquet)"),
+    lang: str = typer.Option("es", "--lang", "-l", help="Idioma de los ítems sin 'lang'"),
+    backend: Optional[str] = typer.Option(None, "--backend"),
+    textref: Optional[str] = typer.Option(None, "--textref"),
+    comparator: Optional[str] = typer.Option(None, "--comparator"),
+    evaluation_level: str = typer.Option("phonemic", "--evaluation-level"),
+    mode: str = typer.Option("objective", "--mode"),
+    pack: Optional[str] = typer.Option(None, "--pack"),
+    max_in_flight: int = typer.Option(16, "--max-in-flight", help="Ítems en memoria a la vez"),
+    asr_batch_size: int = typer.Option(8, "--asr-batch-size", help="Tamaño máximo de micro-lote ASR"),
+    workers: Optional[int] = typer.Option(None, "--workers", help="Hilos de carga/decodificación de audio"),
+    resume: bool = typer.Option(True, "--resume/--no-resume", help="Saltar ítems ya resueltos en la salida (los que fallaron se reintentan)"),
+    json_output: bool = typer.Option(False, "--json"),
+):
+    """Puntúa un corpus completo (audio, texto) con micro-lotes y checkpoint."""
+    kernel = _get_kernel()
+    _apply_compare_plugins(kernel, backend, textref, comparator, lang)
+    runner = BatchPipelineRunner(
+        preprocessor=kernel.pre, asr=kernel.asr, textref=kernel.textref, comparator=kernel.comp,
+        default_lang=lang, max_in_flight=max_in_flight, asr_batch_size=asr_batch_size,
+        workers=workers, evaluation_level=evaluation_level, mode=mode, pack=pack,
+    )
+
+    async def _run():
+        await kernel.setup()
+        try: return await runner.run(manifest, output, resume=resume)
+        finally: await kernel.teardown()
+
+    try:
+        with console.status("[bold green]Procesando corpus..."):
+            report = asyncio.run(_run())
+    except Exception as e:
+        console.print(f"Error: {e}", style="red"); raise typer.Exit(_exit_code_for_error(e))
+
+    summary = report.to_dict()
+    if json_output:
+        _emit_json(summary)
+        return
+    table = Table(title=f"batch-compare → {summary['output']}")
+    table.add_column("Métrica"); table.add_column("Valor", justify="right")
+    for key in ("total", "processed", "skipped", "errors", "wall_s", "items_per_s"):
+        table.add_row(key, str(summary[key]))
+    table.add_row("avg_per", f"{summary['avg_per']:.4f}")
+    table.add_row("avg_rtf", f"{summary['avg_rtf']:.3f}")
+    table.add_row("asr mean batch", str(summary["asr_batches"].get("mean_size", 0.0)))
+    console.print(table)
@@ -50,12 +50,10 @@ def _safe_print(text: str, style: str = "") -> None:
         print(text.encode("ascii", "replace").decode("ascii"))
 
 def _get_kernel(model_pack: Optional[str] = None, llm_name: Optional[str] = None) -> Kernel:
+    from ipa_core.config import loader
     from ipa_core.config.overrides import apply_overrides
-    if model_pack:
-        apply_overrides({"model_pack": model_pack})
-    if llm_name:
-        apply_overrides({"llm": {"name": llm_name}})
-    return create_kernel()
+    cfg = apply_overrides(loader.load_config(), model_pack=model_pack, llm_name=llm_name)
+    return create_kernel(cfg)
 
 def _exit_code_for_error(exc: Exception) -> int:
     from ipa_core.errors import FileNotFound, UnsupportedFormat, ValidationError
@@ -12,6 +12,9 @@ from .practice import ipa_practice
 from .explore import ipa_explore, ipa_list_sounds
 from .compare import compare, transcribe, feedback
 from .plugins import model_app, plugin_app
+from .textref import textref_app
+from .tts import tts_app
+from .batch import batch_compare
 
 app = typer.Typer(help="PronunciaPA: Reconocimiento y evaluación fonética")
 config_app = typer.Typer(help="Gestión de configuración")
@@ -19,6 +22,8 @@ config_app = typer.Typer(help="Gestión de configuración")
 app.add_typer(config_app, name="config")
 app.add_typer(plugin_app, name="plugins")
 app.add_typer(model_app, name="models")
+app.add_typer(textref_app, name="textref")
+app.add_typer(tts_app, name="tts")
 
 ipa_app = typer.Typer(help="Explorador y práctica de sonidos IPA")
 app.add_typer(ipa_app, name="ipa")
@@ -30,6 +35,7 @@ ipa_app.command("list-sounds")(ipa_list_sounds)
 app.command("compare")(compare)
 app.command("transcribe")(transcribe)
 app.command("feedback")(feedback)
+app.command("batch-compare")(batch_compare)
 
 @app.command()
 def health(
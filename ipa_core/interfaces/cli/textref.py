@@ -0,0 +1,55 @@
+from __future__ import annotations
+import asyncio
+from typing import List, Optional
+import typer
+from rich.table import Table
+
+from ipa_core.config import loader
+from ipa_core.plugins import registry
+from ipa_core.textref.cache import get_global_cache
+from ipa_core.textref.warmup import warm_languages
+from .helpers import console, _emit_json
+
+textref_app = typer.Typer(help="Cache de transcripciones texto→IPA")
+
+@textref_app.command("warm")
+def textref_warm(
+    langs: Optional[List[str]] = typer.Option(None, "--lang", "-l", help="Idiomas (default: todos con lecciones)"),
+    textref: Optional[str] = typer.Option(None, "--textref", help="Proveedor (default: el de la config)"),
+    concurrency: int = typer.Option(4, "--concurrency", help="Transcripciones simultáneas"),
+    json_output: bool = typer.Option(False, "--json"),
+):
+    """Precalcular G2P de las frases de lecciones y roadmaps en el cache persistente."""
+    cfg = loader.load_config()
+    name = (textref or cfg.textref.name).lower()
+    params = {**cfg.textref.params, "cache": True}
+    provider = registry.resolve_textref(name, params, strict_mode=cfg.strict_mode)
+
+    async def _run():
+        await provider.setup()
+        try:
+            return await warm_languages(provider, langs, concurrency=concurrency)
+        finally:
+            await provider.teardown()
+
+    reports = asyncio.run(_run())
+    cache = get_global_cache()
+    cache.flush()
+    payload = {
+        "textref": name,
+        "store": str(cache.store.db_path) if cache.store is not None else None,
+        "languages": [r.to_dict() for r in reports],
+        "cache": cache.tier_stats(),
+    }
+    if json_output:
+        _emit_json(payload)
+        return
+    table = Table(title=f"Warm-up TextRef ({name})")
+    table.add_column("Idioma"); table.add_column("Frases"); table.add_column("Errores")
+    for r in reports:
+        table.add_row(r.lang, str(r.texts), str(len(r.errors)))
+    console.print(table)
+    if payload["store"] is None:
+        console.print("⚠ Cache persistente desactivado (PRONUNCIAPA_TEXTREF_CACHE_DB vacío)", style="yellow")
+    else:
+        console.print(f"✓ Cache en {payload['store']}", style="green")
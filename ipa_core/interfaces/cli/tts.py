@@ -0,0 +1,39 @@
+from __future__ import annotations
+import asyncio
+from typing import List, Optional
+import typer
+from rich.table import Table
+
+from ipa_core.config import loader
+from ipa_core.tts.cache import get_tts_audio_cache
+from ipa_core.tts.precompute import precompute_catalog_audio
+from .helpers import console, _emit_json
+
+tts_app = typer.Typer(help="Síntesis de voz (TTS) y cache de audio")
+
+@tts_app.command("precompute")
+def tts_precompute(
+    langs: Optional[List[str]] = typer.Option(None, "--lang", "-l", help="Idiomas (default: todos los catálogos)"),
+    concurrency: int = typer.Option(2, "--concurrency", help="Síntesis simultáneas"),
+    json_output: bool = typer.Option(False, "--json"),
+):
+    """Sintetizar los ejemplos del catálogo IPA en el cache de audio."""
+    cache = get_tts_audio_cache()
+    if cache is None:
+        console.print("Error: cache TTS desactivado (PRONUNCIAPA_TTS_CACHE_DIR vacío)", style="red")
+        raise typer.Exit(1)
+    cfg = loader.load_config()
+    reports = asyncio.run(precompute_catalog_audio(
+        cfg.tts.name, cfg.tts.params, cache, langs, concurrency=concurrency, strict_mode=cfg.strict_mode,
+    ))
+    payload = {"tts": cfg.tts.name, "languages": [r.to_dict() for r in reports], "cache": cache.stats()}
+    if json_output:
+        _emit_json(payload)
+        return
+    table = Table(title=f"Audio TTS precalculado ({cfg.tts.name})")
+    table.add_column("Idioma"); table.add_column("Textos"); table.add_column("Nuevos")
+    table.add_column("En cache"); table.add_column("Errores")
+    for r in reports:
+        table.add_row(r.lang, str(r.texts), str(r.rendered), str(r.cached), str(len(r.errors)))
+    console.print(table)
+    console.print(f"✓ Cache en {cache.root}", style="green")
@@ -3,10 +3,19 @@
 El catálogo es agnóstico al idioma: soportar un nuevo idioma requiere
 únicamente añadir un ``{lang}.yaml`` (y opcionalmente ``{lang}_learning.yaml``)
 en el directorio de catálogos (``data/ipa_catalog/``).
+
+Los YAML se parsean una sola vez por proceso en un :class:`CatalogIndex`
+(con el loader C de LibYAML si está disponible), que además precalcula
+búsquedas por id e IPA de cada sonido. Un documento se vuelve a parsear
+sólo si cambia su ``mtime``/tamaño, y el ``stat`` se hace como mucho una
+vez cada ``check_interval`` segundos: las peticiones calientes no tocan
+disco. Los documentos son compartidos; quien los modifique debe copiarlos.
 """
 from __future__ import annotations
 
-import functools
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 import os
 from typing import Any, Optional
@@ -14,6 +23,10 @@ from typing import Any, Optional
 import yaml
 
 _CATALOG_ENV = "PRONUNCIAPA_IPA_CATALOG_DIR"
+_CHECK_INTERVAL_ENV = "PRONUNCIAPA_IPA_CATALOG_CHECK_INTERVAL"
+_DEFAULT_CHECK_INTERVAL = 2.0
+
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def normalize_lang(lang: str) -> str:
@@ -33,46 +46,176 @@ def resolve_catalog_dir() -> Path:
     return repo_root / "data" / "ipa_catalog"
 
 
+def _check_interval_from_env() -> float:
+    try:
+        return max(0.0, float(os.getenv(_CHECK_INTERVAL_ENV, _DEFAULT_CHECK_INTERVAL)))
+    except ValueError:
+        return _DEFAULT_CHECK_INTERVAL
+
+
+@dataclass
+class CatalogDocument:
+    """YAML de catálogo parseado, con búsquedas de sonidos precalculadas."""
+
+    path: Path
+    data: Any
+    signature: tuple[int, int]
+    checked_at: float = 0.0
+    sounds: list[dict[str, Any]] = field(init=False, repr=False)
+    _by_id: dict[str, int] = field(init=False, repr=False)
+    _by_ipa: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.sounds = list_sounds(self.data) if isinstance(self.data, dict) else []
+        self._by_id, self._by_ipa = {}, {}
+        for pos, sound in enumerate(self.sounds):
+            if sound.get("id") is not None:
+                self._by_id.setdefault(sound["id"], pos)
+            if sound.get("ipa") is not None:
+                self._by_ipa.setdefault(sound["ipa"], pos)
+
+    def find_sound(self, sound_id: str, full_sound_id: Optional[str] = None) -> Optional[dict[str, Any]]:
+        """Primer sonido con ``id`` en (``sound_id``, ``full_sound_id``) o ``ipa == sound_id``."""
+        hits = [
+            pos for pos in (
+                self._by_id.get(sound_id),
+                self._by_id.get(full_sound_id) if full_sound_id is not None else None,
+                self._by_ipa.get(sound_id),
+            )
+            if pos is not None
+        ]
+        return self.sounds[min(hits)] if hits else None
+
+
+class CatalogIndex:
+    """Cache en proceso de los YAML de un directorio de catálogos.
+
+    Parameters
+    ----------
+    catalog_dir:
+        Directorio; por defecto :func:`resolve_catalog_dir`.
+    check_interval:
+        Segundos entre comprobaciones de ``mtime`` de un mismo archivo
+        (0 = comprobar siempre). Por defecto
+        ``PRONUNCIAPA_IPA_CATALOG_CHECK_INTERVAL`` o 2 s.
+    """
+
+    def __init__(self, catalog_dir: Optional[Path] = None, *, check_interval: Optional[float] = None) -> None:
+        self._catalog_dir = Path(catalog_dir) if catalog_dir is not None else None
+        self.check_interval = _check_interval_from_env() if check_interval is None else check_interval
+        self._docs: dict[str, CatalogDocument] = {}
+        self._listing: Optional[tuple[float, int, list[str]]] = None
+        self._lock = threading.Lock()
+        self.parses = 0
+
+    @property
+    def catalog_dir(self) -> Path:
+        return self._catalog_dir if self._catalog_dir is not None else resolve_catalog_dir()
+
+    def document(self, name: str) -> Optional[CatalogDocument]:
+        """Documento ``{name}.yaml`` (``None`` si no existe)."""
+        path = self.catalog_dir / f"{name}.yaml"
+        key = str(path)
+        now = time.monotonic()
+        doc = self._docs.get(key)
+        if doc is not None and now - doc.checked_at < self.check_interval:
+            return doc
+        try:
+            st = path.stat()
+        except OSError:
+            self._docs.pop(key, None)
+            return None
+        signature = (st.st_mtime_ns, st.st_size)
+        if doc is not None and doc.signature == signature:
+            doc.checked_at = now
+            return doc
+        with self._lock:
+            doc = self._docs.get(key)
+            if doc is None or doc.signature != signature:
+                with open(path, "rb") as f:
+                    data = yaml.load(f, Loader=_YamlLoader)
+                self.parses += 1
+                doc = CatalogDocument(path=path, data=data, signature=signature)
+                self._docs[key] = doc
+            doc.checked_at = now
+            return doc
+
+    def data(self, name: str) -> dict[str, Any]:
+        """Contenido de ``{name}.yaml`` (``{}`` si falta o está vacío)."""
+        doc = self.document(name)
+        return doc.data if doc is not None and isinstance(doc.data, dict) else {}
+
+    def names(self) -> list[str]:
+        """Nombres (``stem``) de los YAML del directorio, ordenados."""
+        catalog_dir = self.catalog_dir
+        now = time.monotonic()
+        listing = self._listing
+        if listing is not None and now - listing[0] < self.check_interval:
+            return listing[2]
+        try:
+            mtime = catalog_dir.stat().st_mtime_ns
+        except OSError:
+            self._listing = (now, -1, [])
+            return []
+        if listing is None or listing[1] != mtime:
+            listing = (now, mtime, sorted(p.stem for p in catalog_dir.glob("*.yaml")))
+        else:
+            listing = (now, mtime, listing[2])
+        self._listing = listing
+        return listing[2]
+
+    def invalidate(self) -> None:
+        """Olvidar todo lo parseado."""
+        with self._lock:
+            self._docs.clear()
+            self._listing = None
+
+
+_indexes: dict[str, CatalogIndex] = {}
+
+
+def get_catalog_index(catalog_dir: Optional[Path] = None) -> CatalogIndex:
+    """Índice compartido del directorio (por defecto :func:`resolve_catalog_dir`)."""
+    resolved = Path(catalog_dir) if catalog_dir is not None else resolve_catalog_dir()
+    key = str(resolved)
+    index = _indexes.get(key)
+    if index is None:
+        index = _indexes.setdefault(key, CatalogIndex(resolved))
+    return index
+
+
 def available_languages() -> list[str]:
     """Return list of languages that have a catalog file."""
-    catalog_dir = resolve_catalog_dir()
-    if not catalog_dir.exists():
-        return []
-    return sorted(
-        p.stem for p in catalog_dir.glob("*.yaml")
-        if not p.stem.endswith("_learning") and not p.stem.endswith("_inventory")
-    )
+    return [
+        name for name in get_catalog_index().names()
+        if not name.endswith("_learning") and not name.endswith("_inventory")
+    ]
 
 
-@functools.lru_cache(maxsize=32)
 def load_catalog(lang: str) -> dict[str, Any]:
-    """Load the catalog for a given language (cached)."""
+    """Load the catalog for a given language (cached, invalidated on file change)."""
     lang_key = normalize_lang(lang)
-    catalog_dir = resolve_catalog_dir()
-    path = catalog_dir / f"{lang_key}.yaml"
-    if not path.exists():
+    index = get_catalog_index()
+    doc = index.document(lang_key)
+    if doc is None:
         raise FileNotFoundError(
-            f"IPA catalog not found: {path}. "
+            f"IPA catalog not found: {index.catalog_dir / f'{lang_key}.yaml'}. "
             f"Available: {available_languages()}"
         )
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
-    if not isinstance(data, dict):
+    if not isinstance(doc.data, dict):
         raise ValueError(f"Invalid catalog format for {lang_key}")
-    return data
+    return doc.data
 
 
-@functools.lru_cache(maxsize=32)
 def load_inventory(lang: str) -> dict[str, Any]:
-    """Load the inventory file for a given language (cached)."""
+    """Load the inventory file for a given language (cached, invalidated on file change)."""
     lang_key = normalize_lang(lang)
-    catalog_dir = resolve_catalog_dir()
+    index = get_catalog_index()
     # Try dialect-specific first, then generic
     for suffix in (f"{lang_key}_inventory", f"{lang}_inventory"):
-        path = catalog_dir / f"{suffix}.yaml"
-        if path.exists():
-            data = yaml.safe_load(path.read_text(encoding="utf-8"))
-            if isinstance(data, dict):
-                return data
+        doc = index.document(suffix)
+        if doc is not None and isinstance(doc.data, dict):
+            return doc.data
     raise FileNotFoundError(f"Inventory not found for {lang_key}")
 
 
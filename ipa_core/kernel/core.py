@@ -256,7 +256,23 @@ def _validate_asr_backend(cfg: AppConfig, asr: ASRBackend) -> None:
 def _load_language_pack(cfg: AppConfig) -> Optional[LanguagePack]:
     if not cfg.language_pack:
         return None
-    return load_language_pack(cfg.language_pack)
+    pack = load_language_pack(cfg.language_pack)
+    _register_pack_inventory(cfg.language_pack, pack)
+    return pack
+
+
+def _register_pack_inventory(pack_ref: str, pack: LanguagePack) -> None:
+    """Amplía la matriz de distancias fonéticas con el inventario del pack."""
+    from ipa_core.compare.distance_matrix import register_inventory
+    from ipa_core.normalization.inventory import Inventory
+
+    try:
+        manifest_path = resolve_manifest_path(pack_ref)
+        inventory = Inventory.from_yaml(pack.inventory.resolve_path(manifest_path.parent))
+        register_inventory(inventory.all_phones)
+    except Exception as exc:
+        # La matriz es una optimización: sin ella las distancias se calculan igual.
+        logger.warning("Could not precompute distance matrix for pack %s: %s", pack_ref, exc)
 
 
 def _load_model_pack(cfg: AppConfig) -> tuple[Optional[ModelPack], Optional[Path]]:
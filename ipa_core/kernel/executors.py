@@ -0,0 +1,283 @@
+"""Pools de ejecución con nombre para el trabajo bloqueante.
+
+La inferencia ASR, el VAD (Silero), la conversión de audio (ffmpeg) y el
+G2P son CPU-bound o bloqueantes.  En vez de compartir el executor por
+defecto de asyncio (o correr en línea y bloquear el event loop), cada tipo
+de trabajo usa su propio pool acotado: una inferencia lenta no retrasa la
+conversión de audio ni las actualizaciones de estado del WebSocket.
+
+- :func:`get_executor` devuelve el :class:`NamedExecutor` de un nombre
+  (``asr``, ``vad``, ``audio``, ``g2p``); :meth:`NamedExecutor.run` es el
+  equivalente a ``loop.run_in_executor`` con métricas.
+- En modo ``process`` el pool es un ``ProcessPoolExecutor``: la inferencia
+  escala en varios núcleos sin el GIL.  La función y sus argumentos deben
+  ser serializables; :func:`worker_resource` guarda un recurso (p. ej. el
+  modelo) por proceso trabajador, así se carga una sola vez por worker.
+  Sólo los pools de :data:`PROCESS_POOLS` (``asr``: Allosaurus, el backend
+  unificado y Wav2Vec2) tienen puntos de entrada serializables; los demás
+  pasan closures, así que ``process`` se ignora (con un aviso) si viene del
+  entorno y se rechaza en :func:`configure_executor`.
+- :func:`executor_stats` reporta por pool la utilización y los
+  histogramas de espera en cola y de ejecución.
+
+Variables de entorno
+--------------------
+``PRONUNCIAPA_EXECUTOR_<NOMBRE>_WORKERS``
+    Hilos/procesos del pool (p. ej. ``PRONUNCIAPA_EXECUTOR_ASR_WORKERS=2``).
+``PRONUNCIAPA_EXECUTOR_<NOMBRE>_MODE``
+    ``thread`` (default) o ``process`` (sólo pools de :data:`PROCESS_POOLS`).
+"""
+from __future__ import annotations
+
+import asyncio
+import bisect
+import functools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Literal, Optional, TypeVar
+
+T = TypeVar("T")
+ExecutorMode = Literal["thread", "process"]
+
+logger = logging.getLogger(__name__)
+
+# Cotas superiores (ms) de los buckets de los histogramas; el último es +inf.
+HISTOGRAM_BOUNDS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_CPUS = os.cpu_count() or 1
+DEFAULT_WORKERS: Dict[str, int] = {
+    "asr": min(4, _CPUS),
+    "vad": 2,
+    "audio": min(4, _CPUS),
+    "g2p": 2,
+}
+
+# Pools cuyos llamadores pasan funciones serializables en modo proceso.
+PROCESS_POOLS = frozenset({"asr"})
+
+
+@dataclass
+class Histogram:
+    """Histograma acumulado en buckets fijos (ms)."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(HISTOGRAM_BOUNDS_MS) + 1))
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, ms)] += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def to_dict(self) -> dict[str, Any]:
+        count = sum(self.counts)
+        labels = [f"le_{b}" for b in HISTOGRAM_BOUNDS_MS] + ["inf"]
+        return {
+            "count": count,
+            "mean_ms": round(self.total_ms / count, 3) if count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+def _timed_call(fn: Callable[..., T], *args: Any) -> tuple[float, float, T]:
+    """Ejecutar ``fn`` en el worker y devolver (inicio, fin, resultado) en reloj de pared."""
+    started = time.time()
+    result = fn(*args)
+    return started, time.time(), result
+
+
+class NamedExecutor:
+    """Pool acotado (hilos o procesos) con métricas de cola y uso.
+
+    Parameters
+    ----------
+    name:
+        Nombre del pool (aparece en las métricas y en los hilos).
+    max_workers:
+        Hilos o procesos del pool.
+    mode:
+        ``"thread"`` o ``"process"``.
+    """
+
+    def __init__(self, name: str, *, max_workers: int, mode: ExecutorMode = "thread") -> None:
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Modo de executor desconocido: {mode}")
+        self.name = name
+        self.max_workers = max(1, int(max_workers))
+        self.mode: ExecutorMode = mode
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._created = time.time()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.busy_s = 0.0
+        self.queue_wait = Histogram()
+        self.run_time = Histogram()
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.mode == "process":
+                        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.max_workers,
+                            thread_name_prefix=f"pronunciapa-{self.name}",
+                        )
+        return self._executor
+
+    @property
+    def is_process(self) -> bool:
+        return self.mode == "process"
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Ejecutar ``fn(*args, **kwargs)`` en el pool sin bloquear el event loop."""
+        if kwargs:
+            fn = functools.partial(fn, **kwargs)
+        loop = asyncio.get_running_loop()
+        submitted = time.time()
+        self.submitted += 1
+        try:
+            started, finished, result = await loop.run_in_executor(
+                self.executor, _timed_call, fn, *args
+            )
+        except BaseException:
+            self.failed += 1
+            raise
+        self.completed += 1
+        self.queue_wait.observe(max(0.0, started - submitted) * 1000)
+        self.run_time.observe((finished - started) * 1000)
+        self.busy_s += finished - started
+        return result
+
+    @property
+    def pending(self) -> int:
+        return self.submitted - self.completed - self.failed
+
+    def stats(self) -> dict[str, Any]:
+        elapsed = max(1e-9, time.time() - self._created)
+        return {
+            "mode": self.mode,
+            "max_workers": self.max_workers,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "pending": self.pending,
+            "utilization": round(min(1.0, self.busy_s / (elapsed * self.max_workers)), 4),
+            "queue_wait_ms": self.queue_wait.to_dict(),
+            "run_ms": self.run_time.to_dict(),
+        }
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# ----------------------------------------------------------------------
+# Pools del proceso
+# ----------------------------------------------------------------------
+
+_executors: Dict[str, NamedExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _from_env(name: str) -> NamedExecutor:
+    prefix = f"PRONUNCIAPA_EXECUTOR_{name.upper()}"
+    workers = int(os.environ.get(f"{prefix}_WORKERS", DEFAULT_WORKERS.get(name, 2)))
+    mode = os.environ.get(f"{prefix}_MODE", "thread").strip().lower() or "thread"
+    if mode == "process" and name not in PROCESS_POOLS:
+        logger.warning(
+            "%s_MODE=process no está soportado para el pool '%s' (recibe closures); se usa thread",
+            prefix, name,
+        )
+        mode = "thread"
+    return NamedExecutor(name, max_workers=workers, mode=mode)  # type: ignore[arg-type]
+
+
+def get_executor(name: str) -> NamedExecutor:
+    """Pool compartido del proceso para ``name`` (creado perezosamente)."""
+    executor = _executors.get(name)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(name)
+            if executor is None:
+                executor = _from_env(name)
+                _executors[name] = executor
+    return executor
+
+
+def configure_executor(name: str, *, max_workers: int, mode: ExecutorMode = "thread") -> NamedExecutor:
+    """Reemplazar el pool ``name`` (el anterior se cierra sin esperar)."""
+    if mode == "process" and name not in PROCESS_POOLS:
+        raise ValueError(f"El pool '{name}' no admite modo process (recibe closures)")
+    executor = NamedExecutor(name, max_workers=max_workers, mode=mode)
+    with _executors_lock:
+        previous = _executors.get(name)
+        _executors[name] = executor
+    if previous is not None:
+        previous.shutdown(wait=False)
+    return executor
+
+
+async def run_in_pool(name: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Atajo de ``get_executor(name).run(fn, *args, **kwargs)``."""
+    return await get_executor(name).run(fn, *args, **kwargs)
+
+
+def executor_stats() -> dict[str, Any]:
+    """Métricas de los pools creados hasta ahora."""
+    return {name: executor.stats() for name, executor in sorted(_executors.items())}
+
+
+def shutdown_executors(*, wait: bool = True) -> None:
+    """Cerrar y olvidar todos los pools."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait)
+
+
+# ----------------------------------------------------------------------
+# Recursos por proceso trabajador
+# ----------------------------------------------------------------------
+
+_worker_resources: Dict[Hashable, Any] = {}
+_worker_lock = threading.Lock()
+
+
+def worker_resource(key: Hashable, factory: Callable[[], T]) -> T:
+    """Recurso cacheado en el proceso actual (p. ej. un modelo por worker)."""
+    resource = _worker_resources.get(key)
+    if resource is None:
+        with _worker_lock:
+            resource = _worker_resources.get(key)
+            if resource is None:
+                resource = factory()
+                _worker_resources[key] = resource
+    return resource
+
+
+__all__ = [
+    "DEFAULT_WORKERS",
+    "HISTOGRAM_BOUNDS_MS",
+    "Histogram",
+    "NamedExecutor",
+    "PROCESS_POOLS",
+    "configure_executor",
+    "executor_stats",
+    "get_executor",
+    "run_in_pool",
+    "shutdown_executors",
+    "worker_resource",
+]
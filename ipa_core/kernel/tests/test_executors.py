@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from ipa_core.kernel.executors import (
+    NamedExecutor,
+    configure_executor,
+    executor_stats,
+    get_executor,
+    shutdown_executors,
+    worker_resource,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+async def test_named_pool_bounds_work_and_reports_queue_wait() -> None:
+    pool = NamedExecutor("asr", max_workers=1)
+    try:
+        results = await asyncio.gather(*(pool.run(time.sleep, 0.05) for _ in range(3)))
+    finally:
+        pool.shutdown()
+    assert results == [None, None, None]
+    stats = pool.stats()
+    assert stats["completed"] == 3 and stats["pending"] == 0
+    # Un solo worker: la tercera tarea espera a las dos anteriores.
+    assert stats["queue_wait_ms"]["count"] == 3
+    assert stats["queue_wait_ms"]["max_ms"] >= 90
+    assert stats["run_ms"]["buckets"]["le_100"] == 3
+    assert 0 < stats["utilization"] <= 1
+
+
+@pytest.mark.unit
+async def test_registry_env_process_mode_and_worker_resources(monkeypatch) -> None:
+    monkeypatch.setenv("PRONUNCIAPA_EXECUTOR_G2P_WORKERS", "3")
+    shutdown_executors()
+    try:
+        assert get_executor("g2p").max_workers == 3
+        assert get_executor("g2p") is get_executor("g2p")
+        process_pool = configure_executor("asr", max_workers=1, mode="process")
+        assert await process_pool.run(os.getpid) != os.getpid()
+        assert set(executor_stats()) == {"asr", "g2p"}
+    finally:
+        shutdown_executors()
+    assert executor_stats() == {}
+
+    loads: list[int] = []
+
+    def load_model() -> object:
+        loads.append(1)
+        return object()
+
+    first = worker_resource(("test", "model"), load_model)
+    assert worker_resource(("test", "model"), load_model) is first
+    assert loads == [1]
+
+
+@pytest.mark.unit
+@pytest.mark.reliability
+def test_process_mode_only_for_pools_with_serializable_entry_points(monkeypatch, caplog) -> None:
+    monkeypatch.setenv("PRONUNCIAPA_EXECUTOR_AUDIO_MODE", "process")
+    shutdown_executors()
+    try:
+        with caplog.at_level("WARNING", logger="ipa_core.kernel.executors"):
+            assert get_executor("audio").mode == "thread"
+        assert "PRONUNCIAPA_EXECUTOR_AUDIO_MODE=process" in caplog.text
+        with pytest.raises(ValueError):
+            configure_executor("vad", max_workers=1, mode="process")
+    finally:
+        shutdown_executors()
@@ -2,15 +2,24 @@
 
 This adapter calls the Ollama REST API to generate completions
 using models like TinyLlama or Phi-3 that are already downloaded.
+
+One pooled ``aiohttp.ClientSession`` (keep-alive, bounded connector) is
+opened in ``setup`` and reused by every request until ``teardown``.
+``stream`` yields response chunks as Ollama produces them (``"stream":
+true``, NDJSON); ``complete(..., on_token=cb)`` streams too and hands each
+chunk to ``cb`` before returning the full text.
 """
 from __future__ import annotations
 
+import json
 import os
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
 
 from ipa_core.errors import NotReadyError, ValidationError
 from ipa_core.plugins.base import BasePlugin
 
+TokenCallback = Callable[[str], Awaitable[None]]
+
 
 class OllamaAdapter(BasePlugin):
     """Adapter that calls Ollama's REST API for LLM completions.
@@ -26,6 +35,8 @@ class OllamaAdapter(BasePlugin):
         - temperature: Sampling temperature (default: 0.7)
         - num_ctx: Context window size (default: 4096)
         - timeout: Request timeout in seconds (default: 300)
+        - max_connections: Pooled connections to Ollama (default: 4)
+        - keepalive_timeout: Idle seconds before a pooled connection closes (default: 60)
     """
 
     def __init__(self, params: Optional[dict[str, Any]] = None) -> None:
@@ -40,10 +51,27 @@ class OllamaAdapter(BasePlugin):
         self._temperature = params.get("temperature", 0.7)
         self._num_ctx = params.get("num_ctx", 4096)
         self._timeout = params.get("timeout", 300)
-        self._session = None
+        self._max_connections = int(params.get("max_connections", 4))
+        self._keepalive_timeout = float(params.get("keepalive_timeout", 60))
+        self._session: Optional[Any] = None  # aiohttp.ClientSession
+
+    def _get_session(self) -> Any:
+        """Pooled session (created on first use if ``setup`` was skipped)."""
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(
+                limit=max(1, self._max_connections),
+                keepalive_timeout=self._keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
 
     async def setup(self) -> None:
-        """Verify Ollama is running and model is available."""
+        """Open the pooled session and verify Ollama is running and model is available.
+
+        The session is closed again if the check fails.
+        """
         try:
             import aiohttp
         except ImportError as e:
@@ -52,41 +80,62 @@ class OllamaAdapter(BasePlugin):
                 "Install with: pip install aiohttp"
             ) from e
 
+        session = self._get_session()
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self._base_url}/api/tags",
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status != 200:
-                        raise NotReadyError(
-                            f"Ollama server not responding at {self._base_url}"
-                        )
-                    data = await resp.json()
-                    models = [m.get("name", "") for m in data.get("models", [])]
-                    # Check if model exists (partial match for tags like :latest)
-                    if not any(self._model in m for m in models):
-                        available = ", ".join(models[:5]) or "none"
-                        raise NotReadyError(
-                            f"Model '{self._model}' not found in Ollama. "
-                            f"Available: {available}. "
-                            f"Run: ollama pull {self._model}"
-                        )
+            async with session.get(
+                f"{self._base_url}/api/tags",
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as resp:
+                if resp.status != 200:
+                    raise NotReadyError(
+                        f"Ollama server not responding at {self._base_url}"
+                    )
+                data = await resp.json()
+                models = [m.get("name", "") for m in data.get("models", [])]
+                # Check if model exists (partial match for tags like :latest)
+                if not any(self._model in m for m in models):
+                    available = ", ".join(models[:5]) or "none"
+                    raise NotReadyError(
+                        f"Model '{self._model}' not found in Ollama. "
+                        f"Available: {available}. "
+                        f"Run: ollama pull {self._model}"
+                    )
         except aiohttp.ClientError as e:
+            await self.teardown()
             raise NotReadyError(
                 f"Cannot connect to Ollama at {self._base_url}. "
                 f"Is Ollama running? Try: ollama serve"
             ) from e
+        except BaseException:
+            # A failed check must not leave the pooled session open.
+            await self.teardown()
+            raise
 
     async def teardown(self) -> None:
-        """Cleanup (no-op for stateless HTTP client)."""
-        pass
+        """Close the pooled session."""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+
+    def _payload(self, prompt: str, params: Optional[dict[str, Any]], *, stream: bool) -> tuple[dict[str, Any], float]:
+        merged = dict(params or {})
+        payload = {
+            "model": merged.get("model", self._model),
+            "prompt": prompt,
+            "stream": stream,
+            "options": {
+                "temperature": merged.get("temperature", self._temperature),
+                "num_ctx": merged.get("num_ctx", self._num_ctx),
+            },
+        }
+        return payload, merged.get("timeout", self._timeout)
 
     async def complete(
         self,
         prompt: str,
         *,
         params: Optional[dict[str, Any]] = None,
+        on_token: Optional[TokenCallback] = None,
         **kw,
     ) -> str:
         """Generate completion using Ollama's generate endpoint.
@@ -96,47 +145,78 @@ class OllamaAdapter(BasePlugin):
         prompt : str
             The prompt to send to the model.
         params : dict, optional
-            Override parameters for this call.
+            Override parameters for this call (``stream: true`` streams).
+        on_token : callable, optional
+            Async callback for each streamed chunk; implies streaming.
             
         Returns
         -------
         str
             The model's raw text response.
         """
+        if on_token is not None or (params or {}).get("stream"):
+            chunks = []
+            async for chunk in self.stream(prompt, params=params):
+                chunks.append(chunk)
+                if on_token is not None:
+                    await on_token(chunk)
+            return "".join(chunks)
+
         import aiohttp
 
-        merged = dict(params or {})
-        model = merged.get("model", self._model)
-        temperature = merged.get("temperature", self._temperature)
-        num_ctx = merged.get("num_ctx", self._num_ctx)
-        timeout = merged.get("timeout", self._timeout)
+        payload, timeout = self._payload(prompt, params, stream=False)
+        try:
+            async with self._get_session().post(
+                f"{self._base_url}/api/generate",
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as resp:
+                if resp.status != 200:
+                    text = await resp.text()
+                    raise ValidationError(
+                        f"Ollama error ({resp.status}): {text[:200]}"
+                    )
+                data = await resp.json()
+                return data.get("response", "")
+        except aiohttp.ClientError as e:
+            raise ValidationError(f"Ollama request failed: {e}") from e
 
-        payload = {
-            "model": model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": temperature,
-                "num_ctx": num_ctx,
-            },
-        }
+    async def stream(
+        self,
+        prompt: str,
+        *,
+        params: Optional[dict[str, Any]] = None,
+    ) -> AsyncIterator[str]:
+        """Yield response chunks as Ollama generates them (NDJSON stream)."""
+        import aiohttp
 
+        payload, timeout = self._payload(prompt, params, stream=True)
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self._base_url}/api/generate",
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=timeout),
-                ) as resp:
-                    if resp.status != 200:
-                        text = await resp.text()
-                        raise ValidationError(
-                            f"Ollama error ({resp.status}): {text[:200]}"
-                        )
-                    data = await resp.json()
-                    return data.get("response", "")
+            async with self._get_session().post(
+                f"{self._base_url}/api/generate",
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as resp:
+                if resp.status != 200:
+                    text = await resp.text()
+                    raise ValidationError(
+                        f"Ollama error ({resp.status}): {text[:200]}"
+                    )
+                async for line in resp.content:
+                    if not line.strip():
+                        continue
+                    data = json.loads(line)
+                    if data.get("error"):
+                        raise ValidationError(f"Ollama error: {data['error']}")
+                    chunk = data.get("response", "")
+                    if chunk:
+                        yield chunk
+                    if data.get("done"):
+                        break
         except aiohttp.ClientError as e:
             raise ValidationError(f"Ollama request failed: {e}") from e
+        except json.JSONDecodeError as e:
+            raise ValidationError(f"Ollama stream returned invalid JSON: {e}") from e
 
 
 __all__ = ["OllamaAdapter"]
@@ -145,6 +145,10 @@ class OllamaFeedbackAdapter(OllamaAdapter):
         Los mismos de OllamaAdapter (base_url, model, temperature, etc.)
         más:
         - fallback_on_error: bool — si True (default), usa rule_based si Ollama falla.
+
+    ``complete(..., on_token=cb)`` reenvía los fragmentos de Ollama a ``cb``
+    a medida que llegan (la sesión HTTP es la del pool de OllamaAdapter);
+    ``on_reset`` se llama cada vez que un intento se descarta.
     """
 
     # Señal para que FeedbackService pase el JSON del error report directamente
@@ -221,6 +225,10 @@ class OllamaFeedbackAdapter(OllamaAdapter):
         max_retries = max(1, self._max_retries)
         base_delay = max(0.1, self._base_delay)
 
+        # Cada intento se transmite en vivo por ``on_token``; si se descarta,
+        # ``on_reset`` avisa al consumidor que borre lo recibido.
+        on_reset = kw.pop("on_reset", None)
+
         for attempt in range(1, max_retries + 1):
             try:
                 runtime_params = dict(params or {})
@@ -239,6 +247,8 @@ class OllamaFeedbackAdapter(OllamaAdapter):
                 else:
                     raise LLMAPIError("Extracción de feedback falló o JSON no encontrado")
             except Exception as exc:
+                if on_reset is not None:
+                    await on_reset()
                 if attempt < max_retries:
                     logger.warning(
                         "Ollama request falló (intento %d/%d): %r. Reintentando en %.1fs...",
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from ipa_core.errors import NotReadyError  # noqa: E402
+from ipa_core.llm.ollama import OllamaAdapter  # noqa: E402
+from ipa_core.llm.ollama_feedback import OllamaFeedbackAdapter  # noqa: E402
+from ipa_core.services.feedback import generate_feedback  # noqa: E402
+
+_FEEDBACK = '{"summary": "Bien", "advice_short": "Vibra la r", "drills": []}'
+
+
+@pytest.fixture
+async def ollama_stub():
+    """Servidor HTTP local que imita ``/api/tags`` y ``/api/generate`` de Ollama."""
+    peers: set = set()
+    retried: set = set()
+    # Con "lento" en el prompt, el stub se detiene tras el primer fragmento
+    # hasta que el test libera ``gate`` (o pasan 2 s).
+    slow = SimpleNamespace(gate=asyncio.Event(), finished=False)
+
+    def peer(request: web.Request) -> object:
+        assert request.transport is not None
+        return request.transport.get_extra_info("peername")
+
+    async def tags(request: web.Request) -> web.Response:
+        peers.add(peer(request))
+        return web.json_response({"models": [{"name": "tiny:latest"}, {"name": "qwen3.5:4b"}]})
+
+    async def generate(request: web.Request) -> web.StreamResponse:
+        peers.add(peer(request))
+        body = await request.json()
+        text = _FEEDBACK if "ERROR REPORT" in body["prompt"] else f"eco: {body['prompt']}"
+        if "reintento" in body["prompt"] and body["prompt"] not in retried:
+            retried.add(body["prompt"])
+            text = "no es JSON"  # el primer intento de este prompt es inválido
+        if not body.get("stream"):
+            return web.json_response({"response": text, "done": True})
+        resp = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await resp.prepare(request)
+        for i in range(0, len(text), 7):
+            await resp.write((json.dumps({"response": text[i:i + 7], "done": False}) + "\n").encode())
+            if i == 0 and "lento" in body["prompt"]:
+                try:
+                    await asyncio.wait_for(slow.gate.wait(), timeout=2)
+                except asyncio.TimeoutError:
+                    pass
+        await resp.write((json.dumps({"response": "", "done": True}) + "\n").encode())
+        await resp.write_eof()
+        if "lento" in body["prompt"]:
+            slow.finished = True
+        return resp
+
+    app = web.Application()
+    app.router.add_get("/api/tags", tags)
+    app.router.add_post("/api/generate", generate)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    try:
+        yield f"http://127.0.0.1:{port}", peers, slow
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.integration
+@pytest.mark.performance
+async def test_adapter_reuses_pooled_session_and_streams_tokens(ollama_stub) -> None:
+    base_url, peers, _slow = ollama_stub
+    adapter = OllamaAdapter({"base_url": base_url, "model": "tiny"})
+    await adapter.setup()
+    session = adapter._session
+
+    assert await adapter.complete("hola") == "eco: hola"
+    assert await adapter.complete("adiós") == "eco: adiós"
+    chunks = [c async for c in adapter.stream("streaming")]
+    assert len(chunks) > 1 and "".join(chunks) == "eco: streaming"
+    received: list[str] = []
+
+    async def on_token(chunk: str) -> None:
+        received.append(chunk)
+
+    assert await adapter.complete("x", on_token=on_token) == "eco: x" == "".join(received)
+    assert adapter._session is session and len(peers) == 1  # keep-alive: una sola conexión
+
+    await adapter.teardown()
+    assert session is not None and session.closed and adapter._session is None
+
+
+@pytest.mark.integration
+async def test_feedback_adapter_streams_and_parses_feedback(ollama_stub) -> None:
+    base_url, _peers, _slow = ollama_stub
+    adapter = OllamaFeedbackAdapter({"base_url": base_url})
+    await adapter.setup()
+    received: list[str] = []
+
+    async def on_token(chunk: str) -> None:
+        received.append(chunk)
+
+    raw = await adapter.complete(json.dumps({"lang": "es", "ops": []}), on_token=on_token)
+    await adapter.teardown()
+
+    feedback = json.loads(raw)
+    assert feedback["source"] == "ollama" and feedback["advice_short"] == "Vibra la r"
+    assert "".join(received) == _FEEDBACK
+
+
+@pytest.mark.integration
+@pytest.mark.performance
+async def test_feedback_first_token_reaches_caller_before_completion_finishes(ollama_stub) -> None:
+    base_url, _peers, slow = ollama_stub
+    adapter = OllamaFeedbackAdapter({"base_url": base_url})
+    await adapter.setup()
+    received: list[str] = []
+    finished_at_first_token: list[bool] = []
+
+    async def on_token(chunk: str) -> None:
+        if not received:
+            finished_at_first_token.append(slow.finished)
+            slow.gate.set()  # el stub termina la respuesta sólo después
+        received.append(chunk)
+
+    feedback = await generate_feedback(
+        {"lang": "es", "target_text": "lento", "ops": []}, llm=adapter, on_token=on_token
+    )
+    await adapter.teardown()
+
+    assert finished_at_first_token == [False]
+    assert feedback["source"] == "ollama" and "".join(received) == _FEEDBACK
+
+
+@pytest.mark.integration
+@pytest.mark.reliability
+async def test_feedback_retry_streams_live_and_resets_discarded_attempt(ollama_stub) -> None:
+    base_url, _peers, _slow = ollama_stub
+    adapter = OllamaFeedbackAdapter({"base_url": base_url, "retry_base_delay": 0.1})
+    await adapter.setup()
+    events: list[str] = []
+
+    async def on_token(chunk: str) -> None:
+        events.append(chunk)
+
+    async def on_reset() -> None:
+        events.append("<reset>")
+
+    report = {"lang": "es", "target_text": "reintento", "ops": []}
+    raw = await adapter.complete(json.dumps(report), on_token=on_token, on_reset=on_reset)
+    await adapter.teardown()
+
+    assert json.loads(raw)["source"] == "ollama"
+    reset = events.index("<reset>")
+    assert "".join(events[:reset]) == "no es JSON"  # el intento descartado se transmitió en vivo
+    assert "".join(events[reset + 1:]) == _FEEDBACK
+
+
+@pytest.mark.integration
+@pytest.mark.reliability
+async def test_failed_setup_closes_pooled_session(ollama_stub) -> None:
+    base_url, _peers, _slow = ollama_stub
+    adapter = OllamaAdapter({"base_url": base_url, "model": "inexistente"})
+    session = adapter._get_session()
+
+    with pytest.raises(NotReadyError):
+        await adapter.setup()
+    assert session.closed and adapter._session is None
+
+    unreachable = OllamaAdapter({"base_url": "http://127.0.0.1:9"})
+    with pytest.raises(NotReadyError):
+        await unreachable.setup()
+    assert unreachable._session is None
@@ -0,0 +1,193 @@
+"""Normalizador de tokens IPA compilado y memorizado.
+
+:class:`CompiledNormalizer` produce exactamente lo mismo que
+``IPANormalizer`` (más el ``strip``/minúsculas/NFC previos del
+preprocesador cuando ``lowercase=True``), pero resuelve cada token con una
+sola búsqueda en diccionario: los símbolos del inventario, sus alias y las
+claves de las reglas alofónicas se precalculan al construirlo, y los tokens
+no vistos se calculan una vez y se guardan en un LRU acotado.
+
+Se construye una vez por (inventario, reglas alofónicas, opciones) y se
+reutiliza vía :class:`CompiledNormalizerCache`; el inventario se trata como
+inmutable mientras esté en uso.
+
+Uso
+---
+::
+
+    cache = CompiledNormalizerCache()
+    normalizer = cache.get(inventory, allophone_rules)
+    tokens = normalizer.normalize_many(["B", "a", " ð "])
+"""
+from __future__ import annotations
+
+import unicodedata
+import weakref
+from collections import OrderedDict
+from typing import Any, Iterable, Mapping, Optional
+
+from ipa_core.normalization.mappings import normalize_unicode
+from ipa_core.types import Token
+
+DEFAULT_TOKEN_CACHE_SIZE = 4096
+_MISSING = object()
+
+
+def _inventory_symbols(inventory: Any) -> set[str]:
+    """Símbolos conocidos del inventario (``Inventory`` o ``PhoneticInventory``)."""
+    symbols: set[str] = set()
+    if hasattr(inventory, "all_phones"):
+        symbols |= set(inventory.all_phones)
+    elif hasattr(inventory, "get_all_phones"):
+        symbols |= set(inventory.get_all_phones())
+    symbols |= set(getattr(inventory, "_aliases", None) or {})
+    return symbols
+
+
+class CompiledNormalizer:
+    """Mapa precalculado token crudo → token normalizado.
+
+    Parámetros
+    ----------
+    inventory : Inventory | PhoneticInventory | None
+        Inventario para alias canónicos y validación OOV.
+    allophone_rules : dict[str, str] | None
+        Colapso alofónico (alófono → fonema base).
+    lowercase : bool
+        Aplicar antes ``strip``/minúsculas/NFC como ``BasicPreprocessor``.
+    collapse_oov : bool
+        Marcar los tokens OOV con ``oov_marker`` (como ``IPANormalizer``).
+    cache_size : int
+        Tamaño del LRU de tokens no precalculados.
+    """
+
+    def __init__(
+        self,
+        inventory: Any = None,
+        allophone_rules: Optional[Mapping[str, str]] = None,
+        *,
+        lowercase: bool = False,
+        collapse_oov: bool = False,
+        oov_marker: str = "<?>",
+        cache_size: int = DEFAULT_TOKEN_CACHE_SIZE,
+    ) -> None:
+        self._inventory = inventory
+        self._rules = dict(allophone_rules or {})
+        self._lowercase = lowercase
+        self._collapse_oov = collapse_oov
+        self._oov_marker = oov_marker
+        self._cache_size = max(0, cache_size)
+        self._lru: "OrderedDict[str, Optional[Token]]" = OrderedDict()
+        self._oov: dict[str, bool] = {}
+
+        seeds = set(self._rules)
+        if inventory is not None:
+            seeds |= _inventory_symbols(inventory)
+        self._table: dict[str, Optional[Token]] = {token: self._compute(token) for token in seeds}
+
+    def _compute(self, token: str) -> Optional[Token]:
+        text = token
+        if self._lowercase:
+            text = unicodedata.normalize("NFC", text.strip().lower())
+        normalized = normalize_unicode(text.strip())
+        if not normalized:
+            return None
+        if self._inventory is not None:
+            normalized = self._inventory.get_canonical(normalized)
+        normalized = self._rules.get(normalized, normalized)
+        if self._collapse_oov and self._inventory is not None and not self._inventory.is_valid_phone(normalized):
+            return f"{self._oov_marker}{normalized}"
+        return normalized
+
+    def normalize_token(self, token: Any) -> Optional[Token]:
+        """Token normalizado, o ``None`` si queda vacío."""
+        key = token if type(token) is str else str(token)
+        result = self._table.get(key, _MISSING)
+        if result is not _MISSING:
+            return result  # type: ignore[return-value]
+        lru = self._lru
+        result = lru.get(key, _MISSING)
+        if result is not _MISSING:
+            lru.move_to_end(key)
+            return result  # type: ignore[return-value]
+        result = self._compute(key)
+        if self._cache_size:
+            lru[key] = result
+            if len(lru) > self._cache_size:
+                lru.popitem(last=False)
+        return result
+
+    def normalize_many(self, tokens: Iterable[Any]) -> list[Token]:
+        """Normalizar una secuencia descartando los tokens vacíos."""
+        table = self._table
+        out: list[Token] = []
+        for token in tokens:
+            key = token if type(token) is str else str(token)
+            result = table.get(key, _MISSING)
+            if result is _MISSING:
+                result = self.normalize_token(key)
+            if result:
+                out.append(result)  # type: ignore[arg-type]
+        return out
+
+    def oov_tokens(self, tokens: Iterable[Token]) -> list[Token]:
+        """Tokens que no son fonemas ni símbolos del inventario (como ``BasicPreprocessor``)."""
+        inventory = self._inventory
+        if inventory is None:
+            return []
+        out = []
+        for token in tokens:
+            is_oov = self._oov.get(token)
+            if is_oov is None:
+                is_oov = not inventory.is_valid_phone(token) and not inventory.is_valid_symbol(token)
+                if len(self._oov) < max(self._cache_size, len(self._table)):
+                    self._oov[token] = is_oov
+            if is_oov:
+                out.append(token)
+        return out
+
+    def stats(self) -> dict[str, int]:
+        return {"precomputed": len(self._table), "cached": len(self._lru)}
+
+
+class CompiledNormalizerCache:
+    """Normalizadores compilados por (inventario, reglas, opciones).
+
+    El inventario se identifica por identidad (referencia débil); las reglas
+    por contenido. Guarda como mucho ``max_entries`` normalizadores.
+    """
+
+    def __init__(self, max_entries: int = 16) -> None:
+        self._max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[tuple[Any, ...], tuple[Any, CompiledNormalizer]]" = OrderedDict()
+
+    def get(
+        self,
+        inventory: Any = None,
+        allophone_rules: Optional[Mapping[str, str]] = None,
+        **options: Any,
+    ) -> CompiledNormalizer:
+        key = (
+            id(inventory) if inventory is not None else None,
+            frozenset((allophone_rules or {}).items()),
+            tuple(sorted(options.items())),
+        )
+        entry = self._entries.get(key)
+        if entry is not None:
+            ref, normalizer = entry
+            if ref is None or ref() is inventory:
+                self._entries.move_to_end(key)
+                return normalizer
+        normalizer = CompiledNormalizer(inventory, allophone_rules, **options)
+        ref = weakref.ref(inventory) if inventory is not None else None
+        self._entries[key] = (ref, normalizer)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return normalizer
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = ["CompiledNormalizer", "CompiledNormalizerCache"]
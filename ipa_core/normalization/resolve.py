@@ -1,6 +1,12 @@
-"""Helpers para resolver inventarios desde language packs."""
+"""Helpers para resolver inventarios desde language packs.
+
+Los inventarios cargados se reutilizan mientras el YAML no cambie
+(mtime + tamaño), así los normalizadores compilados por inventario
+(:mod:`ipa_core.normalization.compiled`) se aprovechan entre peticiones.
+"""
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -13,6 +19,9 @@ _DEFAULT_PACK_BY_LANG = {
     "es": "es-mx",
 }
 
+_INVENTORY_CACHE: dict[Path, tuple[tuple[int, int], Inventory]] = {}
+_INVENTORY_LOCK = threading.Lock()
+
 
 def resolve_pack_id(
     *,
@@ -56,7 +65,21 @@ def load_inventory_for(
     if not pack_id:
         return None, None
     inv_path = packs_dir / pack_id / "inventory.yaml"
-    return Inventory.from_yaml(inv_path), pack_id
+    return _cached_inventory(inv_path), pack_id
+
+
+def _cached_inventory(path: Path) -> Inventory:
+    """``Inventory`` de ``path``, recargado sólo si cambió el archivo."""
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _INVENTORY_LOCK:
+        cached = _INVENTORY_CACHE.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+    inventory = Inventory.from_yaml(path)
+    with _INVENTORY_LOCK:
+        _INVENTORY_CACHE[path] = (signature, inventory)
+    return inventory
 
 
 __all__ = ["resolve_pack_id", "load_inventory_for"]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import random
+import unicodedata
+from pathlib import Path
+
+import pytest
+
+from ipa_core.normalization.compiled import CompiledNormalizer
+from ipa_core.normalization.inventory import Inventory
+from ipa_core.normalization.normalizer import IPANormalizer
+from ipa_core.normalization.resolve import load_inventory_for
+from ipa_core.preprocessor_basic import BasicPreprocessor
+
+_PACKS = Path(__file__).resolve().parents[3] / "plugins" / "language_packs"
+
+
+async def _reference(tokens, inventory, rules):
+    """Camino original de ``BasicPreprocessor``: un ``IPANormalizer`` por llamada."""
+    normalizer = IPANormalizer(inventory=inventory, collapse_oov=False)
+    normalizer.load_allophone_rules(rules)
+    raw = [unicodedata.normalize("NFC", str(t).strip().lower()) for t in tokens if str(t).strip()]
+    return await normalizer.normalize(raw)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("pack", ["es-mx", "en-us"])
+async def test_compiled_normalizer_matches_ipa_normalizer(pack: str) -> None:
+    inventory = Inventory.from_yaml(_PACKS / pack / "inventory.yaml")
+    rules = inventory.allophone_collapse
+    symbols = sorted(inventory.all_phones | set(inventory._aliases) | set(rules))
+    rng = random.Random(7)
+    noise = ["", " ", "A", " ɾ ", "é", "g", "ʧ", "x̞", "Θ", "ɡ", "r:", "<?>"]
+    tokens = [rng.choice(symbols + noise) for _ in range(2000)]
+
+    compiled = CompiledNormalizer(inventory, rules, lowercase=True, cache_size=8)
+    assert compiled.normalize_many(tokens) == await _reference(tokens, inventory, rules)
+    assert compiled.stats()["cached"] <= 8
+
+
+@pytest.mark.functional
+async def test_preprocessor_reuses_compiled_normalizer() -> None:
+    inventory, _ = load_inventory_for(lang="es")
+    assert load_inventory_for(lang="es")[0] is inventory
+    pre = BasicPreprocessor()
+    tokens = ["O", "l", "a", "zz"]
+    first = await pre.normalize_tokens(tokens, inventory=inventory)
+    second = await pre.normalize_tokens(tokens, inventory=inventory)
+    assert first == second
+    assert first["tokens"] == await _reference(tokens, inventory, {})
+    assert first["meta"]["oov_tokens"] == ["zz"]
+    assert len(pre._normalizers) == 1
@@ -3,18 +3,39 @@
 Un par mínimo es un par de palabras que difieren en exactamente un fonema.
 Ejemplo: /pata/ vs /bata/ — contraste /p/ ↔ /b/.
 
+Los pares del léxico salen de un índice de *comodines*
+(:class:`MinimalPairIndex`): cada palabra se agrupa, para cada posición, por
+su secuencia de fonemas con esa posición enmascarada (``p a * a``).  Dos
+palabras forman un par mínimo si y sólo si comparten un grupo, así que
+encontrar todos los pares es casi lineal en el tamaño del léxico y las
+búsquedas por fonema, contraste, posición o palabra no recorren el léxico.
+El índice se puede guardar por language pack (ver :func:`default_index_path`).
+
 Uso
 ---
 >>> from ipa_core.packs.minimal_pairs import MinimalPairGenerator
->>> gen = MinimalPairGenerator.from_lexicon(lexicon, language="es-mx")
+>>> gen = MinimalPairGenerator.from_lexicon_strings(lexicon, language="es-mx")
 >>> pairs = gen.find_pairs_for_phoneme("r")
 >>> curated = gen.get_curated_pairs(language="es-mx")
+
+Variables de entorno
+--------------------
+``PRONUNCIAPA_MINIMAL_PAIRS_DIR``
+    Directorio de índices persistidos (default:
+    ``~/.cache/pronunciapa/minimal_pairs``).  Vacío desactiva la persistencia.
 """
 from __future__ import annotations
 
+import gzip
+import hashlib
+import json
 import logging
+import os
+import tempfile
 from dataclasses import dataclass, field
-from typing import Iterator, Optional
+from itertools import combinations
+from pathlib import Path
+from typing import Iterable, Iterator, Mapping, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -203,6 +224,211 @@ _CURATED: dict[str, list[MinimalPair]] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Índice de comodines
+# ---------------------------------------------------------------------------
+
+_INDEX_VERSION = 1
+_MASK = "\x00"
+_SEP = "\x1f"
+
+
+def lexicon_fingerprint(lexicon: Mapping[str, Sequence[str]]) -> str:
+    """Huella estable del léxico tokenizado (invalida índices persistidos)."""
+    payload = json.dumps(
+        sorted((word, list(tokens)) for word, tokens in lexicon.items()),
+        ensure_ascii=False,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def default_index_path(pack_id: str) -> Optional[Path]:
+    """Ruta del índice persistido de un pack (``None`` si está desactivado)."""
+    raw = os.environ.get("PRONUNCIAPA_MINIMAL_PAIRS_DIR")
+    if raw is None:
+        root = Path.home() / ".cache" / "pronunciapa" / "minimal_pairs"
+    elif raw.strip():
+        root = Path(raw.strip()).expanduser()
+    else:
+        return None
+    return root / f"{pack_id}.json.gz"
+
+
+class MinimalPairIndex:
+    """Grupos de palabras que sólo difieren en una posición.
+
+    Cada grupo (*bucket*) guarda la posición enmascarada y las palabras que
+    comparten el resto de la secuencia; sólo se conservan grupos con al
+    menos dos fonemas distintos en esa posición (los que producen pares).
+    """
+
+    def __init__(
+        self,
+        words: list[str],
+        tokens: list[tuple[str, ...]],
+        buckets: list[tuple[int, list[int]]],
+        *,
+        fingerprint: str = "",
+    ) -> None:
+        self.words = words
+        self.tokens = tokens
+        self.buckets = buckets
+        self.fingerprint = fingerprint
+        self._by_phoneme: dict[str, list[int]] = {}
+        self._by_contrast: dict[tuple[str, str], list[int]] = {}
+        self._by_position: dict[int, list[int]] = {}
+        self._by_word: dict[str, list[int]] = {}
+        for bid, (pos, members) in enumerate(buckets):
+            phonemes = sorted({tokens[m][pos] for m in members})
+            for ph in phonemes:
+                self._by_phoneme.setdefault(ph, []).append(bid)
+            for contrast in combinations(phonemes, 2):
+                self._by_contrast.setdefault(contrast, []).append(bid)
+            self._by_position.setdefault(pos, []).append(bid)
+            for m in members:
+                self._by_word.setdefault(words[m], []).append(bid)
+
+    @classmethod
+    def build(cls, lexicon: Mapping[str, Sequence[str]]) -> "MinimalPairIndex":
+        """Indexar un léxico ``{palabra: [fonemas]}``."""
+        words = list(lexicon)
+        tokens = [tuple(lexicon[w]) for w in words]
+        groups: dict[str, tuple[int, list[int]]] = {}
+        for wid, toks in enumerate(tokens):
+            for pos in range(len(toks)):
+                key = _SEP.join(toks[:pos] + (_MASK,) + toks[pos + 1:])
+                groups.setdefault(key, (pos, []))[1].append(wid)
+        buckets = [
+            (pos, members)
+            for pos, members in groups.values()
+            if len(members) > 1 and len({tokens[m][pos] for m in members}) > 1
+        ]
+        return cls(words, tokens, buckets, fingerprint=lexicon_fingerprint(lexicon))
+
+    # ------------------------------------------------------------------
+    # Persistencia
+    # ------------------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        """Guardar el índice (JSON comprimido, escritura atómica)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": _INDEX_VERSION,
+            "fingerprint": self.fingerprint,
+            "words": self.words,
+            "ipa": [" ".join(t) for t in self.tokens],
+            "buckets": [[pos, members] for pos, members in self.buckets],
+        }
+        fd, tmp_name = tempfile.mkstemp(prefix=".tmp_", dir=path.parent)
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(gzip.compress(json.dumps(payload, ensure_ascii=False).encode("utf-8")))
+        os.replace(tmp_name, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "MinimalPairIndex":
+        data = json.loads(gzip.decompress(path.read_bytes()).decode("utf-8"))
+        if data.get("version") != _INDEX_VERSION:
+            raise ValueError(f"Versión de índice no soportada: {data.get('version')}")
+        return cls(
+            list(data["words"]),
+            [tuple(ipa.split()) for ipa in data["ipa"]],
+            [(int(pos), list(members)) for pos, members in data["buckets"]],
+            fingerprint=data.get("fingerprint", ""),
+        )
+
+    @classmethod
+    def load_or_build(cls, lexicon: Mapping[str, Sequence[str]], path: Optional[Path]) -> "MinimalPairIndex":
+        """Cargar el índice de ``path`` si corresponde a ``lexicon``; si no, construirlo y guardarlo."""
+        if path is None:
+            return cls.build(lexicon)
+        fingerprint = lexicon_fingerprint(lexicon)
+        if path.exists():
+            try:
+                index = cls.load(path)
+                if index.fingerprint == fingerprint:
+                    return index
+            except (OSError, ValueError, KeyError) as exc:
+                logger.warning("Índice de pares mínimos ilegible (%s): %s", path, exc)
+        index = cls.build(lexicon)
+        try:
+            index.save(path)
+        except OSError as exc:
+            logger.warning("No se pudo guardar el índice de pares mínimos en %s: %s", path, exc)
+        return index
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def _pairs(
+        self,
+        bucket_ids: Iterable[int],
+        *,
+        language: str,
+        phoneme: Optional[str] = None,
+        contrast: Optional[frozenset[str]] = None,
+        word: Optional[str] = None,
+    ) -> list[MinimalPair]:
+        found: list[tuple[int, int, int]] = []
+        for bid in bucket_ids:
+            pos, members = self.buckets[bid]
+            for a, b in combinations(members, 2):
+                ph_a, ph_b = self.tokens[a][pos], self.tokens[b][pos]
+                if ph_a == ph_b:
+                    continue
+                if phoneme is not None and phoneme not in (ph_a, ph_b):
+                    continue
+                if contrast is not None and frozenset((ph_a, ph_b)) != contrast:
+                    continue
+                if word is not None and word not in (self.words[a], self.words[b]):
+                    continue
+                found.append((a, b, pos))
+        found.sort()
+        return [
+            MinimalPair(
+                word1=self.words[a],
+                ipa1=" ".join(self.tokens[a]),
+                word2=self.words[b],
+                ipa2=" ".join(self.tokens[b]),
+                phoneme1=self.tokens[a][pos],
+                phoneme2=self.tokens[b][pos],
+                position=pos,
+                language=language,
+            )
+            for a, b, pos in found
+        ]
+
+    def all_pairs(self, *, language: str = "es") -> list[MinimalPair]:
+        return self._pairs(range(len(self.buckets)), language=language)
+
+    def pairs_for_phoneme(self, phoneme: str, *, language: str = "es") -> list[MinimalPair]:
+        return self._pairs(
+            self._by_phoneme.get(phoneme, []), language=language, phoneme=phoneme
+        )
+
+    def pairs_for_contrast(self, phoneme1: str, phoneme2: str, *, language: str = "es") -> list[MinimalPair]:
+        key = tuple(sorted((phoneme1, phoneme2)))
+        return self._pairs(
+            self._by_contrast.get(key, []),  # type: ignore[arg-type]
+            language=language,
+            contrast=frozenset(key),
+        )
+
+    def pairs_at_position(self, position: int, *, language: str = "es") -> list[MinimalPair]:
+        return self._pairs(self._by_position.get(position, []), language=language)
+
+    def pairs_for_word(self, word: str, *, language: str = "es") -> list[MinimalPair]:
+        return self._pairs(self._by_word.get(word, []), language=language, word=word)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "words": len(self.words),
+            "buckets": len(self.buckets),
+            "phonemes": len(self._by_phoneme),
+            "contrasts": len(self._by_contrast),
+        }
+
+
 # ---------------------------------------------------------------------------
 # Generador dinámico desde léxico
 # ---------------------------------------------------------------------------
@@ -217,6 +443,12 @@ class MinimalPairGenerator:
         Los fonemas deben estar ya tokenizados (un símbolo IPA por elemento).
     language : str
         Código de idioma (p.ej. ``"es-mx"``).
+    max_pairs : int | None
+        Límite opcional de pares devueltos por :meth:`iter_pairs`
+        (``None`` = todos).
+    pack_id : str | None
+        Si se indica, el índice se persiste en :func:`default_index_path`
+        y se reutiliza mientras el léxico no cambie.
     """
 
     def __init__(
@@ -224,11 +456,14 @@ class MinimalPairGenerator:
         lexicon: dict[str, list[str]],
         *,
         language: str = "es",
-        max_pairs: int = 500,
+        max_pairs: Optional[int] = None,
+        pack_id: Optional[str] = None,
     ) -> None:
         self._lexicon = lexicon
         self.language = language
         self.max_pairs = max_pairs
+        self.pack_id = pack_id
+        self._index: MinimalPairIndex | None = None
         self._pair_cache: list[MinimalPair] | None = None
 
     @classmethod
@@ -237,7 +472,8 @@ class MinimalPairGenerator:
         lexicon: dict[str, str],
         *,
         language: str = "es",
-        max_pairs: int = 500,
+        max_pairs: Optional[int] = None,
+        pack_id: Optional[str] = None,
     ) -> "MinimalPairGenerator":
         """Construir desde léxico con IPA como string (fonemas separados por espacios).
 
@@ -250,7 +486,18 @@ class MinimalPairGenerator:
             word: tokens.split()
             for word, tokens in lexicon.items()
         }
-        return cls(tokenized, language=language, max_pairs=max_pairs)
+        return cls(tokenized, language=language, max_pairs=max_pairs, pack_id=pack_id)
+
+    @property
+    def index(self) -> MinimalPairIndex:
+        """Índice de comodines del léxico (construido o cargado al primer uso)."""
+        if self._index is None:
+            path = default_index_path(self.pack_id) if self.pack_id else None
+            self._index = MinimalPairIndex.load_or_build(self._lexicon, path)
+            logger.debug(
+                "MinimalPairGenerator: índice listo (%s)", self._index.stats(),
+            )
+        return self._index
 
     # ------------------------------------------------------------------
     # API pública
@@ -262,11 +509,7 @@ class MinimalPairGenerator:
         Solo incluye pares donde *una* de las dos palabras contiene
         el fonema dado en la posición de contraste.
         """
-        all_pairs = self._build_all_pairs()
-        return [
-            p for p in all_pairs
-            if p.phoneme1 == phoneme or p.phoneme2 == phoneme
-        ]
+        return self.index.pairs_for_phoneme(phoneme, language=self.language)
 
     def find_pairs_for_contrast(
         self,
@@ -274,12 +517,15 @@ class MinimalPairGenerator:
         phoneme2: str,
     ) -> list[MinimalPair]:
         """Retorna pares que contrastan exactamente ``phoneme1`` vs ``phoneme2``."""
-        all_pairs = self._build_all_pairs()
-        return [
-            p for p in all_pairs
-            if (p.phoneme1 == phoneme1 and p.phoneme2 == phoneme2)
-            or (p.phoneme1 == phoneme2 and p.phoneme2 == phoneme1)
-        ]
+        return self.index.pairs_for_contrast(phoneme1, phoneme2, language=self.language)
+
+    def find_pairs_at_position(self, position: int) -> list[MinimalPair]:
+        """Retorna pares cuyo contraste está en ``position`` (0-based)."""
+        return self.index.pairs_at_position(position, language=self.language)
+
+    def find_pairs_for_word(self, word: str) -> list[MinimalPair]:
+        """Retorna los pares mínimos de ``word`` dentro del léxico."""
+        return self.index.pairs_for_word(word, language=self.language)
 
     def find_pairs_by_tag(self, tag: str) -> list[MinimalPair]:
         """Retorna pares curados con la etiqueta dada."""
@@ -308,27 +554,18 @@ class MinimalPairGenerator:
     # ------------------------------------------------------------------
 
     def _build_all_pairs(self) -> list[MinimalPair]:
-        """Construir todos los pares mínimos desde el léxico (con cache)."""
+        """Todos los pares mínimos del léxico (con cache)."""
         if self._pair_cache is not None:
             return self._pair_cache
 
-        pairs: list[MinimalPair] = []
-        words = list(self._lexicon.items())
-
-        for i, (w1, t1) in enumerate(words):
-            if len(pairs) >= self.max_pairs:
-                break
-            for w2, t2 in words[i + 1:]:
-                if len(pairs) >= self.max_pairs:
-                    break
-                pair = _check_minimal_pair(w1, t1, w2, t2, language=self.language)
-                if pair is not None:
-                    pairs.append(pair)
+        pairs = self.index.all_pairs(language=self.language)
+        if self.max_pairs is not None:
+            pairs = pairs[: self.max_pairs]
 
         self._pair_cache = pairs
         logger.debug(
             "MinimalPairGenerator: %d pares generados desde léxico (%d palabras)",
-            len(pairs), len(words),
+            len(pairs), len(self._lexicon),
         )
         return pairs
 
@@ -387,5 +624,8 @@ def get_curated_pairs(language: str = "es-mx") -> list[MinimalPair]:
 __all__ = [
     "MinimalPair",
     "MinimalPairGenerator",
+    "MinimalPairIndex",
+    "default_index_path",
     "get_curated_pairs",
+    "lexicon_fingerprint",
 ]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ipa_core.packs.minimal_pairs import (
+    MinimalPairGenerator,
+    MinimalPairIndex,
+    _check_minimal_pair,
+)
+
+_PHONES = ["p", "b", "t", "d", "k", "a", "e", "o", "ɾ", "r"]
+
+
+def _lexicon(n: int, seed: int = 5) -> dict[str, list[str]]:
+    rng = random.Random(seed)
+    lexicon: dict[str, list[str]] = {}
+    while len(lexicon) < n:
+        tokens = [rng.choice(_PHONES) for _ in range(rng.randint(2, 4))]
+        lexicon[f"w{len(lexicon)}"] = tokens
+    return lexicon
+
+
+def _brute_force(lexicon: dict[str, list[str]]) -> list[dict[str, Any]]:
+    words = list(lexicon.items())
+    pairs = []
+    for i, (w1, t1) in enumerate(words):
+        for w2, t2 in words[i + 1:]:
+            pair = _check_minimal_pair(w1, t1, w2, t2)
+            if pair is not None:
+                pairs.append(pair)
+    return [p.as_dict() for p in pairs]
+
+
+@pytest.mark.unit
+def test_wildcard_index_finds_every_minimal_pair() -> None:
+    lexicon = _lexicon(400)
+    gen = MinimalPairGenerator(lexicon)
+    expected = _brute_force(lexicon)
+
+    assert [p.as_dict() for p in gen.iter_pairs()] == expected
+    assert len(expected) > 500  # el límite anterior (max_pairs=500) los truncaba
+    by_phoneme = [p for p in expected if "ɾ" in (p["phoneme1"], p["phoneme2"])]
+    assert [p.as_dict() for p in gen.find_pairs_for_phoneme("ɾ")] == by_phoneme
+    contrast = [p for p in expected if {p["phoneme1"], p["phoneme2"]} == {"r", "ɾ"}]
+    assert [p.as_dict() for p in gen.find_pairs_for_contrast("ɾ", "r")] == contrast
+    assert all(p.position == 1 for p in gen.find_pairs_at_position(1))
+    assert all("w7" in (p.word1, p.word2) for p in gen.find_pairs_for_word("w7"))
+
+
+@pytest.mark.unit
+def test_index_is_persisted_per_pack_and_rebuilt_when_lexicon_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PRONUNCIAPA_MINIMAL_PAIRS_DIR", str(tmp_path))
+    lexicon = {"pata": ["p", "a", "t", "a"], "bata": ["b", "a", "t", "a"]}
+
+    first = MinimalPairGenerator(lexicon, pack_id="es-mx").index
+    assert (tmp_path / "es-mx.json.gz").exists()
+    loaded = MinimalPairIndex.load(tmp_path / "es-mx.json.gz")
+    assert loaded.fingerprint == first.fingerprint and loaded.buckets == first.buckets
+
+    lexicon["gata"] = ["g", "a", "t", "a"]
+    gen = MinimalPairGenerator(lexicon, pack_id="es-mx")
+    assert len(gen.find_pairs_at_position(0)) == 3
@@ -6,7 +6,7 @@ subyacentes (fonémicas) y superficiales (fonéticas).
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Literal, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Literal, Optional, TYPE_CHECKING
 from ipa_core.types import EditOp
 
 from ipa_core.textref.tokenize import (
@@ -139,6 +139,9 @@ class ComparisonResult:
         Puntuación (0-100, 100 = perfecto).
     operations : List[EditOp]
         Lista de operaciones de edición (S/I/D).
+    meta : Dict[str, Any]
+        Metadatos extra del pipeline (p.ej. ``timings``), se fusionan en
+        ``to_dict()["meta"]``.
     """
     target: PhonologicalRepresentation
     observed: PhonologicalRepresentation
@@ -147,6 +150,7 @@ class ComparisonResult:
     distance: float = 0.0
     score: float = 100.0
     operations: List[EditOp] = field(default_factory=list)
+    meta: Dict[str, Any] = field(default_factory=dict)
     
     def to_dict(self) -> dict:
         """Convert to CompareResult-compatible dict for API responses.
@@ -174,6 +178,7 @@ class ComparisonResult:
                 "evaluation_level": self.evaluation_level,
                 "target_ipa": self.target.to_ipa(with_delimiters=False),
                 "observed_ipa": self.observed.to_ipa(with_delimiters=False),
+                **self.meta,
             },
         }
 
@@ -0,0 +1,613 @@
+"""Comparación por lotes sobre un manifiesto JSONL.
+
+Puntuar un corpus llamando a ``compare`` ítem por ítem deja ociosos al ASR
+y a eSpeak casi todo el tiempo.  :class:`BatchPipelineRunner` recorre el
+manifiesto en streaming y mantiene hasta ``max_in_flight`` ítems en vuelo:
+
+- La carga/decodificación del audio (y ffmpeg cuando hace falta) corre en
+  un ``ThreadPoolExecutor``; el pipeline recibe PCM en memoria.
+- Las llamadas al ASR y al TextRef de los ítems en vuelo se agrupan en
+  micro-lotes (:class:`MicroBatcher`).  Si el backend expone
+  ``transcribe_many`` / ``to_ipa_many`` el lote va en una sola llamada
+  (eSpeak lo reparte en su pool de procesos); si no, se ejecuta con
+  ``asyncio.gather``.
+- Cada resultado se escribe en cuanto termina (una línea JSONL con
+  ``index`` = número de línea del manifiesto).  Ese archivo es también el
+  checkpoint: al relanzar se saltan los índices ya escritos.
+
+Formato del manifiesto
+----------------------
+Una línea JSON por ítem, como ``data/benchmarks/manifest.jsonl``::
+
+    {"audio": "data/benchmarks/sample.wav", "text": "h"}
+
+Campos opcionales: ``id``, ``lang``, ``target_ipa``.  Las rutas relativas se
+resuelven contra el directorio actual y, si no existen, contra el del
+manifiesto.
+
+Salida Parquet
+--------------
+Con ``output`` terminado en ``.parquet`` los resultados se acumulan en
+``<output>.checkpoint.jsonl`` y al final se escribe el Parquet completo
+(requiere ``pyarrow``, extra ``parquet``).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Literal, Optional, Set, Tuple
+
+from ipa_core.audio.files import cleanup_temp, ensure_wav
+from ipa_core.audio.pcm import TARGET_SAMPLE_RATE, decode_wav_pcm16, pcm_input
+from ipa_core.errors import NotReadyError, UnsupportedFormat
+from ipa_core.ports.asr import ASRBackend
+from ipa_core.ports.compare import Comparator
+from ipa_core.ports.preprocess import Preprocessor
+from ipa_core.ports.textref import TextRefProvider
+from ipa_core.services.comparison import ComparisonService
+from ipa_core.types import ASRResult, AudioInput, TextRefResult
+
+logger = logging.getLogger(__name__)
+
+RunMany = Callable[[str, List[Any]], Awaitable[List[Any]]]
+
+
+# ---------------------------------------------------------------------------
+# Micro-lotes
+# ---------------------------------------------------------------------------
+
+@dataclass
+class MicroBatchStats:
+    """Contadores de un :class:`MicroBatcher`."""
+
+    batches: int = 0
+    items: int = 0
+    largest: int = 0
+    expired: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+
+    @property
+    def mean_size(self) -> float:
+        return self.items / self.batches if self.batches else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "largest": self.largest,
+            "mean_size": round(self.mean_size, 2),
+            "expired": self.expired,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+
+class MicroBatcher:
+    """Agrupa llamadas concurrentes en lotes por clave (p. ej. idioma).
+
+    Un lote se despacha al llegar a ``max_batch`` elementos o ``max_wait_ms``
+    después del primero.  ``run_many(key, items)`` debe devolver un resultado
+    por elemento, en orden; un resultado que sea una excepción se propaga
+    sólo a su llamador.
+
+    Con ``timeout`` (segundos) el llamador recibe ``asyncio.TimeoutError`` si
+    su resultado no llega a tiempo; si aún no se despachó, su elemento sale
+    del lote.  ``stats.queue_depth`` cuenta los elementos en espera de lote.
+    """
+
+    def __init__(self, run_many: RunMany, *, max_batch: int = 8, max_wait_ms: float = 25.0) -> None:
+        self._run_many = run_many
+        self._max_batch = max(1, max_batch)
+        self._max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._pending: Dict[str, List[Tuple[Any, asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self.stats = MicroBatchStats()
+
+    async def submit(self, key: str, item: Any, *, timeout: Optional[float] = None) -> Any:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        pending = self._pending.setdefault(key, [])
+        pending.append((item, future))
+        self.stats.queue_depth += 1
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.stats.queue_depth)
+        if len(pending) >= self._max_batch:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self._max_wait, self._flush, key)
+        if timeout is None:
+            return await future
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self.stats.expired += 1
+            raise
+
+    def _flush(self, key: str) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, [])
+        self.stats.queue_depth -= len(batch)
+        # Los elementos cuyo llamador ya expiró no entran al lote.
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._dispatch(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, key: str, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        self.stats.batches += 1
+        self.stats.items += len(batch)
+        self.stats.largest = max(self.stats.largest, len(batch))
+        try:
+            results = await self._run_many(key, [item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"run_many devolvió {len(results)} resultados para {len(batch)} elementos")
+        except Exception as exc:
+            results = [exc] * len(batch)
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class BatchedASR:
+    """``ASRBackend`` que agrupa las transcripciones concurrentes en micro-lotes."""
+
+    output_type: Literal["ipa", "text", "none"]
+
+    def __init__(self, asr: ASRBackend, *, max_batch: int = 8, max_wait_ms: float = 25.0) -> None:
+        self._asr = asr
+        self.output_type = asr.output_type
+        self.batcher = MicroBatcher(self._transcribe_many, max_batch=max_batch, max_wait_ms=max_wait_ms)
+
+    async def setup(self) -> None:
+        await self._asr.setup()
+
+    async def teardown(self) -> None:
+        await self._asr.teardown()
+
+    async def transcribe(self, audio: AudioInput, *, lang: Optional[str] = None, **kw: Any) -> ASRResult:
+        return await self.batcher.submit(lang or "", audio)
+
+    async def _transcribe_many(self, lang: str, audios: List[AudioInput]) -> List[Any]:
+        many = getattr(self._asr, "transcribe_many", None)
+        if many is not None:
+            return list(await many(audios, lang=lang or None))
+        return list(await asyncio.gather(
+            *(self._asr.transcribe(audio, lang=lang or None) for audio in audios),
+            return_exceptions=True,
+        ))
+
+
+class BatchedTextRef:
+    """``TextRefProvider`` que agrupa las conversiones concurrentes en micro-lotes."""
+
+    def __init__(self, textref: TextRefProvider, *, max_batch: int = 32, max_wait_ms: float = 25.0) -> None:
+        self._textref = textref
+        self.batcher = MicroBatcher(self._to_ipa_many, max_batch=max_batch, max_wait_ms=max_wait_ms)
+
+    async def setup(self) -> None:
+        await self._textref.setup()
+
+    async def teardown(self) -> None:
+        await self._textref.teardown()
+
+    async def to_ipa(self, text: str, *, lang: str, **kw: Any) -> TextRefResult:
+        return await self.batcher.submit(lang, text)
+
+    async def _to_ipa_many(self, lang: str, texts: List[str]) -> List[Any]:
+        many = getattr(self._textref, "to_ipa_many", None)
+        if many is not None:
+            return list(await many(texts, lang=lang))
+        return list(await asyncio.gather(
+            *(self._textref.to_ipa(text, lang=lang) for text in texts),
+            return_exceptions=True,
+        ))
+
+
+# ---------------------------------------------------------------------------
+# Manifiesto y carga de audio
+# ---------------------------------------------------------------------------
+
+@dataclass
+class BatchItem:
+    """Una línea del manifiesto."""
+
+    index: int
+    audio: str
+    text: str
+    id: Optional[str] = None
+    lang: Optional[str] = None
+    target_ipa: Optional[str] = None
+
+
+def _resolve_audio(raw: str, base_dir: Path) -> str:
+    path = Path(raw).expanduser()
+    if path.is_absolute() or path.exists():
+        return str(path)
+    candidate = base_dir / path
+    return str(candidate if candidate.exists() else path)
+
+
+def iter_manifest(path: Path) -> Iterator[BatchItem]:
+    """Leer el manifiesto línea por línea (sin cargarlo entero)."""
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Manifiesto no encontrado: {path}")
+    base_dir = path.resolve().parent
+    with path.open("r", encoding="utf-8") as fh:
+        for index, line in enumerate(fh, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"Error parsing manifest at line {index}: {exc}") from exc
+            if "audio" not in entry or "text" not in entry:
+                raise ValueError(f"Manifest line {index}: se requieren 'audio' y 'text'")
+            yield BatchItem(
+                index=index,
+                audio=_resolve_audio(str(entry["audio"]), base_dir),
+                text=str(entry["text"]),
+                id=str(entry["id"]) if entry.get("id") is not None else None,
+                lang=entry.get("lang"),
+                target_ipa=entry.get("target_ipa"),
+            )
+
+
+def load_batch_audio(path: str) -> AudioInput:
+    """Cargar ``path`` como PCM 16 kHz mono en memoria (bloqueante: usar en un executor)."""
+    samples = None
+    if path.lower().endswith(".wav"):
+        samples = decode_wav_pcm16(Path(path).read_bytes())
+    if samples is None:
+        wav_path, tmp = ensure_wav(path)
+        try:
+            samples = decode_wav_pcm16(Path(wav_path).read_bytes())
+        finally:
+            if tmp:
+                cleanup_temp(wav_path)
+    if samples is None:
+        raise UnsupportedFormat(f"Audio sin muestras PCM utilizables: {path}")
+    return pcm_input(samples)
+
+
+# ---------------------------------------------------------------------------
+# Salida y checkpoint
+# ---------------------------------------------------------------------------
+
+def _load_checkpoint(path: Path) -> Set[int]:
+    """Índices ya resueltos (``status == "ok"``) según el checkpoint.
+
+    El checkpoint se reescribe en streaming sin las filas con error (se
+    reintentan) ni una última línea incompleta (corte a mitad de escritura).
+    """
+    if not path.exists():
+        return set()
+    done: Set[int] = set()
+    kept = path.with_name(path.name + ".tmp")
+    with path.open("rb") as src, kept.open("wb") as dst:
+        for line in src:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                row = json.loads(line)
+                index = int(row["index"])
+            except (ValueError, KeyError, TypeError):
+                continue
+            if row.get("status") != "ok":
+                continue
+            done.add(index)
+            dst.write(line)
+    os.replace(kept, path)
+    return done
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise NotReadyError(
+            "La salida Parquet requiere pyarrow: pip install 'pronunciapa[parquet]'"
+        ) from exc
+    return pq
+
+
+class _ResultSink:
+    """Escribe una línea JSONL por resultado; el mismo archivo sirve de checkpoint."""
+
+    def __init__(self, output: Path, *, resume: bool) -> None:
+        self.output = Path(output)
+        self.parquet = self.output.suffix.lower() == ".parquet"
+        if self.parquet:
+            _require_pyarrow()
+            self.jsonl_path = self.output.with_name(self.output.name + ".checkpoint.jsonl")
+        else:
+            self.jsonl_path = self.output
+        self.jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+        self.done = _load_checkpoint(self.jsonl_path) if resume else set()
+        self._fh = self.jsonl_path.open("a" if resume else "w", encoding="utf-8")
+
+    def write(self, row: dict[str, Any]) -> None:
+        self._fh.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self._fh.flush()
+
+    def close(self, *, complete: bool) -> None:
+        self._fh.close()
+        if not (self.parquet and complete):
+            return
+        import pyarrow as pa
+
+        pq = _require_pyarrow()
+        schema = _parquet_schema(pa)
+        # Por bloques de filas: la memoria no crece con el tamaño del corpus.
+        # Las filas quedan en orden de finalización (ordenar por ``index``).
+        with self.jsonl_path.open("r", encoding="utf-8") as fh, pq.ParquetWriter(self.output, schema) as writer:
+            chunk: list[dict[str, Any]] = []
+            for line in fh:
+                if not line.strip():
+                    continue
+                chunk.append(_parquet_row(json.loads(line)))
+                if len(chunk) >= _PARQUET_CHUNK_ROWS:
+                    writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+                    chunk = []
+            if chunk:
+                writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+
+
+_PARQUET_CHUNK_ROWS = 1024
+
+
+def _parquet_schema(pa: Any) -> Any:
+    """Esquema fijo: las filas ``ok`` y ``error`` comparten columnas (nulas si faltan)."""
+    return pa.schema([
+        ("index", pa.int64()),
+        ("id", pa.string()),
+        ("audio", pa.string()),
+        ("text", pa.string()),
+        ("lang", pa.string()),
+        ("status", pa.string()),
+        ("error", pa.string()),
+        ("error_type", pa.string()),
+        ("error_code", pa.string()),
+        ("per", pa.float64()),
+        ("score", pa.float64()),
+        ("ipa", pa.string()),
+        ("target_ipa", pa.string()),
+        ("ops", pa.string()),
+        ("timings", pa.string()),
+        ("audio_duration", pa.float64()),
+        ("proc_time", pa.float64()),
+    ])
+
+
+def _parquet_row(row: dict[str, Any]) -> dict[str, Any]:
+    # Columnas anidadas heterogéneas → JSON para un esquema estable.
+    row["ops"] = json.dumps(row.get("ops") or [], ensure_ascii=False)
+    row["timings"] = json.dumps(row.get("timings") or {}, ensure_ascii=False)
+    return row
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+@dataclass
+class BatchReport:
+    """Resumen de una ejecución por lotes (agregados en streaming)."""
+
+    output: str
+    total: int = 0
+    processed: int = 0
+    skipped: int = 0
+    errors: int = 0
+    wall_s: float = 0.0
+    per_sum: float = 0.0
+    per_min: Optional[float] = None
+    per_max: Optional[float] = None
+    rtf_sum: float = 0.0
+    rtf_count: int = 0
+    asr: dict[str, Any] = field(default_factory=dict)
+    textref: dict[str, Any] = field(default_factory=dict)
+
+    def add(self, row: dict[str, Any]) -> None:
+        self.processed += 1
+        if row["status"] != "ok":
+            self.errors += 1
+            return
+        per = float(row["per"])
+        self.per_sum += per
+        self.per_min = per if self.per_min is None else min(self.per_min, per)
+        self.per_max = per if self.per_max is None else max(self.per_max, per)
+        if row.get("audio_duration"):
+            self.rtf_sum += row["proc_time"] / row["audio_duration"]
+            self.rtf_count += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        ok = self.processed - self.errors
+        return {
+            "output": self.output,
+            "total": self.total,
+            "processed": self.processed,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "wall_s": round(self.wall_s, 3),
+            "items_per_s": round(self.processed / self.wall_s, 2) if self.wall_s else 0.0,
+            "avg_per": self.per_sum / ok if ok else 0.0,
+            "min_per": self.per_min or 0.0,
+            "max_per": self.per_max or 0.0,
+            "avg_rtf": self.rtf_sum / self.rtf_count if self.rtf_count else 0.0,
+            "asr_batches": self.asr,
+            "textref_batches": self.textref,
+        }
+
+
+class BatchPipelineRunner:
+    """Puntúa un manifiesto ``(audio, texto)`` completo con memoria acotada.
+
+    Parámetros
+    ----------
+    preprocessor, asr, textref, comparator :
+        Los mismos componentes que :class:`ComparisonService` (normalmente
+        los del kernel).  El caller se encarga de ``setup``/``teardown``.
+    default_lang : str
+        Idioma de los ítems sin ``lang``.
+    max_in_flight : int
+        Ítems decodificados en memoria a la vez.
+    asr_batch_size, textref_batch_size : int
+        Tamaño máximo de cada micro-lote.
+    max_wait_ms : float
+        Espera máxima para completar un micro-lote.
+    workers : int, opcional
+        Hilos para carga/decodificación de audio (default: ``min(8, CPUs)``).
+    """
+
+    def __init__(
+        self,
+        *,
+        preprocessor: Optional[Preprocessor] = None,
+        asr: ASRBackend,
+        textref: TextRefProvider,
+        comparator: Optional[Comparator] = None,
+        default_lang: str = "es",
+        max_in_flight: int = 16,
+        asr_batch_size: int = 8,
+        textref_batch_size: int = 32,
+        max_wait_ms: float = 25.0,
+        workers: Optional[int] = None,
+        evaluation_level: str = "phonemic",
+        mode: str = "objective",
+        pack: Optional[str] = None,
+    ) -> None:
+        self.asr = BatchedASR(asr, max_batch=asr_batch_size, max_wait_ms=max_wait_ms)
+        self.textref = BatchedTextRef(textref, max_batch=textref_batch_size, max_wait_ms=max_wait_ms)
+        self._service = ComparisonService(
+            preprocessor=preprocessor,
+            asr=self.asr,
+            textref=self.textref,  # type: ignore[arg-type]
+            comparator=comparator,
+            default_lang=default_lang,
+        )
+        self._default_lang = default_lang
+        self._max_in_flight = max(1, max_in_flight)
+        self._workers = workers or min(8, os.cpu_count() or 1)
+        self._evaluation_level = evaluation_level
+        self._mode = mode
+        self._pack = pack
+
+    async def run(self, manifest: Path, output: Path, *, resume: bool = True) -> BatchReport:
+        """Procesar ``manifest`` y escribir un resultado por ítem en ``output``."""
+        sink = _ResultSink(Path(output), resume=resume)
+        report = BatchReport(output=str(sink.output))
+        semaphore = asyncio.Semaphore(self._max_in_flight)
+        tasks: Set[asyncio.Task] = set()
+        started = time.perf_counter()
+        complete = False
+
+        async def _process(item: BatchItem) -> None:
+            try:
+                row = await self._score(item, executor)
+                sink.write(row)
+                report.add(row)
+            finally:
+                semaphore.release()
+
+        executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="pronunciapa-batch")
+        try:
+            for item in iter_manifest(manifest):
+                report.total += 1
+                if item.index in sink.done:
+                    report.skipped += 1
+                    continue
+                await semaphore.acquire()
+                task = asyncio.create_task(_process(item))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+            complete = True
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            executor.shutdown(wait=False, cancel_futures=True)
+            sink.close(complete=complete)
+            report.wall_s = time.perf_counter() - started
+            report.asr = self.asr.batcher.stats.to_dict()
+            report.textref = self.textref.batcher.stats.to_dict()
+        return report
+
+    async def _score(self, item: BatchItem, executor: ThreadPoolExecutor) -> dict[str, Any]:
+        row: dict[str, Any] = {
+            "index": item.index,
+            "id": item.id,
+            "audio": item.audio,
+            "text": item.text,
+            "lang": item.lang or self._default_lang,
+        }
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            audio = await loop.run_in_executor(executor, load_batch_audio, item.audio)
+            payload = await self._service.compare_audio_detail(
+                audio,
+                item.text,
+                target_ipa=item.target_ipa,
+                lang=row["lang"],
+                evaluation_level=self._evaluation_level,
+                pack=self._pack,
+                mode=self._mode,
+            )
+        except Exception as exc:
+            logger.debug("Batch item %s falló: %s", item.index, exc)
+            row.update({
+                "status": "error",
+                "error": str(exc),
+                "error_type": type(exc).__name__,
+                "error_code": getattr(exc, "error_code", None),
+                "proc_time": time.perf_counter() - started,
+            })
+            return row
+
+        response = payload.to_response()
+        row.update({
+            "status": "ok",
+            "per": float(response.get("per", 0.0) or 0.0),
+            "score": response["score"],
+            "ipa": response["ipa"],
+            "target_ipa": response["target_ipa"],
+            "ops": response.get("ops", []),
+            "timings": response["meta"].get("timings", {}),
+            "audio_duration": len(audio["pcm"]) / TARGET_SAMPLE_RATE,
+            "proc_time": time.perf_counter() - started,
+        })
+        return row
+
+
+__all__ = [
+    "BatchItem",
+    "BatchPipelineRunner",
+    "BatchReport",
+    "BatchedASR",
+    "BatchedTextRef",
+    "MicroBatchStats",
+    "MicroBatcher",
+    "iter_manifest",
+    "load_batch_audio",
+]
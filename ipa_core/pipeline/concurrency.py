@@ -0,0 +1,149 @@
+"""Ejecución concurrente de ramas independientes del pipeline.
+
+La rama observada (audio → ASR → normalización) y la rama objetivo
+(texto → G2P → normalización) no comparten datos: mientras el ASR infiere,
+eSpeak (un subproceso) puede ir generando la referencia.  :func:`run_branches`
+las ejecuta con concurrencia estructurada (``asyncio.TaskGroup``): si una
+rama falla, la otra se cancela y se propaga la excepción original (no un
+``ExceptionGroup``), así los manejadores de error existentes no cambian.
+
+Variables de entorno
+--------------------
+``PRONUNCIAPA_PIPELINE_CONCURRENCY``
+    ``concurrent`` (default) o ``sequential``.  En modo secuencial las
+    ramas se ejecutan en el orden declarado, como antes.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+BranchFactory = Callable[[], Awaitable[Any]]
+
+_MODES = ("concurrent", "sequential")
+
+
+def pipeline_concurrency_mode() -> str:
+    """Modo configurado para ejecutar las ramas del pipeline."""
+    mode = os.environ.get("PRONUNCIAPA_PIPELINE_CONCURRENCY", "concurrent").strip().lower()
+    return mode if mode in _MODES else "concurrent"
+
+
+@dataclass
+class BranchTimings:
+    """Latencia por rama y latencia total de un :func:`run_branches`."""
+
+    mode: str
+    branches_ms: Dict[str, float] = field(default_factory=dict)
+    wall_ms: float = 0.0
+
+    @property
+    def saved_ms(self) -> float:
+        """Latencia ahorrada frente a ejecutar las ramas en serie."""
+        return max(0.0, sum(self.branches_ms.values()) - self.wall_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            **{f"{name}_ms": round(ms, 2) for name, ms in self.branches_ms.items()},
+            "wall_ms": round(self.wall_ms, 2),
+            "saved_ms": round(self.saved_ms, 2),
+        }
+
+
+async def run_branches(
+    branches: Dict[str, BranchFactory],
+    *,
+    mode: Optional[str] = None,
+) -> Tuple[Dict[str, Any], BranchTimings]:
+    """Ejecuta ramas independientes y retorna sus resultados y tiempos.
+
+    Parámetros
+    ----------
+    branches : dict[str, Callable[[], Awaitable]]
+        Nombre → fábrica de la corrutina de cada rama.  Se usan fábricas
+        (no corrutinas) para no crear corrutinas que nunca se esperan
+        cuando una rama previa falla en modo secuencial.
+    mode : str, opcional
+        ``concurrent`` o ``sequential``; por defecto el de
+        :func:`pipeline_concurrency_mode`.
+
+    Retorna
+    -------
+    tuple[dict[str, Any], BranchTimings]
+        Resultados por nombre de rama y tiempos medidos.
+
+    Si varias ramas fallan se propaga la excepción de la primera rama
+    declarada que falló.
+    """
+    mode = mode or pipeline_concurrency_mode()
+    timings = BranchTimings(mode=mode)
+    started = time.perf_counter()
+
+    async def timed(name: str, factory: BranchFactory) -> Any:
+        branch_started = time.perf_counter()
+        try:
+            return await factory()
+        finally:
+            timings.branches_ms[name] = (time.perf_counter() - branch_started) * 1000
+
+    results: Dict[str, Any] = {}
+    try:
+        if mode == "sequential":
+            for name, factory in branches.items():
+                results[name] = await timed(name, factory)
+        else:
+            tasks = await _run_structured(
+                {name: functools.partial(timed, name, factory) for name, factory in branches.items()}
+            )
+            results = {name: task.result() for name, task in tasks.items()}
+    finally:
+        timings.wall_ms = (time.perf_counter() - started) * 1000
+    return results, timings
+
+
+async def _run_structured(branches: Dict[str, BranchFactory]) -> Dict[str, "asyncio.Task[Any]"]:
+    task_group_cls = getattr(asyncio, "TaskGroup", None)
+    if task_group_cls is None:  # pragma: no cover - Python < 3.11
+        return await _run_with_wait(branches)
+
+    tasks: Dict[str, asyncio.Task[Any]] = {}
+    try:
+        async with task_group_cls() as group:
+            for name, factory in branches.items():
+                tasks[name] = group.create_task(factory())
+    except BaseException as exc:
+        _reraise_first_failure(tasks, exc)
+        raise
+    return tasks
+
+
+async def _run_with_wait(branches: Dict[str, BranchFactory]) -> Dict[str, "asyncio.Task[Any]"]:
+    """Equivalente a ``TaskGroup`` para Python < 3.11."""
+    tasks = {name: asyncio.ensure_future(factory()) for name, factory in branches.items()}
+    try:
+        await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        pending = [task for task in tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    _reraise_first_failure(tasks, None)
+    return tasks
+
+
+def _reraise_first_failure(tasks: Dict[str, "asyncio.Task[Any]"], group_exc: Optional[BaseException]) -> None:
+    for task in tasks.values():
+        if task.done() and not task.cancelled() and task.exception() is not None:
+            raise task.exception()  # type: ignore[misc]
+    if group_exc is not None and not isinstance(group_exc, asyncio.CancelledError):
+        # Error fuera de las ramas (p.ej. al crear tareas): se propaga tal cual.
+        raise group_exc
+
+
+__all__ = ["BranchTimings", "pipeline_concurrency_mode", "run_branches"]
@@ -38,6 +38,7 @@ from ipa_core.pipeline.transcribe import EvaluationMode
 from ipa_core.pipeline.ipa_cleaning import clean_asr_tokens, clean_textref_tokens
 from ipa_core.compare.compare import compare_representations
 from ipa_core.compare.oov_handler import OOVHandler
+from ipa_core.pipeline.concurrency import run_branches
 from ipa_core.ports.oov import OOVHandlerPort
 
 logger = logging.getLogger(__name__)
@@ -321,7 +322,12 @@ async def execute_pipeline(
     weights: Optional[CompareWeights] = None,
     oov_handler: Optional[OOVHandlerPort] = None,
 ) -> ComparisonResult:
-    """Pipeline unificado: preproceso → ASR → TextRef → comparación."""
+    """Pipeline unificado: preproceso → (ASR ∥ TextRef) → comparación.
+
+    Las ramas ASR y TextRef se ejecutan concurrentemente (ver
+    :mod:`ipa_core.pipeline.concurrency`); sus tiempos quedan en
+    ``meta["timings"]`` del resultado.
+    """
     source_lang = lang_source or lang
     target_lang = lang_target or lang or _default_lang()
 
@@ -332,15 +338,19 @@ async def execute_pipeline(
         _check_quality_gate(pre_audio_res)
         norm_params = _normalization_params(pack)
         
-        observed_phonetic, _asr_tokens, _asr_result = await _prepare_observed_phonetic(
-            pre=pre, asr=asr, processed_audio=processed_audio,
-            pre_audio_res=pre_audio_res, lang=source_lang, norm_params=norm_params,
-        )
-
-        target_phonemic, _ref_tokens = await _prepare_target_phonemic(
-            pre=pre, textref=textref, text=text, target_ipa=target_ipa,
-            lang=target_lang, evaluation_level=evaluation_level, norm_params=norm_params,
-        )
+        # Ramas independientes: ASR y TextRef corren en paralelo (TaskGroup).
+        branches, timings = await run_branches({
+            "asr": lambda: _prepare_observed_phonetic(
+                pre=pre, asr=asr, processed_audio=processed_audio,
+                pre_audio_res=pre_audio_res, lang=source_lang, norm_params=norm_params,
+            ),
+            "textref": lambda: _prepare_target_phonemic(
+                pre=pre, textref=textref, text=text, target_ipa=target_ipa,
+                lang=target_lang, evaluation_level=evaluation_level, norm_params=norm_params,
+            ),
+        })
+        observed_phonetic, _asr_tokens, _asr_result = branches["asr"]
+        target_phonemic, _ref_tokens = branches["textref"]
 
         target_repr, observed_repr = _select_representations(
             pack=pack, mode=mode, evaluation_level=evaluation_level,
@@ -352,11 +362,13 @@ async def execute_pipeline(
             target_repr=target_repr, observed_repr=observed_repr,
         )
 
-        return await _execute_comparison(
+        result = await _execute_comparison(
             pack=pack, comp=comp, weights=weights, mode=mode,
             evaluation_level=evaluation_level, target_repr=target_repr,
             observed_repr=observed_repr,
         )
+        result.meta["timings"] = timings.to_dict()
+        return result
     finally:
         _cleanup_preprocessor_res(pre_audio_res)
 
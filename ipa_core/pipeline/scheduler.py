@@ -0,0 +1,144 @@
+"""Planificador de inferencia ASR con micro-lotes dinámicos.
+
+Las peticiones concurrentes al kernel compartido llaman a
+``asr.transcribe`` por separado y cada una paga su propio forward pass.
+:class:`InferenceScheduler` se pone delante del puerto ASR:
+
+- Si el backend expone ``transcribe_many`` (Wav2Vec2, plugin ONNX, camino
+  de logits de Allosaurus), junta las peticiones del mismo idioma durante
+  ``max_wait_ms`` o hasta ``max_batch`` elementos y las transcribe en un
+  solo lote con padding; los resultados vuelven a cada llamador.
+- Si no, cada petición se ejecuta sola y sin espera (no hay nada que
+  ganar retrasándola).
+- ``deadline_ms`` (por instancia o por llamada) acota la espera de cada
+  petición; al vencer se lanza :class:`asyncio.TimeoutError`.
+
+Es un ``ASRBackend``: el resto de atributos (``ctc_logits``,
+``ctc_labels``, …) se delegan al backend envuelto.
+
+Variables de entorno (ver :func:`scheduler_from_env`)
+-----------------------------------------------------
+``PRONUNCIAPA_ASR_BATCH_SIZE``
+    Tamaño máximo del lote (default: 8; ``1`` desactiva el planificador).
+``PRONUNCIAPA_ASR_BATCH_WAIT_MS``
+    Espera máxima para completar un lote (default: 10).
+``PRONUNCIAPA_ASR_DEADLINE_MS``
+    Plazo por petición (default: 0 = sin plazo).
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any, List, Optional
+
+from ipa_core.pipeline.batch import BatchedASR
+from ipa_core.ports.asr import ASRBackend
+from ipa_core.types import ASRResult, AudioInput
+
+DEFAULT_BATCH_SIZE = 8
+DEFAULT_BATCH_WAIT_MS = 10.0
+
+
+def supports_batch(asr: Any) -> bool:
+    """``True`` si el backend transcribe varios audios en una llamada."""
+    return callable(getattr(asr, "transcribe_many", None))
+
+
+class InferenceScheduler(BatchedASR):
+    """``ASRBackend`` que agrupa las transcripciones concurrentes del kernel.
+
+    Parameters
+    ----------
+    asr:
+        Backend envuelto.
+    max_batch, max_wait_ms:
+        Límites de cada micro-lote.
+    deadline_ms:
+        Plazo por defecto de cada petición (``None`` = sin plazo).
+    """
+
+    def __init__(
+        self,
+        asr: ASRBackend,
+        *,
+        max_batch: int = DEFAULT_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_BATCH_WAIT_MS,
+        deadline_ms: Optional[float] = None,
+    ) -> None:
+        super().__init__(asr, max_batch=max_batch, max_wait_ms=max_wait_ms)
+        self._deadline_ms = deadline_ms
+        self._single = 0
+
+    @property
+    def backend(self) -> ASRBackend:
+        return self._asr
+
+    @property
+    def batching(self) -> bool:
+        return supports_batch(self._asr)
+
+    def __getattr__(self, name: str) -> Any:
+        # Sólo se llama para atributos que el planificador no define.
+        if name.startswith("__") or name == "_asr":
+            raise AttributeError(name)
+        return getattr(self._asr, name)
+
+    async def transcribe(
+        self,
+        audio: AudioInput,
+        *,
+        lang: Optional[str] = None,
+        deadline_ms: Optional[float] = None,
+        **kw: Any,
+    ) -> ASRResult:
+        deadline_ms = deadline_ms if deadline_ms is not None else self._deadline_ms
+        timeout = deadline_ms / 1000.0 if deadline_ms else None
+        if kw or not self.batching:
+            # Opciones por llamada o backend sin lotes: ejecución individual.
+            self._single += 1
+            call = self._asr.transcribe(audio, lang=lang, **kw)
+            if timeout is None:
+                return await call
+            try:
+                return await asyncio.wait_for(call, timeout)
+            except asyncio.TimeoutError:
+                self.batcher.stats.expired += 1
+                raise
+        return await self.batcher.submit(lang or "", audio, timeout=timeout)
+
+    async def _transcribe_many(self, lang: str, audios: List[AudioInput]) -> List[Any]:
+        if len(audios) == 1:
+            try:
+                return [await self._asr.transcribe(audios[0], lang=lang or None)]
+            except Exception as exc:
+                return [exc]
+        return await super()._transcribe_many(lang, audios)
+
+    def stats(self) -> dict[str, Any]:
+        """Métricas de lotes, profundidad de cola y plazos vencidos."""
+        return {
+            "mode": "batch" if self.batching else "single",
+            "single_calls": self._single,
+            **self.batcher.stats.to_dict(),
+        }
+
+
+def scheduler_from_env(asr: ASRBackend) -> ASRBackend:
+    """Envolver ``asr`` según las variables ``PRONUNCIAPA_ASR_*``.
+
+    Retorna el backend tal cual si el planificador está desactivado o el
+    backend no admite lotes.
+    """
+    max_batch = int(os.environ.get("PRONUNCIAPA_ASR_BATCH_SIZE", DEFAULT_BATCH_SIZE))
+    if max_batch <= 1 or isinstance(asr, InferenceScheduler) or not supports_batch(asr):
+        return asr
+    max_wait_ms = float(os.environ.get("PRONUNCIAPA_ASR_BATCH_WAIT_MS", DEFAULT_BATCH_WAIT_MS))
+    deadline_ms = float(os.environ.get("PRONUNCIAPA_ASR_DEADLINE_MS", 0)) or None
+    return InferenceScheduler(asr, max_batch=max_batch, max_wait_ms=max_wait_ms, deadline_ms=deadline_ms)
+
+
+__all__ = [
+    "InferenceScheduler",
+    "scheduler_from_env",
+    "supports_batch",
+]
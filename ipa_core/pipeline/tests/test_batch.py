@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Literal, Optional
+
+import numpy as np
+import pytest
+
+from ipa_core.audio.pcm import pcm_to_wav_bytes
+from ipa_core.pipeline.batch import BatchPipelineRunner
+from ipa_core.pipeline.tests.test_runner import StubComparator, StubPreprocessor, StubTextRef
+from ipa_core.plugins.base import BasePlugin
+from ipa_core.types import ASRResult, AudioInput
+
+
+class BatchStubASR(BasePlugin):
+    output_type: Literal["ipa", "text", "none"] = "ipa"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batch_sizes: list[int] = []
+
+    async def transcribe(self, audio: AudioInput, *, lang: Optional[str] = None, **kw: Any) -> ASRResult:
+        raise AssertionError("BatchPipelineRunner debe usar transcribe_many")
+
+    async def transcribe_many(self, audios: list[AudioInput], *, lang: Optional[str] = None) -> list[ASRResult]:
+        self.batch_sizes.append(len(audios))
+        return [{"tokens": ["p", "a"], "meta": {"backend": "stub_asr"}} for _ in audios]
+
+
+def _write_manifest(tmp_path: Path, count: int) -> Path:
+    t = np.arange(8000) / 16000
+    wav = pcm_to_wav_bytes((8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16), sample_rate=16000)
+    lines = []
+    for i in range(count):
+        (tmp_path / f"clip{i}.wav").write_bytes(wav)
+        lines.append(json.dumps({"audio": f"clip{i}.wav", "text": "pato", "id": f"c{i}"}))
+    lines.append(json.dumps({"audio": "missing.wav", "text": "pato"}))
+    manifest = tmp_path / "manifest.jsonl"
+    manifest.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return manifest
+
+
+def _runner(asr: BatchStubASR) -> BatchPipelineRunner:
+    return BatchPipelineRunner(
+        preprocessor=StubPreprocessor(),
+        asr=asr,
+        textref=StubTextRef(["p", "a", "t", "o"]),
+        comparator=StubComparator(),
+        max_in_flight=4,
+        asr_batch_size=4,
+        max_wait_ms=50,
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.performance
+async def test_batch_runner_micro_batches_asr_and_records_errors(tmp_path: Path) -> None:
+    asr = BatchStubASR()
+    output = tmp_path / "out.jsonl"
+
+    report = await _runner(asr).run(_write_manifest(tmp_path, 8), output)
+
+    rows = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert sorted(row["index"] for row in rows) == list(range(1, 10))
+    assert sum(row["status"] == "ok" for row in rows) == 8
+    assert [row["error_type"] for row in rows if row["status"] == "error"] == ["FileNotFoundError"]
+    assert sum(asr.batch_sizes) == 8 and max(asr.batch_sizes) > 1
+    assert max(asr.batch_sizes) <= 4
+    assert report.processed == 9 and report.errors == 1
+
+
+@pytest.mark.integration
+@pytest.mark.reliability
+async def test_batch_runner_resumes_from_checkpoint(tmp_path: Path) -> None:
+    manifest = _write_manifest(tmp_path, 3)
+    output = tmp_path / "out.jsonl"
+    await _runner(BatchStubASR()).run(manifest, output)
+    # Simula un corte a mitad de escritura: se pierde la última fila.
+    lines = output.read_text(encoding="utf-8").splitlines()
+    output.write_text("\n".join(lines[:-1]) + "\n" + lines[-1][:10], encoding="utf-8")
+    kept_ok = sum(json.loads(line)["status"] == "ok" for line in lines[:-1])
+
+    asr = BatchStubASR()
+    report = await _runner(asr).run(manifest, output)
+
+    # Se omiten sólo las filas "ok"; la fila con error y la cortada se reintentan.
+    rows = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert sorted(row["index"] for row in rows) == [1, 2, 3, 4]
+    assert report.skipped == kept_ok and report.processed == 4 - kept_ok
+    assert [row["index"] for row in rows if row["status"] == "error"] == [4]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import Any, Literal, Optional
 
@@ -167,3 +168,89 @@ async def test_execute_pipeline_cleans_temp_files_even_when_exception_occurs(tmp
         )
 
     assert not temp_wav.exists()
+
+
+class RendezvousASR(StubASR):
+    """Espera a que TextRef haya empezado: sólo termina si las ramas se solapan."""
+
+    def __init__(self, tokens: Optional[list[str]], started: asyncio.Event, peer: asyncio.Event) -> None:
+        super().__init__(tokens)
+        self._started = started
+        self._peer = peer
+
+    async def transcribe(self, audio: AudioInput, *, lang: Optional[str] = None, **kw: Any) -> ASRResult:
+        self._started.set()
+        await asyncio.wait_for(self._peer.wait(), timeout=2)
+        return await super().transcribe(audio, lang=lang, **kw)
+
+
+class RendezvousTextRef(StubTextRef):
+    def __init__(self, tokens: Optional[list[str]], started: asyncio.Event, peer: asyncio.Event) -> None:
+        super().__init__(tokens)
+        self._started = started
+        self._peer = peer
+
+    async def to_ipa(self, text: str, *, lang: Optional[str] = None, **kw: Any) -> TextRefResult:
+        self._started.set()
+        await asyncio.wait_for(self._peer.wait(), timeout=2)
+        return await super().to_ipa(text, lang=lang, **kw)
+
+
+class SlowTextRef(StubTextRef):
+    def __init__(self, tokens: Optional[list[str]], delay: float) -> None:
+        super().__init__(tokens)
+        self._delay = delay
+        self.cancelled = False
+
+    async def to_ipa(self, text: str, *, lang: Optional[str] = None, **kw: Any) -> TextRefResult:
+        try:
+            await asyncio.sleep(self._delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return await super().to_ipa(text, lang=lang, **kw)
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+async def test_execute_pipeline_overlaps_asr_and_textref_and_reports_timings() -> None:
+    """ASR y TextRef corren en paralelo; meta.timings expone la latencia ahorrada.
+
+    Cada rama espera a que la otra haya empezado, así que en modo
+    secuencial la primera agotaría su espera: el solapamiento se
+    comprueba con eventos y no con tiempos de reloj.
+    """
+    asr_started, textref_started = asyncio.Event(), asyncio.Event()
+    result = await execute_pipeline(
+        StubPreprocessor(),
+        RendezvousASR(["p", "a", "d", "o"], asr_started, textref_started),
+        RendezvousTextRef(["p", "a", "t", "o"], textref_started, asr_started),
+        StubComparator(),
+        audio=_audio_input(),
+        text="pato",
+        lang="es",
+    )
+
+    timings = result.to_dict()["meta"]["timings"]
+    assert timings["mode"] == "concurrent"
+    assert {"asr_ms", "textref_ms", "wall_ms", "saved_ms"} <= set(timings)
+
+
+@pytest.mark.unit
+@pytest.mark.reliability
+async def test_execute_pipeline_cancels_textref_when_asr_fails() -> None:
+    """Si una rama falla, la otra se cancela y se propaga el error original."""
+    textref = SlowTextRef(["p", "a"], delay=5)
+
+    with pytest.raises(ValidationError):
+        await execute_pipeline(
+            StubPreprocessor(),
+            StubASR([]),
+            textref,
+            StubComparator(),
+            audio=_audio_input(),
+            text="pa",
+            lang="es",
+        )
+
+    assert textref.cancelled
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Literal, Optional
+
+import pytest
+
+from ipa_core.pipeline.scheduler import InferenceScheduler, scheduler_from_env
+from ipa_core.plugins.base import BasePlugin
+from ipa_core.types import ASRResult, AudioInput
+
+
+def _audio(name: str) -> AudioInput:
+    return {"path": name, "sample_rate": 16000, "channels": 1}
+
+
+class SingleStubASR(BasePlugin):
+    output_type: Literal["ipa", "text", "none"] = "ipa"
+    ctc_labels = ["", "a"]
+
+    def __init__(self, delay: float = 0.0) -> None:
+        super().__init__()
+        self.delay = delay
+        self.calls = 0
+
+    async def transcribe(self, audio: AudioInput, *, lang: Optional[str] = None, **kw: Any) -> ASRResult:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"tokens": [audio["path"]], "meta": {"backend": "stub", "lang": lang}}
+
+
+class PaddedStubASR(SingleStubASR):
+    def __init__(self, delay: float = 0.0) -> None:
+        super().__init__(delay)
+        self.batch_sizes: list[int] = []
+
+    async def transcribe_many(self, audios: list[AudioInput], *, lang: Optional[str] = None) -> list[Any]:
+        self.batch_sizes.append(len(audios))
+        await asyncio.sleep(self.delay)
+        return [
+            ValueError("audio vacío") if audio["path"] == "bad" else {"tokens": [audio["path"]], "meta": {"lang": lang}}
+            for audio in audios
+        ]
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+async def test_scheduler_batches_scatters_and_enforces_deadlines() -> None:
+    asr = PaddedStubASR()
+    scheduler = InferenceScheduler(asr, max_batch=4, max_wait_ms=50)
+    ids = ["a", "b", "bad", "c", "d"]
+    results = await asyncio.gather(
+        *(scheduler.transcribe(_audio(i), lang="es") for i in ids), return_exceptions=True
+    )
+    # Lote lleno de 4; el quinto sale solo por el camino individual.
+    assert asr.batch_sizes == [4] and asr.calls == 1
+    assert [r["tokens"][0] for r in results if not isinstance(r, BaseException)] == ["a", "b", "c", "d"]
+    assert isinstance(results[2], ValueError)
+    assert scheduler.stats()["max_queue_depth"] == 4
+    assert scheduler.ctc_labels == ["", "a"]
+
+    slow = InferenceScheduler(PaddedStubASR(delay=0.2), max_batch=4, max_wait_ms=1)
+    with pytest.raises(asyncio.TimeoutError):
+        await slow.transcribe(_audio("a"), lang="es", deadline_ms=20)
+    assert slow.stats()["expired"] == 1
+    assert slow.stats()["queue_depth"] == 0
+
+
+@pytest.mark.unit
+async def test_backends_without_batch_support_run_single(monkeypatch) -> None:
+    asr = SingleStubASR()
+    assert scheduler_from_env(asr) is asr
+    monkeypatch.setenv("PRONUNCIAPA_ASR_BATCH_SIZE", "8")
+    assert isinstance(scheduler_from_env(PaddedStubASR()), InferenceScheduler)
+
+    scheduler = InferenceScheduler(asr, max_wait_ms=1000)
+    result = await asyncio.wait_for(scheduler.transcribe(_audio("x"), lang="es"), 0.5)
+    assert result["tokens"] == ["x"] and asr.calls == 1
+    assert scheduler.stats()["mode"] == "single"
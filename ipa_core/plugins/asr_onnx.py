@@ -1,14 +1,22 @@
-"""ASR ONNX offline con salida IPA."""
+"""ASR ONNX offline con salida IPA.
+
+``transcribe_many`` agrupa varios audios en un tensor con padding (el
+relleno es el mínimo del log-mel de cada audio, es decir silencio) y ejecuta
+una sola sesión; los frames de padding se descartan antes de decodificar.
+Si el modelo tiene el batch fijo en 1 se transcribe audio por audio.
+"""
 from __future__ import annotations
 
 import asyncio
 import json
 from pathlib import Path
-from typing import Any, Literal, Optional
+import math
+from typing import Any, List, Literal, Optional
 
 import numpy as np
 
 from ipa_core.backends.audio_processing import LibrosaFeatureExtractor
+from ipa_core.backends.ctc import ctc_greedy_decode
 from ipa_core.backends.onnx_engine import ONNXRunner
 from ipa_core.errors import NotReadyError, ValidationError
 from ipa_core.plugins.base import BasePlugin
@@ -124,6 +132,48 @@ class ONNXASRPlugin(BasePlugin):
         features = await self._extractor.extract(audio)
         features = self._maybe_adjust_features(features)
         logits = await asyncio.to_thread(self._runner.run, features)
+        return self._result(logits, lang)
+
+    async def transcribe_many(
+        self,
+        audios: List[AudioInput],
+        *,
+        lang: Optional[str] = None,
+        **kw: Any,
+    ) -> List[ASRResult]:
+        """Transcribir varios audios en una sola ejecución de la sesión."""
+        if not self._extractor or not self._runner or not self._config:
+            raise NotReadyError("ONNXASRPlugin no inicializado. Ejecuta setup().")
+        features = [self._maybe_adjust_features(await self._extractor.extract(a)) for a in audios]
+        if len(features) < 2 or any(f.ndim != 3 or f.shape[0] != 1 for f in features):
+            return [await self.transcribe(audio, lang=lang) for audio in audios]
+        time_axis = 2 if features[0].shape[1] == self._n_mels else 1
+        frames = [f.shape[time_axis] for f in features]
+        batch = np.stack([self._pad_frames(f[0], max(frames), time_axis - 1) for f in features])
+        try:
+            logits = await asyncio.to_thread(self._runner.run, batch)
+        except Exception:
+            # Modelos exportados con batch fijo: ejecución individual.
+            return [await self.transcribe(audio, lang=lang) for audio in audios]
+        if logits.ndim != 3 or logits.shape[0] != len(features):
+            return [await self.transcribe(audio, lang=lang) for audio in audios]
+        out_frames = logits.shape[1]
+        return [
+            self._result(logits[i, : math.ceil(out_frames * n / max(frames))], lang)
+            for i, n in enumerate(frames)
+        ]
+
+    @staticmethod
+    def _pad_frames(features: np.ndarray, length: int, axis: int) -> np.ndarray:
+        missing = length - features.shape[axis]
+        if missing <= 0:
+            return features
+        widths = [(0, 0)] * features.ndim
+        widths[axis] = (0, missing)
+        return np.pad(features, widths, constant_values=float(features.min()))
+
+    def _result(self, logits: np.ndarray, lang: Optional[str]) -> ASRResult:
+        assert self._config is not None
         tokens = self._ctc_greedy_decode(logits, self._labels, blank_id=self._blank_id or 0)
         return {
             "tokens": tokens,
@@ -149,25 +199,27 @@ class ONNXASRPlugin(BasePlugin):
 
     @staticmethod
     def _ctc_greedy_decode(logits: np.ndarray, labels: list[str], *, blank_id: int) -> list[Token]:
-        if logits.ndim == 3:
-            seq = np.argmax(logits, axis=-1)[0]
-        elif logits.ndim == 2:
-            seq = np.argmax(logits, axis=-1)
-        else:
-            raise ValidationError(f"Salida ONNX con forma inesperada: {logits.shape}")
-
-        tokens: list[Token] = []
-        prev: Optional[int] = None
-        for idx in seq.tolist():
-            if idx == blank_id:
-                prev = idx
-                continue
-            if prev is None or idx != prev:
-                token = labels[idx] if idx < len(labels) else ""
-                if token:
-                    tokens.append(token)
-            prev = idx
-        return tokens
+        return ctc_greedy_decode(logits, labels, blank_id=blank_id)
+
+    # ------------------------------------------------------------------
+    # Streaming (ver ipa_core.audio.streaming_asr)
+    # ------------------------------------------------------------------
+
+    @property
+    def ctc_labels(self) -> list[str]:
+        return self._labels
+
+    @property
+    def ctc_blank_id(self) -> int:
+        return int(self._blank_id or 0)
+
+    async def ctc_logits(self, audio: AudioInput, *, lang: Optional[str] = None) -> Optional[np.ndarray]:
+        """Logits ``T x V`` del audio (sin decodificar)."""
+        if not self._extractor or not self._runner or not self._config:
+            raise NotReadyError("ONNXASRPlugin no inicializado. Ejecuta setup().")
+        features = self._maybe_adjust_features(await self._extractor.extract(audio))
+        logits = await asyncio.to_thread(self._runner.run, features)
+        return logits[0] if logits.ndim == 3 else logits
 
 
 __all__ = ["ONNXASRPlugin"]
@@ -166,6 +166,12 @@ def _register_defaults() -> None:
     from ipa_core.textref.espeak import EspeakTextRef
     from ipa_core.textref.simple import GraphemeTextRef
     from ipa_core.textref.cascading import CascadingTextRef
+    from ipa_core.textref.cache import get_global_cache
+
+    def _textref_cache(p: dict) -> Any:
+        """Cache compartido (memoria + SQLite) salvo ``cache: false``."""
+        return get_global_cache() if p.get("cache", True) else None
+
     register("textref", "grapheme", lambda _: GraphemeTextRef())
     try:
         from ipa_core.textref.epitran import EpitranTextRef
@@ -174,20 +180,32 @@ def _register_defaults() -> None:
         _epitran_cls = None
     else:
         _epitran_cls = EpitranTextRef
-        register("textref", "epitran", lambda p: EpitranTextRef(default_lang=p.get("default_lang", "es")))
-    register("textref", "espeak", lambda p: EspeakTextRef(default_lang=p.get("default_lang", "es")))
+        register(
+            "textref",
+            "epitran",
+            lambda p: EpitranTextRef(default_lang=p.get("default_lang", "es"), cache=_textref_cache(p)),
+        )
+    register(
+        "textref",
+        "espeak",
+        lambda p: EspeakTextRef(
+            default_lang=p.get("default_lang", "es"),
+            cache=_textref_cache(p),
+            workers_per_voice=int(p.get("workers_per_voice", 2)),
+        ),
+    )
 
     def _create_auto_textref(p: dict) -> CascadingTextRef:
         """Construye la cadena automática: espeak → epitran → grapheme."""
         providers: list = []
         lang = p.get("default_lang", "es")
         try:
-            providers.append(EspeakTextRef(default_lang=lang))
+            providers.append(EspeakTextRef(default_lang=lang, cache=_textref_cache(p)))
         except Exception:
             pass
         if _epitran_cls is not None:
             try:
-                providers.append(_epitran_cls(default_lang=lang))
+                providers.append(_epitran_cls(default_lang=lang, cache=_textref_cache(p)))
             except Exception:
                 pass
         providers.append(GraphemeTextRef())
@@ -223,7 +241,7 @@ def _register_defaults() -> None:
             espeak_fb = None
             if p.get("espeak_fallback", True):
                 try:
-                    espeak_fb = EspeakTextRef(default_lang=lang)
+                    espeak_fb = EspeakTextRef(default_lang=lang, cache=_textref_cache(p))
                 except Exception:
                     pass
             return LexiconTextRef(
@@ -235,9 +253,18 @@ def _register_defaults() -> None:
 
     # Comparator
     from ipa_core.compare.levenshtein import LevenshteinComparator
+    from ipa_core.compare.levenshtein_vectorized import VectorizedLevenshteinComparator
     from ipa_core.compare.noop import NoOpComparator
     register("comparator", "levenshtein", lambda _: LevenshteinComparator(use_articulatory=True))
     register("comparator", "default", lambda _: LevenshteinComparator(use_articulatory=True))
+    register(
+        "comparator",
+        "levenshtein_vectorized",
+        lambda p: VectorizedLevenshteinComparator(
+            use_articulatory=bool(p.get("use_articulatory", True)),
+            articulatory_min_cost=float(p.get("articulatory_min_cost", 0.4)),
+        ),
+    )
     register("comparator", "noop", lambda _: NoOpComparator())
 
     # Preprocessor
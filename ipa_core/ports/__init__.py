@@ -5,11 +5,11 @@ Todos los contratos (Protocol) se re-exportan aquí para facilitar imports:
     from ipa_core.ports import ASRBackend, Comparator, TTSProvider
 """
 
-from ipa_core.ports.asr import ASRBackend
+from ipa_core.ports.asr import ASRBackend, CTCStreamingBackend
 from ipa_core.ports.compare import Comparator
 from ipa_core.ports.features import FeatureExtractor
 from ipa_core.ports.history import HistoryPort
-from ipa_core.ports.llm import LLMAdapter
+from ipa_core.ports.llm import LLMAdapter, StreamingLLMAdapter
 from ipa_core.ports.oov import OOVHandlerPort, PassthroughOOVHandler
 from ipa_core.ports.phoneme_corpus import PhonemeCorpusPort, DiskPhonemeCorpus, NullPhonemeCorpus
 from ipa_core.ports.preprocess import Preprocessor
@@ -19,6 +19,7 @@ from ipa_core.ports.tts import TTSProvider
 __all__ = [
     "ASRBackend",
     "Comparator",
+    "CTCStreamingBackend",
     "DiskPhonemeCorpus",
     "FeatureExtractor",
     "HistoryPort",
@@ -28,6 +29,7 @@ __all__ = [
     "PassthroughOOVHandler",
     "PhonemeCorpusPort",
     "Preprocessor",
+    "StreamingLLMAdapter",
     "TextRefProvider",
     "TTSProvider",
 ]
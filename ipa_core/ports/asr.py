@@ -28,11 +28,18 @@ Latencia esperada (no streaming)
 --------------------------------
 Modo actual: síncrono por archivo completo
 - Target: < 3x RTF (real-time factor) para archivos < 30 segundos
-- Streaming: NO implementado aún, diseño preparado para futuro
+
+Streaming
+---------
+``ipa_core.audio.streaming_asr`` emite hipótesis parciales sobre una ventana
+deslizante.  Los backends CTC que implementan :class:`CTCStreamingBackend`
+sólo procesan el audio nuevo de cada ventana (más contexto izquierdo) y el
+estado del decodificador se conserva entre ventanas; el resto se
+re-transcribe sobre el audio acumulado.
 """
 from __future__ import annotations
 
-from typing import Literal, Optional, Protocol, runtime_checkable
+from typing import Any, Literal, Optional, Protocol, runtime_checkable
 
 from ipa_core.types import ASRResult, AudioInput
 
@@ -84,4 +91,24 @@ class ASRBackend(Protocol):
         - model: str - Identificador del modelo
         - lang: str - Idioma usado efectivamente
         """
-        ...
\ No newline at end of file
+        ...
+
+
+@runtime_checkable
+class CTCStreamingBackend(Protocol):
+    """Backend CTC que expone sus logits para decodificación incremental.
+
+    Attributes
+    ----------
+    ctc_labels : list[str]
+        Etiqueta de cada columna de los logits (``""`` para no emitir).
+    ctc_blank_id : int
+        Índice del símbolo *blank*.
+    """
+
+    ctc_labels: list[str]
+    ctc_blank_id: int
+
+    async def ctc_logits(self, audio: AudioInput, *, lang: Optional[str] = None) -> Any:
+        """Logits ``T x V`` (``np.ndarray``) del audio, o ``None`` si no hay."""
+        ...
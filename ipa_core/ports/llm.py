@@ -1,7 +1,17 @@
-"""LLM runtime adapter port (prompt -> text)."""
+"""LLM runtime adapter port (prompt -> text).
+
+Streaming
+---------
+Adapters that can emit tokens as they are generated also implement
+:class:`StreamingLLMAdapter`, and accept ``on_token`` (an async callback
+per chunk) in ``complete``. Adapters that retry internally also accept
+``on_reset`` (an async callback with no arguments), called whenever an
+attempt whose chunks were already streamed is discarded. Other adapters
+ignore both via ``**kw``.
+"""
 from __future__ import annotations
 
-from typing import Any, Optional, Protocol, runtime_checkable
+from typing import Any, AsyncIterator, Optional, Protocol, runtime_checkable
 
 
 @runtime_checkable
@@ -25,3 +35,17 @@ class LLMAdapter(Protocol):
     ) -> str:
         """Generate raw text completion for a prompt."""
         ...
+
+
+@runtime_checkable
+class StreamingLLMAdapter(Protocol):
+    """LLM adapter that yields completion chunks as they arrive."""
+
+    def stream(
+        self,
+        prompt: str,
+        *,
+        params: Optional[dict[str, Any]] = None,
+    ) -> AsyncIterator[str]:
+        """Yield text chunks of the completion in order."""
+        ...
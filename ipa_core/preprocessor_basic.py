@@ -3,17 +3,22 @@
 Implementa el contrato `Preprocessor` con reglas mínimas:
 - process_audio: valida estructura básica; opcionalmente ejecuta AudioProcessingChain.
 - normalize_tokens: minúsculas y recorte simple de espacios.
+
+La normalización de tokens usa un ``CompiledNormalizer`` por (inventario,
+reglas alofónicas), construido una vez y guardado en el preprocesador
+(que vive en el kernel), con memo por token.
 """
 from __future__ import annotations
 
 from typing import Any, Optional
-import unicodedata
 
+import numpy as np
+
+from ipa_core.audio.pcm import has_pcm
 from ipa_core.errors import ValidationError
 from ipa_core.plugins.base import BasePlugin
-from ipa_core.types import AudioInput, PreprocessorResult, Token, TokenSeq
-from ipa_core.normalization.mappings import normalize_unicode
-from ipa_core.normalization.normalizer import IPANormalizer
+from ipa_core.types import AudioInput, PreprocessorResult, TokenSeq
+from ipa_core.normalization.compiled import CompiledNormalizerCache
 
 
 class BasicPreprocessor(BasePlugin):
@@ -33,17 +38,22 @@ class BasicPreprocessor(BasePlugin):
     def __init__(self, *, audio_chain: Optional[Any] = None) -> None:
         super().__init__()
         self._audio_chain = audio_chain
+        self._normalizers = CompiledNormalizerCache()
 
     async def process_audio(self, audio: AudioInput, **kw: Any) -> PreprocessorResult:  # noqa: D401
         """Validar claves esperadas; si hay audio_chain, ejecutarla completa."""
-        try:
-            path = audio["path"]
-            sample_rate = audio["sample_rate"]
-            channels = audio["channels"]
-        except KeyError as exc:  # Mantener error de validación uniforme.
-            raise ValidationError(f"AudioInput missing required key: {exc.args[0]}") from exc
-
-        if not isinstance(path, str) or not path.strip():
+        in_memory = has_pcm(audio)
+        required = self._REQUIRED_AUDIO_KEYS[1:] if in_memory else self._REQUIRED_AUDIO_KEYS
+        missing = [key for key in required if key not in audio]
+        if missing:  # Mantener error de validación uniforme.
+            raise ValidationError(f"AudioInput missing required key: {missing[0]}")
+        sample_rate = audio["sample_rate"]
+        channels = audio["channels"]
+
+        if in_memory:
+            if not isinstance(audio["pcm"], (bytes, bytearray, memoryview, np.ndarray)):
+                raise ValidationError("AudioInput.pcm must be bytes, memoryview or an int16 array")
+        elif not isinstance(audio["path"], str) or not audio["path"].strip():
             raise ValidationError("AudioInput.path must be a non-empty string")
         if not isinstance(sample_rate, int) or sample_rate <= 0:
             raise ValidationError("AudioInput.sample_rate must be a positive integer")
@@ -71,29 +81,15 @@ class BasicPreprocessor(BasePlugin):
         use_normalizer = bool(inventory or allophone_rules or kw.get("use_normalizer"))
 
         if use_normalizer:
-            normalizer = IPANormalizer(inventory=inventory, collapse_oov=False)
-            if allophone_rules:
-                normalizer.load_allophone_rules(allophone_rules)
-            raw_tokens = [
-                unicodedata.normalize("NFC", str(token).strip().lower())
-                for token in tokens
-                if str(token).strip()
-            ]
-            out = await normalizer.normalize(raw_tokens)
+            normalizer = self._normalizers.get(inventory, allophone_rules, lowercase=True)
+            out = normalizer.normalize_many(tokens)
             meta = {"preprocessor": "basic", "count": len(out)}
             if inventory:
-                oov_tokens = [
-                    t for t in inventory.get_oov_phones(out)
-                    if not inventory.is_valid_symbol(t)
-                ]
+                oov_tokens = normalizer.oov_tokens(out)
                 meta["oov_tokens"] = oov_tokens
                 meta["oov_count"] = len(oov_tokens)
             return {"tokens": out, "meta": meta}
 
-        out: list[Token] = []
-        for token in tokens:
-            # Strip, lower and NFC normalization + unicode IPA mappings
-            normalized = normalize_unicode(str(token).strip().lower())
-            if normalized:
-                out.append(normalized)
+        # Strip, lower and NFC normalization + unicode IPA mappings
+        out = self._normalizers.get(lowercase=True).normalize_many(tokens)
         return {"tokens": out, "meta": {"preprocessor": "basic", "count": len(out)}}
@@ -1,7 +1,9 @@
 """Helpers para diagnosticar calidad de audio."""
 from __future__ import annotations
 
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Mapping, Optional, Tuple, Dict, Any
+
+from ipa_core.audio.pcm import AudioSource, has_pcm
 
 from ipa_core.audio.quality_gates import (
     check_quality,
@@ -10,11 +12,11 @@ from ipa_core.audio.quality_gates import (
     DEFAULT_MIN_DURATION_MS,
     DEFAULT_MAX_DURATION_MS,
 )
-from ipa_core.services.user_profile import UserProfileStore, adaptive_thresholds
+from ipa_core.services.user_profile import adaptive_thresholds, get_user_profile_store
 
 
 def assess_audio_quality(
-    path: Optional[str],
+    path: Optional[AudioSource],
     *,
     user_id: Optional[str] = None,
     speech_segments: Optional[List[tuple]] = None,
@@ -22,21 +24,22 @@ def assess_audio_quality(
     """Ejecutar quality gates si el path es válido y retornar warnings.
 
     Args:
-        path: Ruta al archivo WAV.
+        path: Ruta al archivo WAV o ``AudioInput`` (con ``path`` o ``pcm``).
         user_id: ID de usuario para perfiles adaptativos.
         speech_segments: Segmentos de voz [(start_ms, end_ms), ...] del VAD.
             Si se proveen, el SNR se calcula real en lugar del proxy.
     """
-    if not path or not path.lower().endswith(".wav"):
+    source = path if has_pcm(path) else _wav_path(path)
+    if source is None:
         return None, [], None
     profile = None
     if user_id:
-        store = UserProfileStore()
+        store = get_user_profile_store()
         profile = store.get(user_id)
     thresholds = adaptive_thresholds(profile)
     try:
         result = check_quality(
-            path,
+            source,
             min_duration_ms=DEFAULT_MIN_DURATION_MS,
             max_duration_ms=DEFAULT_MAX_DURATION_MS,
             min_snr_db=thresholds["min_snr_db"],
@@ -47,7 +50,7 @@ def assess_audio_quality(
     except Exception:
         return None, [], None
     if user_id:
-        store = UserProfileStore()
+        store = get_user_profile_store()
         profile = store.update(user_id, result)
     warnings: list[str] = []
     if not result.passed and result.user_feedback:
@@ -62,4 +65,11 @@ def assess_audio_quality(
     return result, warnings, meta
 
 
+def _wav_path(source: Optional[AudioSource]) -> Optional[str]:
+    path = source.get("path") if isinstance(source, Mapping) else source
+    if not path or not str(path).lower().endswith(".wav"):
+        return None
+    return str(path)
+
+
 __all__ = ["assess_audio_quality"]
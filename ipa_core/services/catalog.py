@@ -3,79 +3,118 @@ from __future__ import annotations
 import copy
 import logging
 import re
+import os
 import tempfile
+import threading
 import unicodedata
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Optional
 from urllib.parse import quote
-import yaml
 
 from ipa_core.config import loader
+from ipa_core.ipa_catalog import CatalogDocument, get_catalog_index
 from ipa_core.plugins import registry
 from ipa_core.textref.g2p_generator import G2PExerciseGenerator
+from ipa_core.tts.cache import CachedAudio, get_tts_audio_cache, provider_fingerprint, render_cached
+from ipa_core.tts.utils import voice_params
 
 logger = logging.getLogger(__name__)
 
 _CATALOG_DIR = Path(__file__).parent.parent.parent / "data" / "ipa_catalog"
 
+# Disponibilidad del TTS por firma de configuración (archivo + ``mtime`` +
+# variables ``PRONUNCIAPA_*``): cargar la config y resolver el proveedor
+# cuesta ~10 ms y se consultaba en cada respuesta y por idioma.
+_tts_configured: Optional[tuple[tuple[Any, ...], bool]] = None
+_tts_configured_lock = threading.Lock()
+
+
+def _config_signature() -> tuple[Any, ...]:
+    path = loader.resolve_config_path()
+    env = tuple(sorted((k, v) for k, v in os.environ.items() if k.startswith("PRONUNCIAPA_")))
+    if path is None:
+        return (None, env)
+    st = path.stat()
+    return (str(path.resolve()), st.st_mtime_ns, st.st_size, env)
+
+
+def _resolve_tts_configured() -> bool:
+    cfg = loader.load_config()
+    name = (cfg.tts.name or "").lower()
+    if name in ("", "none"):
+        return False
+    registry.resolve_tts(name, cfg.tts.params, strict_mode=False)
+    return True
+
 
 class CatalogService:
-    """Service to handle IPA catalog business logic with low complexity."""
+    """Service to handle IPA catalog business logic with low complexity.
+
+    Los YAML se leen del :class:`~ipa_core.ipa_catalog.CatalogIndex`
+    compartido (parseados una vez, invalidados por ``mtime``); como sus
+    documentos son compartidos, las respuestas copian antes de anotar.
+    """
 
     def __init__(self, catalog_dir: Path = _CATALOG_DIR):
         self.catalog_dir = catalog_dir
+        self._index = get_catalog_index(catalog_dir)
+
+    def _load_yaml(self, name: str) -> dict[str, Any]:
+        return self._index.data(name)
 
-    def _load_yaml(self, path: Path) -> dict[str, Any]:
-        if not path.exists():
-            return {}
-        with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+    def _find_sound(self, name: str, sound_id: str, full_sound_id: str) -> Optional[dict[str, Any]]:
+        doc: Optional[CatalogDocument] = self._index.document(name)
+        return doc.find_sound(sound_id, full_sound_id) if doc is not None else None
 
     def is_tts_configured(self) -> bool:
+        """Indica si hay un TTS utilizable (se resuelve una vez por configuración)."""
+        global _tts_configured
         try:
-            cfg = loader.load_config()
-            name = (cfg.tts.name or "").lower()
-            if name in ("", "none"):
-                return False
-            registry.resolve_tts(name, cfg.tts.params, strict_mode=False)
-            return True
-        except Exception:
+            signature = _config_signature()
+        except OSError:
             return False
+        cached = _tts_configured
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        with _tts_configured_lock:
+            cached = _tts_configured
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            try:
+                configured = _resolve_tts_configured()
+            except Exception:
+                configured = False
+            _tts_configured = (signature, configured)
+        return configured
 
     def get_sounds_for_language(self, lang: str, category: Optional[str] = None) -> Optional[dict[str, Any]]:
-        catalog_file = self.catalog_dir / f"{lang}.yaml"
-        if not catalog_file.exists():
+        if self._index.document(lang) is None:
             return None
-        data = self._load_yaml(catalog_file)
+        data = self._load_yaml(lang)
         sounds = data.get("sounds", [])
         if category:
             sounds = [s for s in sounds if category in s.get("tags", [])]
         
-        tts_ok = self.is_tts_configured()
-        for sound in sounds:
-            sound_id = sound.get("id")
-            if sound_id and tts_ok:
-                sound["audio_url"] = f"/api/ipa-sounds/audio?sound_id={quote(sound_id)}"
+        if self.is_tts_configured():
+            sounds = [
+                {**sound, "audio_url": f"/api/ipa-sounds/audio?sound_id={quote(sound['id'])}"}
+                if sound.get("id") else sound
+                for sound in sounds
+            ]
                 
         return {"language": lang, "total": len(sounds), "sounds": sounds}
 
     def get_all_languages_sounds(self, category: Optional[str] = None) -> dict[str, Any]:
         all_sounds: dict[str, Any] = {}
-        for yaml_file in self.catalog_dir.glob("*.yaml"):
-            if yaml_file.name.endswith("_learning.yaml"):
+        for lang_code in self._index.names():
+            if lang_code.endswith("_learning"):
                 continue
-            lang_code = yaml_file.stem
             lang_data = self.get_sounds_for_language(lang_code, category)
             if lang_data:
                 all_sounds[lang_code] = {"total": lang_data["total"], "sounds": lang_data["sounds"]}
         return {"languages": list(all_sounds.keys()), "data": all_sounds}
 
-    def _find_sound_in_data(self, data: dict[str, Any], sound_id: str, full_sound_id: str) -> Optional[dict[str, Any]]:
-        for sound in data.get("sounds", []):
-            if sound.get("id") in (sound_id, full_sound_id) or sound.get("ipa") == sound_id:
-                return sound
-        return None
-
     def _parse_sound_id(self, sound_id: str) -> tuple[str, str]:
         parts = sound_id.split("/", 1)
         if len(parts) != 2:
@@ -84,11 +123,10 @@ class CatalogService:
 
     def get_sound_audio_info(self, sound_id: str, example: Optional[str] = None) -> dict[str, Any]:
         lang, ipa = self._parse_sound_id(sound_id)
-        data = self._load_yaml(self.catalog_dir / f"{lang}.yaml")
-        if not data:
+        if not self._load_yaml(lang):
             raise FileNotFoundError(f"Language catalog not found: {lang}")
             
-        sound_data = self._find_sound_in_data(data, ipa, sound_id)
+        sound_data = self._find_sound(lang, ipa, sound_id)
         if not sound_data:
             raise KeyError(f"Sound not found: {sound_id}")
             
@@ -106,28 +144,45 @@ class CatalogService:
                 return seeds[0].get("text")
         return None
 
-    async def generate_audio_file(self, lang: str, text: str) -> str:
+    async def generate_audio(self, lang: str, text: str) -> CachedAudio:
+        """Audio de ``text`` desde el cache TTS; sólo se inicializa el TTS si falta."""
         cfg = loader.load_config()
-        tts = registry.resolve_tts(cfg.tts.name, cfg.tts.params)
-        await tts.setup()
-        try:
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-                output_path = tmp_file.name
-            await tts.synthesize(text=text, lang=lang, output_path=output_path)
-            return output_path
-        finally:
-            await tts.teardown()
+        _, params = voice_params(cfg.tts.params, lang=lang)
+
+        @asynccontextmanager
+        async def _lease():
+            tts = registry.resolve_tts(cfg.tts.name, params)
+            await tts.setup()
+            try:
+                yield tts
+            finally:
+                await tts.teardown()
+
+        return await render_cached(
+            _lease,
+            get_tts_audio_cache(),
+            provider=provider_fingerprint(cfg.tts.name, params),
+            text=text,
+            lang=lang,
+            params=params,
+        )
+
+    async def generate_audio_file(self, lang: str, text: str) -> str:
+        audio = await self.generate_audio(lang, text)
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
+            tmp_file.write(audio.wav_bytes())
+            return tmp_file.name
 
     def get_learning_content(self, lang: str, sound_id: Optional[str] = None) -> dict[str, Any]:
-        learning_data = self._load_yaml(self.catalog_dir / f"{lang}_learning.yaml")
+        learning_data = self._load_yaml(f"{lang}_learning")
         if not learning_data:
-            basic_data = self._load_yaml(self.catalog_dir / f"{lang}.yaml")
+            basic_data = self._load_yaml(lang)
             if not basic_data:
                 raise FileNotFoundError(f"No content for: {lang}")
             return {"language": lang, "has_learning_content": False, "sounds": basic_data.get("sounds", [])}
 
         if sound_id:
-            sound = self._find_sound_in_data(learning_data, sound_id, sound_id)
+            sound = self._find_sound(f"{lang}_learning", sound_id, sound_id)
             if sound:
                 return {"language": lang, "has_learning_content": True, "sound": sound}
             raise KeyError(f"Sound not found: {sound_id}")
@@ -159,14 +214,11 @@ class CatalogService:
 
     def get_drills(self, lang: str, sound_id: str, drill_type: Optional[str] = None) -> dict[str, Any]:
         full_sound_id = self._resolve_full_sound_id(lang, sound_id)
-        learning_data = self._load_yaml(self.catalog_dir / f"{lang}_learning.yaml")
-        basic_data = self._load_yaml(self.catalog_dir / f"{lang}.yaml")
-        
-        sound_info = self._find_sound_in_data(learning_data, sound_id, full_sound_id)
-        drills = sound_info.get("drills", []) if sound_info else []
+        sound_info = self._find_sound(f"{lang}_learning", sound_id, full_sound_id)
+        drills = [dict(d) for d in sound_info.get("drills", [])] if sound_info else []
         
         if not drills:
-            sound_info = sound_info or self._find_sound_in_data(basic_data, sound_id, full_sound_id)
+            sound_info = sound_info or self._find_sound(lang, sound_id, full_sound_id)
             if sound_info:
                 drills = self._build_context_drills(sound_info, sound_id)
                 
@@ -243,15 +295,12 @@ class CatalogService:
             include_audio = self.is_tts_configured()
             
         full_sound_id = self._resolve_full_sound_id(lang, sound_id)
-        learning_data = self._load_yaml(self.catalog_dir / f"{lang}_learning.yaml")
-        basic_data = self._load_yaml(self.catalog_dir / f"{lang}.yaml")
-        
-        if not learning_data and not basic_data:
+        if not self._load_yaml(f"{lang}_learning") and not self._load_yaml(lang):
             raise FileNotFoundError(f"Language catalog not found: {lang}")
 
-        sound_info = self._find_sound_in_data(learning_data, sound_id, full_sound_id)
+        sound_info = self._find_sound(f"{lang}_learning", sound_id, full_sound_id)
         has_learning = sound_info is not None
-        base_sound = self._find_sound_in_data(basic_data, sound_id, full_sound_id)
+        base_sound = self._find_sound(lang, sound_id, full_sound_id)
         sound_info = sound_info or base_sound
         
         if not sound_info:
@@ -8,15 +8,17 @@ from typing import Any, Optional, cast
 
 from ipa_core.audio.files import cleanup_temp, ensure_wav, persist_bytes
 from ipa_core.audio.markers import mark_audio_preprocessed
+from ipa_core.audio.pcm import audio_file, decode_wav_pcm16, is_canonical_pcm, pcm_input
 from ipa_core.backends.audio_io import to_audio_input
 from ipa_core.errors import NotReadyError, ValidationError
+from ipa_core.kernel.executors import get_executor
 from ipa_core.normalization.resolve import resolve_pack_id
 from ipa_core.ports.asr import ASRBackend
 from ipa_core.ports.compare import Comparator
 from ipa_core.ports.preprocess import Preprocessor
 from ipa_core.ports.textref import TextRefProvider
 from ipa_core.preprocessor_basic import BasicPreprocessor
-from ipa_core.types import CompareResult, CompareWeights, Token
+from ipa_core.types import AudioInput, CompareResult, CompareWeights, Token
 from ipa_core.plugins import registry
 from ipa_core.phonology.representation import ComparisonResult, RepresentationLevel
 from ipa_core.pipeline.runner import execute_pipeline
@@ -93,12 +95,8 @@ class ComparisonService:
         return registry.resolve_comparator(selected, {})
 
     @staticmethod
-    def _build_pipeline_audio(path: str) -> dict[str, object]:
-        return mark_audio_preprocessed({
-            "path": path,
-            "sample_rate": 16000,
-            "channels": 1,
-        })
+    def _build_pipeline_audio(audio: AudioInput) -> dict[str, object]:
+        return mark_audio_preprocessed({**audio, "sample_rate": 16000, "channels": 1})
 
     @staticmethod
     async def _load_language_pack(pack: Optional[str], lang: str) -> tuple[Optional[LanguagePackPlugin], Optional[str]]:
@@ -206,10 +204,10 @@ class ComparisonService:
         mode: str = "objective",
         user_id: Optional[str] = None,
     ) -> ComparisonPayload:
-        wav_path, tmp = ensure_wav(path)
+        wav_path, tmp = await get_executor("audio").run(ensure_wav, path)
         try:
             return await self._run_pipeline_detail(
-                wav_path,
+                {"path": wav_path, "sample_rate": 16000, "channels": 1},
                 text,
                 target_ipa=target_ipa,
                 lang=lang,
@@ -229,6 +227,67 @@ class ComparisonService:
             if tmp:
                 cleanup_temp(wav_path)
 
+    async def compare_audio_detail(
+        self,
+        audio: AudioInput,
+        text: str,
+        *,
+        target_ipa: Optional[str] = None,
+        lang: Optional[str] = None,
+        lang_source: Optional[str] = None,
+        lang_target: Optional[str] = None,
+        weights: Optional[CompareWeights] = None,
+        allow_textref_fallback: bool = False,
+        fallback_lang: Optional[str] = None,
+        evaluation_level: str = "phonemic",
+        force_phonetic: Optional[bool] = None,
+        allow_quality_downgrade: Optional[bool] = None,
+        pack: Optional[str] = None,
+        mode: str = "objective",
+        user_id: Optional[str] = None,
+    ) -> ComparisonPayload:
+        """Como :meth:`compare_file_detail` pero sobre un ``AudioInput``.
+
+        El PCM 16 kHz mono en memoria va directo al pipeline (sin disco ni
+        ffmpeg); cualquier otro audio sigue por :meth:`compare_file_detail`.
+        """
+        if is_canonical_pcm(audio):
+            return await self._run_pipeline_detail(
+                audio,
+                text,
+                target_ipa=target_ipa,
+                lang=lang,
+                lang_source=lang_source,
+                lang_target=lang_target,
+                weights=weights,
+                allow_textref_fallback=allow_textref_fallback,
+                fallback_lang=fallback_lang,
+                evaluation_level=evaluation_level,
+                force_phonetic=force_phonetic,
+                allow_quality_downgrade=allow_quality_downgrade,
+                pack=pack,
+                mode=mode,
+                user_id=user_id,
+            )
+        with audio_file(audio) as path:
+            return await self.compare_file_detail(
+                path,
+                text,
+                target_ipa=target_ipa,
+                lang=lang,
+                lang_source=lang_source,
+                lang_target=lang_target,
+                weights=weights,
+                allow_textref_fallback=allow_textref_fallback,
+                fallback_lang=fallback_lang,
+                evaluation_level=evaluation_level,
+                force_phonetic=force_phonetic,
+                allow_quality_downgrade=allow_quality_downgrade,
+                pack=pack,
+                mode=mode,
+                user_id=user_id,
+            )
+
     async def compare_bytes_detail(
         self,
         data: bytes,
@@ -250,6 +309,25 @@ class ComparisonService:
         user_id: Optional[str] = None,
     ) -> ComparisonPayload:
         suffix = Path(filename).suffix or ".wav"
+        samples = decode_wav_pcm16(data) if suffix.lower() == ".wav" else None
+        if samples is not None:
+            return await self.compare_audio_detail(
+                pcm_input(samples),
+                text,
+                target_ipa=target_ipa,
+                lang=lang,
+                lang_source=lang_source,
+                lang_target=lang_target,
+                weights=weights,
+                allow_textref_fallback=allow_textref_fallback,
+                fallback_lang=fallback_lang,
+                evaluation_level=evaluation_level,
+                force_phonetic=force_phonetic,
+                allow_quality_downgrade=allow_quality_downgrade,
+                pack=pack,
+                mode=mode,
+                user_id=user_id,
+            )
         tmp_original = persist_bytes(data, suffix=suffix)
         try:
             return await self.compare_file_detail(
@@ -274,7 +352,7 @@ class ComparisonService:
 
     async def _run_pipeline_detail(
         self,
-        wav_path: str,
+        audio: AudioInput,
         text: str,
         *,
         target_ipa: Optional[str],
@@ -294,7 +372,7 @@ class ComparisonService:
         effective_source_lang = lang_source or lang or self._default_lang
         effective_target_lang = lang_target or lang or self._default_lang
         quality_res, quality_warnings, profile_meta = assess_audio_quality(
-            wav_path,
+            audio,
             user_id=user_id,
         )
         warnings: list[str] = list(quality_warnings)
@@ -330,13 +408,12 @@ class ComparisonService:
                 warnings.append(
                     "Aviso: evaluation_level=phonetic sin language pack; comparación aproximada."
                 )
-            audio = self._build_pipeline_audio(wav_path)
             comp_res = await execute_pipeline(
                 self.pre,
                 self.asr,
                 self.textref,
                 self.comp,
-                audio=audio,  # type: ignore[arg-type]
+                audio=self._build_pipeline_audio(audio),  # type: ignore[arg-type]
                 text=text,
                 target_ipa=target_ipa,
                 lang=lang,
@@ -119,6 +119,33 @@ def calculate_articulatory_distance(ref: str, hyp: str) -> float:
     
     Distance is 0.0 for identical phones and 1.0 for maximally different.
     Phones of different types (consonant vs vowel) get maximum distance.
+    Values come from the precomputed ``categorical`` distance matrix
+    (see :mod:`ipa_core.compare.distance_matrix`).
+    
+    Parameters
+    ----------
+    ref : str
+        Reference phone.
+    hyp : str
+        Hypothesis phone (what the user produced).
+        
+    Returns
+    -------
+    float
+        Distance between 0.0 and 1.0.
+    """
+    if ref == hyp:
+        return 0.0
+    from ipa_core.compare.distance_matrix import get_distance_matrix
+
+    return get_distance_matrix("categorical").distance(ref, hyp)
+
+
+def categorical_distance(ref: str, hyp: str) -> float:
+    """Categorical feature distance used to fill the ``categorical`` matrix.
+    
+    Prefer :func:`calculate_articulatory_distance`, which reads the
+    precomputed matrix instead of re-deriving features on every call.
     
     Parameters
     ----------
@@ -351,6 +378,7 @@ __all__ = [
     "build_enriched_error_report",
     "get_phone_features",
     "calculate_articulatory_distance",
+    "categorical_distance",
     "categorize_error",
     "CONSONANT_FEATURES",
     "VOWEL_FEATURES",
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 import json
 import logging
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 from ipa_core.errors import NotReadyError, ValidationError
 from ipa_core.llm.utils import extract_json_object, load_json, load_text, validate_json_schema
@@ -15,7 +15,8 @@ from ipa_core.services.audio_quality import assess_audio_quality
 from ipa_core.services.adaptation import adapt_settings
 from ipa_core.kernel.core import Kernel
 from ipa_core.packs.schema import ModelPack
-from ipa_core.types import AudioInput, CompareResult, Token
+from ipa_core.pipeline.concurrency import run_branches
+from ipa_core.types import ASRResult, AudioInput, CompareResult, PreprocessorResult, Token
 from ipa_core.normalization.resolve import load_inventory_for
 from ipa_core.services.user_profile import UserAudioProfile
 
@@ -100,19 +101,34 @@ async def generate_feedback(
     retry: bool = True,
     prompt_path: Optional[Path] = None,
     output_schema_path: Optional[Path] = None,
+    on_token: Optional[Callable[[str], Awaitable[None]]] = None,
+    on_reset: Optional[Callable[[], Awaitable[None]]] = None,
 ) -> dict[str, Any]:
     """Generate LLM feedback from an Error Report.
 
     Cuando ``llm`` es un ``RuleBasedFeedbackAdapter`` (``llm.rule_based``
     es True), el reporte se pasa directamente como JSON y no se requiere
     ``model_pack`` ni ``model_pack_dir``.
+
+    ``on_token`` recibe los fragmentos del LLM a medida que se generan
+    (sólo adaptadores con streaming, p.ej. Ollama; el resto lo ignora).
+    Cada intento se transmite en vivo; cuando uno se descarta (reintento o
+    fallback) se llama ``on_reset`` para que el consumidor borre lo recibido.
+    Los adaptadores ``rule_based`` reintentan por su cuenta y reciben
+    ``on_reset``; para el resto los reintentos se resuelven aquí.
     """
+    stream_kw = {"on_token": on_token} if on_token is not None else {}
     # Path de respaldo basado en reglas: no requiere model_pack ni prompt
     if getattr(llm, "rule_based", False):
-        raw = await llm.complete(json.dumps(report, ensure_ascii=False), params={})
+        reset_kw = {"on_reset": on_reset} if on_reset is not None else {}
+        raw = await llm.complete(
+            json.dumps(report, ensure_ascii=False), params={}, **stream_kw, **reset_kw
+        )
         try:
             return json.loads(raw)
         except (json.JSONDecodeError, ValueError):
+            if on_reset is not None:
+                await on_reset()
             return generate_fallback_feedback(report)
 
     # Path LLM normal: requiere model_pack
@@ -126,7 +142,7 @@ async def generate_feedback(
         prompt_path=prompt_path,
         output_schema_path=output_schema_path,
     )
-    raw = await llm.complete(assets.prompt, params=assets.llm_params)
+    raw = await llm.complete(assets.prompt, params=assets.llm_params, **stream_kw)
     try:
         payload = _normalize_llm_payload(extract_json_object(raw))
         validate_json_schema(payload, assets.output_schema)
@@ -135,13 +151,17 @@ async def generate_feedback(
         if not retry:
             raise
     # Retry once with a stricter instruction.
+    if on_reset is not None:
+        await on_reset()
     fix_prompt = assets.prompt + "\nReturn ONLY valid JSON. Fix any schema violations.\n"
-    raw = await llm.complete(fix_prompt, params=assets.llm_params)
+    raw = await llm.complete(fix_prompt, params=assets.llm_params, **stream_kw)
     try:
         payload = _normalize_llm_payload(extract_json_object(raw))
         validate_json_schema(payload, assets.output_schema)
         return payload
     except ValidationError:
+        if on_reset is not None:
+            await on_reset()
         return generate_fallback_feedback(report, schema=assets.output_schema)
 
 
@@ -168,6 +188,8 @@ class FeedbackService:
         prompt_path: Optional[Path] = None,
         output_schema_path: Optional[Path] = None,
         user_id: Optional[str] = None,
+        on_token: Optional[Callable[[str], Awaitable[None]]] = None,
+        on_reset: Optional[Callable[[], Awaitable[None]]] = None,
     ) -> dict[str, Any]:
         effective_source_lang = lang_source or lang
         effective_target_lang = lang_target or lang
@@ -187,15 +209,17 @@ class FeedbackService:
 
         pre_audio_res = await self._kernel.pre.process_audio(audio)
         processed_audio = pre_audio_res.get("audio", audio)
-        asr_result = await self._kernel.asr.transcribe(processed_audio, lang=effective_source_lang)
-        hyp_tokens = asr_result.get("tokens")
-        if not hyp_tokens:
-            raise ValidationError("ASR no devolvio tokens IPA.")
-        hyp_pre_res = await self._kernel.pre.normalize_tokens(
-            hyp_tokens,
-            inventory=runtime.inventory,
-            allophone_rules=runtime.allophone_rules,
-        )
+        # ASR y TextRef son independientes: se ejecutan en paralelo.
+        branches, timings = await run_branches({
+            "asr": lambda: self._observed_branch(
+                processed_audio, lang=effective_source_lang, runtime=runtime,
+            ),
+            "textref": lambda: self._target_branch(
+                text, target_ipa=target_ipa, lang=effective_target_lang, runtime=runtime,
+            ),
+        })
+        asr_result, hyp_pre_res = branches["asr"]
+        ref_tokens = branches["textref"]
         hyp_tokens = hyp_pre_res.get("tokens", [])
         hyp_oov = hyp_pre_res.get("meta", {}).get("oov_tokens", [])
         if hyp_oov:
@@ -204,19 +228,6 @@ class FeedbackService:
                 f"Tokens IPA fuera del inventario: {preview}",
             ]))
 
-        if target_ipa and target_ipa.strip():
-            ref_tokens_raw = [tok for tok in target_ipa.strip().split() if tok]
-        else:
-            tr_result = await self._kernel.textref.to_ipa(text, lang=effective_target_lang)
-            ref_tokens_raw = tr_result.get("tokens", [])
-
-        ref_pre_res = await self._kernel.pre.normalize_tokens(
-            ref_tokens_raw,
-            inventory=runtime.inventory,
-            allophone_rules=runtime.allophone_rules,
-        )
-        ref_tokens = ref_pre_res.get("tokens", [])
-
         compare_res = await self._kernel.comp.compare(ref_tokens, hyp_tokens)
         compare_payload = _build_compare_payload(
             compare_result=compare_res,
@@ -232,6 +243,7 @@ class FeedbackService:
             adaptive_meta=runtime.adaptive_meta,
             profile_meta=runtime.profile_meta,
         )
+        compare_payload["meta"]["timings"] = timings.to_dict()
 
         report = build_error_report(
             target_text=text,
@@ -266,6 +278,8 @@ class FeedbackService:
             model_pack_dir=self._kernel.model_pack_dir or None,
             prompt_path=prompt_path,
             output_schema_path=output_schema_path,
+            on_token=on_token,
+            on_reset=on_reset,
         )
         feedback_payload = _apply_feedback_context(feedback, context=runtime.context)
 
@@ -287,6 +301,47 @@ class FeedbackService:
             "feedback": feedback_payload,
         }
 
+    async def _observed_branch(
+        self,
+        processed_audio: AudioInput,
+        *,
+        lang: str,
+        runtime: FeedbackRuntimeContext,
+    ) -> tuple[ASRResult, PreprocessorResult]:
+        """Rama observada: ASR + normalización de la hipótesis."""
+        asr_result = await self._kernel.asr.transcribe(processed_audio, lang=lang)
+        hyp_tokens = asr_result.get("tokens")
+        if not hyp_tokens:
+            raise ValidationError("ASR no devolvio tokens IPA.")
+        hyp_pre_res = await self._kernel.pre.normalize_tokens(
+            hyp_tokens,
+            inventory=runtime.inventory,
+            allophone_rules=runtime.allophone_rules,
+        )
+        return asr_result, hyp_pre_res
+
+    async def _target_branch(
+        self,
+        text: str,
+        *,
+        target_ipa: Optional[str],
+        lang: str,
+        runtime: FeedbackRuntimeContext,
+    ) -> list[Token]:
+        """Rama objetivo: TextRef (o IPA manual) + normalización."""
+        if target_ipa and target_ipa.strip():
+            ref_tokens_raw = [tok for tok in target_ipa.strip().split() if tok]
+        else:
+            tr_result = await self._kernel.textref.to_ipa(text, lang=lang)
+            ref_tokens_raw = tr_result.get("tokens", [])
+
+        ref_pre_res = await self._kernel.pre.normalize_tokens(
+            ref_tokens_raw,
+            inventory=runtime.inventory,
+            allophone_rules=runtime.allophone_rules,
+        )
+        return ref_pre_res.get("tokens", [])
+
 
 def _resolve_feedback_level(
     feedback_level: Optional[str],
@@ -378,7 +433,7 @@ async def _prepare_feedback_runtime_context(
 ) -> FeedbackRuntimeContext:
     roadmap_progress = await _load_roadmap_progress(kernel, user_id, lang)
     quality_res, quality_warnings, profile_meta = assess_audio_quality(
-        audio.get("path"),
+        audio,
         user_id=user_id,
     )
     profile = _profile_from_meta(profile_meta)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from ipa_core.ipa_catalog import CatalogIndex
+from ipa_core.services.catalog import CatalogService
+
+_CATALOG = """
+sounds:
+  - id: es/r
+    ipa: r
+    tags: [consonant]
+    contexts:
+      initial:
+        seeds: [{text: rosa}, {text: rata}]
+  - id: es/x
+    ipa: es/r
+"""
+
+_LEARNING = """
+sounds:
+  - id: es/r
+    ipa: r
+    drills:
+      - type: word_initial
+        targets: [rosa]
+"""
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+def test_index_parses_once_and_reparses_on_file_change(tmp_path) -> None:
+    path = tmp_path / "es.yaml"
+    path.write_text(_CATALOG, encoding="utf-8")
+    index = CatalogIndex(tmp_path, check_interval=0)
+
+    doc = index.document("es")
+    assert doc is not None
+    assert index.document("es") is doc and index.parses == 1
+    assert (doc.find_sound("r", "es/r") or {}).get("id") == "es/r"
+    assert (doc.find_sound("es/r") or {}).get("id") == "es/r"  # primer match: id antes que ipa
+    assert index.document("fr") is None
+    assert index.names() == ["es"]
+
+    path.write_text(_CATALOG.replace("rosa", "ropa"), encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert "ropa" in str(index.data("es")) and index.parses == 2
+
+
+@pytest.mark.unit
+@pytest.mark.functional
+def test_catalog_service_reuses_parsed_documents_without_mutating_them(tmp_path, monkeypatch) -> None:
+    (tmp_path / "es.yaml").write_text(_CATALOG, encoding="utf-8")
+    (tmp_path / "es_learning.yaml").write_text(_LEARNING, encoding="utf-8")
+    service = CatalogService(tmp_path)
+    monkeypatch.setattr(service, "is_tts_configured", lambda: True)
+
+    for _ in range(3):
+        sounds = service.get_sounds_for_language("es", category="consonant")
+        drills = service.get_drills("es", "r")
+    assert sounds is not None and drills is not None
+    assert sounds["sounds"][0]["audio_url"].endswith("sound_id=es/r")
+    assert drills["drills"][0]["targets_with_audio"][0]["text"] == "rosa"
+    assert service.get_all_languages_sounds()["languages"] == ["es"]
+
+    assert service._index.parses == 2
+    raw = service._index.data("es_learning")["sounds"][0]["drills"][0]
+    assert "targets_with_audio" not in raw
+    assert "audio_url" not in service._index.data("es")["sounds"][0]
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+def test_tts_availability_resolved_once_per_config(tmp_path, monkeypatch) -> None:
+    from ipa_core.services import catalog
+
+    config = tmp_path / "config.yaml"
+    config.write_text("tts:\n  name: none\n", encoding="utf-8")
+    monkeypatch.setenv("PRONUNCIAPA_CONFIG", str(config))
+    monkeypatch.setattr(catalog, "_tts_configured", None)
+    calls: list[int] = []
+
+    def resolve() -> bool:
+        calls.append(1)
+        return True
+
+    monkeypatch.setattr(catalog, "_resolve_tts_configured", resolve)
+    (tmp_path / "es.yaml").write_text(_CATALOG, encoding="utf-8")
+    service = CatalogService(tmp_path)
+
+    for _ in range(3):
+        service.get_all_languages_sounds()
+    assert service.is_tts_configured() and len(calls) == 1
+
+    config.write_text("tts:\n  name: piper\n", encoding="utf-8")
+    st = config.stat()
+    os.utime(config, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert service.is_tts_configured() and len(calls) == 2
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+from ipa_core.services import feedback as feedback_module
+from ipa_core.services.feedback import FeedbackGenerationAssets, generate_feedback
+
+_VALID = '{"summary": "Bien", "advice_short": "Vibra la r", "advice_long": "", "drills": []}'
+
+
+class ScriptedLLM:
+    """LLM falso que transmite por fragmentos una respuesta por llamada."""
+
+    def __init__(self, *responses: str) -> None:
+        self._responses = list(responses)
+
+    async def complete(self, prompt: str, *, params: Optional[dict[str, Any]] = None, on_token=None, **kw: Any) -> str:
+        text = self._responses.pop(0)
+        if on_token is not None:
+            for i in range(0, len(text), 5):
+                await on_token(text[i:i + 5])
+        return text
+
+
+@pytest.fixture
+def _assets(monkeypatch: pytest.MonkeyPatch) -> None:
+    assets = FeedbackGenerationAssets(
+        prompt="ERROR REPORT",
+        output_schema={"type": "object", "required": ["summary"]},
+        llm_params={},
+    )
+    monkeypatch.setattr(feedback_module, "_resolve_feedback_generation_assets", lambda *a, **k: assets)
+
+
+@pytest.mark.unit
+@pytest.mark.reliability
+@pytest.mark.usefixtures("_assets")
+@pytest.mark.parametrize(
+    ("responses", "expected"),
+    [
+        ((_VALID,), _VALID),
+        (("no es JSON", _VALID), "no es JSON<reset>" + _VALID),
+    ],
+)
+async def test_generate_feedback_streams_attempts_live_and_resets_discarded(
+    responses: tuple[str, ...], expected: str
+) -> None:
+    received: list[str] = []
+
+    async def on_token(chunk: str) -> None:
+        received.append(chunk)
+
+    async def on_reset() -> None:
+        received.append("<reset>")
+
+    payload = await generate_feedback(
+        {"lang": "es"},
+        llm=ScriptedLLM(*responses),
+        model_pack=object(),  # type: ignore[arg-type]
+        model_pack_dir=Path("."),
+        on_token=on_token,
+        on_reset=on_reset,
+    )
+
+    assert payload["advice_short"] == "Vibra la r"
+    assert "".join(received) == expected
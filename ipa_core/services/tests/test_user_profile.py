@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from ipa_core.audio.quality_gates import QualityGateResult
+from ipa_core.services.user_profile import UserProfileStore, adaptive_thresholds
+
+
+def _quality(rms: float = 0.01) -> QualityGateResult:
+    return QualityGateResult(passed=True, issues=[], snr_db=12.0, rms_amplitude=rms, duration_ms=1000)
+
+
+@pytest.mark.unit
+@pytest.mark.functional
+def test_store_imports_json_and_serves_hot_profiles_from_lru(tmp_path) -> None:
+    legacy = tmp_path / "user_profiles.json"
+    legacy.write_text(json.dumps({"ana": {"user_id": "ana", "samples": 4, "rms_ema": 0.008, "snr_ema": 10.0}}))
+    store = UserProfileStore(legacy, cache_size=2)
+    assert store.path.suffix == ".sqlite3"
+
+    ana = store.get("ana")
+    assert ana is not None and ana.samples == 4
+    assert store.get("ana") is ana  # LRU
+    assert adaptive_thresholds(ana)["min_rms"] == pytest.approx(0.004)
+
+    updated = store.update("ana", _quality())
+    assert updated.samples == 5 and store.get("ana") is updated
+    assert store.get("nadie") is None
+    store.close()
+
+    reopened = UserProfileStore(legacy)
+    profile = reopened.get("ana")
+    assert profile is not None and profile.samples == 5
+    assert set(reopened.load()) == {"ana"}
+    reopened.close()
+
+
+@pytest.mark.unit
+def test_concurrent_updates_from_several_stores_are_not_lost(tmp_path) -> None:
+    db = tmp_path / "profiles.sqlite3"
+    stores = [UserProfileStore(db) for _ in range(4)]
+
+    def _worker(store: UserProfileStore) -> None:
+        for _ in range(25):
+            store.update("u1", _quality())
+
+    threads = [threading.Thread(target=_worker, args=(s,)) for s in stores]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    profile = UserProfileStore(db, cache_size=0).get("u1")
+    assert profile is not None and profile.samples == 100
+    for store in stores:
+        store.close()
@@ -8,9 +8,17 @@ from typing import Any, Optional, cast
 
 from ipa_core.audio.files import cleanup_temp, ensure_wav, persist_bytes
 from ipa_core.audio.markers import mark_audio_preprocessed, strip_audio_markers
+from ipa_core.audio.pcm import (
+    audio_file,
+    decode_wav_pcm16,
+    is_canonical_pcm,
+    pcm_input,
+    without_pcm,
+)
 from ipa_core.audio.quality_gates import quality_gate_error_code
 from ipa_core.backends.audio_io import to_audio_input
 from ipa_core.errors import NotReadyError, ValidationError
+from ipa_core.kernel.executors import get_executor
 from ipa_core.ports.asr import ASRBackend
 from ipa_core.ports.preprocess import Preprocessor
 from ipa_core.ports.textref import TextRefProvider
@@ -141,13 +149,26 @@ class TranscriptionService:
         user_id: Optional[str] = None,
     ) -> TranscriptionPayload:
         """Transcribir archivo de audio de forma asíncrona."""
-        wav_path, tmp = ensure_wav(path)
+        wav_path, tmp = await get_executor("audio").run(ensure_wav, path)
         try:
-            return await self._run_pipeline(wav_path, lang=lang, user_id=user_id)
+            return await self._run_pipeline(to_audio_input(wav_path), lang=lang, user_id=user_id)
         finally:
             if tmp:
                 cleanup_temp(wav_path)
 
+    async def transcribe_audio(
+        self,
+        audio: AudioInput,
+        *,
+        lang: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> TranscriptionPayload:
+        """Transcribir un ``AudioInput``; el PCM 16 kHz mono en memoria no pasa por disco."""
+        if is_canonical_pcm(audio):
+            return await self._run_pipeline(audio, lang=lang, user_id=user_id)
+        with audio_file(audio) as path:
+            return await self.transcribe_file(path, lang=lang, user_id=user_id)
+
     async def transcribe_bytes(
         self,
         data: bytes,
@@ -158,6 +179,9 @@ class TranscriptionService:
     ) -> TranscriptionPayload:
         """Transcribir bytes de audio de forma asíncrona."""
         suffix = Path(filename).suffix or ".wav"
+        samples = decode_wav_pcm16(data) if suffix.lower() == ".wav" else None
+        if samples is not None:
+            return await self.transcribe_audio(pcm_input(samples), lang=lang, user_id=user_id)
         tmp_original = persist_bytes(data, suffix=suffix)
         try:
             return await self.transcribe_file(tmp_original, lang=lang, user_id=user_id)
@@ -166,17 +190,16 @@ class TranscriptionService:
 
     async def _run_pipeline(
         self,
-        wav_path: str,
+        audio: AudioInput,
         *,
         lang: Optional[str],
         user_id: Optional[str],
     ) -> TranscriptionPayload:
         effective_lang = _effective_lang(lang, self._default_lang)
         quality_res, quality_warnings, profile_meta = assess_audio_quality(
-            wav_path,
+            audio,
             user_id=user_id,
         )
-        audio = to_audio_input(wav_path)
         audio = cast(AudioInput, mark_audio_preprocessed(audio))
         pre_audio_res = await self.pre.process_audio(audio)
         try:
@@ -217,7 +240,7 @@ class TranscriptionService:
                 norm_meta=norm_res.get("meta", {}),
                 backend_name=backend_name,
             )
-            payload_audio = cast(AudioInput, strip_audio_markers(audio))
+            payload_audio = cast(AudioInput, without_pcm(strip_audio_markers(audio)))
             return TranscriptionPayload(
                 tokens=tokens,
                 ipa=" ".join(tokens),
@@ -1,7 +1,22 @@
-"""User profile store for adaptive audio quality."""
+"""User profile store for adaptive audio quality.
+
+Los perfiles viven en una tabla SQLite (WAL) con una fila por usuario:
+``get`` y ``update`` leen/escriben sólo ese usuario, y ``update`` hace el
+leer-modificar-escribir dentro de una transacción ``BEGIN IMMEDIATE``, así
+varios workers pueden actualizar el mismo archivo sin perder muestras.
+Un LRU en memoria sirve los perfiles calientes; ``get`` puede ir por detrás
+de escrituras hechas por otros procesos hasta que el perfil sale del LRU o
+se actualiza en este proceso.
+
+El antiguo ``user_profiles.json`` se importa una vez al crear la base.
+"""
 from __future__ import annotations
 
 import json
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -10,9 +25,36 @@ from typing import Optional, Dict, Any, Union
 from ipa_core.audio.quality_gates import QualityGateResult, DEFAULT_MIN_RMS, DEFAULT_MIN_SNR_DB
 
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_PROFILE_PATH = Path("outputs") / "user_profiles.json"
+DEFAULT_CACHE_SIZE = 1024
 _EMA_ALPHA = 0.2
 
+_CREATE_PROFILES = """
+CREATE TABLE IF NOT EXISTS user_audio_profiles (
+    user_id       TEXT PRIMARY KEY,
+    samples       INTEGER NOT NULL DEFAULT 0,
+    rms_ema       REAL,
+    snr_ema       REAL,
+    clipping_ema  REAL,
+    last_seen     TEXT
+);
+"""
+
+_UPSERT_PROFILE = """
+INSERT INTO user_audio_profiles (user_id, samples, rms_ema, snr_ema, clipping_ema, last_seen)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(user_id) DO UPDATE SET
+    samples = excluded.samples,
+    rms_ema = excluded.rms_ema,
+    snr_ema = excluded.snr_ema,
+    clipping_ema = excluded.clipping_ema,
+    last_seen = excluded.last_seen
+"""
+
+_COLUMNS = "user_id, samples, rms_ema, snr_ema, clipping_ema, last_seen"
+
 
 def _ema(prev: Optional[float], value: Optional[float]) -> Optional[float]:
     if value is None:
@@ -52,40 +94,136 @@ class UserAudioProfile:
             last_seen=data.get("last_seen"),
         )
 
+    def _row(self) -> tuple[Any, ...]:
+        return (self.user_id, self.samples, self.rms_ema, self.snr_ema, self.clipping_ema, self.last_seen)
 
-class UserProfileStore:
-    """Persist user audio profiles to a JSON file."""
 
-    def __init__(self, path: Optional[Union[Path, str]] = None) -> None:
-        self._path = Path(path) if path else DEFAULT_PROFILE_PATH
+class UserProfileStore:
+    """Persist user audio profiles to a SQLite table keyed by user.
+
+    ``path`` es el archivo SQLite; si termina en ``.json`` (ruta del
+    formato anterior) la base se crea junto a él como ``.sqlite3`` y el
+    JSON se importa la primera vez.
+    """
+
+    def __init__(self, path: Optional[Union[Path, str]] = None, *, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        path = Path(path) if path else DEFAULT_PROFILE_PATH
+        self._legacy_json = path if path.suffix == ".json" else None
+        self._path = path.with_suffix(".sqlite3") if self._legacy_json else path
+        self._cache_size = max(0, cache_size)
+        self._cache: "OrderedDict[str, UserAudioProfile]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            is_new = not self._path.exists()
+            conn = sqlite3.connect(str(self._path), timeout=5.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_CREATE_PROFILES)
+            self._conn = conn
+            if is_new and self._legacy_json is not None and self._legacy_json.exists():
+                self._import_json(self._legacy_json)
+        return self._conn
+
+    def _import_json(self, path: Path) -> None:
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("No se pudo importar %s: %s", path, exc)
+            return
+        if isinstance(raw, dict):
+            self._save_rows(
+                UserAudioProfile.from_dict(payload) for payload in raw.values() if isinstance(payload, dict)
+            )
+
+    def _save_rows(self, profiles: Any) -> None:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(_UPSERT_PROFILE, [p._row() for p in profiles])
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _remember(self, profile: UserAudioProfile) -> None:
+        if not self._cache_size:
+            return
+        self._cache[profile.user_id] = profile
+        self._cache.move_to_end(profile.user_id)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _select(self, conn: sqlite3.Connection, user_id: str) -> Optional[UserAudioProfile]:
+        row = conn.execute(
+            f"SELECT {_COLUMNS} FROM user_audio_profiles WHERE user_id=?", (user_id,)
+        ).fetchone()
+        return UserAudioProfile(*row) if row else None
 
     def load(self) -> Dict[str, UserAudioProfile]:
-        if not self._path.exists():
-            return {}
-        raw = json.loads(self._path.read_text(encoding="utf-8"))
-        profiles: Dict[str, UserAudioProfile] = {}
-        if isinstance(raw, dict):
-            for user_id, payload in raw.items():
-                if isinstance(payload, dict):
-                    profiles[user_id] = UserAudioProfile.from_dict(payload)
-        return profiles
+        """Todos los perfiles (recorre la tabla completa)."""
+        with self._lock:
+            rows = self._connect().execute(f"SELECT {_COLUMNS} FROM user_audio_profiles").fetchall()
+        return {row[0]: UserAudioProfile(*row) for row in rows}
 
     def save(self, profiles: Dict[str, UserAudioProfile]) -> None:
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {uid: profile.to_dict() for uid, profile in profiles.items()}
-        self._path.write_text(json.dumps(payload, ensure_ascii=True, indent=2), encoding="utf-8")
+        with self._lock:
+            self._save_rows(profiles.values())
+            for profile in profiles.values():
+                self._cache.pop(profile.user_id, None)
 
     def get(self, user_id: str) -> Optional[UserAudioProfile]:
-        profiles = self.load()
-        return profiles.get(user_id)
+        with self._lock:
+            profile = self._cache.get(user_id)
+            if profile is not None:
+                self._cache.move_to_end(user_id)
+                return profile
+            profile = self._select(self._connect(), user_id)
+            if profile is not None:
+                self._remember(profile)
+            return profile
 
     def update(self, user_id: str, quality: QualityGateResult) -> UserAudioProfile:
-        profiles = self.load()
-        profile = profiles.get(user_id) or UserAudioProfile(user_id=user_id)
-        profile.update(quality)
-        profiles[user_id] = profile
-        self.save(profiles)
-        return profile
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                profile = self._select(conn, user_id) or UserAudioProfile(user_id=user_id)
+                profile.update(quality)
+                conn.execute(_UPSERT_PROFILE, profile._row())
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            self._remember(profile)
+            return profile
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_default_store: Optional[UserProfileStore] = None
+_default_lock = threading.Lock()
+
+
+def get_user_profile_store() -> UserProfileStore:
+    """Store compartido del proceso (conexión y LRU reutilizados)."""
+    global _default_store
+    if _default_store is None:
+        with _default_lock:
+            if _default_store is None:
+                _default_store = UserProfileStore()
+    return _default_store
 
 
 def adaptive_thresholds(profile: Optional[UserAudioProfile]) -> dict[str, float]:
@@ -109,5 +247,6 @@ __all__ = [
     "UserAudioProfile",
     "UserProfileStore",
     "adaptive_thresholds",
+    "get_user_profile_store",
     "DEFAULT_PROFILE_PATH",
 ]
@@ -8,22 +8,59 @@ Mejoras respecto a la implementación anterior:
 - Thread-safe (``cachetools`` usa bloqueos internos correctos).
 - Manejo de TTL delegado a ``cachetools.TTLCache``.
 - ~300 líneas menos de código manual.
+
+Segundo nivel persistente
+-------------------------
+:class:`PersistentTextRefStore` guarda los resultados en un SQLite local
+(modo WAL) compartido por todos los workers del servidor, de modo que un
+reinicio no vuelve a lanzar eSpeak para las mismas frases de lección.
+``TextRefCache`` lo consulta tras un fallo en memoria (*read-through*) y
+le entrega las escrituras en lotes (*write-behind*).  La clave combina
+proveedor, versión del proveedor, voz, idioma y texto normalizado.
+
+Las llamadas a SQLite son bloqueantes: los caminos async
+(:meth:`TextRefCache.get_async`, :meth:`TextRefCache.set_async` y
+``get_or_compute``) las ejecutan en el pool ``g2p``
+(:mod:`ipa_core.kernel.executors`) y sólo el nivel en memoria se toca
+desde el event loop.
+
+Variables de entorno
+--------------------
+``PRONUNCIAPA_TEXTREF_CACHE_DB``
+    Ruta del SQLite del cache global (default:
+    ``~/.cache/pronunciapa/textref.sqlite3``).  Una cadena vacía lo
+    desactiva (sólo queda el nivel en memoria).
 """
 from __future__ import annotations
 
+import atexit
 import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
 import time
+import unicodedata
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
 
 from cachetools import LRUCache, TTLCache
 
+from ipa_core.kernel.executors import get_executor
 from ipa_core.types import TextRefResult
 
+logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
 
+def normalize_cache_text(text: str) -> str:
+    """Forma canónica del texto para la clave (NFC y espacios colapsados)."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
 @dataclass
 class CacheStats:
     """Estadísticas del cache.
@@ -63,11 +100,217 @@ class CacheStats:
         }
 
 
+_CREATE_ENTRIES = """
+CREATE TABLE IF NOT EXISTS textref_entries (
+    key        TEXT PRIMARY KEY,
+    provider   TEXT NOT NULL,
+    lang       TEXT NOT NULL,
+    result     TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_textref_last_used ON textref_entries (last_used);
+"""
+
+
+@dataclass
+class DiskCacheStats(CacheStats):
+    """Estadísticas del nivel persistente.
+
+    ``hits``/``misses`` sólo cuentan consultas que fallaron en memoria.
+    """
+    writes: int = 0
+    evictions: int = 0
+    pending: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        data.update(writes=self.writes, evictions=self.evictions, pending=self.pending)
+        return data
+
+
+class PersistentTextRefStore:
+    """Nivel persistente del cache TextRef sobre SQLite (WAL).
+
+    Varios procesos pueden abrir el mismo archivo: WAL permite lecturas
+    concurrentes con un escritor y ``busy_timeout`` serializa los lotes.
+
+    Parámetros
+    ----------
+    db_path : str | Path
+        Ruta al archivo SQLite (se crea si no existe).
+    max_entries : int
+        Tope de filas; al superarlo se eliminan las de uso más antiguo.
+    flush_interval : float
+        Segundos máximos que una escritura espera en memoria.
+    batch_size : int
+        Escrituras pendientes que disparan un volcado inmediato.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        max_entries: int = 50_000,
+        flush_interval: float = 1.0,
+        batch_size: int = 64,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self._max_entries = max_entries
+        self._flush_interval = flush_interval
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending: Dict[str, tuple[str, str, str]] = {}
+        self._touched: set[str] = set()
+        self._timer: Optional[threading.Timer] = None
+        self._stats = DiskCacheStats(max_size=max_entries)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: Optional[sqlite3.Connection] = sqlite3.connect(
+            str(self.db_path), timeout=5.0, check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_CREATE_ENTRIES)
+
+    def get(self, key: str) -> Optional[TextRefResult]:
+        """Leer una entrada (incluye escrituras aún no volcadas)."""
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                payload: Optional[str] = pending[2]
+            elif self._conn is None:
+                payload = None
+            else:
+                row = self._conn.execute(
+                    "SELECT result FROM textref_entries WHERE key = ?", (key,),
+                ).fetchone()
+                payload = row[0] if row else None
+            if payload is None:
+                self._stats.misses += 1
+                return None
+            self._stats.hits += 1
+            self._touched.add(key)
+        return json.loads(payload)
+
+    def put(self, key: str, provider: str, lang: str, result: TextRefResult) -> None:
+        """Encolar una escritura (write-behind)."""
+        payload = json.dumps(result, ensure_ascii=False)
+        with self._lock:
+            self._pending[key] = (provider, lang, payload)
+            flush_now = len(self._pending) >= self._batch_size
+            if not flush_now:
+                self._schedule_flush()
+        if flush_now:
+            self.flush()
+
+    def _schedule_flush(self) -> None:
+        if self._timer is None and self._conn is not None:
+            self._timer = threading.Timer(self._flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> int:
+        """Volcar escrituras pendientes y aplicar el tope de tamaño."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._conn is None or not (self._pending or self._touched):
+                return 0
+            now = time.time()
+            rows = [
+                (key, provider, lang, payload, now, now)
+                for key, (provider, lang, payload) in self._pending.items()
+            ]
+            touched = [(now, key) for key in self._touched.difference(self._pending)]
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO textref_entries "
+                        "(key, provider, lang, result, created_at, last_used) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    self._conn.executemany(
+                        "UPDATE textref_entries SET last_used = ? WHERE key = ?", touched,
+                    )
+                    self._stats.evictions += self._evict_overflow()
+            except sqlite3.Error as exc:
+                logger.warning("No se pudo volcar el cache TextRef a %s: %s", self.db_path, exc)
+                return 0
+            self._pending.clear()
+            self._touched.clear()
+            self._stats.writes += len(rows)
+            return len(rows)
+
+    def _evict_overflow(self) -> int:
+        assert self._conn is not None
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM textref_entries").fetchone()
+        overflow = count - self._max_entries
+        if overflow <= 0:
+            return 0
+        self._conn.execute(
+            "DELETE FROM textref_entries WHERE key IN ("
+            "SELECT key FROM textref_entries ORDER BY last_used LIMIT ?)",
+            (overflow,),
+        )
+        return overflow
+
+    def invalidate(self, key: str) -> bool:
+        """Eliminar una entrada (pendiente o persistida)."""
+        with self._lock:
+            existed = self._pending.pop(key, None) is not None
+            self._touched.discard(key)
+            if self._conn is not None:
+                with self._conn:
+                    cursor = self._conn.execute(
+                        "DELETE FROM textref_entries WHERE key = ?", (key,),
+                    )
+                existed = existed or cursor.rowcount > 0
+            return existed
+
+    def clear(self) -> int:
+        """Vaciar el nivel persistente."""
+        with self._lock:
+            self._pending.clear()
+            self._touched.clear()
+            if self._conn is None:
+                return 0
+            with self._conn:
+                cursor = self._conn.execute("DELETE FROM textref_entries")
+            return cursor.rowcount
+
+    def __len__(self) -> int:
+        """Filas persistidas (sin contar escrituras pendientes)."""
+        with self._lock:
+            if self._conn is None:
+                return 0
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM textref_entries").fetchone()
+            return count
+
+    def get_stats(self) -> DiskCacheStats:
+        """Estadísticas del nivel persistente."""
+        size = len(self)
+        with self._lock:
+            self._stats.size = size
+            self._stats.pending = len(self._pending)
+            return self._stats
+
+    def close(self) -> None:
+        """Volcar lo pendiente y cerrar la conexión."""
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
 class TextRefCache:
     """Cache LRU (con TTL opcional) para resultados de TextRef.
 
     Internamente delega a ``cachetools.TTLCache`` o ``cachetools.LRUCache``
-    según si se proporciona *ttl_seconds*.
+    según si se proporciona *ttl_seconds*.  Con *store* añade un segundo
+    nivel persistente compartido entre procesos.
 
     Parámetros
     ----------
@@ -76,12 +319,15 @@ class TextRefCache:
     ttl_seconds : float | None
         Tiempo de vida de las entradas en segundos.
         Si es None, las entradas no expiran (LRU puro).
+    store : PersistentTextRefStore | None
+        Nivel en disco consultado tras un fallo en memoria.
     """
 
     def __init__(
         self,
         max_size: int = 1000,
         ttl_seconds: Optional[float] = None,
+        store: Optional[PersistentTextRefStore] = None,
     ) -> None:
         self._max_size = max_size
         self._ttl = ttl_seconds
@@ -92,14 +338,21 @@ class TextRefCache:
         else:
             self._cache = LRUCache(maxsize=max_size)
         self._stats = CacheStats(max_size=max_size)
+        self._store = store
+
+    @property
+    def store(self) -> Optional[PersistentTextRefStore]:
+        """Nivel persistente (si lo hay)."""
+        return self._store
 
     @staticmethod
-    def _make_key(text: str, lang: str, provider: str) -> str:
+    def _make_key(text: str, lang: str, provider: str, variant: str = "") -> str:
         """Generar clave única para una entrada.
 
-        Usa SHA256 truncado para mantener claves cortas.
+        ``variant`` identifica versión y voz del proveedor.  Usa SHA256
+        truncado para mantener claves cortas.
         """
-        raw = f"{provider}:{lang}:{text}"
+        raw = "\x1f".join((provider, variant, lang, normalize_cache_text(text)))
         return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
 
     def get(
@@ -107,6 +360,8 @@ class TextRefCache:
         text: str,
         lang: str,
         provider: str,
+        *,
+        variant: str = "",
     ) -> Optional[TextRefResult]:
         """Obtener resultado del cache si existe.
 
@@ -118,18 +373,47 @@ class TextRefCache:
             Código de idioma.
         provider : str
             Nombre del provider.
+        variant : str
+            Versión/voz del provider (parte de la clave).
 
         Retorna
         -------
         TextRefResult | None
             Resultado cacheado o None si no existe/expiró.
         """
-        key = self._make_key(text, lang, provider)
+        key = self._make_key(text, lang, provider, variant)
+        result = self._memory_get(key)
+        if result is not None or self._store is None:
+            return result
+        result = self._store.get(key)
+        if result is not None:
+            self._cache[key] = result
+        return result
+
+    async def get_async(
+        self,
+        text: str,
+        lang: str,
+        provider: str,
+        *,
+        variant: str = "",
+    ) -> Optional[TextRefResult]:
+        """Como :meth:`get`, pero el nivel SQLite se consulta en el pool ``g2p``."""
+        key = self._make_key(text, lang, provider, variant)
+        result = self._memory_get(key)
+        if result is not None or self._store is None:
+            return result
+        result = await get_executor("g2p").run(self._store.get, key)
+        if result is not None:
+            self._cache[key] = result
+        return result
+
+    def _memory_get(self, key: str) -> Optional[TextRefResult]:
         result = self._cache.get(key)
-        if result is None:
+        if result is not None:
+            self._stats.hits += 1
+        else:
             self._stats.misses += 1
-            return None
-        self._stats.hits += 1
         return result
 
     def set(
@@ -138,6 +422,8 @@ class TextRefCache:
         lang: str,
         provider: str,
         result: TextRefResult,
+        *,
+        variant: str = "",
     ) -> None:
         """Almacenar resultado en el cache.
 
@@ -151,9 +437,28 @@ class TextRefCache:
             Nombre del provider.
         result : TextRefResult
             Resultado a cachear.
+        variant : str
+            Versión/voz del provider (parte de la clave).
         """
-        key = self._make_key(text, lang, provider)
+        key = self._make_key(text, lang, provider, variant)
+        self._cache[key] = result
+        if self._store is not None:
+            self._store.put(key, provider, lang, result)
+
+    async def set_async(
+        self,
+        text: str,
+        lang: str,
+        provider: str,
+        result: TextRefResult,
+        *,
+        variant: str = "",
+    ) -> None:
+        """Como :meth:`set`; la escritura (y un posible volcado) corre en el pool ``g2p``."""
+        key = self._make_key(text, lang, provider, variant)
         self._cache[key] = result
+        if self._store is not None:
+            await get_executor("g2p").run(self._store.put, key, provider, lang, result)
 
     async def get_or_compute(
         self,
@@ -161,6 +466,8 @@ class TextRefCache:
         lang: str,
         provider: str,
         compute_fn: Callable[[], Awaitable[TextRefResult]],
+        *,
+        variant: str = "",
     ) -> TextRefResult:
         """Obtener del cache o computar y cachear.
 
@@ -174,18 +481,20 @@ class TextRefCache:
             Nombre del provider.
         compute_fn : Callable
             Función async que computa el resultado si no está en cache.
+        variant : str
+            Versión/voz del provider (parte de la clave).
 
         Retorna
         -------
         TextRefResult
             Resultado (del cache o recién computado).
         """
-        cached = self.get(text, lang, provider)
+        cached = await self.get_async(text, lang, provider, variant=variant)
         if cached is not None:
             return cached
 
         result = await compute_fn()
-        self.set(text, lang, provider, result)
+        await self.set_async(text, lang, provider, result, variant=variant)
         return result
 
     def invalidate(
@@ -193,23 +502,24 @@ class TextRefCache:
         text: str,
         lang: str,
         provider: str,
+        *,
+        variant: str = "",
     ) -> bool:
-        """Invalidar una entrada específica.
+        """Invalidar una entrada específica (en ambos niveles).
 
         Retorna
         -------
         bool
             True si la entrada existía y fue eliminada.
         """
-        key = self._make_key(text, lang, provider)
-        try:
-            del self._cache[key]
-            return True
-        except KeyError:
-            return False
+        key = self._make_key(text, lang, provider, variant)
+        existed = self._cache.pop(key, None) is not None
+        if self._store is not None:
+            existed = self._store.invalidate(key) or existed
+        return existed
 
     def clear(self) -> int:
-        """Limpiar todo el cache.
+        """Limpiar el nivel en memoria (el persistente se conserva).
 
         Retorna
         -------
@@ -220,24 +530,60 @@ class TextRefCache:
         self._cache.clear()
         return count
 
+    def flush(self) -> int:
+        """Volcar al disco las escrituras pendientes del nivel persistente."""
+        return self._store.flush() if self._store is not None else 0
+
     def get_stats(self) -> CacheStats:
-        """Obtener estadísticas del cache."""
+        """Obtener estadísticas del nivel en memoria."""
         self._stats.size = len(self._cache)
         return self._stats
 
+    def tier_stats(self) -> Dict[str, Any]:
+        """Estadísticas por nivel (``memory`` y ``disk``)."""
+        return {
+            "memory": self.get_stats().to_dict(),
+            "disk": self._store.get_stats().to_dict() if self._store is not None else None,
+        }
+
     def __len__(self) -> int:
         """Número de entradas en el cache."""
         return len(self._cache)
 
-    def __contains__(self, key: tuple[str, str, str]) -> bool:
-        """Verificar si una entrada existe."""
-        text, lang, provider = key
-        cache_key = self._make_key(text, lang, provider)
+    def __contains__(self, key: tuple[str, ...]) -> bool:
+        """Verificar si una entrada existe en memoria.
+
+        ``key`` es ``(text, lang, provider)`` o ``(text, lang, provider, variant)``.
+        """
+        text, lang, provider, *rest = key
+        cache_key = self._make_key(text, lang, provider, rest[0] if rest else "")
         return cache_key in self._cache
 
 
+def default_store_path() -> Optional[Path]:
+    """Ruta del SQLite del cache global, o None si está desactivado."""
+    configured = os.environ.get("PRONUNCIAPA_TEXTREF_CACHE_DB")
+    if configured is not None:
+        return Path(configured).expanduser() if configured.strip() else None
+    return Path.home() / ".cache" / "pronunciapa" / "textref.sqlite3"
+
+
+def _open_default_store() -> Optional[PersistentTextRefStore]:
+    path = default_store_path()
+    if path is None:
+        return None
+    try:
+        store = PersistentTextRefStore(path)
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("Cache TextRef persistente no disponible (%s): %s", path, exc)
+        return None
+    atexit.register(store.close)
+    return store
+
+
 # Instancia global del cache (singleton)
 _global_cache: Optional[TextRefCache] = None
+_global_lock = threading.Lock()
 
 
 def get_global_cache(
@@ -256,23 +602,44 @@ def get_global_cache(
     Retorna
     -------
     TextRefCache
-        Instancia global del cache.
+        Instancia global del cache, con el nivel SQLite de
+        :func:`default_store_path` si está habilitado.
     """
     global _global_cache
     if _global_cache is None:
-        _global_cache = TextRefCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        with _global_lock:
+            if _global_cache is None:
+                _global_cache = TextRefCache(
+                    max_size=max_size,
+                    ttl_seconds=ttl_seconds,
+                    store=_open_default_store(),
+                )
     return _global_cache
 
 
+def global_cache_stats() -> Optional[Dict[str, Any]]:
+    """Estadísticas por nivel del cache global, o None si aún no existe."""
+    cache = _global_cache
+    return cache.tier_stats() if cache is not None else None
+
+
 def reset_global_cache() -> None:
     """Resetear el cache global (útil para tests)."""
     global _global_cache
-    _global_cache = None
+    with _global_lock:
+        if _global_cache is not None and _global_cache.store is not None:
+            _global_cache.store.close()
+        _global_cache = None
 
 
 __all__ = [
     "CacheStats",
+    "DiskCacheStats",
+    "PersistentTextRefStore",
     "TextRefCache",
+    "default_store_path",
     "get_global_cache",
+    "global_cache_stats",
+    "normalize_cache_text",
     "reset_global_cache",
 ]
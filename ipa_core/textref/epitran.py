@@ -5,6 +5,7 @@ from functools import lru_cache
 from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
 
 from ipa_core.errors import NotReadyError
+from ipa_core.kernel.executors import get_executor
 from ipa_core.plugins.base import BasePlugin
 from ipa_core.textref.tokenize import tokenize_ipa
 from ipa_core.types import TextRefResult
@@ -22,6 +23,15 @@ except Exception:  # pragma: no cover
 LangFactory = Callable[[str], object]
 
 
+@lru_cache(maxsize=1)
+def _epitran_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("epitran")
+    except Exception:
+        return "unknown"
+
+
 class EpitranTextRef(BasePlugin):
     """Convierte texto a IPA usando modelos de Epitran."""
 
@@ -65,11 +75,12 @@ class EpitranTextRef(BasePlugin):
         
         resolved_lang = lang or self._default_lang
         
-        # Usar cache si está disponible
+        # Usar cache si está disponible (la clave incluye versión y código)
         if self._cache is not None:
             return await self._cache.get_or_compute(
                 cleaned, resolved_lang, "epitran",
-                lambda: self._compute_ipa(cleaned, resolved_lang)
+                lambda: self._compute_ipa(cleaned, resolved_lang),
+                variant=f"{_epitran_version()}|{self._resolve_code(resolved_lang)}",
             )
         
         return await self._compute_ipa(cleaned, resolved_lang)
@@ -77,14 +88,17 @@ class EpitranTextRef(BasePlugin):
     async def _compute_ipa(self, text: str, lang: str) -> TextRefResult:
         """Ejecutar Epitran para obtener transcripción IPA."""
         code = self._resolve_code(lang)
-        model = self._get_model(code)
-        tokens = self._transliterate(model, text)
+        # Carga del modelo y transliteración bloquean: pool ``g2p``.
+        tokens = await get_executor("g2p").run(self._transliterate_with, code, text)
         if isinstance(tokens, str):
             clean_tokens = tokenize_ipa(tokens)
         else:
             clean_tokens = [token for token in tokens if token.strip()]
         return {"tokens": clean_tokens, "meta": {"method": "epitran", "code": code}}
 
+    def _transliterate_with(self, code: str, text: str) -> list[str] | str:
+        return self._transliterate(self._get_model(code), text)
+
     @staticmethod
     def _transliterate(model: Any, text: str) -> list[str] | str:
         if hasattr(model, "trans_list"):
@@ -1,19 +1,28 @@
-"""TextRef provider basado en la CLI de eSpeak/eSpeak-NG."""
+"""TextRef provider basado en la CLI de eSpeak/eSpeak-NG.
+
+Por defecto reutiliza procesos eSpeak de larga vida por voz
+(:mod:`ipa_core.textref.espeak_pool`); si el pool falla, cae a un proceso
+por texto.
+"""
 from __future__ import annotations
 
 import asyncio
+import logging
 import os
 import shutil
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING
 
 from ipa_core.errors import NotReadyError, ValidationError
 from ipa_core.plugins.base import BasePlugin
+from ipa_core.textref.espeak_pool import EspeakProcessPool, EspeakWorkerError
 from ipa_core.textref.tokenize import tokenize_ipa
 from ipa_core.types import TextRefResult
 
 if TYPE_CHECKING:
     from ipa_core.textref.cache import TextRefCache
 
+logger = logging.getLogger(__name__)
+
 
 class EspeakTextRef(BasePlugin):
     """Convierte texto a IPA usando el binario `espeak`/`espeak-ng`. """
@@ -31,11 +40,20 @@ class EspeakTextRef(BasePlugin):
         default_lang: str = "es",
         binary: Optional[str] = None,
         cache: Optional["TextRefCache"] = None,
+        workers_per_voice: int = 2,
+        worker_timeout: float = 10.0,
     ) -> None:
+        """``workers_per_voice=0`` desactiva el pool (un proceso por texto)."""
         self._default_lang = default_lang
         self._binary = binary or os.getenv("PRONUNCIAPA_ESPEAK_BIN") or self._detect_binary()
         self._cache = cache
         self._voice_map = self._build_voice_map()
+        self._version: Optional[str] = None
+        self._pool: Optional[EspeakProcessPool] = None
+        if workers_per_voice > 0:
+            self._pool = EspeakProcessPool(
+                self._binary, workers_per_voice=workers_per_voice, timeout=worker_timeout,
+            )
 
     def _build_voice_map(self) -> dict[str, str]:
         """Build language->voice map with optional environment overrides.
@@ -78,6 +96,37 @@ class EspeakTextRef(BasePlugin):
             "No se encontró 'espeak' ni 'espeak-ng'. Instálalo o exporta PRONUNCIAPA_ESPEAK_BIN."
         )
 
+    async def setup(self) -> None:
+        await self._espeak_version()
+
+    async def _espeak_version(self) -> str:
+        """Primera línea de ``--version`` (p. ej. ``eSpeak NG text-to-speech: 1.51``).
+
+        Se consulta una sola vez con un subproceso asíncrono: no bloquea el
+        event loop aunque ``setup()`` no se haya llamado.
+        """
+        if self._version is None:
+            self._version = await self._read_version()
+        return self._version
+
+    async def _read_version(self) -> str:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                self._binary, "--version",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except OSError:
+            return "unknown"
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=5)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return "unknown"
+        lines = stdout.decode("utf-8", errors="replace").strip().splitlines()
+        return lines[0].strip() if lines else "unknown"
+
     def _resolve_voice(self, lang: str) -> str:
         lang = (lang or self._default_lang or "").strip().lower()
         if lang in self._voice_map:
@@ -92,26 +141,65 @@ class EspeakTextRef(BasePlugin):
 
         return lang or self._default_lang
 
+    async def teardown(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+
     async def to_ipa(self, text: str, *, lang: Optional[str] = None, **kw: Any) -> TextRefResult:  # noqa: D401
         """Convertir texto a IPA usando el binario externo de forma asíncrona."""
-        cleaned = text.strip()
-        if not cleaned:
-            return {"tokens": [], "meta": {"empty": True}}
-        
+        return (await self.to_ipa_many([text], lang=lang, **kw))[0]
+
+    async def to_ipa_many(
+        self, texts: Sequence[str], *, lang: Optional[str] = None, **kw: Any
+    ) -> List[TextRefResult]:
+        """Convertir varios textos en un solo round-trip con el worker eSpeak.
+
+        Los resultados conservan el orden de ``texts``; los que ya están en
+        cache no llegan a eSpeak.
+        """
         resolved_lang = lang or self._default_lang
-        
-        # Usar cache si está disponible
-        if self._cache is not None:
-            return await self._cache.get_or_compute(
-                cleaned, resolved_lang, "espeak",
-                lambda: self._compute_ipa(cleaned, resolved_lang)
-            )
-        
-        return await self._compute_ipa(cleaned, resolved_lang)
-    
-    async def _compute_ipa(self, text: str, lang: str) -> TextRefResult:
-        """Ejecutar espeak para obtener transcripción IPA."""
-        voice = self._resolve_voice(lang)
+        voice = self._resolve_voice(resolved_lang)
+        variant = f"{await self._espeak_version()}|{voice}" if self._cache is not None else ""
+
+        results: List[Optional[TextRefResult]] = [None] * len(texts)
+        missing: Dict[str, List[int]] = {}
+        for idx, text in enumerate(texts):
+            cleaned = text.strip()
+            if not cleaned:
+                results[idx] = {"tokens": [], "meta": {"empty": True}}
+                continue
+            # Usar cache si está disponible (la clave incluye versión y voz)
+            if self._cache is not None:
+                cached = await self._cache.get_async(cleaned, resolved_lang, "espeak", variant=variant)
+                if cached is not None:
+                    results[idx] = cached
+                    continue
+            missing.setdefault(cleaned, []).append(idx)
+
+        if missing:
+            pending = list(missing)
+            outputs = await self._run_espeak(pending, voice)
+            for cleaned, output in zip(pending, outputs):
+                result: TextRefResult = {
+                    "tokens": tokenize_ipa(output),
+                    "meta": {"method": "espeak", "voice": voice},
+                }
+                if self._cache is not None:
+                    await self._cache.set_async(cleaned, resolved_lang, "espeak", result, variant=variant)
+                for idx in missing[cleaned]:
+                    results[idx] = result
+        return results  # type: ignore[return-value]
+
+    async def _run_espeak(self, texts: List[str], voice: str) -> List[str]:
+        """Salida IPA cruda por texto: pool persistente o un proceso por texto."""
+        if self._pool is not None:
+            try:
+                return await self._pool.transcribe_many(texts, voice=voice)
+            except EspeakWorkerError as exc:
+                logger.warning("Pool eSpeak no disponible, usando un proceso por texto: %s", exc)
+        return [await self._run_oneshot(text, voice) for text in texts]
+
+    async def _run_oneshot(self, text: str, voice: str) -> str:
         cmd = [self._binary, "-q", "-v", voice, "--ipa=3", text]
         
         try:
@@ -127,7 +215,7 @@ class EspeakTextRef(BasePlugin):
                 stderr_text = stderr.decode("utf-8", errors="replace")
                 raise ValidationError(f"eSpeak falló con código {proc.returncode}: {stderr_text}")
                 
-            output = stdout.decode("utf-8", errors="replace").strip()
+            return stdout.decode("utf-8", errors="replace").strip()
             
         except FileNotFoundError as exc:  # pragma: no cover
             raise NotReadyError(f"No se pudo ejecutar {self._binary}") from exc
@@ -135,9 +223,6 @@ class EspeakTextRef(BasePlugin):
             if isinstance(exc, (ValidationError, NotReadyError)):
                 raise
             raise ValidationError(f"Error al ejecutar eSpeak: {exc}") from exc
-            
-        tokens = tokenize_ipa(output)
-        return {"tokens": tokens, "meta": {"method": "espeak", "voice": voice}} 
 
 
 __all__ = ["EspeakTextRef"]
@@ -0,0 +1,226 @@
+"""Pool de procesos eSpeak persistentes.
+
+Lanzar ``espeak-ng -q -v <voz> --ipa=3 <texto>`` por cada texto paga
+fork/exec y la carga de la voz en cada llamada.  Sin texto en la línea de
+comandos, eSpeak lee stdin línea por línea y vacía stdout tras cada una,
+así que un mismo proceso puede transcribir indefinidamente.
+
+Protocolo
+---------
+Cada texto se envía en una línea seguida de una línea centinela.  Al
+arrancar, el worker transcribe el centinela solo y memoriza su salida; la
+respuesta a un texto son todas las líneas anteriores a esa salida.  Un lote
+de textos se escribe de una vez (un solo *round-trip*).
+
+Si un proceso muere, no responde a tiempo o la salida no cuadra con el
+protocolo, se mata y se relanza en la siguiente petición; la petición en
+curso falla con :class:`EspeakWorkerError` para que el llamador use la ruta
+de un proceso por texto.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Palabra sin sentido cuya transcripción sirve de delimitador.
+_SENTINEL = "qxzpronunciapaqxz"
+
+
+class EspeakWorkerError(RuntimeError):
+    """El worker eSpeak falló (caída, timeout o protocolo)."""
+
+
+@dataclass
+class EspeakPoolStats:
+    """Contadores del pool."""
+
+    started: int = 0
+    restarts: int = 0
+    failures: int = 0
+    batches: int = 0
+    texts: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "started": self.started,
+            "restarts": self.restarts,
+            "failures": self.failures,
+            "batches": self.batches,
+            "texts": self.texts,
+        }
+
+
+class _EspeakWorker:
+    """Un proceso eSpeak de larga vida para una voz."""
+
+    def __init__(self, binary: str, voice: str, *, timeout: float, stats: EspeakPoolStats) -> None:
+        self._binary = binary
+        self._voice = voice
+        self._timeout = timeout
+        self._stats = stats
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._sentinel_ipa = ""
+        self._crashed = False
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.returncode is None
+
+    async def _start(self) -> None:
+        self._proc = await asyncio.create_subprocess_exec(
+            self._binary, "-q", "-v", self._voice, "--ipa=3",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        if self._crashed:
+            self._stats.restarts += 1
+        self._stats.started += 1
+        self._write([_SENTINEL])
+        line = await asyncio.wait_for(self._readline(), self._timeout)
+        self._sentinel_ipa = line.strip()
+        if not self._sentinel_ipa:
+            raise EspeakWorkerError("eSpeak no produjo salida para el centinela")
+
+    def _write(self, lines: Sequence[str]) -> None:
+        assert self._proc is not None and self._proc.stdin is not None
+        self._proc.stdin.write("".join(f"{line}\n" for line in lines).encode("utf-8"))
+
+    async def _readline(self) -> str:
+        assert self._proc is not None and self._proc.stdout is not None
+        raw = await self._proc.stdout.readline()
+        if not raw:
+            raise EspeakWorkerError("eSpeak cerró stdout (proceso terminado)")
+        return raw.decode("utf-8", errors="replace")
+
+    async def _read_batch(self, count: int) -> List[str]:
+        outputs: List[str] = []
+        lines: List[str] = []
+        while len(outputs) < count:
+            line = (await self._readline()).strip()
+            if line == self._sentinel_ipa:
+                outputs.append("\n".join(lines))
+                lines = []
+            elif line:
+                lines.append(line)
+        return outputs
+
+    async def transcribe_many(self, texts: Sequence[str]) -> List[str]:
+        """Salida IPA cruda de eSpeak para cada texto (en orden)."""
+        try:
+            if not self.alive:
+                await self._start()
+            assert self._proc is not None and self._proc.stdin is not None
+            payload: List[str] = []
+            for text in texts:
+                payload.extend((" ".join(text.split()), _SENTINEL))
+            self._write(payload)
+            reader = asyncio.ensure_future(self._read_batch(len(texts)))
+            try:
+                await asyncio.wait_for(self._proc.stdin.drain(), self._timeout)
+                budget = self._timeout * max(1, len(texts) // 50 + 1)
+                return await asyncio.wait_for(reader, budget)
+            finally:
+                reader.cancel()
+        except (EspeakWorkerError, OSError, asyncio.TimeoutError, ConnectionError) as exc:
+            self._stats.failures += 1
+            self.kill()
+            raise EspeakWorkerError(f"worker eSpeak ({self._voice}) falló: {exc}") from exc
+
+    def kill(self) -> None:
+        """Terminar el proceso; se relanza en la próxima petición."""
+        proc, self._proc = self._proc, None
+        self._crashed = True
+        if proc is not None and proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:  # pragma: no cover
+                pass
+
+    async def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None or proc.returncode is not None:
+            return
+        try:
+            assert proc.stdin is not None
+            proc.stdin.close()
+            await asyncio.wait_for(proc.wait(), 1.0)
+        except (asyncio.TimeoutError, OSError, ConnectionError):
+            proc.kill()
+
+
+class _VoicePool:
+    def __init__(self, workers: List[_EspeakWorker]) -> None:
+        self.workers = workers
+        self.idle: "asyncio.Queue[_EspeakWorker]" = asyncio.Queue()
+        for worker in workers:
+            self.idle.put_nowait(worker)
+
+
+class EspeakProcessPool:
+    """Procesos eSpeak persistentes agrupados por voz.
+
+    Parámetros
+    ----------
+    binary : str
+        Ejecutable ``espeak``/``espeak-ng``.
+    workers_per_voice : int
+        Procesos concurrentes por voz (se lanzan bajo demanda).
+    timeout : float
+        Segundos máximos por línea antes de dar el worker por colgado.
+    """
+
+    def __init__(self, binary: str, *, workers_per_voice: int = 2, timeout: float = 10.0) -> None:
+        self._binary = binary
+        self._workers_per_voice = max(1, workers_per_voice)
+        self._timeout = timeout
+        self._voices: Dict[str, _VoicePool] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats = EspeakPoolStats()
+
+    def _voice_pool(self, voice: str) -> _VoicePool:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Los pipes asyncio pertenecen a un event loop: al cambiar de loop
+            # (tests, CLI con asyncio.run) se descartan los procesos anteriores.
+            for stale in self._voices.values():
+                for worker in stale.workers:
+                    worker.kill()
+            self._voices.clear()
+            self._loop = loop
+        pool = self._voices.get(voice)
+        if pool is None:
+            pool = _VoicePool([
+                _EspeakWorker(self._binary, voice, timeout=self._timeout, stats=self.stats)
+                for _ in range(self._workers_per_voice)
+            ])
+            self._voices[voice] = pool
+        return pool
+
+    async def transcribe_many(self, texts: Sequence[str], *, voice: str) -> List[str]:
+        """Transcribir ``texts`` con un worker de ``voice`` en un solo round-trip."""
+        if not texts:
+            return []
+        pool = self._voice_pool(voice)
+        worker = await pool.idle.get()
+        try:
+            outputs = await worker.transcribe_many(texts)
+        finally:
+            pool.idle.put_nowait(worker)
+        self.stats.batches += 1
+        self.stats.texts += len(texts)
+        return outputs
+
+    async def close(self) -> None:
+        """Cerrar todos los procesos."""
+        voices, self._voices = self._voices, {}
+        for pool in voices.values():
+            for worker in pool.workers:
+                await worker.close()
+
+
+__all__ = ["EspeakPoolStats", "EspeakProcessPool", "EspeakWorkerError"]
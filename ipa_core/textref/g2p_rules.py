@@ -3,13 +3,20 @@
 Permite definir reglas de conversión grafema→fonema que dependen
 del contexto (caracteres anteriores/posteriores), reduciendo la
 necesidad de léxicos manuales extensos.
+
+El motor compila el ruleset: las reglas se indexan en un trie por
+grafema, así que en cada posición sólo se prueban las reglas cuyo grafema
+coincide (en el mismo orden de prioridad), y los contextos se precompilan
+(literal, clase de caracteres o regex evaluada sin cortar la palabra).
+Las conversiones por palabra se memorizan en un LRU.
 """
 from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import yaml
 
@@ -111,20 +118,29 @@ class G2PRuleset:
         Reglas ordenadas por prioridad.
     exceptions : dict[str, str]
         Diccionario de excepciones (palabra → IPA).
+    version : int
+        Contador de cambios; los motores recompilan cuando cambia.
     """
     language: str
     dialect: str
     rules: List[G2PRule] = field(default_factory=list)
     exceptions: Dict[str, str] = field(default_factory=dict)
+    version: int = field(default=0, compare=False, repr=False)
     
     def add_rule(self, rule: G2PRule) -> None:
         """Añadir regla y reordenar por prioridad."""
         self.rules.append(rule)
         self.rules.sort(key=lambda r: (-r.priority, -len(r.grapheme)))
+        self.touch()
     
     def add_exception(self, word: str, ipa: str) -> None:
         """Añadir excepción al léxico."""
         self.exceptions[word.lower()] = ipa
+        self.touch()
+
+    def touch(self) -> None:
+        """Marcar el ruleset como modificado (tras editar ``rules``/``exceptions`` a mano)."""
+        self.version += 1
     
     @classmethod
     def from_yaml(cls, path: Path) -> "G2PRuleset":
@@ -170,15 +186,125 @@ class G2PRuleset:
             yaml.dump(data, f, allow_unicode=True, sort_keys=False)
 
 
+# ---------------------------------------------------------------------------
+# Compilación de contextos
+# ---------------------------------------------------------------------------
+
+ContextCheck = Callable[[str, int], bool]
+
+_REGEX_META = set(".^$*+?{}[]\\|()")
+_SIMPLE_CLASS_RE = re.compile(r"^\[([^\]\\^\-\[]+)\]$")
+# Construcciones cuyo resultado depende de lo que hay fuera del fragmento
+# cortado: con ellas el contexto derecho se evalúa sobre el corte.
+_SLICE_ONLY_RE = re.compile(r"\^|\\A|\\b|\\B|\(\?<[=!]")
+
+
+def _compile_left(pattern: str) -> Optional[ContextCheck]:
+    """``check(word, pos)`` equivalente a ``re.search(f"({pattern})$", word[:pos])``."""
+    if not pattern:
+        return None
+    if not _REGEX_META & set(pattern):
+        return lambda word, pos: word.endswith(pattern, 0, pos)
+    simple = _SIMPLE_CLASS_RE.match(pattern)
+    if simple:
+        chars = frozenset(simple.group(1))
+        return lambda word, pos: pos > 0 and word[pos - 1] in chars
+    regex = re.compile(f"({pattern})$")
+    # ``endpos`` trunca la cadena igual que ``word[:pos]``.
+    return lambda word, pos: regex.search(word, 0, pos) is not None
+
+
+def _compile_right(pattern: str) -> Optional[ContextCheck]:
+    """``check(word, end)`` equivalente a ``re.match(f"^({pattern})", word[end:])``."""
+    if not pattern:
+        return None
+    if not _REGEX_META & set(pattern):
+        return lambda word, end: word.startswith(pattern, end)
+    simple = _SIMPLE_CLASS_RE.match(pattern)
+    if simple:
+        chars = frozenset(simple.group(1))
+        return lambda word, end: end < len(word) and word[end] in chars
+    if _SLICE_ONLY_RE.search(pattern):
+        sliced = re.compile(f"^({pattern})")
+        return lambda word, end: sliced.match(word[end:]) is not None
+    regex = re.compile(f"({pattern})")
+    return lambda word, end: regex.match(word, end) is not None
+
+
+@dataclass
+class _CompiledRule:
+    order: int
+    grapheme: str
+    phoneme: str
+    left: Optional[ContextCheck]
+    right: Optional[ContextCheck]
+
+
+class _TrieNode:
+    __slots__ = ("children", "rules")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.rules: List[_CompiledRule] = []
+
+
+class _CompiledRuleset:
+    """Reglas indexadas por grafema en un trie de caracteres."""
+
+    def __init__(self, rules: List[G2PRule]) -> None:
+        self.root = _TrieNode()
+        for order, rule in enumerate(rules):
+            grapheme = rule.grapheme.lower()
+            node = self.root
+            for char in grapheme:
+                node = node.children.setdefault(char, _TrieNode())
+            node.rules.append(_CompiledRule(
+                order=order,
+                grapheme=grapheme,
+                phoneme=rule.phoneme,
+                left=_compile_left(rule.left_context),
+                right=_compile_right(rule.right_context),
+            ))
+
+    def candidates(self, word: str, pos: int) -> List[_CompiledRule]:
+        """Reglas cuyo grafema coincide en ``pos``, en orden de prioridad."""
+        node = self.root
+        found = list(node.rules)
+        for char in word[pos:]:
+            node = node.children.get(char)  # type: ignore[assignment]
+            if node is None:
+                break
+            found.extend(node.rules)
+        if len(found) > 1:
+            found.sort(key=lambda r: r.order)
+        return found
+
+
+_DEFAULT_MEMO_SIZE = 8192
+
+
 class G2PRulesEngine:
     """Motor de conversión G2P basado en reglas.
     
     Aplica reglas sensibles al contexto para convertir
     texto a IPA, consultando excepciones primero.
+
+    Las reglas se compilan al primer uso y se recompilan (vaciando el LRU)
+    cuando cambia ``ruleset.version``: ``add_rule``/``add_exception`` lo
+    incrementan; tras editar ``rules`` o ``exceptions`` directamente hay
+    que llamar a ``ruleset.touch()``. ``memo_size`` es el tamaño del LRU
+    por palabra (0 lo desactiva).
     """
     
-    def __init__(self, ruleset: G2PRuleset) -> None:
+    def __init__(self, ruleset: G2PRuleset, *, memo_size: int = _DEFAULT_MEMO_SIZE) -> None:
         self._ruleset = ruleset
+        self._compiled: Optional[_CompiledRuleset] = None
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._memo_size = max(0, int(memo_size))
+        self._convert_cached = (
+            lru_cache(maxsize=self._memo_size)(self._convert_word)
+            if self._memo_size else self._convert_word
+        )
     
     @classmethod
     def from_yaml(cls, path: Path) -> "G2PRulesEngine":
@@ -199,27 +325,59 @@ class G2PRulesEngine:
         str
             Transcripción IPA.
         """
-        word_lower = word.lower().strip()
-        
+        self._ensure_compiled()
+        return self._convert_cached(word.lower().strip())
+
+    def convert_many(self, words: Iterable[str]) -> List[str]:
+        """Convertir varias palabras (las repetidas se convierten una vez)."""
+        self._ensure_compiled()
+        done: Dict[str, str] = {}
+        out = []
+        for word in words:
+            key = word.lower().strip()
+            ipa = done.get(key)
+            if ipa is None:
+                ipa = done[key] = self._convert_cached(key)
+            out.append(ipa)
+        return out
+
+    def _ensure_compiled(self) -> None:
+        ruleset = self._ruleset
+        rules = ruleset.rules
+        signature = (id(rules), id(ruleset.exceptions), ruleset.version)
+        if signature != self._signature:
+            self._compiled = _CompiledRuleset(rules)
+            self._signature = signature
+            cache_clear = getattr(self._convert_cached, "cache_clear", None)
+            if cache_clear is not None:
+                cache_clear()
+
+    def _convert_word(self, word_lower: str) -> str:
         # 1. Buscar en excepciones primero
         if word_lower in self._ruleset.exceptions:
             return self._ruleset.exceptions[word_lower]
         
         # 2. Aplicar reglas
+        compiled = self._compiled
+        assert compiled is not None
         result = []
         pos = 0
+        length = len(word_lower)
         
-        while pos < len(word_lower):
+        while pos < length:
             matched = False
             
-            # Buscar regla que aplique (ya ordenadas por prioridad y longitud)
-            for rule in self._ruleset.rules:
-                if pos + len(rule.grapheme) <= len(word_lower):
-                    if rule.matches(word_lower, pos):
-                        result.append(rule.phoneme)
-                        pos += len(rule.grapheme)
-                        matched = True
-                        break
+            # Sólo las reglas cuyo grafema coincide (ya ordenadas por prioridad y longitud)
+            for rule in compiled.candidates(word_lower, pos):
+                end = pos + len(rule.grapheme)
+                if rule.left is not None and not rule.left(word_lower, pos):
+                    continue
+                if rule.right is not None and not rule.right(word_lower, end):
+                    continue
+                result.append(rule.phoneme)
+                pos = end
+                matched = True
+                break
             
             if not matched:
                 # No hay regla: copiar carácter o marcar como desconocido
@@ -17,7 +17,7 @@ from __future__ import annotations
 
 import re
 import unicodedata
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Optional, Sequence, TYPE_CHECKING
 
 from ipa_core.plugins.base import BasePlugin
 from ipa_core.textref.tokenize import tokenize_ipa
@@ -151,18 +151,21 @@ class LexiconTextRef(BasePlugin):
             else:
                 oov_words.append((idx, word))
 
-        # Segunda pasada: fallback a eSpeak para OOV — una llamada por palabra
-        # para respetar límites de palabra (eSpeak no señaliza word boundaries).
+        # Segunda pasada: fallback a eSpeak para OOV — un texto por palabra
+        # para respetar límites de palabra (eSpeak no señaliza word boundaries),
+        # enviados en un solo lote.
         if oov_words:
             if self._espeak is not None:
-                for idx, word in oov_words:
-                    try:
-                        res = await self._espeak.to_ipa(word, lang=lang)
-                        word_tokens[idx] = res.get("tokens", [])
-                        sources.append("espeak_fallback")
-                    except Exception:  # noqa: BLE001
-                        word_tokens[idx] = []
-                        sources.append("oov_skipped")
+                results: Sequence[Optional[TextRefResult]]
+                try:
+                    results = await self._espeak.to_ipa_many(
+                        [word for _, word in oov_words], lang=lang,
+                    )
+                except Exception:  # noqa: BLE001
+                    results = [None] * len(oov_words)
+                for (idx, _), res in zip(oov_words, results):
+                    word_tokens[idx] = res.get("tokens", []) if res else []
+                    sources.append("espeak_fallback" if res else "oov_skipped")
             else:
                 for idx, _ in oov_words:
                     word_tokens[idx] = []
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from ipa_core.textref.cache import PersistentTextRefStore, TextRefCache, default_store_path
+from ipa_core.types import TextRefResult
+
+
+def _result(*tokens: str) -> TextRefResult:
+    return {"tokens": list(tokens), "meta": {"method": "espeak"}}
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+async def test_persistent_tier_survives_restart_and_keys_by_variant(tmp_path) -> None:
+    db = tmp_path / "textref.sqlite3"
+    calls: list[str] = []
+
+    async def compute():
+        calls.append("espeak")
+        return _result("o", "l", "a")
+
+    first_store = PersistentTextRefStore(db, flush_interval=60)
+    first = TextRefCache(store=first_store)
+    await first.get_or_compute("hola", "es", "espeak", compute, variant="1.51|es")
+    # Write-behind: aún pendiente, pero visible para lecturas del mismo proceso.
+    assert first_store.get_stats().pending == 1
+    first_store.close()
+
+    # "Reinicio": memoria vacía, el nivel SQLite responde y promueve a memoria.
+    second_store = PersistentTextRefStore(db)
+    second = TextRefCache(store=second_store)
+    again = await second.get_or_compute("  hola ", "es", "espeak", compute, variant="1.51|es")
+    assert again["tokens"] == ["o", "l", "a"]
+    assert calls == ["espeak"]
+    assert second.tier_stats()["disk"]["hits"] == 1
+    assert second.get("hola", "es", "espeak", variant="1.51|es") is not None
+    assert second.tier_stats()["memory"]["hits"] == 1
+
+    # Otra versión/voz del proveedor es otra entrada.
+    assert second.get("hola", "es", "espeak", variant="1.52|es") is None
+    second_store.close()
+
+
+@pytest.mark.unit
+@pytest.mark.reliability
+def test_persistent_tier_evicts_least_recently_used(tmp_path) -> None:
+    store = PersistentTextRefStore(tmp_path / "textref.sqlite3", max_entries=2, batch_size=1)
+    cache = TextRefCache(store=store)
+    cache.set("uno", "es", "espeak", _result("u"))
+    cache.set("dos", "es", "espeak", _result("d"))
+    cache.clear()
+    assert cache.get("uno", "es", "espeak") is not None  # toca "uno"
+    store.flush()
+    cache.set("tres", "es", "espeak", _result("t"))
+    cache.clear()
+
+    assert len(store) == 2
+    assert store.get_stats().evictions == 1
+    assert cache.get("dos", "es", "espeak") is None
+    assert cache.get("uno", "es", "espeak") is not None
+    store.close()
+
+
+class ThreadRecordingStore(PersistentTextRefStore):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.threads: list[int] = []
+
+    def get(self, key):
+        self.threads.append(threading.get_ident())
+        return super().get(key)
+
+    def put(self, key, provider, lang, result) -> None:
+        self.threads.append(threading.get_ident())
+        super().put(key, provider, lang, result)
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+async def test_async_paths_keep_sqlite_off_the_event_loop(tmp_path) -> None:
+    store = ThreadRecordingStore(tmp_path / "textref.sqlite3", batch_size=1)
+    cache = TextRefCache(store=store)
+
+    async def compute():
+        return _result("o", "l", "a")
+
+    await cache.get_or_compute("hola", "es", "espeak", compute, variant="1.51|es")
+    assert len(store.threads) == 2
+    assert threading.get_ident() not in store.threads
+
+    assert ("hola", "es", "espeak", "1.51|es") in cache
+    assert ("hola", "es", "espeak") not in cache
+    # conftest redirige el cache global fuera de $HOME.
+    default_path = default_store_path()
+    assert default_path is not None and Path.home() not in default_path.parents
+    store.close()
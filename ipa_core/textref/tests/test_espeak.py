@@ -31,3 +31,83 @@ def test_resolve_voice_uses_global_override(monkeypatch: pytest.MonkeyPatch) ->
     provider = EspeakTextRef(binary="espeak")
 
     assert provider._resolve_voice("zz") == "en-us"
+
+
+_FAKE_ESPEAK = """#!{python}
+import sys
+args = sys.argv[1:]
+if args == ["--version"]:
+    print("eSpeak NG text-to-speech: 1.51")
+    sys.exit(0)
+if len(args) > 4:  # modo un-proceso-por-texto
+    print(args[-1].upper())
+    sys.exit(0)
+with open({log!r}, "a") as log:
+    log.write("start\\n")
+for line in sys.stdin:
+    if line.strip() == "boom":
+        sys.exit(3)
+    print(line.strip().upper(), flush=True)
+"""
+
+
+@pytest.fixture
+def fake_espeak(tmp_path):
+    import stat
+    import sys
+
+    log = tmp_path / "starts.log"
+    script = tmp_path / "espeak-ng"
+    script.write_text(_FAKE_ESPEAK.format(python=sys.executable, log=str(log)))
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return str(script), log
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+async def test_to_ipa_many_reuses_one_process_per_voice(fake_espeak) -> None:
+    binary, log = fake_espeak
+    provider = EspeakTextRef(binary=binary, workers_per_voice=1)
+
+    first = await provider.to_ipa_many(["sol", "", "mar", "sol"], lang="es")
+    second = await provider.to_ipa("luna", lang="es")
+
+    assert [r["tokens"] for r in first] == [["S", "O", "L"], [], ["M", "A", "R"], ["S", "O", "L"]]
+    assert second["tokens"] == ["L", "U", "N", "A"]
+    assert log.read_text().count("start") == 1
+    assert provider._pool is not None and provider._pool.stats.batches == 2
+    await provider.teardown()
+
+
+@pytest.mark.unit
+@pytest.mark.reliability
+async def test_crashed_worker_falls_back_and_restarts(fake_espeak) -> None:
+    binary, log = fake_espeak
+    provider = EspeakTextRef(binary=binary, workers_per_voice=1)
+
+    crashed = await provider.to_ipa("boom", lang="es")  # el worker muere a mitad del lote
+    recovered = await provider.to_ipa("sol", lang="es")
+
+    assert crashed["tokens"] == ["B", "O", "O", "M"]  # vía un proceso por texto
+    assert recovered["tokens"] == ["S", "O", "L"]
+    assert provider._pool is not None
+    assert provider._pool.stats.failures == 1
+    assert provider._pool.stats.restarts == 1
+    assert log.read_text().count("start") == 2
+    await provider.teardown()
+
+
+@pytest.mark.unit
+async def test_version_is_read_once_without_blocking_subprocess(fake_espeak, monkeypatch) -> None:
+    import subprocess
+
+    def _blocking(*_args, **_kwargs):
+        raise AssertionError("--version no debe usar subprocess.run")
+
+    monkeypatch.setattr(subprocess, "run", _blocking)
+    binary, _log = fake_espeak
+    provider = EspeakTextRef(binary=binary, workers_per_voice=0)
+
+    await provider.setup()
+    assert provider._version == "eSpeak NG text-to-speech: 1.51"
+    assert await provider._espeak_version() == provider._version
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from ipa_core.textref.g2p_rules import G2PRule, G2PRuleset, G2PRulesEngine
+
+_PACKS = Path(__file__).resolve().parents[3] / "plugins" / "language_packs"
+
+
+def _reference_convert(ruleset: G2PRuleset, word: str) -> str:
+    """Algoritmo original: probar todas las reglas en cada posición."""
+    word_lower = word.lower().strip()
+    if word_lower in ruleset.exceptions:
+        return ruleset.exceptions[word_lower]
+    result, pos = [], 0
+    while pos < len(word_lower):
+        for rule in ruleset.rules:
+            if pos + len(rule.grapheme) <= len(word_lower) and rule.matches(word_lower, pos):
+                result.append(rule.phoneme)
+                pos += len(rule.grapheme)
+                break
+        else:
+            if word_lower[pos].isalpha():
+                result.append(f"?{word_lower[pos]}?")
+            pos += 1
+    return "".join(result)
+
+
+def _words(alphabet: str, n: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 9))) for _ in range(n)]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("pack", sorted(p.parent.name for p in _PACKS.glob("*/g2p_rules.yaml")))
+def test_compiled_engine_matches_reference_on_pack_rules(pack: str) -> None:
+    ruleset = G2PRuleset.from_yaml(_PACKS / pack / "g2p_rules.yaml")
+    engine = G2PRulesEngine(ruleset)
+    words = _words("aeioucsnlmxhtrqy' -", 2000) + ["México", " cielo ", "casa"]
+    assert engine.convert_many(words) == [_reference_convert(ruleset, w) for w in words]
+
+
+@pytest.mark.unit
+def test_compiled_contexts_and_invalidation_match_reference() -> None:
+    ruleset = G2PRuleset(language="xx", dialect="xx")
+    for rule in [
+        G2PRule("ch", "tʃ", priority=5),
+        G2PRule("C", "s", right_context="[ei]", priority=10),
+        G2PRule("c", "k"),
+        G2PRule("g", "x", right_context="e|i"),
+        G2PRule("g", "ɣ", left_context="[aeiou]"),
+        G2PRule("g", "g"),
+        G2PRule("r", "r", left_context="^|n"),
+        G2PRule("r", "ɾ"),
+        G2PRule("u", "", left_context="q", right_context="(?<=u)[ei]"),
+        G2PRule("u", "w", right_context="\\ba"),
+        G2PRule("qu", "k", right_context="e$"),
+        G2PRule("e", "e"), G2PRule("i", "i"), G2PRule("a", "a"), G2PRule("o", "o"), G2PRule("u", "u"),
+        G2PRule("q", "k"), G2PRule("n", "n"), G2PRule("h", "", left_context="c"),
+    ]:
+        ruleset.add_rule(rule)
+    engine = G2PRulesEngine(ruleset, memo_size=64)
+    words = _words("cheigraounqx", 3000, seed=11)
+    assert engine.convert_many(words) == [_reference_convert(ruleset, w) for w in words]
+
+    # Reglas nuevas invalidan el índice compilado y el memo.
+    assert engine.convert("x") == "?x?"
+    ruleset.add_rule(G2PRule("x", "ks"))
+    assert engine.convert("x") == "ks"
+
+
+@pytest.mark.unit
+def test_overwritten_exceptions_and_in_place_edits_invalidate_memo() -> None:
+    ruleset = G2PRuleset(language="xx", dialect="xx")
+    ruleset.add_rule(G2PRule("a", "a"))
+    ruleset.add_rule(G2PRule("b", "b"))
+    engine = G2PRulesEngine(ruleset)
+
+    ruleset.add_exception("ab", "X")
+    assert engine.convert("ab") == "X"
+    ruleset.add_exception("ab", "Y")
+    assert engine.convert("ab") == "Y"
+
+    assert engine.convert("ba") == "ba"
+    ruleset.rules[0] = G2PRule("a", "ɑ")
+    ruleset.touch()
+    assert engine.convert("ba") == "bɑ"
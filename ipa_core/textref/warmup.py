@@ -0,0 +1,155 @@
+"""Precalentado del cache TextRef con el contenido de las lecciones.
+
+Recorre las frases de práctica de ``data/ipa_catalog/{lang}_learning.yaml``
+(ejemplos de audio, drills y pares mínimos) y las semillas del catálogo
+``{lang}.yaml`` para los fonemas de cada tema del roadmap, y las pasa por
+el proveedor TextRef configurado.  Con el cache persistente habilitado
+(ver :mod:`ipa_core.textref.cache`), los workers del servidor arrancan con
+esas transcripciones ya calculadas.
+
+Uso
+---
+::
+
+    pronunciapa textref warm --lang es --lang en
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, Optional
+
+import yaml
+
+from ipa_core.ipa_catalog import load_catalog, normalize_lang, resolve_catalog_dir
+from ipa_core.ports.textref import TextRefProvider
+from ipa_core.services.lesson import load_roadmap
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmupReport:
+    """Resultado del precalentado de un idioma."""
+
+    lang: str
+    texts: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"lang": self.lang, "texts": self.texts, "errors": list(self.errors)}
+
+
+def _learning_texts(learning: dict[str, Any]) -> Iterator[str]:
+    for sound in learning.get("sounds", []) or []:
+        for example in sound.get("audio_examples", []) or []:
+            yield example.get("text", "")
+        for drill in sound.get("drills", []) or []:
+            yield drill.get("target", "")
+            yield from drill.get("targets", []) or []
+            for pair in drill.get("pairs", []) or []:
+                yield from pair
+        for pair in sound.get("minimal_pairs", []) or []:
+            # Formato ["/ipa/", "palabra", "/ipa/", "palabra"]: sólo la ortografía.
+            yield from (item for item in pair if not str(item).startswith("/"))
+
+
+def _roadmap_texts(lang: str) -> Iterator[str]:
+    roadmap = load_roadmap(lang) or {}
+    phonemes = {p for topic in roadmap.get("topics", []) for p in topic.get("phonemes", [])}
+    if not phonemes:
+        return
+    try:
+        catalog = load_catalog(lang)
+    except (FileNotFoundError, ValueError):
+        return
+    for sound in catalog.get("sounds", []):
+        if sound.get("ipa") not in phonemes:
+            continue
+        for context in (sound.get("contexts") or {}).values():
+            for seed in (context or {}).get("seeds", []) or []:
+                yield seed.get("text", "")
+
+
+def collect_practice_texts(lang: str) -> list[str]:
+    """Frases de práctica de un idioma (sin duplicados, en orden de aparición)."""
+    lang = normalize_lang(lang)
+    path = resolve_catalog_dir() / f"{lang}_learning.yaml"
+    learning: dict[str, Any] = {}
+    if path.exists():
+        learning = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+
+    seen: dict[str, None] = {}
+    for raw in (*_learning_texts(learning), *_roadmap_texts(lang)):
+        text = str(raw or "").strip()
+        if text:
+            seen.setdefault(text, None)
+    return list(seen)
+
+
+def learning_languages() -> list[str]:
+    """Idiomas con contenido de lecciones en el catálogo."""
+    return sorted(
+        p.name[: -len("_learning.yaml")]
+        for p in resolve_catalog_dir().glob("*_learning.yaml")
+    )
+
+
+async def warm_textref_cache(
+    textref: TextRefProvider,
+    lang: str,
+    texts: Iterable[str],
+    *,
+    concurrency: int = 4,
+    batch_size: int = 64,
+) -> WarmupReport:
+    """Transcribir ``texts`` con ``textref`` para poblar su cache.
+
+    Si el proveedor expone ``to_ipa_many`` (eSpeak), los textos se envían
+    en lotes de ``batch_size``.
+    """
+    report = WarmupReport(lang=lang)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    many = getattr(textref, "to_ipa_many", None)
+    items = list(texts)
+    step = max(1, batch_size) if many is not None else 1
+    batches = [items[i:i + step] for i in range(0, len(items), step)]
+
+    async def _one(batch: list[str]) -> None:
+        async with semaphore:
+            try:
+                if many is not None:
+                    await many(batch, lang=lang)
+                else:
+                    await textref.to_ipa(batch[0], lang=lang)
+                report.texts += len(batch)
+            except Exception as exc:
+                logger.debug("Warm-up TextRef falló para %r: %s", batch, exc)
+                report.errors.extend(batch)
+
+    await asyncio.gather(*(_one(batch) for batch in batches))
+    return report
+
+
+async def warm_languages(
+    textref: TextRefProvider,
+    langs: Optional[Iterable[str]] = None,
+    *,
+    concurrency: int = 4,
+) -> list[WarmupReport]:
+    """Precalentar todos los idiomas indicados (por defecto, los que tienen lecciones)."""
+    reports = []
+    for lang in langs or learning_languages():
+        texts = collect_practice_texts(lang)
+        reports.append(await warm_textref_cache(textref, lang, texts, concurrency=concurrency))
+    return reports
+
+
+__all__ = [
+    "WarmupReport",
+    "collect_practice_texts",
+    "learning_languages",
+    "warm_languages",
+    "warm_textref_cache",
+]
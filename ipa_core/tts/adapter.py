@@ -30,6 +30,10 @@ class TTSAdapter(BasePlugin):
         await self._system.teardown()
         await self._piper.teardown()
 
+    def memory_footprint(self) -> int:
+        """Bytes estimados de los backends listos (ver ``PiperTTS.memory_footprint``)."""
+        return self._piper.memory_footprint() if self._piper_ready else 0
+
     async def synthesize(self, text: str, *, lang: str, voice: Optional[str] = None, output_path: Optional[str] = None, **kw) -> TTSResult:
         if self._prefer == "system":
             return await _synthesize_with_fallback(
@@ -0,0 +1,284 @@
+"""Cache de audio sintetizado direccionado por contenido.
+
+Las lecciones piden una y otra vez el mismo audio ("perro", "ship/sheep").
+Cada síntesis se guarda comprimida (gzip) bajo una clave
+``sha256(proveedor, voz, idioma, texto, sample_rate)``, donde *proveedor*
+incluye una huella de sus parámetros (modelo Piper, backend del sistema...),
+así que cambiar de voz o de modelo no sirve audio viejo.
+
+- La clave es también el ``ETag``: el cliente puede revalidar con
+  ``If-None-Match`` sin descargar de nuevo.
+- Los archivos ``.wav.gz`` se sirven tal cual a clientes que aceptan gzip.
+- Al superar ``max_bytes`` se eliminan los archivos usados hace más tiempo
+  (la fecha de modificación se refresca en cada hit).
+
+Variables de entorno
+--------------------
+``PRONUNCIAPA_TTS_CACHE_DIR``
+    Directorio del cache (default: ``~/.cache/pronunciapa/tts_audio``).
+    Vacío lo desactiva.
+``PRONUNCIAPA_TTS_CACHE_MAX_MB``
+    Tamaño máximo en MB (default: 256).
+"""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, Dict, Optional
+
+from ipa_core.ports.tts import TTSProvider
+from ipa_core.textref.cache import normalize_cache_text
+from ipa_core.tts.utils import configured_sample_rate
+
+logger = logging.getLogger(__name__)
+
+_SUFFIX = ".wav.gz"
+_DEFAULT_MAX_MB = 256
+
+
+def provider_fingerprint(name: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Identidad de una instancia TTS: nombre + huella de sus parámetros efectivos."""
+    payload = json.dumps(params or {}, sort_keys=True, default=str)
+    return f"{name}:{hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]}"
+
+
+def tts_cache_key(
+    provider: str,
+    *,
+    voice: Optional[str],
+    lang: str,
+    text: str,
+    sample_rate: Optional[int],
+) -> str:
+    """Clave de contenido de una síntesis."""
+    parts = (provider, voice or "", lang.lower(), normalize_cache_text(text), str(sample_rate or ""))
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedAudio:
+    """Audio listo para servir: archivo comprimido en cache o bytes en memoria."""
+
+    key: str
+    gz_path: Optional[Path] = None
+    wav: Optional[bytes] = None
+    hit: bool = False
+    backend: Optional[str] = None
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.key[:32]}"'
+
+    def gzip_bytes(self) -> bytes:
+        if self.gz_path is not None:
+            return self.gz_path.read_bytes()
+        return gzip.compress(self.wav or b"", compresslevel=6)
+
+    def wav_bytes(self) -> bytes:
+        if self.wav is not None:
+            return self.wav
+        assert self.gz_path is not None
+        return gzip.decompress(self.gz_path.read_bytes())
+
+
+class TTSAudioCache:
+    """Archivos ``<clave>.wav.gz`` bajo ``root`` con desalojo LRU por tamaño."""
+
+    def __init__(self, root: Path, *, max_bytes: int = _DEFAULT_MAX_MB * 1024 * 1024) -> None:
+        self.root = Path(root)
+        self.max_bytes = max(0, int(max_bytes))
+        self._total: Optional[int] = None
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}{_SUFFIX}"
+
+    def _files(self) -> list[Path]:
+        return list(self.root.glob(f"*/*{_SUFFIX}")) if self.root.exists() else []
+
+    def total_bytes(self) -> int:
+        if self._total is None:
+            self._total = sum(p.stat().st_size for p in self._files())
+        return self._total
+
+    def get(self, key: str) -> Optional[CachedAudio]:
+        path = self._path(key)
+        try:
+            os.utime(path)  # marca de uso para el LRU
+        except FileNotFoundError:
+            return None
+        self.hits += 1
+        return CachedAudio(key=key, gz_path=path, hit=True)
+
+    def put(self, key: str, wav: bytes) -> CachedAudio:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = gzip.compress(wav, compresslevel=6)
+        fd, tmp_name = tempfile.mkstemp(prefix=".tmp_", dir=path.parent)
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(payload)
+        previous = path.stat().st_size if path.exists() else 0
+        total = self.total_bytes()  # antes de reemplazar: no contar el archivo nuevo dos veces
+        os.replace(tmp_name, path)
+        self._total = total + len(payload) - previous
+        self._evict()
+        return CachedAudio(key=key, gz_path=path if path.exists() else None, wav=None if path.exists() else wav)
+
+    def _evict(self) -> None:
+        if self.total_bytes() <= self.max_bytes:
+            return
+        files = sorted(self._files(), key=lambda p: p.stat().st_mtime)
+        for path in files:
+            if self._total is None or self._total <= self.max_bytes:
+                break
+            size = path.stat().st_size
+            path.unlink(missing_ok=True)
+            self._total = (self._total or 0) - size
+            self.evictions += 1
+
+    def lock(self, key: str) -> asyncio.Lock:
+        """Lock por clave: una sola síntesis aunque lleguen varias peticiones iguales."""
+        return self._locks.setdefault(key, asyncio.Lock())
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "dir": str(self.root),
+            "files": len(self._files()),
+            "bytes": self.total_bytes(),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+async def _synthesize_bytes(tts: TTSProvider, *, text: str, lang: str, voice: Optional[str]) -> tuple[bytes, Optional[str]]:
+    with tempfile.NamedTemporaryFile(prefix="pronunciapa_tts_", suffix=".wav", delete=False) as tmp:
+        output_path = tmp.name
+    try:
+        result = await tts.synthesize(text=text, lang=lang, voice=voice, output_path=output_path)
+        audio = result.get("audio")
+        path = (audio.get("path") if audio else None) or output_path
+        data = Path(path).read_bytes()
+        if path != output_path:
+            Path(path).unlink(missing_ok=True)
+        return data, result.get("meta", {}).get("backend")
+    finally:
+        Path(output_path).unlink(missing_ok=True)
+
+
+TTSLease = Callable[[], AsyncContextManager[TTSProvider]]
+
+
+def instance_lease(tts: TTSProvider) -> TTSLease:
+    """``TTSLease`` para una instancia ya inicializada."""
+
+    @asynccontextmanager
+    async def _lease() -> AsyncIterator[TTSProvider]:
+        yield tts
+
+    return _lease
+
+
+async def render_cached(
+    lease: TTSLease,
+    cache: Optional[TTSAudioCache],
+    *,
+    provider: str,
+    text: str,
+    lang: str,
+    voice: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> CachedAudio:
+    """Audio de ``text``: del cache si existe; si no, se sintetiza y se guarda.
+
+    ``lease`` presta la instancia TTS sólo cuando hay que sintetizar (un hit
+    no inicializa ninguna voz).  ``provider`` identifica la instancia (ver
+    :func:`provider_fingerprint`) y ``params`` sus parámetros efectivos
+    (para la ``sample_rate``).
+    """
+
+    async def _synthesize() -> tuple[bytes, Optional[str]]:
+        async with lease() as tts:
+            return await _synthesize_bytes(tts, text=text, lang=lang, voice=voice)
+
+    key = tts_cache_key(
+        provider,
+        voice=voice,
+        lang=lang,
+        text=text,
+        sample_rate=configured_sample_rate(params or {}),
+    )
+    if cache is None:
+        wav, backend = await _synthesize()
+        return CachedAudio(key=key, wav=wav, backend=backend)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    async with cache.lock(key):
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        cache.misses += 1
+        wav, backend = await _synthesize()
+        stored = await asyncio.to_thread(cache.put, key, wav)
+    cache._locks.pop(key, None)
+    stored.backend = backend
+    return stored
+
+
+def default_cache_dir() -> Optional[Path]:
+    """Directorio configurado (``None`` si ``PRONUNCIAPA_TTS_CACHE_DIR`` está vacío)."""
+    raw = os.environ.get("PRONUNCIAPA_TTS_CACHE_DIR")
+    if raw is None:
+        return Path.home() / ".cache" / "pronunciapa" / "tts_audio"
+    raw = raw.strip()
+    return Path(raw).expanduser() if raw else None
+
+
+_global_cache: Optional[TTSAudioCache] = None
+_global_loaded = False
+
+
+def get_tts_audio_cache() -> Optional[TTSAudioCache]:
+    """Cache global del proceso (``None`` si está desactivado)."""
+    global _global_cache, _global_loaded
+    if not _global_loaded:
+        root = default_cache_dir()
+        if root is not None:
+            max_mb = float(os.environ.get("PRONUNCIAPA_TTS_CACHE_MAX_MB", _DEFAULT_MAX_MB))
+            _global_cache = TTSAudioCache(root, max_bytes=int(max_mb * 1024 * 1024))
+        _global_loaded = True
+    return _global_cache
+
+
+def reset_tts_audio_cache() -> None:
+    """Olvidar el cache global (tests o cambio de variables de entorno)."""
+    global _global_cache, _global_loaded
+    _global_cache, _global_loaded = None, False
+
+
+__all__ = [
+    "CachedAudio",
+    "TTSAudioCache",
+    "default_cache_dir",
+    "get_tts_audio_cache",
+    "instance_lease",
+    "provider_fingerprint",
+    "render_cached",
+    "reset_tts_audio_cache",
+    "tts_cache_key",
+]
@@ -1,9 +1,16 @@
-"""Piper TTS adapter."""
+"""Piper TTS adapter.
+
+Si el paquete ``piper`` (``piper-tts``) está instalado, la voz ONNX se carga
+una vez en ``setup()`` y se sintetiza en un hilo; la instancia queda caliente
+mientras viva (ver ``ipa_server.tts_provider``).  Sin el paquete se invoca el
+binario ``piper`` en cada síntesis.
+"""
 from __future__ import annotations
 
 import asyncio
 import os
 import shutil
+import wave
 from pathlib import Path
 from typing import Any, Optional
 
@@ -31,12 +38,10 @@ class PiperTTS(BasePlugin):
         self._speaker = params.get("speaker")
         self._extra_args = list(params.get("extra_args", []))
         self._options = dict(params.get("options", {}))
+        self._in_process = bool(params.get("in_process", True))
+        self._voice: Any = None
 
     async def setup(self) -> None:
-        if not _binary_exists(self._binary):
-            raise NotReadyError(
-                "Piper binary not found. Install it or set PRONUNCIAPA_PIPER_BIN."
-            )
         if not self._model_path:
             raise NotReadyError("Piper model_path is required.")
         model_path = Path(self._model_path)
@@ -46,6 +51,23 @@ class PiperTTS(BasePlugin):
             config_path = Path(self._config_path)
             if not config_path.exists():
                 raise NotReadyError(f"Piper config not found: {config_path}")
+        if self._in_process and self._voice is None:
+            self._voice = await asyncio.to_thread(
+                _load_piper_voice, str(model_path), self._config_path
+            )
+        if self._voice is None and not _binary_exists(self._binary):
+            raise NotReadyError(
+                "Piper binary not found. Install it or set PRONUNCIAPA_PIPER_BIN."
+            )
+
+    async def teardown(self) -> None:
+        self._voice = None
+
+    def memory_footprint(self) -> int:
+        """Bytes estimados de la voz cargada (tamaño del modelo ONNX; 0 con el binario)."""
+        if self._voice is None or not self._model_path:
+            return 0
+        return Path(self._model_path).stat().st_size
 
     async def synthesize(
         self,
@@ -59,6 +81,11 @@ class PiperTTS(BasePlugin):
         cleaned = text.strip()
         if not cleaned:
             raise ValidationError("TTS text must be non-empty.")
+        speaker = self._speaker if self._speaker is not None else voice
+        if self._voice is not None and self._in_process_supports_options():
+            out_path = ensure_output_path(output_path, suffix=".wav")
+            await asyncio.to_thread(self._synthesize_in_process, cleaned, out_path, speaker)
+            return self._result(out_path, lang=lang, speaker=speaker)
         if not _binary_exists(self._binary):
             raise NotReadyError(
                 "Piper binary not found. Install it or set PRONUNCIAPA_PIPER_BIN."
@@ -73,7 +100,6 @@ class PiperTTS(BasePlugin):
         if self._config_path:
             cmd.extend(["--config", str(self._config_path)])
 
-        speaker = self._speaker if self._speaker is not None else voice
         if speaker is not None:
             cmd.extend(["--speaker", str(speaker)])
 
@@ -103,7 +129,50 @@ class PiperTTS(BasePlugin):
 
         if not out_path.exists():
             raise ValidationError("Piper did not produce an output file.")
-
+        return self._result(out_path, lang=lang, speaker=speaker)
+
+    def _in_process_supports_options(self) -> bool:
+        """piper-tts >= 1.3 no admite ``sentence_silence``: entonces se usa el binario."""
+        if "sentence_silence" not in self._options:
+            return True
+        if getattr(self._voice, "synthesize_wav", None) is None:
+            return True
+        return not _binary_exists(self._binary)
+
+    def _speaker_id(self, speaker: Any) -> Optional[int]:
+        """Id numérico del hablante (como ``--speaker``) o por nombre en la config de la voz."""
+        if speaker is None:
+            return None
+        if str(speaker).isdigit():
+            return int(speaker)
+        speaker_map = getattr(getattr(self._voice, "config", None), "speaker_id_map", None) or {}
+        return speaker_map.get(str(speaker))
+
+    def _synthesize_in_process(self, text: str, out_path: Path, speaker: Any) -> None:
+        speaker_id = self._speaker_id(speaker)
+        with wave.open(str(out_path), "wb") as wav_file:
+            synth_wav = getattr(self._voice, "synthesize_wav", None)
+            if synth_wav is not None:  # piper-tts >= 1.3
+                from piper import SynthesisConfig
+
+                syn_config = SynthesisConfig(
+                    speaker_id=speaker_id,
+                    length_scale=self._options.get("length_scale"),
+                    noise_scale=self._options.get("noise_scale"),
+                    noise_w_scale=self._options.get("noise_w"),
+                )
+                synth_wav(text, wav_file, syn_config=syn_config)
+                return
+            kwargs = {
+                key: self._options[key]
+                for key in ("length_scale", "noise_scale", "noise_w", "sentence_silence")
+                if key in self._options
+            }
+            if speaker_id is not None:
+                kwargs["speaker_id"] = speaker_id
+            self._voice.synthesize(text, wav_file, **kwargs)
+
+    def _result(self, out_path: Path, *, lang: str, speaker: Any) -> TTSResult:
         sample_rate, channels = read_audio_meta(
             out_path,
             default_rate=self._sample_rate,
@@ -121,10 +190,20 @@ class PiperTTS(BasePlugin):
                 "model_path": str(self._model_path),
                 "lang": lang,
                 "speaker": speaker,
+                "in_process": self._voice is not None,
             },
         }
 
 
+def _load_piper_voice(model_path: str, config_path: Optional[str]) -> Any:
+    """Cargar la voz con el paquete ``piper``; ``None`` si no está instalado."""
+    try:
+        from piper import PiperVoice
+    except ImportError:
+        return None
+    return PiperVoice.load(model_path, config_path=config_path)
+
+
 def _binary_exists(binary: str) -> bool:
     if shutil.which(binary):
         return True
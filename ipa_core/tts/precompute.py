@@ -0,0 +1,127 @@
+"""Precalculado del audio de los ejemplos del catálogo IPA.
+
+Sintetiza cada ejemplo de ``data/ipa_catalog/*.yaml`` (semillas de cada
+sonido y frases de ``{lang}_learning.yaml``) con el TTS configurado y lo
+guarda en el cache de :mod:`ipa_core.tts.cache` con la misma clave que usa
+el servidor, así las páginas de lección sirven bytes estáticos.
+
+Uso
+---
+::
+
+    pronunciapa tts precompute --lang es --lang en
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+from ipa_core.ipa_catalog import load_catalog, normalize_lang, resolve_catalog_dir
+from ipa_core.plugins import registry
+from ipa_core.textref.warmup import collect_practice_texts
+from ipa_core.tts.cache import TTSAudioCache, instance_lease, provider_fingerprint, render_cached
+from ipa_core.tts.utils import voice_params
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PrecomputeReport:
+    """Resultado del precalculado de un idioma."""
+
+    lang: str
+    texts: int = 0
+    rendered: int = 0
+    cached: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "lang": self.lang,
+            "texts": self.texts,
+            "rendered": self.rendered,
+            "cached": self.cached,
+            "errors": list(self.errors),
+        }
+
+
+def catalog_languages() -> list[str]:
+    """Idiomas con catálogo (``{lang}.yaml``)."""
+    return sorted(
+        p.stem for p in resolve_catalog_dir().glob("*.yaml")
+        if not p.name.endswith("_learning.yaml")
+    )
+
+
+def catalog_example_texts(lang: str) -> list[str]:
+    """Todos los textos de ejemplo con audio en el catálogo (sin duplicados)."""
+    lang = normalize_lang(lang)
+    seen: dict[str, None] = {}
+    try:
+        catalog = load_catalog(lang)
+    except (FileNotFoundError, ValueError):
+        catalog = {}
+    for sound in catalog.get("sounds", []):
+        for context in (sound.get("contexts") or {}).values():
+            for seed in (context or {}).get("seeds", []) or []:
+                text = str(seed.get("text") or "").strip()
+                if text:
+                    seen.setdefault(text, None)
+    for text in collect_practice_texts(lang):
+        seen.setdefault(text, None)
+    return list(seen)
+
+
+async def precompute_catalog_audio(
+    name: str,
+    params: Optional[dict[str, Any]],
+    cache: TTSAudioCache,
+    langs: Optional[Iterable[str]] = None,
+    *,
+    concurrency: int = 2,
+    strict_mode: bool = False,
+) -> list[PrecomputeReport]:
+    """Sintetizar y cachear los ejemplos de ``langs`` (default: todos los catálogos)."""
+    reports = []
+    for lang in langs or catalog_languages():
+        report = PrecomputeReport(lang=lang)
+        texts = catalog_example_texts(lang)
+        report.texts = len(texts)
+        _, lang_params = voice_params(params, lang=lang)
+        tts = registry.resolve_tts(name, lang_params, strict_mode=strict_mode)
+        await tts.setup()
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        provider = provider_fingerprint(name, lang_params)
+
+        async def _one(text: str) -> None:
+            async with semaphore:
+                try:
+                    audio = await render_cached(
+                        instance_lease(tts), cache,
+                        provider=provider, text=text, lang=lang, params=lang_params,
+                    )
+                except Exception as exc:
+                    logger.debug("TTS precompute falló para %r: %s", text, exc)
+                    report.errors.append(text)
+                    return
+                if audio.hit:
+                    report.cached += 1
+                else:
+                    report.rendered += 1
+
+        try:
+            await asyncio.gather(*(_one(text) for text in texts))
+        finally:
+            await tts.teardown()
+        reports.append(report)
+    return reports
+
+
+__all__ = [
+    "PrecomputeReport",
+    "catalog_example_texts",
+    "catalog_languages",
+    "precompute_catalog_audio",
+]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+from ipa_core.plugins.base import BasePlugin
+from ipa_core.tts.cache import TTSAudioCache, instance_lease, render_cached
+from ipa_core.types import TTSResult
+
+
+class FakeTTS(BasePlugin):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    async def synthesize(self, text: str, *, lang: str, voice: Optional[str] = None,
+                         output_path: Optional[str] = None, **kw: Any) -> TTSResult:
+        self.calls += 1
+        await asyncio.sleep(0)
+        path = output_path or ""
+        Path(path).write_bytes(b"RIFF" + text.encode("utf-8") * 200)
+        return {"audio": {"path": path, "sample_rate": 22050, "channels": 1}, "meta": {"backend": "fake"}}
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+async def test_render_cached_synthesizes_once_per_content(tmp_path: Path) -> None:
+    tts = FakeTTS()
+    cache = TTSAudioCache(tmp_path)
+    render = lambda text, voice=None: render_cached(  # noqa: E731
+        instance_lease(tts), cache, provider="fake:1", text=text, lang="es", voice=voice,
+    )
+
+    first, second = await asyncio.gather(render("perro"), render("perro"))
+    again = await render("  perro ")
+    other_voice = await render("perro", voice="m1")
+
+    assert tts.calls == 2
+    assert first.key == second.key == again.key != other_voice.key
+    assert again.hit and not first.hit
+    assert again.wav_bytes() == b"RIFF" + b"perro" * 200
+    assert len(again.gzip_bytes()) < len(again.wav_bytes())
+
+
+@pytest.mark.unit
+def test_audio_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = TTSAudioCache(tmp_path, max_bytes=13_000)
+    keys = [c * 64 for c in "abc"]
+    past = time.time() - 60
+    for key in keys[:2]:
+        cache.put(key, os.urandom(6000))  # incomprimible: ~6 KB en disco
+        os.utime(cache._path(key), (past, past))
+    assert cache.get(keys[0]) is not None  # hit: "a" pasa a ser la más reciente
+    cache.put(keys[2], os.urandom(6000))
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None and cache.get(keys[2]) is not None
+    assert cache.evictions == 1 and cache.total_bytes() <= 13_000
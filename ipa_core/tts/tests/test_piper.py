@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import sys
+import types
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+from ipa_core.tts.piper import PiperTTS
+
+
+@dataclass
+class FakeSynthesisConfig:
+    speaker_id: Optional[int] = None
+    length_scale: Optional[float] = None
+    noise_scale: Optional[float] = None
+    noise_w_scale: Optional[float] = None
+
+
+class FakeVoice:
+    def __init__(self) -> None:
+        self.config = types.SimpleNamespace(speaker_id_map={"ana": 3})
+        self.configs: list[Any] = []
+
+    def synthesize_wav(self, text: str, wav_file: wave.Wave_write, syn_config: Any = None) -> None:
+        self.configs.append(syn_config)
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(22050)
+        wav_file.writeframes(b"\x00\x00" * 100)
+
+
+@pytest.mark.unit
+async def test_in_process_synthesis_passes_speaker_and_options(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "piper", types.SimpleNamespace(SynthesisConfig=FakeSynthesisConfig))
+    tts = PiperTTS({
+        "model_path": str(tmp_path / "voz.onnx"),
+        "speaker": "ana",
+        "options": {"length_scale": 1.2, "noise_scale": 0.5, "noise_w": 0.7},
+    })
+    tts._voice = FakeVoice()
+
+    result = await tts.synthesize("hola", lang="es", output_path=str(tmp_path / "out.wav"))
+
+    assert result["meta"]["in_process"] is True
+    assert tts._voice.configs == [FakeSynthesisConfig(3, 1.2, 0.5, 0.7)]
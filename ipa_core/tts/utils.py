@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+DEFAULT_VOICE_KEY = "default"
 
 
 def ensure_output_path(output_path: Optional[str], *, suffix: str) -> Path:
@@ -32,3 +34,47 @@ def read_audio_meta(path: Path, *, default_rate: int, default_channels: int) ->
         except Exception:
             return default_rate, default_channels
     return default_rate, default_channels
+
+
+def _merge_params(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+    """Mezcla ``override`` sobre ``base`` (un nivel de anidación: ``piper``, ``system``)."""
+    merged = dict(base)
+    for name, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(name), dict):
+            merged[name] = {**merged[name], **value}
+        else:
+            merged[name] = value
+    return merged
+
+
+def voice_params(
+    params: Optional[dict[str, Any]],
+    *,
+    lang: Optional[str] = None,
+    voice: Optional[str] = None,
+) -> tuple[str, dict[str, Any]]:
+    """Resolver ``(clave de voz, parámetros)`` para ``(lang, voice)``.
+
+    ``params["voices"]`` puede mapear una voz o un idioma a overrides de los
+    parámetros base (p. ej. otro ``model_path`` de Piper); sin override la
+    clave es ``"default"``.
+    """
+    base = dict(params or {})
+    voices = {str(k).lower(): dict(v or {}) for k, v in (base.pop("voices", None) or {}).items()}
+    for candidate in (voice, lang):
+        if candidate and candidate.lower() in voices:
+            key = candidate.lower()
+            return key, _merge_params(base, voices[key])
+    return DEFAULT_VOICE_KEY, base
+
+
+def configured_sample_rate(params: dict[str, Any]) -> Optional[int]:
+    """Frecuencia de salida configurada (``sample_rate`` global o del backend preferido)."""
+    if params.get("sample_rate"):
+        return int(params["sample_rate"])
+    prefer = str(params.get("prefer", "piper")).lower()
+    for name in (prefer, "piper", "system"):
+        sub = params.get(name)
+        if isinstance(sub, dict) and sub.get("sample_rate"):
+            return int(sub["sample_rate"])
+    return None
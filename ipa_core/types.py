@@ -32,17 +32,26 @@ Token = str  # Representa un símbolo o token IPA individual (por ejemplo, "a",
 TokenSeq = Sequence[Token]  # Secuencia ordenada de tokens IPA (la transcripción).
 
 
-class AudioInput(TypedDict):
+class _AudioFormat(TypedDict):
+    sample_rate: int
+    channels: int
+
+
+class AudioInput(_AudioFormat, total=False):
     """Describe un audio de entrada para el sistema.
 
     - path: ruta al archivo de audio en disco.
+    - pcm: muestras PCM 16-bit en memoria (``bytes``/``memoryview`` o
+      ``np.ndarray`` int16); alternativa a ``path`` que evita el disco
+      (ver ``ipa_core.audio.pcm``).
     - sample_rate: frecuencia de muestreo en Hz (p. ej., 16000).
     - channels: número de canales (1 para mono, 2 para estéreo).
+
+    Debe venir al menos uno de ``path`` o ``pcm``.
     """
 
     path: str
-    sample_rate: int
-    channels: int
+    pcm: Any
 
 
 class ASRResult(TypedDict, total=False):
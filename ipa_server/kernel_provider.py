@@ -1,69 +1,454 @@
 """Proveedor compartido del kernel HTTP.
 
-Centraliza el cache singleton para que los routers no dependan entre si.
+Centraliza el pool de kernels calientes para que los routers no dependan
+entre si ni paguen ``create_kernel`` + ``setup()`` en cada request.
+
+Cada variante del kernel se identifica con un :class:`KernelKey` (huella de
+la config efectiva + overrides del request).  La primera petición de una
+variante la construye y la calienta; las siguientes la reutilizan mediante
+``lease()``, que limita la concurrencia por variante con un semáforo.
+
+Los overrides vienen del cliente, así que las variantes con overrides se
+acotan con una política LRU: al superar el límite se libera la menos usada
+que no esté prestada.  Las variantes por defecto no cuentan para el límite;
+sólo se liberan cuando cambia la config (su huella deja de ser la actual).
+
+Variables de entorno
+--------------------
+``PRONUNCIAPA_KERNEL_PREWARM``
+    Variantes a calentar al arrancar la app, separadas por ``;``.  Cada
+    variante es ``default`` o una lista ``campo=valor`` separada por comas
+    (campos: model_pack, llm, backend, textref, comparator).  Ejemplo::
+
+        PRONUNCIAPA_KERNEL_PREWARM="default;textref=espeak,comparator=noop"
+
+``PRONUNCIAPA_KERNEL_MAX_CONCURRENCY``
+    Leases simultáneos permitidos por variante (default: 4).
+``PRONUNCIAPA_KERNEL_MAX_VARIANTS``
+    Variantes con overrides que se mantienen calientes (default: 8).
+
+El ASR de cada variante queda detrás de un
+:class:`~ipa_core.pipeline.scheduler.InferenceScheduler` cuando el backend
+admite lotes (``PRONUNCIAPA_ASR_BATCH_SIZE`` y afines).
 """
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
-from typing import Optional
+import os
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Optional
 
 from ipa_core.config import loader
+from ipa_core.config.overrides import apply_overrides
+from ipa_core.config.schema import AppConfig
 from ipa_core.kernel.core import Kernel, create_kernel
+from ipa_core.pipeline.scheduler import InferenceScheduler, scheduler_from_env
+from ipa_core.plugins import registry
 
 logger = logging.getLogger("ipa_server")
 
-_cached_kernel: Optional[Kernel] = None
-_kernel_ready = False
-_kernel_lock: Optional[asyncio.Lock] = None
+_DEFAULT_MAX_CONCURRENCY = 4
+_DEFAULT_MAX_VARIANTS = 8
+_OVERRIDE_FIELDS = ("model_pack", "llm", "backend", "textref", "comparator")
+
+
+@dataclass(frozen=True)
+class KernelKey:
+    """Identifica una variante del kernel dentro del pool."""
+
+    config_fingerprint: str
+    model_pack: Optional[str] = None
+    llm: Optional[str] = None
+    backend: Optional[str] = None
+    textref: Optional[str] = None
+    comparator: Optional[str] = None
+
+    @property
+    def overrides(self) -> dict[str, Optional[str]]:
+        return {name: getattr(self, name) for name in _OVERRIDE_FIELDS}
+
+    @property
+    def is_default(self) -> bool:
+        return not any(self.overrides.values())
+
+    def label(self) -> str:
+        """Etiqueta legible para logs y métricas."""
+        parts = [f"{k}={v}" for k, v in self.overrides.items() if v]
+        return ",".join(parts) or "default"
+
+
+@dataclass
+class _PoolEntry:
+    kernel: Kernel
+    semaphore: asyncio.Semaphore
+    ready: bool = False
+    warmup_ms: Optional[float] = None
+    leases: int = 0
+    in_use: int = 0
+    # Leases en curso, incluidos los que esperan setup o semáforo: una
+    # entrada con referencias no se desaloja.
+    refs: int = 0
+    setup_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+KernelFactory = Callable[[AppConfig], Kernel]
+
+
+def config_fingerprint(cfg: AppConfig) -> str:
+    """Huella estable de la config efectiva (cambia si cambia cualquier campo)."""
+    payload = cfg.model_dump_json()
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _normalize_override(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    value = value.strip().lower()
+    return value or None
+
+
+class KernelPool:
+    """Pool de kernels calientes indexado por :class:`KernelKey`.
+
+    Parameters
+    ----------
+    factory:
+        Construye el kernel base a partir de la config efectiva
+        (default: ``create_kernel``).  Los overrides de plugins
+        (backend/textref/comparator) se resuelven encima en modo estricto.
+    max_concurrency:
+        Leases simultáneos permitidos por variante.
+    max_variants:
+        Variantes con overrides retenidas (LRU); las variantes por defecto
+        no cuentan.
+    """
+
+    def __init__(
+        self,
+        *,
+        factory: KernelFactory = create_kernel,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        max_variants: int = _DEFAULT_MAX_VARIANTS,
+    ) -> None:
+        self._factory = factory
+        self._max_concurrency = max(1, int(max_concurrency))
+        self._max_variants = max(1, int(max_variants))
+        self._entries: OrderedDict[KernelKey, _PoolEntry] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._warmups = 0
+        self._warmup_ms_total = 0.0
+
+    # ------------------------------------------------------------------
+    # Claves
+    # ------------------------------------------------------------------
+
+    def key_for(
+        self,
+        *,
+        model_pack: Optional[str] = None,
+        llm: Optional[str] = None,
+        backend: Optional[str] = None,
+        textref: Optional[str] = None,
+        comparator: Optional[str] = None,
+        cfg: Optional[AppConfig] = None,
+    ) -> KernelKey:
+        """Construye la clave de una variante para la config efectiva actual."""
+        cfg = cfg or loader.load_config()
+        return KernelKey(
+            config_fingerprint=config_fingerprint(cfg),
+            model_pack=_normalize_override(model_pack),
+            llm=_normalize_override(llm),
+            backend=_normalize_override(backend),
+            textref=_normalize_override(textref),
+            comparator=_normalize_override(comparator),
+        )
+
+    # ------------------------------------------------------------------
+    # Construcción y calentamiento
+    # ------------------------------------------------------------------
+
+    def get(self, key: KernelKey) -> Kernel:
+        """Retorna el kernel de la variante, construyéndolo si no está en el pool.
+
+        No llama a ``setup()`` ni guarda el kernel nuevo: permite validarlo
+        (p.ej. el ``output_type`` del ASR) antes de cargar modelos pesados.
+        La variante entra al pool con el primer ``lease()``/``acquire()``,
+        al que se le puede pasar el kernel ya validado.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry.kernel
+        return self._build(key)
+
+    def _build(self, key: KernelKey) -> Kernel:
+        cfg = apply_overrides(
+            loader.load_config(), model_pack=key.model_pack, llm_name=key.llm
+        )
+        kernel = self._factory(cfg)
+        # Los overrides de plugins se resuelven en modo estricto: un nombre
+        # inexistente debe ser un error del cliente, no un fallback silencioso.
+        if key.backend:
+            kernel.asr = registry.resolve_asr(key.backend, {}, strict_mode=True)
+        if key.textref:
+            kernel.textref = registry.resolve_textref(key.textref, {}, strict_mode=True)
+        if key.comparator:
+            kernel.comp = registry.resolve_comparator(key.comparator, {}, strict_mode=True)
+        kernel.asr = scheduler_from_env(kernel.asr)
+        return kernel
+
+    async def _ensure_ready(self, key: KernelKey, entry: _PoolEntry) -> None:
+        if entry.ready:
+            self._hits += 1
+            return
+        async with entry.setup_lock:
+            if entry.ready:
+                self._hits += 1
+                return
+            self._misses += 1
+            started = time.perf_counter()
+            await entry.kernel.setup()
+            entry.warmup_ms = (time.perf_counter() - started) * 1000
+            entry.ready = True
+            self._warmups += 1
+            self._warmup_ms_total += entry.warmup_ms
+            logger.info(
+                "Kernel variant '%s' warmed up in %.1f ms", key.label(), entry.warmup_ms
+            )
 
+    async def _admit(self, key: KernelKey, kernel: Optional[Kernel] = None) -> _PoolEntry:
+        """Retorna la entrada de la variante, agregándola (y desalojando) si falta."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            await self._evict(key.config_fingerprint)
+            return entry
+        entry = _PoolEntry(
+            kernel=kernel if kernel is not None else self._build(key),
+            semaphore=asyncio.Semaphore(self._max_concurrency),
+        )
+        self._entries[key] = entry
+        await self._evict(key.config_fingerprint)
+        return entry
 
-def _get_kernel_lock() -> asyncio.Lock:
-    """Lazy-init del lock dentro del event loop activo."""
-    global _kernel_lock
-    if _kernel_lock is None:
-        _kernel_lock = asyncio.Lock()
-    return _kernel_lock
+    async def _evict(self, current_fingerprint: str) -> None:
+        """Libera variantes de una config anterior y las LRU por encima del límite.
+
+        Una variante (incluida la por defecto) cuya huella ya no coincide con
+        la config actual no volverá a pedirse: se libera en cuanto no tenga
+        leases en curso.
+        """
+        for key, entry in list(self._entries.items()):
+            if key.config_fingerprint != current_fingerprint and not entry.refs:
+                await self._drop(key, "stale config")
+        candidates = [key for key in self._entries if not key.is_default]
+        excess = len(candidates) - self._max_variants
+        for key in candidates:
+            if excess <= 0:
+                break
+            if self._entries[key].refs:
+                continue
+            await self._drop(key, "LRU")
+            excess -= 1
+
+    async def _drop(self, key: KernelKey, reason: str) -> None:
+        entry = self._entries.pop(key)
+        self._evictions += 1
+        logger.info("Kernel variant '%s' evicted from pool (%s)", key.label(), reason)
+        if entry.ready:
+            try:
+                await entry.kernel.teardown()
+            except Exception as exc:  # pragma: no cover
+                logger.warning("Error tearing down kernel '%s': %s", key.label(), exc)
+
+    async def acquire(self, key: KernelKey, kernel: Optional[Kernel] = None) -> Kernel:
+        """Retorna el kernel de la variante ya calentado (sin límite de concurrencia)."""
+        entry = await self._admit(key, kernel)
+        entry.refs += 1
+        try:
+            await self._ensure_ready(key, entry)
+        finally:
+            entry.refs -= 1
+        return entry.kernel
+
+    @asynccontextmanager
+    async def lease(self, key: KernelKey, kernel: Optional[Kernel] = None) -> AsyncIterator[Kernel]:
+        """Presta el kernel caliente de la variante con concurrencia acotada.
+
+        ``kernel`` es el candidato devuelto por :meth:`get` (ya validado);
+        se usa sólo si la variante todavía no está en el pool.
+        """
+        entry = await self._admit(key, kernel)
+        entry.refs += 1
+        try:
+            await self._ensure_ready(key, entry)
+            async with entry.semaphore:
+                entry.leases += 1
+                entry.in_use += 1
+                try:
+                    yield entry.kernel
+                finally:
+                    entry.in_use -= 1
+        finally:
+            entry.refs -= 1
+
+    async def prewarm(self, keys: list[KernelKey]) -> None:
+        """Calienta las variantes indicadas; los fallos se registran y se omiten."""
+        for key in keys:
+            try:
+                await self.acquire(key)
+            except Exception as exc:
+                self._entries.pop(key, None)
+                logger.warning("Kernel prewarm failed for '%s': %s", key.label(), exc)
+
+    def peek(self, key: KernelKey) -> Optional[Kernel]:
+        """Retorna el kernel de la variante si ya está listo, sin inicializarlo."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.ready:
+            return entry.kernel
+        return None
+
+    async def teardown(self) -> None:
+        """Libera todos los kernels del pool."""
+        entries, self._entries = self._entries, OrderedDict()
+        for key, entry in entries.items():
+            if not entry.ready:
+                continue
+            try:
+                await entry.kernel.teardown()
+                logger.info("Kernel variant '%s' torn down", key.label())
+            except Exception as exc:  # pragma: no cover
+                logger.warning("Error tearing down kernel '%s': %s", key.label(), exc)
+
+    # ------------------------------------------------------------------
+    # Métricas
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        """Métricas de hit/miss y calentamiento por variante."""
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "warmups": self._warmups,
+            "warmup_ms_total": round(self._warmup_ms_total, 2),
+            "max_concurrency": self._max_concurrency,
+            "max_variants": self._max_variants,
+            "evictions": self._evictions,
+            "variants": [
+                {
+                    "variant": key.label(),
+                    "config": key.config_fingerprint,
+                    "ready": entry.ready,
+                    "warmup_ms": round(entry.warmup_ms, 2) if entry.warmup_ms is not None else None,
+                    "leases": entry.leases,
+                    "in_use": entry.in_use,
+                    "asr_scheduler": _scheduler_stats(entry.kernel),
+                }
+                for key, entry in self._entries.items()
+            ],
+        }
+
+
+def _scheduler_stats(kernel: Kernel) -> Optional[dict[str, Any]]:
+    asr = kernel.asr
+    return asr.stats() if isinstance(asr, InferenceScheduler) else None
+
+
+def parse_prewarm_spec(spec: str) -> list[dict[str, Optional[str]]]:
+    """Parsea ``PRONUNCIAPA_KERNEL_PREWARM`` en una lista de overrides."""
+    variants: list[dict[str, Optional[str]]] = []
+    for raw in spec.split(";"):
+        raw = raw.strip()
+        if not raw:
+            continue
+        if raw.lower() == "default":
+            variants.append({})
+            continue
+        overrides: dict[str, Optional[str]] = {}
+        for item in raw.split(","):
+            name, sep, value = item.partition("=")
+            name = name.strip().lower()
+            if not sep or name not in _OVERRIDE_FIELDS:
+                logger.warning("Ignoring invalid kernel prewarm entry: %r", item)
+                continue
+            overrides[name] = value.strip() or None
+        if overrides:
+            variants.append(overrides)
+    return variants
+
+
+# ----------------------------------------------------------------------
+# Pool global del proceso
+# ----------------------------------------------------------------------
+
+_pool: Optional[KernelPool] = None
+
+
+def get_kernel_pool() -> KernelPool:
+    """Retorna el pool global (creado perezosamente)."""
+    global _pool
+    if _pool is None:
+        max_concurrency = int(
+            os.environ.get("PRONUNCIAPA_KERNEL_MAX_CONCURRENCY", _DEFAULT_MAX_CONCURRENCY)
+        )
+        max_variants = int(
+            os.environ.get("PRONUNCIAPA_KERNEL_MAX_VARIANTS", _DEFAULT_MAX_VARIANTS)
+        )
+        _pool = KernelPool(max_concurrency=max_concurrency, max_variants=max_variants)
+    return _pool
+
+
+async def prewarm_kernels(spec: Optional[str] = None) -> None:
+    """Calienta las variantes configuradas en ``PRONUNCIAPA_KERNEL_PREWARM``."""
+    spec = spec if spec is not None else os.environ.get("PRONUNCIAPA_KERNEL_PREWARM", "")
+    variants = parse_prewarm_spec(spec)
+    if not variants:
+        return
+    pool = get_kernel_pool()
+    cfg = loader.load_config()
+    await pool.prewarm([pool.key_for(cfg=cfg, **overrides) for overrides in variants])
 
 
 async def get_or_create_kernel() -> Kernel:
-    """Retorna un kernel caliente reutilizable para endpoints HTTP."""
-    global _cached_kernel, _kernel_ready
-    if _cached_kernel is not None and _kernel_ready:
-        return _cached_kernel
-    async with _get_kernel_lock():
-        if _cached_kernel is not None and _kernel_ready:
-            return _cached_kernel
-        cfg = loader.load_config()
-        _cached_kernel = create_kernel(cfg)
-        await _cached_kernel.setup()
-        _kernel_ready = True
-        logger.info("Kernel singleton created and ready")
-        return _cached_kernel
+    """Retorna el kernel caliente de la variante por defecto."""
+    pool = get_kernel_pool()
+    return await pool.acquire(pool.key_for())
 
 
 def get_kernel() -> Kernel:
-    """Crea un kernel no cacheado para dependencias request-scoped."""
+    """Crea un kernel no cacheado (fuera del pool)."""
     cfg = loader.load_config()
     return create_kernel(cfg)
 
 
 async def teardown_kernel_singleton() -> None:
-    """Libera el kernel cacheado durante el apagado de la app."""
-    global _cached_kernel, _kernel_ready
-    if _cached_kernel is not None:
-        try:
-            await _cached_kernel.teardown()
-            logger.info("Kernel singleton torn down")
-        except Exception as exc:  # pragma: no cover
-            logger.warning("Error tearing down kernel singleton: %s", exc)
-        finally:
-            _cached_kernel = None
-            _kernel_ready = False
+    """Libera todos los kernels cacheados durante el apagado de la app."""
+    global _pool
+    pool, _pool = _pool, None
+    if pool is not None:
+        await pool.teardown()
 
 
 def peek_kernel() -> Optional[Kernel]:
-    """Retorna el kernel cacheado si ya está listo, sin forzar inicialización."""
-    if _cached_kernel is not None and _kernel_ready:
-        return _cached_kernel
-    return None
\ No newline at end of file
+    """Retorna el kernel por defecto si ya está listo, sin forzar inicialización."""
+    if _pool is None:
+        return None
+    try:
+        return _pool.peek(_pool.key_for())
+    except Exception:  # pragma: no cover - config inválida
+        return None
+
+
+def kernel_pool_stats() -> dict[str, Any]:
+    """Métricas del pool global (vacías si aún no se creó)."""
+    if _pool is None:
+        return KernelPool().stats()
+    return _pool.stats()
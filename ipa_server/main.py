@@ -21,6 +21,7 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from ipa_core.audio.ffmpeg import find_ffmpeg_binary
+from ipa_core.kernel.executors import shutdown_executors
 from ipa_core.errors import (
     FileNotFound,
     KernelError,
@@ -29,7 +30,8 @@ from ipa_core.errors import (
     ValidationError,
 )
 from ipa_server.http_errors import error_response, from_request, kernel_error_response, validation_error_response
-from ipa_server.kernel_provider import teardown_kernel_singleton
+from ipa_server.kernel_provider import prewarm_kernels, teardown_kernel_singleton
+from ipa_server.tts_provider import prewarm_tts, teardown_tts_registry
 from ipa_server.realtime import realtime_router
 from ipa_server.routers.debug import router as debug_router
 from ipa_server.routers.drills import router as drills_router
@@ -150,10 +152,14 @@ def _register_exception_handlers(app: FastAPI) -> None:
 @asynccontextmanager
 async def _app_lifespan(_app: FastAPI):
     """Manage app lifecycle resources."""
+    await prewarm_kernels()
+    await prewarm_tts()
     try:
         yield
     finally:
+        await teardown_tts_registry()
         await teardown_kernel_singleton()
+        shutdown_executors(wait=False)
 
 
 def get_app() -> FastAPI:
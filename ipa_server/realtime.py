@@ -14,17 +14,18 @@ import json
 import logging
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, AsyncContextManager, Dict, Optional
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 
 from ipa_core.audio.stream import AudioBuffer, AudioSegment, StreamConfig, StreamState
+from ipa_core.audio.streaming_asr import MIN_STEP_MS, StreamingTranscriber
 from ipa_core.config import loader
-from ipa_core.kernel.core import create_kernel, Kernel
-from ipa_core.plugins import registry
+from ipa_core.kernel.core import Kernel
 from ipa_core.services.comparison import ComparisonService
 from ipa_core.services.transcription import TranscriptionService
+from ipa_server.kernel_provider import KernelKey, KernelPool, get_kernel_pool
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +48,8 @@ class WSConfig(BaseModel):
     reference_text: Optional[str] = None
     mode: str = "objective"
     evaluation_level: str = "phonemic"
+    streaming: bool = False
+    partial_interval_ms: int = 300
 
 
 class WSStateUpdate(BaseModel):
@@ -92,20 +95,34 @@ class RealtimeSession:
     
     Mantiene el estado de una conexión WebSocket individual,
     incluyendo el buffer de audio y la configuración.
+
+    El kernel no es propio de la sesión: se toma caliente del pool compartido
+    (:mod:`ipa_server.kernel_provider`), así que el handshake no carga modelos,
+    y cada segmento se procesa dentro de un ``lease`` cuyo semáforo por
+    variante acota las inferencias simultáneas de todas las sesiones.
     """
     
     def __init__(
         self,
         websocket: WebSocket,
         config: WSConfig,
+        *,
+        pool: Optional[KernelPool] = None,
     ) -> None:
         self.websocket = websocket
         self.ws_config = config
         self.kernel: Optional[Kernel] = None
         self.is_active = True
+        self._pool = pool or get_kernel_pool()
+        self._kernel_key: Optional[KernelKey] = None
+        self._transcription: Optional[TranscriptionService] = None
+        self._comparison: Optional[ComparisonService] = None
+        self._stream: Optional[StreamingTranscriber] = None
+        self._partial_task: Optional[asyncio.Task] = None
         
         # Cargar configuración de realtime desde YAML
         cfg = loader.load_config()
+        self._cfg = cfg
         realtime_cfg = getattr(cfg, "realtime", None)
         
         stream_config = StreamConfig(
@@ -114,6 +131,7 @@ class RealtimeSession:
             frame_ms=30,
             max_buffer_seconds=30,
         )
+        self._stream_config = stream_config
         
         # Crear buffer con callbacks
         self.buffer = AudioBuffer(
@@ -123,22 +141,45 @@ class RealtimeSession:
         )
     
     async def setup(self) -> None:
-        """Inicializar kernel y servicios."""
+        """Tomar el kernel caliente del pool y crear los servicios de la sesión."""
         try:
-            cfg = loader.load_config()
-            self.kernel = create_kernel(cfg)
-            await self.kernel.setup()
+            self._kernel_key = self._pool.key_for(cfg=self._cfg)
+            self.kernel = await self._pool.acquire(self._kernel_key)
+            self._transcription = TranscriptionService(
+                preprocessor=self.kernel.pre,
+                asr=self.kernel.asr,
+                textref=self.kernel.textref,
+                default_lang=self.ws_config.lang,
+            )
+            self._comparison = ComparisonService(
+                preprocessor=self.kernel.pre,
+                asr=self.kernel.asr,
+                textref=self.kernel.textref,
+                comparator=self.kernel.comp,
+                default_lang=self.ws_config.lang,
+            )
+            self._configure_stream()
             logger.info(f"Sesión realtime iniciada: lang={self.ws_config.lang}")
         except Exception as e:
             logger.error(f"Error inicializando sesión realtime: {e}")
             raise
     
+    def _lease(self) -> AsyncContextManager[Kernel]:
+        """Lease del kernel de la sesión en el pool (requiere ``setup()``)."""
+        if self._kernel_key is None:
+            raise RuntimeError("Sesión realtime sin kernel: llamar a setup() primero")
+        return self._pool.lease(self._kernel_key)
+
     async def teardown(self) -> None:
-        """Limpiar recursos."""
+        """Limpiar recursos (el kernel es del pool y sigue caliente)."""
         self.is_active = False
         self.buffer.reset()
-        if self.kernel:
-            await self.kernel.teardown()
+        if self._partial_task and not self._partial_task.done():
+            self._partial_task.cancel()
+        self._stream = None
+        self.kernel = None
+        self._transcription = None
+        self._comparison = None
     
     async def _on_state_change(self, state: StreamState) -> None:
         """Callback cuando cambia el estado del buffer."""
@@ -160,28 +201,21 @@ class RealtimeSession:
     
     async def _on_segment_ready(self, segment: AudioSegment) -> None:
         """Callback cuando un segmento está listo para procesar."""
-        if not self.is_active or not self.kernel:
+        if not self.is_active or self._transcription is None:
             return
         
         try:
+            if self._stream is not None:
+                await self._send_final(segment.duration_ms)
             # Si hay texto de referencia, comparar
             if self.ws_config.reference_text:
-                await self._send_comparison(
-                    segment_path=str(segment.audio_path),
-                    duration_ms=segment.duration_ms,
-                )
-            else:
-                service = TranscriptionService(
-                    preprocessor=self.kernel.pre,
-                    asr=self.kernel.asr,
-                    textref=self.kernel.textref,
-                    default_lang=self.ws_config.lang,
-                )
-
-                result = await service.transcribe_file(
-                    str(segment.audio_path),
-                    lang=self.ws_config.lang,
-                )
+                await self._send_comparison(segment, duration_ms=segment.duration_ms)
+            elif self._stream is None:
+                async with self._lease():
+                    result = await self._transcription.transcribe_audio(
+                        segment.audio_input(),
+                        lang=self.ws_config.lang,
+                    )
 
                 # Solo transcripción
                 msg = WSTranscriptionResult(
@@ -200,33 +234,21 @@ class RealtimeSession:
         except Exception as e:
             logger.error(f"Error procesando segmento: {e}")
             await self._send_error(str(e), "processing_error")
-        finally:
-            # Limpiar archivo temporal
-            try:
-                segment.audio_path.unlink(missing_ok=True)
-            except Exception:
-                pass
     
-    async def _send_comparison(self, segment_path: str, duration_ms: int) -> None:
+    async def _send_comparison(self, segment: AudioSegment, duration_ms: int) -> None:
         """Enviar resultado de comparación."""
-        if not self.kernel:
+        if self._comparison is None:
             return
         
         try:
-            service = ComparisonService(
-                preprocessor=self.kernel.pre,
-                asr=self.kernel.asr,
-                textref=self.kernel.textref,
-                comparator=self.kernel.comp,
-                default_lang=self.ws_config.lang,
-            )
-            payload = await service.compare_file_detail(
-                segment_path,
-                self.ws_config.reference_text or "",
-                lang=self.ws_config.lang,
-                mode=self.ws_config.mode,
-                evaluation_level=self.ws_config.evaluation_level,
-            )
+            async with self._lease():
+                payload = await self._comparison.compare_audio_detail(
+                    segment.audio_input(),
+                    self.ws_config.reference_text or "",
+                    lang=self.ws_config.lang,
+                    mode=self.ws_config.mode,
+                    evaluation_level=self.ws_config.evaluation_level,
+                )
 
             compare_payload = payload.to_response()
 
@@ -244,6 +266,42 @@ class RealtimeSession:
             logger.error(f"Error en comparación: {e}")
             await self._send_error(str(e), "comparison_error")
     
+    def _configure_stream(self) -> None:
+        """(Re)crear el transcriptor incremental según ``ws_config.streaming``."""
+        if not self.ws_config.streaming or self.kernel is None:
+            self._stream = None
+            return
+        self.ws_config.partial_interval_ms = max(MIN_STEP_MS, self.ws_config.partial_interval_ms)
+        self._stream = StreamingTranscriber(
+            self.kernel.asr,
+            lang=self.ws_config.lang,
+            step_ms=self.ws_config.partial_interval_ms,
+            max_buffer_seconds=self._stream_config.max_buffer_seconds,
+            lease=self._lease,
+        )
+
+    async def _send_partial(self) -> None:
+        """Enviar la hipótesis parcial del enunciado en curso."""
+        stream = self._stream
+        if stream is None:
+            return
+        try:
+            hypothesis = await stream.partial()
+            if hypothesis is not None and hypothesis.tokens and self.is_active:
+                await self.websocket.send_json({"type": "partial", "data": hypothesis.to_payload()})
+        except Exception as e:
+            logger.warning(f"Error en transcripción parcial: {e}")
+
+    async def _send_final(self, duration_ms: int) -> None:
+        """Cerrar el enunciado en curso y enviar su hipótesis final."""
+        stream = self._stream
+        if stream is None:
+            return
+        hypothesis = await stream.finish()
+        payload = hypothesis.to_payload()
+        payload["meta"]["duration_ms"] = duration_ms
+        await self.websocket.send_json({"type": "final", "data": payload})
+
     async def _send_error(self, message: str, code: str = "unknown") -> None:
         """Enviar mensaje de error."""
         try:
@@ -259,10 +317,19 @@ class RealtimeSession:
             pass
     
     async def handle_audio(self, audio_data: bytes) -> None:
-        """Procesar chunk de audio recibido."""
+        """Procesar chunk de audio recibido.
+
+        El transcriptor incremental sólo recibe audio mientras el VAD del
+        buffer considera que hay un enunciado en curso: el silencio previo
+        no se transcribe.
+        """
         if not self.is_active:
             return
-        await self.buffer.add_chunk(audio_data)
+        state = await self.buffer.add_chunk(audio_data)
+        stream = self._stream
+        if stream is not None and state.is_speaking and stream.feed(audio_data):
+            if self._partial_task is None or self._partial_task.done():
+                self._partial_task = asyncio.create_task(self._send_partial())
     
     async def _handle_config_message(self, data: dict) -> None:
         """Actualizar configuración desde mensaje JSON."""
@@ -270,6 +337,14 @@ class RealtimeSession:
         if "reference_text" in data: self.ws_config.reference_text = data["reference_text"]
         if "mode" in data: self.ws_config.mode = data["mode"]
         if "evaluation_level" in data: self.ws_config.evaluation_level = data["evaluation_level"]
+        if "streaming" in data: self.ws_config.streaming = bool(data["streaming"])
+        if "partial_interval_ms" in data:
+            try:
+                self.ws_config.partial_interval_ms = max(MIN_STEP_MS, int(data["partial_interval_ms"]))
+            except (TypeError, ValueError):
+                logger.warning("partial_interval_ms inválido: %r", data["partial_interval_ms"])
+        if {"lang", "streaming", "partial_interval_ms"} & data.keys():
+            self._configure_stream()
         logger.info(f"Config actualizada: {self.ws_config}")
 
     async def handle_message(self, message: dict) -> None:
@@ -282,6 +357,8 @@ class RealtimeSession:
             await self.buffer.flush()
         elif msg_type == "reset":
             self.buffer.reset()
+            if self._stream is not None:
+                self._stream.reset()
             await self._on_state_change(self.buffer.state)
         elif msg_type == "ping":
             await self.websocket.send_json({"type": "pong"})
@@ -301,6 +378,8 @@ async def _process_ws_text_message(session: RealtimeSession, text_msg: str) -> N
 async def _run_ws_loop(websocket: WebSocket, session: RealtimeSession) -> None:
     while True:
         message = await websocket.receive()
+        if message.get("type") == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000))
         if "text" in message:
             await _process_ws_text_message(session, message["text"])
         elif "bytes" in message:
@@ -354,6 +433,10 @@ async def realtime_status() -> dict:
             "channels": 1,
             "sample_width": 16,
         },
+        "streaming": {
+            "config": {"streaming": True, "partial_interval_ms": 300},
+            "messages": ["partial", "final"],
+        },
     }
 
 
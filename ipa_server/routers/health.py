@@ -12,8 +12,11 @@ from ipa_core.audio.ffmpeg import find_ffmpeg_binary
 from ipa_core.config import loader
 from ipa_core.errors import NotReadyError
 from ipa_core.kernel.core import _normalize_llm_name
+from ipa_core.kernel.executors import executor_stats
 from ipa_core.plugins import registry
-from ipa_server.kernel_provider import peek_kernel
+from ipa_core.textref.cache import global_cache_stats
+from ipa_server.kernel_provider import kernel_pool_stats, peek_kernel
+from ipa_server.tts_provider import tts_registry_stats
 
 router = APIRouter(tags=["health"])
 
@@ -61,6 +64,12 @@ def _diagnose_llm(cfg) -> dict[str, Any]:
 
 def _diagnose_tts(cfg) -> dict[str, Any]:
     tts_name = cfg.tts.name
+    stats = tts_registry_stats()
+    if stats is not None and stats["voices"]:
+        return _safe_component_ready(
+            tts_name,
+            extra={"source": "tts_registry", "voices": stats["voices"], "memory_bytes": stats["memory_bytes"]},
+        )
     active_kernel = peek_kernel()
     if active_kernel is not None and active_kernel.tts is not None:
         return _safe_component_ready(tts_name, extra={"source": "kernel_cache"})
@@ -112,6 +121,10 @@ async def health() -> dict[str, Any]:
         "strict_mode": cfg.strict_mode,
         "components": components,
         "ffmpeg": {"configured": bool(ffmpeg_path), "path": ffmpeg_path},
+        "kernel_pool": kernel_pool_stats(),
+        "executors": executor_stats(),
+        "textref_cache": global_cache_stats(),
+        "tts_registry": tts_registry_stats(),
         "language_packs": packs,
         "local_models": None,
     }
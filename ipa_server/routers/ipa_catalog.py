@@ -7,12 +7,12 @@ import re
 from typing import Any, Optional
 from urllib.parse import quote
 
-from fastapi import APIRouter
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Request
 
 from ipa_core.services.catalog import CatalogService
 from ipa_server.http_errors import error_response
 from ipa_server.models import SoundLesson
+from ipa_server.tts_provider import cached_audio_response, synthesize_cached
 
 router = APIRouter(prefix="/api", tags=["ipa-catalog"])
 logger = logging.getLogger(__name__)
@@ -55,19 +55,19 @@ def _handle_audio_info_error(e: Exception):
     return error_response(status_code=500, detail=str(e), error_type="internal_error")
 
 @router.get("/ipa-sounds/audio")
-async def get_ipa_sound_audio(sound_id: str, example: Optional[str] = None):
+async def get_ipa_sound_audio(request: Request, sound_id: str, example: Optional[str] = None):
     try:
         info = catalog_service.get_sound_audio_info(sound_id, example)
     except Exception as e:
         return _handle_audio_info_error(e)
 
     try:
-        output_path = await catalog_service.generate_audio_file(info["lang"], info["example"])
+        audio = await synthesize_cached(info["example"], lang=info["lang"])
         safe_sound = _safe_filename_part(sound_id.replace("/", "_"), fallback="sound")
         safe_example = _safe_filename_part(info["example"], fallback="example")
         
-        return FileResponse(
-            path=output_path, media_type="audio/wav", filename=f"{safe_sound}_{safe_example}.wav",
+        return cached_audio_response(
+            request, audio, filename=f"{safe_sound}_{safe_example}.wav",
             headers={"X-Example-Text": _ascii_header_value(info["example"]), "X-Sound-IPA": _ascii_header_value(info["ipa"])}
         )
     except Exception as e:
@@ -1,28 +1,37 @@
 """Core pipeline endpoints: transcribe, textref, compare, feedback."""
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import tempfile
 from pathlib import Path
-from typing import Any, Optional, Union, cast
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Union, cast
 
 from fastapi import APIRouter, Depends, File, Form, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from ipa_core.audio.markers import mark_audio_preprocessed
 from ipa_core.audio.files import cleanup_temp, ensure_wav
+from ipa_core.audio.pcm import (
+    decode_wav_pcm16,
+    has_pcm,
+    is_canonical_pcm,
+    pcm_input,
+    without_pcm,
+)
 from ipa_core.backends.audio_io import to_audio_input
-from ipa_core.config import loader
 from ipa_core.config.resolution import resolve_request_lang
-from ipa_core.config.overrides import apply_overrides
 from ipa_core.errors import ValidationError
-from ipa_core.kernel.core import Kernel, create_kernel
+from ipa_core.kernel.core import Kernel
+from ipa_core.kernel.executors import get_executor
 from ipa_core.normalization.resolve import resolve_pack_id
+from ipa_core.pipeline.concurrency import run_branches
 from ipa_core.pipeline.runner import run_pipeline_with_pack, execute_pipeline
 from ipa_core.pipeline.transcribe import EvaluationMode
 from ipa_core.pipeline.ipa_cleaning import clean_asr_tokens, clean_textref_tokens
 from ipa_core.phonology.representation import RepresentationLevel
-from ipa_core.plugins import registry
 from ipa_core.plugins.language_pack import LanguagePackPlugin
 from ipa_core.services.adaptation import adapt_settings
 from ipa_core.services.audio_quality import assess_audio_quality
@@ -30,10 +39,14 @@ from ipa_core.services.comparison import ComparisonService
 from ipa_core.services.feedback import FeedbackService
 from ipa_core.services.feedback_store import FeedbackStore
 from ipa_core.services.transcription import TranscriptionService
-from ipa_core.types import AudioInput
+from ipa_core.types import ASRResult, AudioInput
 from ipa_core.display.ipa_display import build_display, DisplayMode
 from ipa_server.http_errors import error_response
-from ipa_server.kernel_provider import get_kernel as _get_kernel, get_or_create_kernel
+from ipa_server.kernel_provider import (
+    KernelPool,
+    get_kernel_pool as _get_kernel_pool,
+    get_or_create_kernel,
+)
 from ipa_server.models import (
     CompareResponse,
     FeedbackResponse,
@@ -48,28 +61,27 @@ logger = logging.getLogger("ipa_server")
 router = APIRouter(prefix="/v1", tags=["pipeline"])
 
 
-def _build_kernel(
-    *,
-    model_pack: Optional[str] = None,
-    llm_name: Optional[str] = None,
-) -> Kernel:
-    cfg = loader.load_config()
-    cfg = apply_overrides(cfg, model_pack=model_pack, llm_name=llm_name)
-    return create_kernel(cfg)
-
+async def _process_upload(audio: UploadFile) -> AudioInput:
+    """Convierte un UploadFile en ``AudioInput``.
 
-async def _process_upload(audio: UploadFile) -> Path:
-    """Guarda un UploadFile en un archivo temporal y retorna su ruta."""
+    Un WAV PCM 16-bit a 16 kHz se decodifica en memoria (``pcm``) sin tocar
+    el disco; cualquier otro formato se guarda en un archivo temporal
+    (``path``) para que ``ensure_wav`` lo convierta con ffmpeg.
+    """
     from ipa_core.audio.files import _fix_wav_data_chunk
     suffix = Path(audio.filename).suffix if audio.filename else ".wav"
+    content = await audio.read()
+    if suffix.lower() == ".wav":
+        samples = decode_wav_pcm16(content)
+        if samples is not None:
+            return pcm_input(samples)
     with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        content = await audio.read()
         tmp.write(content)
         tmp_path = Path(tmp.name)
     # Corregir header WAV si el cliente (Flutter/record) escribió tamaños erróneos.
     if tmp_path.suffix.lower() == ".wav":
         _fix_wav_data_chunk(str(tmp_path))
-    return tmp_path
+    return {"path": str(tmp_path), "sample_rate": 16000, "channels": 1}
 
 
 def _asr_unavailable_response(*, backend_name: str, reason: str) -> JSONResponse:
@@ -117,10 +129,53 @@ def _assert_real_ipa_asr(asr_backend: Any) -> Optional[JSONResponse]:
     return None
 
 
-def _cleanup_uploaded_file(path: Path) -> None:
+def _cleanup_uploaded_file(upload: AudioInput) -> None:
     """Limpia archivos temporales de upload sin tapar errores previos."""
-    if path.exists():
-        cleanup_temp(str(path))
+    path = upload.get("path")
+    if path and not has_pcm(upload) and Path(path).exists():
+        cleanup_temp(path)
+
+
+def _ndjson(event: dict[str, Any]) -> bytes:
+    return (json.dumps(jsonable_encoder(event), ensure_ascii=False) + "\n").encode("utf-8")
+
+
+async def _feedback_event_stream(
+    run: Callable[
+        [Callable[[str], Awaitable[None]], Callable[[], Awaitable[None]]],
+        Awaitable[dict[str, Any]],
+    ],
+    cleanup: Callable[[], None],
+) -> AsyncIterator[bytes]:
+    """Eventos NDJSON de ``/v1/feedback`` con ``stream``.
+
+    ``token`` (varios), ``reset`` cuando el LLM descarta un intento (el
+    cliente borra los tokens recibidos), y al final ``result`` o ``error``.
+    """
+    queue: asyncio.Queue[Optional[dict[str, Any]]] = asyncio.Queue()
+
+    async def on_token(chunk: str) -> None:
+        await queue.put({"type": "token", "text": chunk})
+
+    async def on_reset() -> None:
+        await queue.put({"type": "reset"})
+
+    task = asyncio.ensure_future(run(on_token, on_reset))
+    task.add_done_callback(lambda _: queue.put_nowait(None))
+    try:
+        while (event := await queue.get()) is not None:
+            yield _ndjson(event)
+        try:
+            result = task.result()
+        except Exception as exc:
+            logger.warning("Feedback en streaming falló: %s", exc)
+            yield _ndjson({"type": "error", "detail": str(exc), "error_type": type(exc).__name__})
+        else:
+            yield _ndjson({"type": "result", "data": result})
+    finally:
+        if not task.done():
+            task.cancel()
+        cleanup()
 
 
 def _resolve_safe_client_path(raw_path: Optional[str], *, label: str) -> Optional[Path]:
@@ -159,36 +214,29 @@ async def transcribe(
     textref: Optional[str] = Form(None, description="Nombre del proveedor texto→IPA"),
     persist: Optional[bool] = Form(False, description="Si True, guarda el audio procesado"),
     user_id: Optional[str] = Form(None, description="ID de usuario (opcional)"),
-    kernel: Kernel = Depends(_get_kernel),
+    pool: KernelPool = Depends(_get_kernel_pool),
 ) -> Union[dict[str, Any], JSONResponse]:
     """Transcripción de audio a IPA usando el microkernel."""
     lang_resolved = resolve_request_lang(lang)
-    tmp_path = await _process_upload(audio)
+    upload = await _process_upload(audio)
     try:
-        if backend:
-            kernel.asr = registry.resolve_asr(
-                backend.lower(), {"lang": lang_resolved}, strict_mode=True
-            )
-        if textref:
-            kernel.textref = registry.resolve_textref(
-                textref.lower(), {"default_lang": lang_resolved}, strict_mode=True
-            )
+        key = pool.key_for(backend=backend, textref=textref)
         # Validate output_type BEFORE setup() — avoids loading heavy models for
         # non-IPA backends injected via the `backend` request parameter.
-        asr_guard = _assert_real_ipa_asr(kernel.asr)
+        candidate = pool.get(key)
+        asr_guard = _assert_real_ipa_asr(candidate.asr)
         if asr_guard:
             return asr_guard
-        await kernel.setup()
-        # (which also runs it) — no need to call it redundantly here.
-        service = TranscriptionService(
-            preprocessor=kernel.pre,
-            asr=kernel.asr,
-            textref=kernel.textref,
-            default_lang=lang_resolved,
-        )
-        payload = await service.transcribe_file(
-            str(tmp_path), lang=lang_resolved, user_id=user_id
-        )
+        async with pool.lease(key, candidate) as kernel:
+            service = TranscriptionService(
+                preprocessor=kernel.pre,
+                asr=kernel.asr,
+                textref=kernel.textref,
+                default_lang=lang_resolved,
+            )
+            payload = await service.transcribe_audio(
+                upload, lang=lang_resolved, user_id=user_id
+            )
         meta = payload.meta or {}
         return {
             "ipa": payload.ipa,
@@ -197,8 +245,7 @@ async def transcribe(
             "meta": meta,
         }
     finally:
-        await kernel.teardown()
-        _cleanup_uploaded_file(tmp_path)
+        _cleanup_uploaded_file(upload)
 
 
 @router.post("/textref", response_model=TextRefResponse)
@@ -206,36 +253,21 @@ async def textref_endpoint(
     text: str = Form(..., description="Texto a convertir a IPA"),
     lang: Optional[str] = Form(None, description="Idioma del texto"),
     textref: Optional[str] = Form(None, description="Nombre del proveedor texto→IPA"),
-    kernel: Kernel = Depends(_get_kernel),
+    pool: KernelPool = Depends(_get_kernel_pool),
 ) -> Union[dict[str, Any], JSONResponse]:
     """Convierte texto a IPA usando el proveedor TextRef."""
     lang_resolved = resolve_request_lang(lang)
-    try:
-        if textref:
-            kernel.textref = registry.resolve_textref(
-                textref.lower(), {"default_lang": lang_resolved}, strict_mode=True
-            )
-        await kernel.setup()
+    async with pool.lease(pool.key_for(textref=textref)) as kernel:
         tr_res = await kernel.textref.to_ipa(text, lang=lang_resolved)
-        tokens = tr_res.get("tokens", [])
-        meta = tr_res.get("meta", {})
-        return {
-            "ipa": " ".join(tokens),
-            "tokens": tokens,
-            "lang": lang_resolved,
-            "meta": meta,
-        }
-    finally:
-        await kernel.teardown()
-
+    tokens = tr_res.get("tokens", [])
+    meta = tr_res.get("meta", {})
+    return {
+        "ipa": " ".join(tokens),
+        "tokens": tokens,
+        "lang": lang_resolved,
+        "meta": meta,
+    }
 
-def _apply_plugins(kernel: Kernel, backend: Optional[str], textref: Optional[str], comparator: Optional[str], lang_source_resolved: str, lang_target_resolved: str) -> None:
-    if backend:
-        kernel.asr = registry.resolve_asr(backend.lower(), {"lang": lang_source_resolved}, strict_mode=True)
-    if textref:
-        kernel.textref = registry.resolve_textref(textref.lower(), {"default_lang": lang_target_resolved}, strict_mode=True)
-    if comparator:
-        kernel.comp = registry.resolve_comparator(comparator.lower(), {}, strict_mode=True)
 
 def _build_display_payload(ops: list, evaluation_level: str, score: float, display_mode: str) -> Optional[dict]:
     dm: DisplayMode = "casual" if display_mode == "casual" else "technical"
@@ -276,29 +308,29 @@ async def compare(
     display_mode: Optional[str] = Form(None, description="Modo de display IPA"),
     persist: Optional[bool] = Form(False, description="Si True, guarda el audio procesado"),
     user_id: Optional[str] = Form(None, description="ID de usuario (opcional)"),
-    kernel: Kernel = Depends(_get_kernel),
+    pool: KernelPool = Depends(_get_kernel_pool),
 ) -> Union[dict[str, Any], JSONResponse]:
     """Comparación de audio contra texto de referencia."""
     lang_source_resolved = resolve_request_lang(lang_source or lang)
     lang_target_resolved = resolve_request_lang(lang_target or lang)
     
-    tmp_path = await _process_upload(audio)
+    upload = await _process_upload(audio)
     try:
-        _apply_plugins(kernel, backend, textref, comparator, lang_source_resolved, lang_target_resolved)
-
-        asr_guard = _assert_real_ipa_asr(kernel.asr)
+        key = pool.key_for(backend=backend, textref=textref, comparator=comparator)
+        candidate = pool.get(key)
+        asr_guard = _assert_real_ipa_asr(candidate.asr)
         if asr_guard:
             return asr_guard
-        await kernel.setup()
-
-        service = ComparisonService(preprocessor=kernel.pre, asr=kernel.asr, textref=kernel.textref, comparator=kernel.comp, default_lang=lang_target_resolved)
-        compare_payload = await service.compare_file_detail(
-            str(tmp_path), text, target_ipa=target_ipa, lang=lang,
-            lang_source=lang_source_resolved, lang_target=lang_target_resolved,
-            evaluation_level=evaluation_level, force_phonetic=force_phonetic,
-            allow_quality_downgrade=allow_quality_downgrade, pack=pack,
-            mode=mode, user_id=user_id,
-        )
+
+        async with pool.lease(key, candidate) as kernel:
+            service = ComparisonService(preprocessor=kernel.pre, asr=kernel.asr, textref=kernel.textref, comparator=kernel.comp, default_lang=lang_target_resolved)
+            compare_payload = await service.compare_audio_detail(
+                upload, text, target_ipa=target_ipa, lang=lang,
+                lang_source=lang_source_resolved, lang_target=lang_target_resolved,
+                evaluation_level=evaluation_level, force_phonetic=force_phonetic,
+                allow_quality_downgrade=allow_quality_downgrade, pack=pack,
+                mode=mode, user_id=user_id,
+            )
         payload = compare_payload.to_response()
 
         if display_mode is not None:
@@ -313,11 +345,10 @@ async def compare(
 
         return payload
     finally:
-        await kernel.teardown()
-        _cleanup_uploaded_file(tmp_path)
+        _cleanup_uploaded_file(upload)
 
 
-def _get_cleaned_asr_tokens(asr_result: dict, lang: str) -> list[str]:
+def _get_cleaned_asr_tokens(asr_result: ASRResult, lang: str) -> list[str]:
     hyp_tokens = asr_result.get("tokens", [])
     if not hyp_tokens:
         raw_text = asr_result.get("raw_text", "")
@@ -358,20 +389,29 @@ async def quick_compare(
     asr_guard = _assert_real_ipa_asr(kernel.asr)
     if asr_guard: return asr_guard
     
-    tmp_path = await _process_upload(audio)
+    upload = await _process_upload(audio)
     wav_tmp = False
-    wav_path = str(tmp_path)
+    wav_path = ""
     try:
-        wav_path, wav_tmp = ensure_wav(str(tmp_path))
-
-        audio_in: AudioInput = to_audio_input(wav_path)
+        if is_canonical_pcm(upload):
+            audio_in: AudioInput = upload
+        else:
+            wav_path, wav_tmp = await get_executor("audio").run(ensure_wav, upload["path"])
+            audio_in = to_audio_input(wav_path)
         audio_pre = mark_audio_preprocessed(audio_in)
         pre_result = await kernel.pre.process_audio(cast(AudioInput, audio_pre))
         processed = pre_result.get("audio", audio_in)
 
-        asr_result = await kernel.asr.transcribe(processed, lang=lang_source_resolved)
-        hyp_tokens = _get_cleaned_asr_tokens(asr_result, lang_source_resolved)
-        ref_tokens = await _get_cleaned_ref_tokens(kernel, text, target_ipa, lang_target_resolved)
+        async def _observed_branch() -> tuple[ASRResult, list[str]]:
+            asr_result = await kernel.asr.transcribe(processed, lang=lang_source_resolved)
+            return asr_result, _get_cleaned_asr_tokens(asr_result, lang_source_resolved)
+
+        branches, timings = await run_branches({
+            "asr": _observed_branch,
+            "textref": lambda: _get_cleaned_ref_tokens(kernel, text, target_ipa, lang_target_resolved),
+        })
+        asr_result, hyp_tokens = branches["asr"]
+        ref_tokens = branches["textref"]
 
         result = await kernel.comp.compare(ref_tokens, hyp_tokens)
 
@@ -394,12 +434,13 @@ async def quick_compare(
                 "compare": result.get("meta", {}),
                 "lang_source": lang_source_resolved,
                 "lang_target": lang_target_resolved,
+                "timings": timings.to_dict(),
                 "quick": True,
             },
         }
     finally:
         if wav_tmp: cleanup_temp(wav_path)
-        _cleanup_uploaded_file(tmp_path)
+        _cleanup_uploaded_file(upload)
 
 
 @router.post("/feedback", response_model=FeedbackResponse)
@@ -435,63 +476,76 @@ async def feedback(
     ),
     persist: bool = Form(False, description="Guardar resultado localmente"),
     user_id: Optional[str] = Form(None, description="ID de usuario (opcional)"),
-) -> Union[dict[str, Any], JSONResponse]:
+    stream: bool = Form(
+        False,
+        description="Responder NDJSON: tokens del LLM a medida que llegan y luego el resultado",
+    ),
+    pool: KernelPool = Depends(_get_kernel_pool),
+) -> Union[dict[str, Any], JSONResponse, StreamingResponse]:
     """Analiza la pronunciacion y genera feedback con LLM local."""
     lang_source_resolved = resolve_request_lang(lang_source or lang)
     lang_target_resolved = resolve_request_lang(lang_target or lang)
-    tmp_path = await _process_upload(audio)
-    # Use the singleton kernel when no per-request overrides are needed.
-    # _build_kernel creates a fresh kernel (+ full Allosaurus load) each call.
-    use_singleton = model_pack is None and llm is None
-    if use_singleton:
-        kernel = await get_or_create_kernel()
-    else:
-        kernel = _build_kernel(model_pack=model_pack, llm_name=llm)
+    upload = await _process_upload(audio)
+    # Sin overrides se usa la variante por defecto; con model_pack/llm se
+    # reutiliza la variante correspondiente del pool (sin recargar Allosaurus).
+    key = pool.key_for(model_pack=model_pack, llm=llm)
+    streaming = False
     try:
         # Validate output_type BEFORE setup() — see note in /v1/transcribe.
-        asr_guard = _assert_real_ipa_asr(kernel.asr)
+        candidate = pool.get(key)
+        asr_guard = _assert_real_ipa_asr(candidate.asr)
         if asr_guard:
             return asr_guard
-        if not use_singleton:
-            await kernel.setup()
-        audio_in: AudioInput = {
-            "path": str(tmp_path),
-            "sample_rate": 16000,
-            "channels": 1,
-        }
-        service = FeedbackService(kernel)
+        audio_in: AudioInput = upload
         prompt_file = _resolve_safe_client_path(prompt_path, label="Prompt")
         schema_file = _resolve_safe_client_path(output_schema_path, label="Output schema")
-        result = await service.analyze(
-            audio=audio_in,
-            text=text,
-            lang=lang_target_resolved,
-            lang_source=lang_source_resolved,
-            lang_target=lang_target_resolved,
-            target_ipa=target_ipa,
-            mode=mode,
-            evaluation_level=evaluation_level,
-            force_phonetic=force_phonetic,
-            allow_quality_downgrade=allow_quality_downgrade,
-            feedback_level=feedback_level,
-            prompt_path=prompt_file,
-            output_schema_path=schema_file,
-            user_id=user_id,
-        )
-        if persist:
-            store = FeedbackStore()
-            store.append(
-                result,
-                audio=dict(audio_in),
-                meta={
-                    "text": text,
-                    "lang": lang_target_resolved,
-                    "lang_source": lang_source_resolved,
-                    "lang_target": lang_target_resolved,
-                },
+
+        async def _analyze(
+            on_token: Optional[Callable[[str], Awaitable[None]]] = None,
+            on_reset: Optional[Callable[[], Awaitable[None]]] = None,
+        ) -> dict[str, Any]:
+            # El lease cubre también el stream NDJSON, que corre después del handler.
+            async with pool.lease(key, candidate) as kernel:
+                result = await FeedbackService(kernel).analyze(
+                    audio=audio_in,
+                    text=text,
+                    lang=lang_target_resolved,
+                    lang_source=lang_source_resolved,
+                    lang_target=lang_target_resolved,
+                    target_ipa=target_ipa,
+                    mode=mode,
+                    evaluation_level=evaluation_level,
+                    force_phonetic=force_phonetic,
+                    allow_quality_downgrade=allow_quality_downgrade,
+                    feedback_level=feedback_level,
+                    prompt_path=prompt_file,
+                    output_schema_path=schema_file,
+                    user_id=user_id,
+                    on_token=on_token,
+                    on_reset=on_reset,
+                )
+            if persist:
+                store = FeedbackStore()
+                store.append(
+                    result,
+                    audio=without_pcm(audio_in),
+                    meta={
+                        "text": text,
+                        "lang": lang_target_resolved,
+                        "lang_source": lang_source_resolved,
+                        "lang_target": lang_target_resolved,
+                    },
+                )
+            return result
+
+        if stream:
+            # El generador limpia el upload al terminar de transmitir.
+            streaming = True
+            return StreamingResponse(
+                _feedback_event_stream(_analyze, lambda: _cleanup_uploaded_file(upload)),
+                media_type="application/x-ndjson",
             )
-        return result
+        return await _analyze()
     finally:
-        if not use_singleton:
-            await kernel.teardown()
-        _cleanup_uploaded_file(tmp_path)
+        if not streaming:
+            _cleanup_uploaded_file(upload)
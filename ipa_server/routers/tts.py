@@ -1,22 +1,21 @@
 """TTS (text-to-speech) endpoints."""
 from __future__ import annotations
 
-import tempfile
 from typing import Optional
 
-from fastapi import APIRouter, Query
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import APIRouter, Query, Request
 
-from ipa_core.config import loader
 from ipa_core.errors import NotReadyError
-from ipa_core.plugins import registry
 from ipa_server.http_errors import error_response
+from ipa_core.tts.cache import get_tts_audio_cache
+from ipa_server.tts_provider import cached_audio_response, get_tts_registry, synthesize_cached
 
 router = APIRouter(prefix="/api/tts", tags=["tts"])
 
 
 @router.get("/speak")
 async def tts_speak(
+    request: Request,
     text: str = Query(..., description="Texto a sintetizar"),
     lang: str = Query("es", description="Código de idioma (es, en, etc.)"),
     voice: Optional[str] = Query(None, description="Voz específica (opcional)"),
@@ -30,29 +29,18 @@ async def tts_speak(
         )
 
     try:
-        cfg = loader.load_config()
-        tts = registry.resolve_tts(cfg.tts.name, cfg.tts.params)
-        await tts.setup()
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-            output_path = tmp_file.name
-
-        try:
-            result = await tts.synthesize(
-                text=text.strip(), lang=lang, voice=voice, output_path=output_path
-            )
-            return FileResponse(
-                path=output_path,
-                media_type="audio/wav",
-                filename=f"tts_{lang}_{text[:20].replace(' ', '_')}.wav",
-                headers={
-                    "X-TTS-Text": text[:100],
-                    "X-TTS-Lang": lang,
-                    "X-TTS-Backend": result.get("meta", {}).get("backend", "unknown"),
-                },
-            )
-        finally:
-            await tts.teardown()
+        # Cache por contenido + instancia caliente del proceso (sin setup por request).
+        audio = await synthesize_cached(text.strip(), lang=lang, voice=voice)
+        return cached_audio_response(
+            request,
+            audio,
+            filename=f"tts_{lang}_{text[:20].replace(' ', '_')}.wav",
+            headers={
+                "X-TTS-Text": text[:100],
+                "X-TTS-Lang": lang,
+                "X-TTS-Backend": audio.backend or "unknown",
+            },
+        )
 
     except NotReadyError as e:
         return error_response(
@@ -75,23 +63,28 @@ async def tts_speak(
 
 @router.get("/status")
 async def tts_status():
-    """Verifica el estado del sistema TTS."""
+    """Verifica el estado del sistema TTS y las voces cargadas."""
+    tts_registry = get_tts_registry()
     try:
-        cfg = loader.load_config()
-        tts = registry.resolve_tts(cfg.tts.name, cfg.tts.params)
-        await tts.setup()
-        await tts.teardown()
-
+        await tts_registry.acquire()
         return {
             "status": "ready",
-            "backend": cfg.tts.name,
-            "prefer": cfg.tts.params.get("prefer", "system") if cfg.tts.params else "system",
+            "backend": tts_registry.name,
+            "prefer": tts_registry.params.get("prefer", "system"),
+            "registry": tts_registry.stats(),
+            "audio_cache": _audio_cache_stats(),
         }
     except NotReadyError as e:
         return {
             "status": "not_ready",
             "error": str(e),
             "hint": "Instala eSpeak-NG: https://github.com/espeak-ng/espeak-ng/releases",
+            "registry": tts_registry.stats(),
         }
     except Exception as e:
         return {"status": "error", "error": str(e)}
+
+
+def _audio_cache_stats():
+    cache = get_tts_audio_cache()
+    return cache.stats() if cache is not None else None
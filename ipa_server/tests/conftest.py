@@ -76,15 +76,11 @@ def reset_kernel_singleton():
     pipeline_router._cached_kernel = None
     pipeline_router._kernel_ready = False
     pipeline_router._kernel_lock = None
-    kernel_provider._cached_kernel = None
-    kernel_provider._kernel_ready = False
-    kernel_provider._kernel_lock = None
+    kernel_provider._pool = None
     yield
     pipeline_router._cached_kernel = None
     pipeline_router._kernel_ready = False
     pipeline_router._kernel_lock = None
-    kernel_provider._cached_kernel = None
-    kernel_provider._kernel_ready = False
-    kernel_provider._kernel_lock = None
+    kernel_provider._pool = None
 
 
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from ipa_server.kernel_provider import KernelKey, KernelPool, parse_prewarm_spec
+
+
+class DummyIpaASR:
+    output_type = "ipa"
+
+
+class CountingKernel:
+    def __init__(self) -> None:
+        self.asr: Any = DummyIpaASR()
+        self.textref: Any = object()
+        self.comp: Any = object()
+        self.setup_calls = 0
+        self.teardown_calls = 0
+
+    async def setup(self) -> None:
+        self.setup_calls += 1
+
+    async def teardown(self) -> None:
+        self.teardown_calls += 1
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+async def test_pool_reuses_warm_kernel_across_leases() -> None:
+    """Una variante se construye y calienta una sola vez; los leases siguientes son hits."""
+    built: list[CountingKernel] = []
+
+    def factory(_cfg: Any) -> CountingKernel:
+        kernel = CountingKernel()
+        built.append(kernel)
+        return kernel
+
+    pool = KernelPool(factory=factory)  # type: ignore[arg-type]
+    key = pool.key_for()
+    for _ in range(3):
+        async with pool.lease(key) as kernel:
+            assert kernel is built[0]
+
+    assert len(built) == 1
+    assert built[0].setup_calls == 1
+    stats = pool.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+    assert stats["warmups"] == 1
+    assert stats["variants"][0]["leases"] == 3
+
+    await pool.teardown()
+    assert built[0].teardown_calls == 1
+
+
+@pytest.mark.unit
+async def test_pool_keys_variants_by_overrides() -> None:
+    """Overrides distintos producen variantes distintas; mayúsculas no."""
+    pool = KernelPool(factory=lambda _cfg: CountingKernel())  # type: ignore[arg-type,return-value]
+
+    default_key = pool.key_for()
+    noop_key = pool.key_for(comparator="NoOp")
+    assert default_key != noop_key
+    assert noop_key == pool.key_for(comparator="noop")
+    assert noop_key.label() == "comparator=noop"
+
+    assert pool.get(default_key) is not pool.get(noop_key)
+
+
+@pytest.mark.unit
+async def test_pool_rejects_unknown_plugin_override() -> None:
+    """Un override inexistente es error del cliente (KeyError), no fallback silencioso."""
+    pool = KernelPool(factory=lambda _cfg: CountingKernel())  # type: ignore[arg-type,return-value]
+
+    with pytest.raises(KeyError):
+        pool.get(pool.key_for(backend="missing_backend_xyz"))
+
+
+@pytest.mark.unit
+@pytest.mark.reliability
+async def test_pool_bounds_concurrent_leases() -> None:
+    """Nunca hay más leases simultáneos que max_concurrency por variante."""
+    pool = KernelPool(factory=lambda _cfg: CountingKernel(), max_concurrency=2)  # type: ignore[arg-type,return-value]
+    key = pool.key_for()
+    active = 0
+    peak = 0
+
+    async def worker() -> None:
+        nonlocal active, peak
+        async with pool.lease(key):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(worker() for _ in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.unit
+@pytest.mark.security
+async def test_pool_caches_variants_only_once_leased_and_bounds_overrides() -> None:
+    """``get`` no retiene variantes rechazadas; las variantes con overrides son LRU."""
+    built: list[CountingKernel] = []
+
+    def factory(_cfg: Any) -> CountingKernel:
+        kernel = CountingKernel()
+        built.append(kernel)
+        return kernel
+
+    pool = KernelPool(factory=factory, max_variants=2)  # type: ignore[arg-type]
+    default_key = pool.key_for()
+    pool.get(pool.key_for(llm="rejected"))
+    assert pool.stats()["variants"] == []
+
+    candidate = pool.get(default_key)
+    async with pool.lease(default_key, candidate) as kernel:
+        assert kernel is candidate
+
+    keys = [pool.key_for(llm=f"llm{i}") for i in range(3)]
+    async with pool.lease(keys[0]):
+        for key in keys[1:]:
+            async with pool.lease(key):
+                pass
+        # keys[0] está prestada: se desaloja la siguiente menos usada.
+        labels = [v["variant"] for v in pool.stats()["variants"]]
+        assert labels == ["default", "llm=llm0", "llm=llm2"]
+    assert pool.stats()["evictions"] == 1
+    # built: rechazada, default, llm0, llm1 (desalojada y liberada), llm2.
+    assert [k.teardown_calls for k in built] == [0, 0, 0, 1, 0]
+
+    await pool.teardown()
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+async def test_pool_releases_default_variant_of_previous_config() -> None:
+    """Al cambiar la config, la variante por defecto anterior se libera sin leases en curso."""
+    built: list[CountingKernel] = []
+
+    def factory(_cfg: Any) -> CountingKernel:
+        kernel = CountingKernel()
+        built.append(kernel)
+        return kernel
+
+    pool = KernelPool(factory=factory)  # type: ignore[arg-type]
+    old_key, new_key = KernelKey(config_fingerprint="old"), KernelKey(config_fingerprint="new")
+
+    async with pool.lease(old_key):
+        async with pool.lease(new_key):
+            pass
+        # La variante anterior sigue prestada: no se libera todavía.
+        assert [v["config"] for v in pool.stats()["variants"]] == ["old", "new"]
+    async with pool.lease(new_key):
+        pass
+
+    assert [v["config"] for v in pool.stats()["variants"]] == ["new"]
+    assert [k.teardown_calls for k in built] == [1, 0]
+    await pool.teardown()
+
+
+@pytest.mark.unit
+def test_parse_prewarm_spec() -> None:
+    assert parse_prewarm_spec("") == []
+    assert parse_prewarm_spec("default; textref=espeak,comparator=noop ;bogus=1") == [
+        {},
+        {"textref": "espeak", "comparator": "noop"},
+    ]
@@ -3,7 +3,7 @@ from __future__ import annotations
 import time
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, Literal, Optional
+from typing import Any, Literal, Optional, cast
 
 import pytest
 from httpx import ASGITransport, AsyncClient
@@ -11,7 +11,8 @@ from httpx import ASGITransport, AsyncClient
 from ipa_core.errors import ValidationError
 from ipa_core.plugins.base import BasePlugin
 from ipa_core.pipeline.runner import execute_pipeline
-from ipa_server.kernel_provider import get_or_create_kernel, peek_kernel, teardown_kernel_singleton
+from ipa_core.kernel.core import Kernel
+from ipa_server.kernel_provider import KernelPool, get_or_create_kernel, peek_kernel, teardown_kernel_singleton
 from ipa_server.main import get_app
 from ipa_server.routers import pipeline as pipeline_router
 from ipa_core.types import ASRResult, AudioInput, CompareResult, CompareWeights, PreprocessorResult, TextRefResult, TokenSeq
@@ -38,6 +39,11 @@ class DummyKernel:
         self.teardown_called = True
 
 
+def _pool_for(kernel: Any) -> KernelPool:
+    """Pool cuya fábrica siempre devuelve el kernel falso dado."""
+    return KernelPool(factory=lambda _cfg: cast(Kernel, kernel))
+
+
 class PerfPreprocessor(BasePlugin):
     async def process_audio(self, audio: AudioInput, **kw: Any) -> PreprocessorResult:
         return {"audio": audio, "meta": {"audio_quality": {"passed": True, "issues": []}}}
@@ -120,13 +126,13 @@ async def test_execute_pipeline_finishes_under_two_seconds_in_stub_mode() -> Non
 @pytest.mark.security
 async def test_feedback_rejects_client_supplied_external_prompt_path_before_fs_use(api_client, wav_bytes: bytes, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """QA-03 case 3=A: rutas arbitrarias del cliente deben rechazarse antes de usar el FS."""
-    client, _app = api_client
+    client, app = api_client
     external_prompt = tmp_path / "external_prompt.md"
     external_prompt.write_text("forbidden external prompt", encoding="utf-8")
     analyze_called = False
 
-    async def fake_get_or_create_kernel():
-        return SimpleNamespace(asr=DummyIpaASR())
+    kernel = SimpleNamespace(asr=DummyIpaASR())
+    app.dependency_overrides[pipeline_router._get_kernel_pool] = lambda: _pool_for(kernel)
 
     async def fake_analyze(self, *args: Any, **kwargs: Any):
         nonlocal analyze_called
@@ -157,7 +163,6 @@ async def test_feedback_rejects_client_supplied_external_prompt_path_before_fs_u
             "feedback": {"summary": "ok"},
         }
 
-    monkeypatch.setattr(pipeline_router, "get_or_create_kernel", fake_get_or_create_kernel)
     monkeypatch.setattr("ipa_server.routers.pipeline.FeedbackService.analyze", fake_analyze)
 
     response = await client.post(
@@ -186,7 +191,7 @@ async def test_compare_empty_audio_returns_descriptive_validation_without_traceb
         raise AssertionError("El archivo de prueba debía estar vacío")
 
     monkeypatch.setattr("ipa_server.routers.pipeline.ComparisonService.compare_file_detail", fake_compare_file_detail)
-    app.dependency_overrides[pipeline_router._get_kernel] = lambda: kernel
+    app.dependency_overrides[pipeline_router._get_kernel_pool] = lambda: _pool_for(kernel)
 
     response = await client.post(
         "/v1/compare",
@@ -217,7 +222,7 @@ async def test_missing_plugin_returns_clear_client_error(api_client, wav_bytes:
     """QA-08 case 6=A: plugin inexistente debe retornar error claro para el cliente."""
     client, app = api_client
     kernel = DummyKernel()
-    app.dependency_overrides[pipeline_router._get_kernel] = lambda: kernel
+    app.dependency_overrides[pipeline_router._get_kernel_pool] = lambda: _pool_for(kernel)
 
     response = await client.post(
         "/v1/transcribe",
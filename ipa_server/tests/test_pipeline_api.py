@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, Optional
+from typing import Any, Optional, cast
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
 from ipa_core.errors import ValidationError
+from ipa_core.kernel.core import Kernel
+from ipa_server.kernel_provider import KernelPool
 from ipa_server.main import get_app
 from ipa_server.routers import pipeline as pipeline_router
 from tests.utils.audio import write_sine_wave
@@ -37,6 +40,11 @@ class DummyKernel:
         self.teardown_called = True
 
 
+def _pool_for(kernel: Any) -> KernelPool:
+    """Pool cuya fábrica siempre devuelve el kernel falso dado."""
+    return KernelPool(factory=lambda _cfg: cast(Kernel, kernel))
+
+
 class DummyQuickPreprocessor:
     async def process_audio(self, audio: dict[str, Any]) -> dict[str, Any]:
         return {"audio": audio, "meta": {}}
@@ -83,11 +91,11 @@ async def test_transcribe_returns_transcription_response_schema(api_client, wav_
     client, app = api_client
     kernel = DummyKernel()
 
-    async def fake_transcribe_file(self, path: str, *, lang: Optional[str] = None, user_id: Optional[str] = None):
+    async def fake_transcribe_audio(self, audio: dict, *, lang: Optional[str] = None, user_id: Optional[str] = None):
         return SimpleNamespace(ipa="h o l a", tokens=["h", "o", "l", "a"], meta={"backend": "test_ipa", "lang": lang})
 
-    monkeypatch.setattr("ipa_server.routers.pipeline.TranscriptionService.transcribe_file", fake_transcribe_file)
-    app.dependency_overrides[pipeline_router._get_kernel] = lambda: kernel
+    monkeypatch.setattr("ipa_server.routers.pipeline.TranscriptionService.transcribe_audio", fake_transcribe_audio)
+    app.dependency_overrides[pipeline_router._get_kernel_pool] = lambda: _pool_for(kernel)
 
     response = await client.post(
         "/v1/transcribe",
@@ -113,7 +121,7 @@ async def test_transcribe_rejects_non_ipa_backend_before_kernel_setup(api_client
     from ipa_core.plugins import registry
 
     registry.register("asr", "non_ipa_test", lambda _params: DummyTextASR())
-    app.dependency_overrides[pipeline_router._get_kernel] = lambda: kernel
+    app.dependency_overrides[pipeline_router._get_kernel_pool] = lambda: _pool_for(kernel)
 
     response = await client.post(
         "/v1/transcribe",
@@ -148,11 +156,11 @@ async def test_compare_returns_score_and_alignment_payload(api_client, wav_bytes
                 "meta": {"distance": 0.2},
             }
 
-    async def fake_compare_file_detail(self, *args: Any, **kwargs: Any) -> FakeComparePayload:
+    async def fake_compare_audio_detail(self, *args: Any, **kwargs: Any) -> FakeComparePayload:
         return FakeComparePayload()
 
-    monkeypatch.setattr("ipa_server.routers.pipeline.ComparisonService.compare_file_detail", fake_compare_file_detail)
-    app.dependency_overrides[pipeline_router._get_kernel] = lambda: kernel
+    monkeypatch.setattr("ipa_server.routers.pipeline.ComparisonService.compare_audio_detail", fake_compare_audio_detail)
+    app.dependency_overrides[pipeline_router._get_kernel_pool] = lambda: _pool_for(kernel)
 
     response = await client.post(
         "/v1/compare",
@@ -181,7 +189,7 @@ async def test_compare_rejects_invalid_audio_with_422_not_500(api_client, wav_by
         raise ValidationError("Audio corrupto o ilegible")
 
     monkeypatch.setattr("ipa_server.routers.pipeline.ComparisonService.compare_file_detail", fake_compare_file_detail)
-    app.dependency_overrides[pipeline_router._get_kernel] = lambda: kernel
+    app.dependency_overrides[pipeline_router._get_kernel_pool] = lambda: _pool_for(kernel)
 
     response = await client.post(
         "/v1/compare",
@@ -224,13 +232,9 @@ async def test_quick_compare_returns_descriptive_validation_error_when_asr_has_n
 @pytest.mark.usability
 async def test_feedback_rejects_missing_prompt_path_immediately(api_client, wav_bytes: bytes, monkeypatch: pytest.MonkeyPatch) -> None:
     """QA-07 case 6=A: prompt_path inexistente debe rechazarse de forma descriptiva e inmediata."""
-    client, _app = api_client
+    client, app = api_client
     kernel = SimpleNamespace(asr=DummyIpaASR())
-
-    async def fake_get_or_create_kernel():
-        return kernel
-
-    monkeypatch.setattr(pipeline_router, "get_or_create_kernel", fake_get_or_create_kernel)
+    app.dependency_overrides[pipeline_router._get_kernel_pool] = lambda: _pool_for(kernel)
 
     response = await client.post(
         "/v1/feedback",
@@ -269,12 +273,12 @@ async def test_compare_forwards_adaptation_policy_flags(api_client, wav_bytes: b
                 "meta": {},
             }
 
-    async def fake_compare_file_detail(self, *args: Any, **kwargs: Any) -> FakeComparePayload:
+    async def fake_compare_audio_detail(self, *args: Any, **kwargs: Any) -> FakeComparePayload:
         captured_kwargs.update(kwargs)
         return FakeComparePayload()
 
-    monkeypatch.setattr("ipa_server.routers.pipeline.ComparisonService.compare_file_detail", fake_compare_file_detail)
-    app.dependency_overrides[pipeline_router._get_kernel] = lambda: kernel
+    monkeypatch.setattr("ipa_server.routers.pipeline.ComparisonService.compare_audio_detail", fake_compare_audio_detail)
+    app.dependency_overrides[pipeline_router._get_kernel_pool] = lambda: _pool_for(kernel)
 
     response = await client.post(
         "/v1/compare",
@@ -290,3 +294,35 @@ async def test_compare_forwards_adaptation_policy_flags(api_client, wav_bytes: b
     assert response.status_code == 200
     assert captured_kwargs["force_phonetic"] is True
     assert captured_kwargs["allow_quality_downgrade"] is False
+
+
+@pytest.mark.system
+@pytest.mark.performance
+async def test_feedback_stream_returns_llm_tokens_before_result(api_client, wav_bytes: bytes, monkeypatch: pytest.MonkeyPatch) -> None:
+    client, _app = api_client
+
+    async def fake_get_or_create_kernel():
+        return SimpleNamespace(asr=DummyIpaASR())
+
+    async def fake_analyze(self, *args: Any, on_token=None, on_reset=None, **kwargs: Any):
+        await on_token("no es JSON")
+        await on_reset()  # intento descartado por el LLM
+        for chunk in ('{"summary":', ' "bien"}'):
+            await on_token(chunk)
+        return {"report": {}, "compare": {"per": 0.0}, "feedback": {"summary": "bien"}}
+
+    monkeypatch.setattr(pipeline_router, "get_or_create_kernel", fake_get_or_create_kernel)
+    monkeypatch.setattr("ipa_server.routers.pipeline.FeedbackService.analyze", fake_analyze)
+
+    response = await client.post(
+        "/v1/feedback",
+        data={"text": "pato", "lang": "es", "stream": "true"},
+        files={"audio": ("sample.wav", wav_bytes, "audio/wav")},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [e["type"] for e in events] == ["token", "reset", "token", "token", "result"]
+    assert "".join(e["text"] for e in events[2:4]) == '{"summary": "bien"}'
+    assert events[-1]["data"]["feedback"] == {"summary": "bien"}
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import math
+import struct
+from typing import Any
+
+import pytest
+
+from ipa_core.kernel.core import create_kernel
+from ipa_core.plugins.base import BasePlugin
+from ipa_server.kernel_provider import KernelPool
+from ipa_server.realtime import RealtimeSession, WSConfig
+
+
+class FakeWebSocket:
+    def __init__(self) -> None:
+        self.sent: list[dict[str, Any]] = []
+
+    async def send_json(self, payload: dict[str, Any]) -> None:
+        self.sent.append(payload)
+
+
+def _tone_pcm(ms: int = 300, rate: int = 16000) -> bytes:
+    samples = (int(8000 * math.sin(2 * math.pi * 220 * i / rate)) for i in range(rate * ms // 1000))
+    return b"".join(struct.pack("<h", s) for s in samples)
+
+
+@pytest.mark.functional
+@pytest.mark.performance
+async def test_realtime_sessions_share_warm_kernel() -> None:
+    """Las sesiones toman el kernel caliente del pool y no lo liberan al cerrar."""
+    built: list[Any] = []
+
+    def factory(cfg: Any) -> Any:
+        kernel = create_kernel(cfg)
+        built.append(kernel)
+        return kernel
+
+    pool = KernelPool(factory=factory)
+    first = RealtimeSession(FakeWebSocket(), WSConfig(), pool=pool)  # type: ignore[arg-type]
+    second = RealtimeSession(FakeWebSocket(), WSConfig(), pool=pool)  # type: ignore[arg-type]
+    await first.setup()
+    await second.setup()
+    assert len(built) == 1 and first.kernel is second.kernel
+
+    await second.handle_audio(_tone_pcm())
+    await second.handle_message({"type": "flush"})
+    results = [m for m in second.websocket.sent if m["type"] == "transcription"]  # type: ignore[attr-defined]
+    assert results and results[0]["data"]["ipa"]
+    assert pool.stats()["variants"][0]["leases"] == 1
+
+    await first.teardown()
+    await second.teardown()
+    assert pool.peek(pool.key_for()) is built[0]
+    await pool.teardown()
+
+    idle = RealtimeSession(FakeWebSocket(), WSConfig(), pool=pool)  # type: ignore[arg-type]
+    with pytest.raises(RuntimeError):
+        idle._lease()
+
+
+class CountingASR(BasePlugin):
+    """ASR sin ``ctc_logits``: cada parcial re-transcribe el buffer."""
+
+    output_type = "ipa"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.samples: list[int] = []
+
+    async def transcribe(self, audio: Any, *, lang: Any = None, **kw: Any) -> dict[str, Any]:
+        self.samples.append(len(audio["pcm"]))
+        return {"tokens": ["o", "l", "a"], "meta": {}}
+
+
+@pytest.mark.functional
+@pytest.mark.performance
+async def test_realtime_streaming_sends_partials_and_final_only_for_speech() -> None:
+    asr = CountingASR()
+
+    def factory(cfg: Any) -> Any:
+        kernel = create_kernel(cfg)
+        kernel.asr = asr  # type: ignore[assignment]
+        return kernel
+
+    pool = KernelPool(factory=factory)
+    session = RealtimeSession(
+        FakeWebSocket(), WSConfig(streaming=True, partial_interval_ms=0), pool=pool  # type: ignore[arg-type]
+    )
+    await session.setup()
+    assert session.ws_config.partial_interval_ms == 100
+
+    for _ in range(5):
+        await session.handle_audio(b"\x00\x00" * 1600)  # silencio: no alimenta al stream
+    assert asr.samples == []
+    for _ in range(5):
+        await session.handle_audio(_tone_pcm(100))
+        if session._partial_task is not None:
+            await session._partial_task
+    await session.handle_message({"type": "flush"})
+
+    sent = session.websocket.sent  # type: ignore[attr-defined]
+    partials = [m for m in sent if m["type"] == "partial"]
+    finals = [m for m in sent if m["type"] == "final"]
+    assert len(partials) == 5 and len(finals) == 1
+    assert finals[0]["data"]["tokens"] == ["o", "l", "a"]
+    # Sólo el audio con voz llega al ASR (5 x 100 ms).
+    assert max(asr.samples) == 8000
+    await session.teardown()
+    await pool.teardown()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from ipa_server.tts_provider import TTSRegistry, parse_tts_prewarm_spec
+
+
+class CountingTTS:
+    def __init__(self, params: dict[str, Any]) -> None:
+        self.params = params
+        self.setup_calls = 0
+        self.teardown_calls = 0
+
+    async def setup(self) -> None:
+        self.setup_calls += 1
+
+    async def teardown(self) -> None:
+        self.teardown_calls += 1
+
+    def memory_footprint(self) -> int:
+        return 1000
+
+    async def synthesize(self, text: str, *, lang: str, **kw: Any) -> dict[str, Any]:
+        return {"audio": {"path": "x.wav"}, "meta": {"backend": "counting"}}
+
+
+def _registry(built: list[CountingTTS], **kw: Any) -> TTSRegistry:
+    def factory(_name: str, params: dict[str, Any]) -> CountingTTS:
+        tts = CountingTTS(params)
+        built.append(tts)
+        return tts
+
+    params = {"prefer": "piper", "piper": {"model_path": "es.onnx"}, "voices": {
+        "en": {"piper": {"model_path": "en.onnx"}},
+        "fr": {"piper": {"model_path": "fr.onnx"}},
+    }}
+    return TTSRegistry("default", params, factory=factory, **kw)
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+async def test_tts_registry_keeps_voices_warm_and_evicts_lru() -> None:
+    built: list[CountingTTS] = []
+    reg = _registry(built, max_voices=2)
+
+    for _ in range(3):
+        async with reg.lease(lang="es") as tts:
+            await tts.synthesize("hola", lang="es")
+    assert len(built) == 1 and built[0].setup_calls == 1
+
+    async with reg.lease(lang="en") as en:
+        assert en.params["piper"] == {"model_path": "en.onnx"}
+        assert en.params["prefer"] == "piper"
+    async with reg.lease(lang="es"):
+        pass
+    async with reg.lease(lang="fr"):
+        pass
+
+    stats = reg.stats()
+    assert [v["voice"] for v in stats["voices"]] == ["default", "fr"]
+    assert stats["evictions"] == 1 and stats["memory_bytes"] == 2000
+    assert built[1].teardown_calls == 1
+
+    await reg.teardown()
+    assert built[0].teardown_calls == 1
+
+
+@pytest.mark.unit
+def test_parse_tts_prewarm_spec() -> None:
+    assert parse_tts_prewarm_spec("") == [(None, None)]
+    assert parse_tts_prewarm_spec("none") == []
+    assert parse_tts_prewarm_spec("es, en:amy") == [("es", None), ("en", "amy")]
@@ -0,0 +1,363 @@
+"""Proveedores TTS compartidos por el proceso del servidor.
+
+``/api/tts/speak`` resolvía el plugin, llamaba ``setup()`` y ``teardown()``
+y releía la config en cada request; con Piper en proceso eso significa
+recargar la voz ONNX en cada clic.  :class:`TTSRegistry` mantiene las
+instancias calientes durante toda la vida de la app:
+
+- Una instancia por *voz configurada*: ``tts.params.voices`` puede mapear
+  una voz o un idioma a parámetros propios (p. ej. otro ``model_path`` de
+  Piper).  Las peticiones sin override comparten la instancia ``default``.
+- LRU: como máximo ``max_voices`` instancias; al superar el límite se
+  libera (``teardown``) la menos usada recientemente que esté ociosa.
+- Un semáforo por proveedor limita las síntesis simultáneas.
+
+Ejemplo de config::
+
+    tts:
+      name: default
+      params:
+        prefer: piper
+        piper: {model_path: models/piper/es_MX-claude-high.onnx}
+        voices:
+          en: {piper: {model_path: models/piper/en_US-amy-medium.onnx}}
+
+Variables de entorno
+--------------------
+``PRONUNCIAPA_TTS_MAX_VOICES``
+    Instancias calientes como máximo (default: 4).
+``PRONUNCIAPA_TTS_MAX_CONCURRENCY``
+    Síntesis simultáneas por proveedor (default: 2).
+``PRONUNCIAPA_TTS_PREWARM``
+    Voces a calentar al arrancar, separadas por comas (``es,en:amy``);
+    vacío calienta sólo la instancia ``default`` y ``none`` desactiva.
+
+El audio sintetizado pasa por el cache direccionado por contenido de
+:mod:`ipa_core.tts.cache` (:func:`synthesize_cached`) y se sirve con
+``ETag`` (:func:`cached_audio_response`).
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Optional
+
+from fastapi import Request, Response
+
+from ipa_core.config import loader
+from ipa_core.plugins import registry
+from ipa_core.tts.cache import CachedAudio, get_tts_audio_cache, provider_fingerprint, render_cached
+from ipa_core.tts.utils import DEFAULT_VOICE_KEY, voice_params
+
+logger = logging.getLogger("ipa_server")
+
+_DEFAULT_MAX_VOICES = 4
+_DEFAULT_MAX_CONCURRENCY = 2
+
+TTSFactory = Callable[[str, dict[str, Any]], Any]
+
+
+@dataclass
+class _VoiceEntry:
+    provider: Any
+    ready: bool = False
+    setup_ms: Optional[float] = None
+    uses: int = 0
+    in_use: int = 0
+    memory_bytes: Optional[int] = None
+    setup_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+def _memory_footprint(provider: Any) -> Optional[int]:
+    footprint = getattr(provider, "memory_footprint", None)
+    if footprint is None:
+        return None
+    try:
+        return int(footprint())
+    except Exception:  # pragma: no cover - métrica best-effort
+        return None
+
+
+class TTSRegistry:
+    """Instancias TTS calientes por voz, con LRU y concurrencia acotada.
+
+    Parameters
+    ----------
+    name, params:
+        Proveedor y parámetros de ``cfg.tts``.
+    factory:
+        Construye una instancia (default: ``registry.resolve_tts``).
+    max_voices:
+        Instancias calientes como máximo.
+    max_concurrency:
+        Síntesis simultáneas permitidas.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        params: Optional[dict[str, Any]] = None,
+        *,
+        factory: Optional[TTSFactory] = None,
+        strict_mode: bool = False,
+        max_voices: int = _DEFAULT_MAX_VOICES,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        self.name = name
+        self._config_params = dict(params or {})
+        self._params = voice_params(self._config_params)[1]
+        self._factory = factory or (
+            lambda n, p: registry.resolve_tts(n, p, strict_mode=strict_mode)
+        )
+        self._max_voices = max(1, int(max_voices))
+        self._max_concurrency = max(1, int(max_concurrency))
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        self._entries: "OrderedDict[str, _VoiceEntry]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def params(self) -> dict[str, Any]:
+        """Parámetros base del proveedor (sin ``voices``)."""
+        return dict(self._params)
+
+    # ------------------------------------------------------------------
+    # Claves
+    # ------------------------------------------------------------------
+
+    def voice_key(self, *, lang: Optional[str] = None, voice: Optional[str] = None) -> str:
+        """Clave de la instancia que sirve ``(lang, voice)``."""
+        return voice_params(self._config_params, lang=lang, voice=voice)[0]
+
+    def voice_params(self, key: str) -> dict[str, Any]:
+        """Parámetros efectivos de la instancia ``key``."""
+        return voice_params(self._config_params, voice=key)[1]
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    async def _ensure_ready(self, key: str) -> _VoiceEntry:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _VoiceEntry(provider=self._factory(self.name, self.voice_params(key)))
+            self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if entry.ready:
+            self._hits += 1
+            return entry
+        async with entry.setup_lock:
+            if entry.ready:
+                self._hits += 1
+                return entry
+            self._misses += 1
+            started = time.perf_counter()
+            try:
+                await entry.provider.setup()
+            except Exception:
+                self._entries.pop(key, None)
+                raise
+            entry.setup_ms = (time.perf_counter() - started) * 1000
+            entry.memory_bytes = _memory_footprint(entry.provider)
+            entry.ready = True
+            logger.info("TTS voice '%s' (%s) ready in %.1f ms", key, self.name, entry.setup_ms)
+        return entry
+
+    async def _evict_idle(self) -> None:
+        while len(self._entries) > self._max_voices:
+            # Nunca la más reciente: es la que se acaba de pedir.
+            candidates = list(self._entries.items())[:-1]
+            victim = next((k for k, e in candidates if e.in_use == 0 and e.ready), None)
+            if victim is None:
+                return
+            entry = self._entries.pop(victim)
+            self._evictions += 1
+            try:
+                await entry.provider.teardown()
+            except Exception as exc:  # pragma: no cover
+                logger.warning("Error tearing down TTS voice '%s': %s", victim, exc)
+            logger.info("TTS voice '%s' evicted (LRU)", victim)
+
+    async def acquire(self, *, lang: Optional[str] = None, voice: Optional[str] = None) -> Any:
+        """Instancia lista para ``(lang, voice)`` (sin límite de concurrencia)."""
+        entry = await self._ensure_ready(self.voice_key(lang=lang, voice=voice))
+        await self._evict_idle()
+        return entry.provider
+
+    @asynccontextmanager
+    async def lease(self, *, lang: Optional[str] = None, voice: Optional[str] = None) -> AsyncIterator[Any]:
+        """Presta la instancia caliente de la voz con concurrencia acotada."""
+        entry = await self._ensure_ready(self.voice_key(lang=lang, voice=voice))
+        entry.in_use += 1
+        try:
+            await self._evict_idle()
+            async with self._semaphore:
+                entry.uses += 1
+                yield entry.provider
+        finally:
+            entry.in_use -= 1
+
+    async def prewarm(self, voices: list[tuple[Optional[str], Optional[str]]]) -> None:
+        """Calienta las voces ``(lang, voice)`` indicadas; los fallos se registran y se omiten."""
+        for lang, voice in voices:
+            try:
+                await self.acquire(lang=lang, voice=voice)
+            except Exception as exc:
+                logger.warning("TTS prewarm failed for '%s': %s", voice or lang or DEFAULT_VOICE_KEY, exc)
+
+    async def teardown(self) -> None:
+        """Libera todas las instancias."""
+        entries, self._entries = self._entries, OrderedDict()
+        for key, entry in entries.items():
+            if not entry.ready:
+                continue
+            try:
+                await entry.provider.teardown()
+            except Exception as exc:  # pragma: no cover
+                logger.warning("Error tearing down TTS voice '%s': %s", key, exc)
+
+    # ------------------------------------------------------------------
+    # Métricas
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        """Voces cargadas (orden LRU → MRU), memoria estimada y contadores."""
+        voices = [
+            {
+                "voice": key,
+                "ready": entry.ready,
+                "setup_ms": round(entry.setup_ms, 2) if entry.setup_ms is not None else None,
+                "uses": entry.uses,
+                "in_use": entry.in_use,
+                "memory_bytes": entry.memory_bytes,
+            }
+            for key, entry in self._entries.items()
+        ]
+        return {
+            "provider": self.name,
+            "max_voices": self._max_voices,
+            "max_concurrency": self._max_concurrency,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "memory_bytes": sum(v["memory_bytes"] or 0 for v in voices),
+            "voices": voices,
+        }
+
+
+def parse_tts_prewarm_spec(spec: str) -> list[tuple[Optional[str], Optional[str]]]:
+    """Parsea ``PRONUNCIAPA_TTS_PREWARM`` en una lista de ``(lang, voice)``."""
+    spec = spec.strip()
+    if not spec:
+        return [(None, None)]
+    if spec.lower() == "none":
+        return []
+    voices: list[tuple[Optional[str], Optional[str]]] = []
+    for raw in spec.split(","):
+        lang, _, voice = raw.strip().partition(":")
+        if lang or voice:
+            voices.append((lang or None, voice or None))
+    return voices
+
+
+# ----------------------------------------------------------------------
+# Registro global del proceso
+# ----------------------------------------------------------------------
+
+_registry: Optional[TTSRegistry] = None
+
+
+def get_tts_registry() -> TTSRegistry:
+    """Retorna el registro global (creado perezosamente con la config actual)."""
+    global _registry
+    if _registry is None:
+        cfg = loader.load_config()
+        _registry = TTSRegistry(
+            cfg.tts.name,
+            cfg.tts.params,
+            strict_mode=cfg.strict_mode,
+            max_voices=int(os.environ.get("PRONUNCIAPA_TTS_MAX_VOICES", _DEFAULT_MAX_VOICES)),
+            max_concurrency=int(
+                os.environ.get("PRONUNCIAPA_TTS_MAX_CONCURRENCY", _DEFAULT_MAX_CONCURRENCY)
+            ),
+        )
+    return _registry
+
+
+async def prewarm_tts(spec: Optional[str] = None) -> None:
+    """Calienta las voces de ``PRONUNCIAPA_TTS_PREWARM`` al arrancar la app."""
+    spec = spec if spec is not None else os.environ.get("PRONUNCIAPA_TTS_PREWARM", "")
+    voices = parse_tts_prewarm_spec(spec)
+    if voices:
+        await get_tts_registry().prewarm(voices)
+
+
+async def teardown_tts_registry() -> None:
+    """Libera las voces cargadas durante el apagado de la app."""
+    global _registry
+    reg, _registry = _registry, None
+    if reg is not None:
+        await reg.teardown()
+
+
+def tts_registry_stats() -> Optional[dict[str, Any]]:
+    """Métricas del registro global (``None`` si aún no se creó)."""
+    return _registry.stats() if _registry is not None else None
+
+
+# ----------------------------------------------------------------------
+# Audio cacheado
+# ----------------------------------------------------------------------
+
+async def synthesize_cached(text: str, *, lang: str, voice: Optional[str] = None) -> CachedAudio:
+    """Audio de ``text`` desde el cache; la voz sólo se presta si hay que sintetizar."""
+    tts_registry = get_tts_registry()
+    params = tts_registry.voice_params(tts_registry.voice_key(lang=lang, voice=voice))
+    audio = await render_cached(
+        lambda: tts_registry.lease(lang=lang, voice=voice),
+        get_tts_audio_cache(),
+        provider=provider_fingerprint(tts_registry.name, params),
+        text=text,
+        lang=lang,
+        voice=voice,
+        params=params,
+    )
+    if audio.backend is None:
+        audio.backend = tts_registry.name
+    return audio
+
+
+def _etag_matches(if_none_match: str, *etags: str) -> bool:
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or any(tag in candidates for tag in etags)
+
+
+def cached_audio_response(
+    request: Request,
+    audio: CachedAudio,
+    *,
+    filename: str,
+    headers: Optional[dict[str, str]] = None,
+) -> Response:
+    """Respuesta WAV con ``ETag``/``If-None-Match``; gzip tal cual si el cliente lo acepta."""
+    gzip_ok = "gzip" in request.headers.get("accept-encoding", "").lower()
+    etag = audio.etag[:-1] + '-gz"' if gzip_ok else audio.etag
+    base = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=86400",
+        "Vary": "Accept-Encoding",
+        "X-TTS-Cache": "HIT" if audio.hit else "MISS",
+        **(headers or {}),
+    }
+    if _etag_matches(request.headers.get("if-none-match", ""), audio.etag, audio.etag[:-1] + '-gz"'):
+        return Response(status_code=304, headers=base)
+    base["Content-Disposition"] = f'attachment; filename="{filename}"'
+    if gzip_ok:
+        return Response(audio.gzip_bytes(), media_type="audio/wav", headers={**base, "Content-Encoding": "gzip"})
+    return Response(audio.wav_bytes(), media_type="audio/wav", headers=base)
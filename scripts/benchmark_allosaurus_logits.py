@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Benchmark del camino de logits de Allosaurus.
+
+Compara, por enunciado, el tiempo de CPU del camino anterior (envolver
+``lm.compute`` y correr ``recognize()`` completo sólo para capturar los
+logits, con el PCM en memoria escrito antes a un WAV temporal) con el
+camino directo de ``AllosaurusBackend`` (frontend + modelo acústico sobre
+la forma de onda en memoria). En ambos casos se aplica la misma máscara
+del idioma, se decodifica una vez con el mismo decoder CTC y se verifica
+que los tokens coincidan.
+
+Usa los WAV de ``data/sample/manifest.jsonl`` (generarlos con
+``scripts/create_sample_audio.py`` si faltan). Requiere Allosaurus.
+
+Uso
+---
+    PYTHONPATH=. python scripts/benchmark_allosaurus_logits.py
+    PYTHONPATH=. python scripts/benchmark_allosaurus_logits.py --repeats 20 --json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from ipa_core.audio.pcm import decode_wav_pcm16, pad_samples  # noqa: E402
+from ipa_core.backends.allosaurus_backend import (  # noqa: E402
+    ALLOSAURUS_AVAILABLE,
+    AllosaurusBackend,
+    _wav_file_for,
+)
+
+
+def _legacy_logits(backend: AllosaurusBackend, path: str, lang: Optional[str]) -> Optional[np.ndarray]:
+    """Camino anterior: interceptar ``lm.compute`` durante ``recognize()``."""
+    lm = backend._lm
+    compute_fn = lm.compute
+    captured: dict[str, np.ndarray] = {}
+
+    def wrapped_compute(logits: Any, *args: Any, **kwargs: Any) -> Any:
+        captured["logits"] = np.asarray(logits).copy()
+        return compute_fn(logits, *args, **kwargs)
+
+    lm.compute = wrapped_compute
+    try:
+        backend._model.recognize(path, lang_id=lang, timestamp=False)
+    finally:
+        lm.compute = compute_fn
+    return captured.get("logits")
+
+
+def _legacy(backend: AllosaurusBackend, samples: np.ndarray, lang: str) -> list[str]:
+    # recognize() sólo lee archivos: el PCM en memoria se escribía a un temporal.
+    with _wav_file_for(samples) as path:
+        logits = _legacy_logits(backend, path, lang)
+    if logits is None:
+        return []
+    return backend._decode_with_ctc(backend._apply_mask(logits, backend._inventory_mask(lang)))
+
+
+def _direct(backend: AllosaurusBackend, samples: np.ndarray, lang: str) -> list[str]:
+    logits = backend._extract_logits_sync(samples)
+    if logits is None:
+        return []
+    return backend._decode_with_ctc(backend._apply_mask(logits, backend._inventory_mask(lang)))
+
+
+def _cpu_ms(fn: Callable[[], list[str]], repeats: int) -> tuple[float, list[str]]:
+    tokens: list[str] = []
+    samples = []
+    for _ in range(repeats):
+        started = time.process_time()
+        tokens = fn()
+        samples.append((time.process_time() - started) * 1000)
+    return statistics.median(samples), tokens
+
+
+def _run(args: argparse.Namespace) -> dict:
+    backend = AllosaurusBackend(model_name=args.model)
+    asyncio.run(backend.setup())
+
+    rows = []
+    for line in Path(args.manifest).read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        path = ROOT / entry["audio_filepath"]
+        if not path.exists():
+            print(f"(omitido, no existe) {path}", file=sys.stderr)
+            continue
+        samples = decode_wav_pcm16(path.read_bytes())
+        if samples is None:
+            print(f"(omitido, no es PCM 16 kHz) {path}", file=sys.stderr)
+            continue
+        samples = pad_samples(samples, 16000, min_ms=700, pad_ms=150)
+        lang = backend._resolve_lang(entry.get("lang"))
+        backend._ensure_decoder_and_mask(lang)
+
+        legacy_ms, legacy_tokens = _cpu_ms(lambda: _legacy(backend, samples, lang), args.repeats)
+        direct_ms, direct_tokens = _cpu_ms(lambda: _direct(backend, samples, lang), args.repeats)
+        rows.append({
+            "file": path.name,
+            "lang": lang,
+            "duration_s": round(len(samples) / 16000, 2),
+            "legacy_cpu_ms": round(legacy_ms, 2),
+            "direct_cpu_ms": round(direct_ms, 2),
+            "speedup": round(legacy_ms / direct_ms, 2) if direct_ms else None,
+            "same_tokens": legacy_tokens == direct_tokens,
+        })
+    return {"model": args.model, "repeats": args.repeats, "utterances": rows}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--manifest", default=str(ROOT / "data" / "sample" / "manifest.jsonl"))
+    parser.add_argument("--model", default="uni2005")
+    parser.add_argument("--repeats", type=int, default=10, help="Repeticiones por enunciado (mediana)")
+    parser.add_argument("--json", action="store_true", help="Salida JSON")
+    args = parser.parse_args()
+
+    if not ALLOSAURUS_AVAILABLE:
+        sys.exit("Allosaurus no instalado. Ejecuta: pip install allosaurus")
+
+    report = _run(args)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"CPU por enunciado (mediana de {report['repeats']}), modelo {report['model']}")
+    for row in report["utterances"]:
+        same = "tokens idénticos" if row["same_tokens"] else "TOKENS DISTINTOS"
+        print(
+            f"  {row['file']:<20} {row['duration_s']:>5.2f}s  "
+            f"intercept {row['legacy_cpu_ms']:>8.2f} ms  directo {row['direct_cpu_ms']:>8.2f} ms  "
+            f"(x{row['speedup']})  {same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Benchmark del análisis de señal: bucles ``struct`` vs NumPy.
+
+Genera clips PCM 16-bit sintéticos (ráfagas de "voz" sobre ruido de fondo,
+16 kHz mono) y mide por separado:
+
+- VAD por energía   (RMS por frame de 30 ms)
+- quality gates     (RMS, pico, clipping, SNR real por VAD y SNR proxy)
+
+con la implementación anterior (``struct.unpack`` + bucles Python, copiada
+abajo tal cual) y con ``ipa_core.audio.analysis``.
+
+Antes de medir verifica que ambas producen las mismas energías por frame y
+las mismas métricas de calidad (tolerancia de redondeo ``1e-12``).
+
+Uso
+---
+    PYTHONPATH=. python scripts/benchmark_audio_analysis.py
+    PYTHONPATH=. python scripts/benchmark_audio_analysis.py --seconds 5 30 --repeat 3
+    PYTHONPATH=. python scripts/benchmark_audio_analysis.py --json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import statistics
+import struct
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipa_core.audio.analysis import analyze_signal, frame_energies, pcm16_view  # noqa: E402
+
+_SAMPLE_RATE = 16000
+_FRAME_MS = 30
+
+
+# ---------------------------------------------------------------------------
+# Implementación anterior (referencia)
+# ---------------------------------------------------------------------------
+
+def _legacy_frame_energies(raw: bytes, frame_ms: int = _FRAME_MS) -> list[float]:
+    bytes_per_frame = int(_SAMPLE_RATE * frame_ms / 1000) * 2
+    energies = []
+    for i in range(0, len(raw) - bytes_per_frame, bytes_per_frame):
+        frame = raw[i:i + bytes_per_frame]
+        samples = struct.unpack(f"<{len(frame) // 2}h", frame)
+        energies.append((sum(s * s for s in samples) / len(samples)) ** 0.5)
+    return energies
+
+
+def _legacy_quality(raw: bytes, segments: list[tuple[int, int]] | None) -> dict:
+    max_val = 32767
+    samples = struct.unpack(f"<{len(raw) // 2}h", raw)
+    n = len(samples)
+    rms = (sum(s * s for s in samples) / n) ** 0.5 / max_val
+    peak = max(abs(s) for s in samples) / max_val
+    threshold = int(32767 * 0.99)
+    clipping = sum(1 for s in samples if abs(s) >= threshold) / n
+
+    snr_db, method = None, "proxy"
+    if segments:
+        speech_sq, silence_sq, speech_c, silence_c = 0.0, 0.0, 0, 0
+        for i, s in enumerate(samples):
+            ms = i * 1000.0 / _SAMPLE_RATE
+            if any(start <= ms < end for start, end in segments):
+                speech_sq += s * s
+                speech_c += 1
+            else:
+                silence_sq += s * s
+                silence_c += 1
+        if silence_c and silence_c >= int(0.05 * n):
+            noise_rms = (silence_sq / silence_c) ** 0.5 / max_val
+            signal_rms = (speech_sq / max(speech_c, 1)) ** 0.5 / max_val
+            snr_db = 60.0 if noise_rms <= 0.0001 else 20.0 * math.log10(max(signal_rms, 1e-9) / noise_rms)
+            method = "real_vad"
+    if snr_db is None:
+        noise_floor = sorted(abs(s) for s in samples)[n // 10] / max_val
+        snr_db = 20.0 * math.log10(rms / noise_floor) if noise_floor > 0.001 else 60.0
+    return {"rms": rms, "peak": peak, "clipping": clipping, "snr_db": snr_db, "snr_method": method}
+
+
+# ---------------------------------------------------------------------------
+# Implementación NumPy
+# ---------------------------------------------------------------------------
+
+def _numpy_frame_energies(raw: bytes, frame_ms: int = _FRAME_MS) -> np.ndarray:
+    return frame_energies(pcm16_view(raw), int(_SAMPLE_RATE * frame_ms / 1000))
+
+
+def _numpy_quality(raw: bytes, segments: list[tuple[int, int]] | None) -> dict:
+    stats = analyze_signal(pcm16_view(raw), _SAMPLE_RATE, segments)
+    return {
+        "rms": stats.rms, "peak": stats.peak, "clipping": stats.clipping_ratio,
+        "snr_db": stats.snr_db, "snr_method": stats.snr_method,
+    }
+
+
+def _make_clip(seconds: float, rng: np.random.Generator) -> tuple[bytes, list[tuple[int, int]]]:
+    """Ruido de fondo con ráfagas de tono de 400 ms cada segundo."""
+    n = int(seconds * _SAMPLE_RATE)
+    t = np.arange(n) / _SAMPLE_RATE
+    signal = rng.normal(0.0, 150.0, n)
+    segments = []
+    for start_ms in range(200, int(seconds * 1000) - 400, 1000):
+        lo, hi = start_ms * _SAMPLE_RATE // 1000, (start_ms + 400) * _SAMPLE_RATE // 1000
+        signal[lo:hi] += 9000.0 * np.sin(2 * np.pi * 220.0 * t[lo:hi])
+        segments.append((start_ms, start_ms + 400))
+    return np.clip(signal, -32768, 32767).astype("<i2").tobytes(), segments
+
+
+def _same_quality(expected: dict, actual: dict) -> bool:
+    return expected["snr_method"] == actual["snr_method"] and all(
+        math.isclose(expected[key], actual[key], rel_tol=1e-9, abs_tol=1e-12)
+        for key in ("rms", "peak", "clipping", "snr_db")
+    )
+
+
+def _time(fn, *args, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(*args)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def run_benchmark(durations: list[float], repeat: int, seed: int) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    rows = []
+    for seconds in durations:
+        raw, segments = _make_clip(seconds, rng)
+        identical = (
+            np.allclose(_legacy_frame_energies(raw), _numpy_frame_energies(raw), rtol=1e-12, atol=0)
+            and _same_quality(_legacy_quality(raw, segments), _numpy_quality(raw, segments))
+            and _same_quality(_legacy_quality(raw, None), _numpy_quality(raw, None))
+        )
+        for label, legacy, vectorized, args in (
+            ("vad", _legacy_frame_energies, _numpy_frame_energies, (raw,)),
+            ("quality", _legacy_quality, _numpy_quality, (raw, segments)),
+        ):
+            python_ms = _time(legacy, *args, repeat=repeat)
+            numpy_ms = _time(vectorized, *args, repeat=repeat)
+            rows.append({
+                "seconds": seconds,
+                "stage": label,
+                "python_ms": round(python_ms, 3),
+                "numpy_ms": round(numpy_ms, 3),
+                "speedup": round(python_ms / numpy_ms, 1) if numpy_ms else None,
+                "identical": identical,
+            })
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark análisis de señal struct vs NumPy",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--seconds", type=float, nargs="+", default=[1.0, 5.0, 30.0])
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones por duración (mediana)")
+    parser.add_argument("--seed", type=int, default=13)
+    parser.add_argument("--json", action="store_true", help="Salida JSON")
+    args = parser.parse_args()
+
+    rows = run_benchmark(args.seconds, args.repeat, args.seed)
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    print(f"{'seconds':>7} {'stage':>8} {'python ms':>10} {'numpy ms':>10} {'speedup':>8} {'identical':>9}")
+    for row in rows:
+        print(
+            f"{row['seconds']:>7.1f} {row['stage']:>8} {row['python_ms']:>10.2f} "
+            f"{row['numpy_ms']:>10.2f} {row['speedup']:>7}x {str(row['identical']):>9}"
+        )
+    if not all(row["identical"] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
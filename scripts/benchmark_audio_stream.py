@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Benchmark del ``AudioBuffer`` de realtime con muchas sesiones simultáneas.
+
+Simula ``--sessions`` conexiones de ``/ws/practice`` que envían chunks PCM
+16-bit de ``--chunk-ms`` (voz sintética seguida de un silencio) y compara:
+
+- **legacy**: lista de chunks + ``b"".join`` + WAV temporal por segmento y
+  un envío de estado por chunk (implementación anterior, copiada abajo).
+- **ring**: ``ipa_core.audio.stream.AudioBuffer`` (ring buffer preasignado,
+  segmentos como vistas y estado limitado a ``state_interval_ms``).
+
+Reporta CPU por chunk (``time.process_time``), envíos de estado y pico de
+memoria asignada (``tracemalloc``).  El ring reserva ``max_buffer_seconds``
+por sesión desde el inicio (constante); las páginas de ``np.zeros`` sólo
+pasan a memoria residente cuando se escriben.
+
+Uso
+---
+    PYTHONPATH=. python scripts/benchmark_audio_stream.py
+    PYTHONPATH=. python scripts/benchmark_audio_stream.py --sessions 200 --seconds 4 --json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+import wave
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipa_core.audio.analysis import pcm16_view, signal_rms  # noqa: E402
+from ipa_core.audio.stream import AudioBuffer, StreamConfig  # noqa: E402
+
+_SAMPLE_RATE = 16000
+
+
+# ---------------------------------------------------------------------------
+# Implementación anterior (referencia)
+# ---------------------------------------------------------------------------
+
+class LegacyAudioBuffer:
+    """Ruta caliente del buffer anterior: chunks en lista y WAV por segmento."""
+
+    def __init__(self, on_segment_ready, on_state_change, config: StreamConfig) -> None:
+        self._config = config
+        self._on_segment_ready = on_segment_ready
+        self._on_state_change = on_state_change
+        self._chunks: list[bytes] = []
+        self._total_bytes = 0
+        self._is_speaking = False
+        self._current_volume = 0.0
+
+    def _state(self) -> dict:
+        return {
+            "is_speaking": self._is_speaking,
+            "volume_level": self._current_volume,
+            "buffer_duration_ms": int(self._total_bytes / (_SAMPLE_RATE * 2 / 1000)),
+            "status": "speaking" if self._is_speaking else "listening",
+        }
+
+    async def add_chunk(self, audio_data: bytes) -> None:
+        self._chunks.append(audio_data)
+        self._total_bytes += len(audio_data)
+        rms = signal_rms(pcm16_view(audio_data))
+        self._current_volume = min(1.0, rms / 32767.0 * 10)
+        self._is_speaking = rms > 100 and (rms / 32767.0) > self._config.energy_threshold
+        await self._on_state_change(self._state())
+
+    async def flush(self) -> None:
+        audio_data = b"".join(self._chunks)
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav", prefix="realtime_") as tmp:
+            path = Path(tmp.name)
+        with wave.open(str(path), "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(_SAMPLE_RATE)
+            w.writeframes(audio_data)
+        self._chunks.clear()
+        self._total_bytes = 0
+        await self._on_segment_ready(path)
+        path.unlink(missing_ok=True)
+
+
+# ---------------------------------------------------------------------------
+# Simulación
+# ---------------------------------------------------------------------------
+
+def _chunks(seconds: float, chunk_ms: int, seed: int) -> list[bytes]:
+    rng = np.random.default_rng(seed)
+    n = int(_SAMPLE_RATE * chunk_ms / 1000)
+    total = int(seconds * 1000 / chunk_ms)
+    speech = int(total * 0.75)
+    out = []
+    for i in range(total):
+        amp = 6000 if i < speech else 30
+        out.append((rng.standard_normal(n) * amp).astype(np.int16).tobytes())
+    return out
+
+
+async def _run(kind: str, sessions: int, chunks: list[bytes]) -> dict:
+    sent = {"state": 0, "segments": 0}
+
+    async def on_state(state) -> None:
+        payload = state if isinstance(state, dict) else {
+            "is_speaking": state.is_speaking,
+            "volume_level": state.volume_level,
+            "buffer_duration_ms": state.buffer_duration_ms,
+            "status": state.status,
+        }
+        json.dumps({"type": "state", "data": payload})
+        sent["state"] += 1
+
+    async def on_segment(_segment) -> None:
+        sent["segments"] += 1
+
+    config = StreamConfig(silence_timeout_ms=60_000, max_buffer_seconds=30)
+    tracemalloc.start()
+    if kind == "legacy":
+        buffers = [LegacyAudioBuffer(on_segment, on_state, config) for _ in range(sessions)]
+    else:
+        buffers = [AudioBuffer(on_segment_ready=on_segment, on_state_change=on_state, config=config)
+                   for _ in range(sessions)]
+    started = time.process_time()
+    for chunk in chunks:  # intercalado: cada sesión recibe su chunk por turno
+        for buffer in buffers:
+            # Cada frame WebSocket llega como un objeto ``bytes`` nuevo.
+            await buffer.add_chunk(memoryview(chunk).tobytes())
+    for buffer in buffers:
+        await buffer.flush()
+    cpu = time.process_time() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    n_chunks = sessions * len(chunks)
+    return {
+        "impl": kind,
+        "sessions": sessions,
+        "chunks": n_chunks,
+        "cpu_s": round(cpu, 3),
+        "us_per_chunk": round(cpu / n_chunks * 1e6, 1),
+        "state_msgs": sent["state"],
+        "segments": sent["segments"],
+        "peak_mb": round(peak / 1e6, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=4.0, help="Audio por sesión")
+    parser.add_argument("--chunk-ms", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="Salida JSON")
+    args = parser.parse_args()
+
+    chunks = _chunks(args.seconds, args.chunk_ms, args.seed)
+    rows = [asyncio.run(_run(kind, args.sessions, chunks)) for kind in ("legacy", "ring")]
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'impl':<8} {'sesiones':>8} {'chunks':>8} {'CPU s':>7} {'us/chunk':>9} {'estados':>8} {'pico MB':>8}")
+    for r in rows:
+        print(
+            f"{r['impl']:<8} {r['sessions']:>8} {r['chunks']:>8} {r['cpu_s']:>7.2f} "
+            f"{r['us_per_chunk']:>9.1f} {r['state_msgs']:>8} {r['peak_mb']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
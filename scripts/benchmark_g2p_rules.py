@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Benchmark del motor de reglas G2P.
+
+Compara el bucle anterior (probar todas las reglas en cada posición) con
+el motor compilado de ``ipa_core.textref.g2p_rules`` (trie por grafema,
+contextos precompilados) sin memo y con memo LRU, sobre una lista de
+palabras con repeticiones tipo Zipf. Verifica que las salidas sean
+idénticas.
+
+Uso
+---
+    PYTHONPATH=. python scripts/benchmark_g2p_rules.py
+    PYTHONPATH=. python scripts/benchmark_g2p_rules.py --words 50000 --rules plugins/language_packs/es-mx/g2p_rules.yaml
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipa_core.textref.g2p_rules import G2PRule, G2PRuleset, G2PRulesEngine  # noqa: E402
+
+# Reglas de español de tamaño realista (el pack es-mx sólo trae un ejemplo).
+_ES_RULES = [
+    ("ch", "tʃ", "", "", 5), ("ll", "ʝ", "", "", 5), ("rr", "r", "", "", 5),
+    ("qu", "k", "", "[ei]", 5), ("gu", "g", "", "[ei]", 5), ("gü", "gw", "", "", 5),
+    ("c", "s", "", "[eiéí]", 10), ("c", "k", "", "", 0),
+    ("g", "x", "", "[eiéí]", 10), ("g", "ɣ", "[aeiouáéíóúlrs]", "", 1), ("g", "g", "", "", 0),
+    ("r", "r", "^|[nls]", "", 1), ("r", "ɾ", "", "", 0),
+    ("b", "β", "[aeiouáéíóúlrs]", "", 1), ("b", "b", "", "", 0),
+    ("v", "β", "[aeiouáéíóúlrs]", "", 1), ("v", "b", "", "", 0),
+    ("d", "ð", "[aeiouáéíóúlrs]", "", 1), ("d", "d", "", "", 0),
+    ("y", "i", "", "$", 2), ("y", "ʝ", "", "", 0),
+    ("x", "ks", "", "", 0), ("z", "s", "", "", 0), ("h", "", "", "", 0),
+    ("ñ", "ɲ", "", "", 0), ("j", "x", "", "", 0), ("n", "ŋ", "", "[kg]|c[aou]", 1),
+] + [(g, p, "", "", 0) for g, p in zip("aeiouáéíóúfklmnpstw", "aeiouaeioufklmnpstw")]
+
+_LETTERS = "aaaaeeeeiioooouucdlmnprrsstbgvhjyzqñxáéíóú"
+
+
+def _ruleset(path: Optional[str]) -> G2PRuleset:
+    if path:
+        return G2PRuleset.from_yaml(Path(path))
+    ruleset = G2PRuleset(language="es", dialect="bench")
+    for grapheme, phoneme, left, right, priority in _ES_RULES:
+        ruleset.add_rule(G2PRule(grapheme, phoneme, left, right, priority))
+    return ruleset
+
+
+def _words(n: int, vocab: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    pool = ["".join(rng.choice(_LETTERS) for _ in range(rng.randint(2, 11))) for _ in range(vocab)]
+    weights = [1 / (rank + 1) for rank in range(vocab)]
+    return rng.choices(pool, weights=weights, k=n)
+
+
+def _legacy_convert(ruleset: G2PRuleset, word: str) -> str:
+    word_lower = word.lower().strip()
+    if word_lower in ruleset.exceptions:
+        return ruleset.exceptions[word_lower]
+    result, pos = [], 0
+    while pos < len(word_lower):
+        for rule in ruleset.rules:
+            if pos + len(rule.grapheme) <= len(word_lower) and rule.matches(word_lower, pos):
+                result.append(rule.phoneme)
+                pos += len(rule.grapheme)
+                break
+        else:
+            if word_lower[pos].isalpha():
+                result.append(f"?{word_lower[pos]}?")
+            pos += 1
+    return "".join(result)
+
+
+def _timed(fn) -> tuple[float, list[str]]:
+    started = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - started, out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--words", type=int, default=50000)
+    parser.add_argument("--vocab", type=int, default=8000, help="Palabras distintas")
+    parser.add_argument("--rules", default=None, help="YAML de reglas (default: reglas de español del script)")
+    parser.add_argument("--seed", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Salida JSON")
+    args = parser.parse_args()
+
+    ruleset = _ruleset(args.rules)
+    words = _words(args.words, args.vocab, args.seed)
+    legacy_s, expected = _timed(lambda: [_legacy_convert(ruleset, w) for w in words])
+    no_memo = G2PRulesEngine(ruleset, memo_size=0)
+    compiled_s, compiled = _timed(lambda: [no_memo.convert(w) for w in words])
+    memo = G2PRulesEngine(ruleset)
+    memo_s, memoized = _timed(lambda: [memo.convert(w) for w in words])
+    batch_s, batch = _timed(lambda: G2PRulesEngine(ruleset).convert_many(words))
+    assert compiled == expected and memoized == expected and batch == expected
+
+    row = {
+        "words": len(words),
+        "distinct": len(set(words)),
+        "rules": len(ruleset.rules),
+        "legacy_s": round(legacy_s, 3),
+        "compiled_s": round(compiled_s, 3),
+        "memo_s": round(memo_s, 3),
+        "convert_many_s": round(batch_s, 3),
+        "speedup_compiled": round(legacy_s / compiled_s, 2),
+        "speedup_memo": round(legacy_s / memo_s, 2),
+    }
+    if args.json:
+        print(json.dumps(row, indent=2))
+        return
+    print(f"{row['words']} palabras ({row['distinct']} distintas), {row['rules']} reglas; salidas idénticas")
+    print(f"  bucle anterior : {row['legacy_s']:.3f} s")
+    print(f"  trie compilado : {row['compiled_s']:.3f} s  (x{row['speedup_compiled']})")
+    print(f"  + memo LRU     : {row['memo_s']:.3f} s  (x{row['speedup_memo']})")
+    print(f"  convert_many   : {row['convert_many_s']:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
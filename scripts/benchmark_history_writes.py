@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Benchmark de escritura del historial SQLite.
+
+Compara la ruta anterior (INSERT + un UPSERT por fonema + commit por
+intento, sin WAL) con la cola write-behind de
+``ipa_core.history.sqlite.SQLiteHistory`` (lotes en una transacción con
+``executemany``) para un minuto de carga de 10k intentos. Sin ``--paced``
+los intentos llegan lo más rápido posible (capacidad); con ``--paced`` se
+reparten a la tasa pedida y se mide la latencia de ``record_attempt``.
+
+Uso
+---
+    PYTHONPATH=. python scripts/benchmark_history_writes.py
+    PYTHONPATH=. python scripts/benchmark_history_writes.py --attempts 10000 --paced --rate 10000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipa_core.history import sqlite as history_sqlite  # noqa: E402
+from ipa_core.history.sqlite import SQLiteHistory, _phoneme_deltas  # noqa: E402
+
+_PHONES = "p b t d k g f s x m n ɲ l ɾ r tʃ ʝ w j a e i o u".split()
+
+
+class _LegacyHistory(SQLiteHistory):
+    """Ruta anterior: cada intento en su propia transacción."""
+
+    async def setup(self) -> None:
+        import aiosqlite
+
+        self._conn = await aiosqlite.connect(self._db_path)
+        mod = history_sqlite
+        for script in (mod._CREATE_ATTEMPTS, mod._CREATE_PHONEME, mod._CREATE_ROADMAP):
+            await self._conn.executescript(script)
+        await self._conn.commit()
+
+    async def record_attempt(self, *, user_id, lang, text, score, per, ops, meta=None) -> str:
+        mod = history_sqlite
+        conn = self._require_conn()
+        attempt_id = f"{user_id}-{time.perf_counter_ns()}"
+        await conn.execute(mod._INSERT_ATTEMPT, (
+            attempt_id, user_id, lang, text, round(score, 2), round(per, 4),
+            json.dumps(ops, ensure_ascii=False), json.dumps(meta or {}, ensure_ascii=False), time.time(),
+        ))
+        for phoneme, (attempts, correct) in _phoneme_deltas(ops).items():
+            await conn.execute(mod._UPSERT_PHONEME, (user_id, lang, phoneme, attempts, correct))
+        await conn.commit()
+        return attempt_id
+
+
+def _attempts(n: int, users: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        ops = []
+        for _ in range(rng.randint(4, 12)):
+            ref = rng.choice(_PHONES)
+            kind = rng.choices(["eq", "sub", "del"], weights=[8, 2, 1])[0]
+            ops.append({"op": kind, "ref": ref, "hyp": ref if kind == "eq" else rng.choice(_PHONES)})
+        out.append({
+            "user_id": f"user{rng.randrange(users)}", "lang": "es", "text": "texto",
+            "score": rng.uniform(40, 100), "per": rng.random() / 2, "ops": ops,
+        })
+    return out
+
+
+async def _run(history: SQLiteHistory, attempts: list[dict], *, paced: bool, rate: float, concurrency: int) -> dict:
+    await history.setup()
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    interval = 60.0 / rate
+
+    async def _one(i: int, attempt: dict) -> None:
+        if paced:
+            await asyncio.sleep(i * interval)
+        async with semaphore:
+            started = time.perf_counter()
+            await history.record_attempt(**attempt)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    cpu = time.process_time()
+    await asyncio.gather(*(_one(i, a) for i, a in enumerate(attempts)))
+    await history.teardown()
+    wall = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "wall_s": round(wall, 3),
+        "cpu_s": round(time.process_time() - cpu, 3),
+        "attempts_per_min": round(len(attempts) / wall * 60),
+        "p50_ms": round(statistics.median(latencies), 3),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1], 3),
+    }
+
+
+async def _main(args: argparse.Namespace) -> dict:
+    attempts = _attempts(args.attempts, args.users, args.seed)
+    rows = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, history in (
+            ("legacy", _LegacyHistory(Path(tmp) / "legacy.db")),
+            ("write_behind", SQLiteHistory(Path(tmp) / "batched.db", batch_size=args.batch_size)),
+        ):
+            rows[name] = await _run(
+                history, attempts, paced=args.paced, rate=args.rate, concurrency=args.concurrency,
+            )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--attempts", type=int, default=10000)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=64, help="Peticiones simultáneas")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--paced", action="store_true", help="Repartir los intentos a --rate por minuto")
+    parser.add_argument("--rate", type=float, default=10000, help="Intentos por minuto con --paced")
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Salida JSON")
+    args = parser.parse_args()
+
+    rows = asyncio.run(_main(args))
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'ruta':>13} {'wall s':>8} {'cpu s':>7} {'intentos/min':>13} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, r in rows.items():
+        print(
+            f"{name:>13} {r['wall_s']:>8.3f} {r['cpu_s']:>7.3f} {r['attempts_per_min']:>13} "
+            f"{r['p50_ms']:>8.3f} {r['p99_ms']:>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Benchmark del comparador Levenshtein: motor Python vs vectorizado.
+
+Genera pares (referencia, hipótesis) sintéticos de 50–500 tokens IPA con
+~15 % de errores y mide la latencia media de ``compare()`` con:
+
+- ``LevenshteinComparator``            (DP Python de referencia)
+- ``VectorizedLevenshteinComparator``  (anti-diagonales NumPy / bit-paralelo)
+
+Antes de medir verifica que ambos motores producen exactamente las mismas
+``ops``, ``alignment`` y ``per``.
+
+Uso
+---
+    PYTHONPATH=. python scripts/benchmark_levenshtein.py
+    PYTHONPATH=. python scripts/benchmark_levenshtein.py --lengths 50 100 500 --repeat 3
+    PYTHONPATH=. python scripts/benchmark_levenshtein.py --no-articulatory   # ruta bit-paralela
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipa_core.compare.levenshtein import LevenshteinComparator  # noqa: E402
+from ipa_core.compare.levenshtein_vectorized import VectorizedLevenshteinComparator  # noqa: E402
+
+_PHONES = [
+    "p", "b", "t", "d", "k", "g", "m", "n", "ɲ", "f", "s", "x", "θ",
+    "tʃ", "ʝ", "l", "ʎ", "ɾ", "r", "β", "ð", "ɣ", "a", "e", "i", "o", "u",
+]
+
+
+def _make_pair(length: int, rng: random.Random, error_rate: float = 0.15) -> tuple[list[str], list[str]]:
+    ref = [rng.choice(_PHONES) for _ in range(length)]
+    hyp: list[str] = []
+    for token in ref:
+        roll = rng.random()
+        if roll < error_rate / 3:
+            continue  # deleción
+        if roll < 2 * error_rate / 3:
+            hyp.append(rng.choice(_PHONES))  # sustitución
+        elif roll < error_rate:
+            hyp.extend([token, rng.choice(_PHONES)])  # inserción
+        else:
+            hyp.append(token)
+    return ref, hyp
+
+
+async def _time_compare(comparator, ref: list[str], hyp: list[str], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await comparator.compare(ref, hyp)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def run_benchmark(lengths: list[int], repeat: int, use_articulatory: bool, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    reference = LevenshteinComparator(use_articulatory=use_articulatory)
+    vectorized = VectorizedLevenshteinComparator(use_articulatory=use_articulatory)
+
+    rows = []
+    for length in lengths:
+        ref, hyp = _make_pair(length, rng)
+        expected = await reference.compare(ref, hyp)
+        actual = await vectorized.compare(ref, hyp)
+        identical = (
+            expected["ops"] == actual["ops"]
+            and expected["alignment"] == actual["alignment"]
+            and expected["per"] == actual["per"]
+        )
+        python_ms = await _time_compare(reference, ref, hyp, repeat)
+        vector_ms = await _time_compare(vectorized, ref, hyp, repeat)
+        rows.append({
+            "tokens": length,
+            "engine": actual["meta"]["engine"],
+            "python_ms": round(python_ms, 3),
+            "vectorized_ms": round(vector_ms, 3),
+            "speedup": round(python_ms / vector_ms, 1) if vector_ms else None,
+            "identical": identical,
+        })
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark Levenshtein Python vs vectorizado",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--lengths", type=int, nargs="+", default=[50, 100, 200, 500])
+    parser.add_argument("--repeat", type=int, default=5, help="Repeticiones por tamaño (mediana)")
+    parser.add_argument("--no-articulatory", action="store_true", help="Costos unitarios (ruta bit-paralela)")
+    parser.add_argument("--seed", type=int, default=13)
+    parser.add_argument("--json", action="store_true", help="Salida JSON")
+    args = parser.parse_args()
+
+    rows = asyncio.run(run_benchmark(args.lengths, args.repeat, not args.no_articulatory, args.seed))
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    print(f"{'tokens':>7} {'engine':>12} {'python ms':>10} {'vector ms':>10} {'speedup':>8} {'identical':>9}")
+    for row in rows:
+        print(
+            f"{row['tokens']:>7} {row['engine']:>12} {row['python_ms']:>10.2f} "
+            f"{row['vectorized_ms']:>10.2f} {row['speedup']:>7}x {str(row['identical']):>9}"
+        )
+    if not all(row["identical"] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Benchmark de descubrimiento de pares mínimos.
+
+Compara la búsqueda anterior (todas las parejas de palabras con
+``_check_minimal_pair``, O(n²)) con el índice de comodines de
+``ipa_core.packs.minimal_pairs`` sobre léxicos sintéticos, y mide también
+guardar/cargar el índice persistido.
+
+Uso
+---
+    PYTHONPATH=. python scripts/benchmark_minimal_pairs.py
+    PYTHONPATH=. python scripts/benchmark_minimal_pairs.py --words 1000 10000 100000 --brute-max 5000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipa_core.packs.minimal_pairs import MinimalPairIndex, _check_minimal_pair  # noqa: E402
+
+_PHONES = "p b t d k g f s x m n ɲ l ɾ r tʃ ʝ w j a e i o u".split()
+
+
+def _lexicon(n: int, seed: int) -> dict[str, list[str]]:
+    rng = random.Random(seed)
+    lexicon: dict[str, list[str]] = {}
+    while len(lexicon) < n:
+        length = rng.randint(3, 8)
+        lexicon[f"w{len(lexicon)}"] = [rng.choice(_PHONES) for _ in range(length)]
+    return lexicon
+
+
+def _brute(lexicon: dict[str, list[str]]) -> int:
+    words = list(lexicon.items())
+    count = 0
+    for i, (w1, t1) in enumerate(words):
+        for w2, t2 in words[i + 1:]:
+            if _check_minimal_pair(w1, t1, w2, t2) is not None:
+                count += 1
+    return count
+
+
+def _row(n: int, brute_max: int, seed: int) -> dict:
+    lexicon = _lexicon(n, seed)
+    row: dict = {"words": n}
+    started = time.perf_counter()
+    index = MinimalPairIndex.build(lexicon)
+    pairs = index.all_pairs()
+    row["index_s"] = round(time.perf_counter() - started, 3)
+    row["pairs"] = len(pairs)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "index.json.gz"
+        index.save(path)
+        started = time.perf_counter()
+        MinimalPairIndex.load(path)
+        row["load_s"] = round(time.perf_counter() - started, 3)
+        row["index_kb"] = round(path.stat().st_size / 1024, 1)
+    if n <= brute_max:
+        started = time.perf_counter()
+        assert _brute(lexicon) == len(pairs)
+        row["brute_s"] = round(time.perf_counter() - started, 3)
+    return row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--words", type=int, nargs="+", default=[1000, 3000, 100000])
+    parser.add_argument("--brute-max", type=int, default=3000, help="Tamaño máximo para la búsqueda O(n²)")
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--json", action="store_true", help="Salida JSON")
+    args = parser.parse_args()
+
+    rows = [_row(n, args.brute_max, args.seed) for n in args.words]
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'palabras':>9} {'pares':>8} {'O(n²) s':>9} {'índice s':>9} {'carga s':>8} {'KB':>8}")
+    for r in rows:
+        brute = f"{r['brute_s']:.3f}" if "brute_s" in r else "-"
+        print(
+            f"{r['words']:>9} {r['pairs']:>8} {brute:>9} {r['index_s']:>9.3f} "
+            f"{r['load_s']:>8.3f} {r['index_kb']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
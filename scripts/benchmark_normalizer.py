@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark de la normalización de tokens IPA.
+
+Compara el camino anterior de ``BasicPreprocessor.normalize_tokens`` (un
+``IPANormalizer`` nuevo por llamada, con sus reglas alofónicas) con el
+``CompiledNormalizer`` que el preprocesador reutiliza entre llamadas,
+sobre secuencias típicas de un enunciado (~40 tokens). Verifica que las
+salidas sean idénticas.
+
+Uso
+---
+    PYTHONPATH=. python scripts/benchmark_normalizer.py
+    PYTHONPATH=. python scripts/benchmark_normalizer.py --pack en-us --calls 20000 --tokens 40
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipa_core.normalization.inventory import Inventory  # noqa: E402
+from ipa_core.normalization.normalizer import IPANormalizer  # noqa: E402
+from ipa_core.preprocessor_basic import BasicPreprocessor  # noqa: E402
+
+_PACKS = Path(__file__).resolve().parents[1] / "plugins" / "language_packs"
+
+
+async def _legacy(tokens, inventory, rules) -> tuple[list[str], list[str]]:
+    normalizer = IPANormalizer(inventory=inventory, collapse_oov=False)
+    if rules:
+        normalizer.load_allophone_rules(rules)
+    raw = [unicodedata.normalize("NFC", str(t).strip().lower()) for t in tokens if str(t).strip()]
+    out = await normalizer.normalize(raw)
+    oov = [t for t in inventory.get_oov_phones(out) if not inventory.is_valid_symbol(t)]
+    return out, oov
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    inventory = Inventory.from_yaml(_PACKS / args.pack / "inventory.yaml")
+    rules = inventory.allophone_collapse
+    rng = random.Random(args.seed)
+    symbols = sorted(inventory.all_phones | set(rules)) + ["A", " ɾ ", "ɡ", "ʧ"]
+    sequences = [[rng.choice(symbols) for _ in range(args.tokens)] for _ in range(args.calls)]
+
+    started = time.perf_counter()
+    expected = [await _legacy(seq, inventory, rules) for seq in sequences]
+    legacy_s = time.perf_counter() - started
+
+    pre = BasicPreprocessor()
+    started = time.perf_counter()
+    got = []
+    for seq in sequences:
+        result = await pre.normalize_tokens(seq, inventory=inventory, allophone_rules=rules)
+        got.append((result["tokens"], result["meta"]["oov_tokens"]))
+    compiled_s = time.perf_counter() - started
+    assert got == expected
+
+    return {
+        "pack": args.pack,
+        "calls": args.calls,
+        "tokens_per_call": args.tokens,
+        "legacy_s": round(legacy_s, 3),
+        "compiled_s": round(compiled_s, 3),
+        "legacy_us_per_call": round(legacy_s / args.calls * 1e6, 1),
+        "compiled_us_per_call": round(compiled_s / args.calls * 1e6, 1),
+        "speedup": round(legacy_s / compiled_s, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--pack", default="es-mx")
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--tokens", type=int, default=40, help="Tokens por secuencia")
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Salida JSON")
+    args = parser.parse_args()
+
+    row = asyncio.run(_run(args))
+    if args.json:
+        print(json.dumps(row, indent=2))
+        return
+    print(f"{row['calls']} llamadas x {row['tokens_per_call']} tokens ({row['pack']}); salidas idénticas")
+    print(f"  IPANormalizer por llamada : {row['legacy_us_per_call']:.1f} µs/llamada")
+    print(f"  CompiledNormalizer        : {row['compiled_us_per_call']:.1f} µs/llamada  (x{row['speedup']})")
+
+
+if __name__ == "__main__":
+    main()
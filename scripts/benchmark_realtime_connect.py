@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Benchmark de latencia de conexión de ``/ws/practice``.
+
+Abre ``--connections`` WebSockets seguidos contra la app FastAPI (en
+proceso, vía ``TestClient``) y mide el tiempo desde ``connect`` hasta el
+mensaje ``ready``.  Con ``--cold`` se libera el pool de kernels después de
+cada conexión, lo que reproduce el comportamiento anterior (cada sesión
+pagaba ``create_kernel`` + ``setup()`` en el handshake).
+
+Uso
+---
+    PYTHONPATH=. python scripts/benchmark_realtime_connect.py
+    PYTHONPATH=. python scripts/benchmark_realtime_connect.py --connections 20 --cold
+    PRONUNCIAPA_ASR=stub PYTHONPATH=. python scripts/benchmark_realtime_connect.py --json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from ipa_server.kernel_provider import kernel_pool_stats, teardown_kernel_singleton  # noqa: E402
+from ipa_server.main import get_app  # noqa: E402
+
+
+def run(connections: int, cold: bool) -> dict:
+    latencies: list[float] = []
+    with TestClient(get_app()) as client:
+        for _ in range(connections):
+            started = time.perf_counter()
+            with client.websocket_connect("/ws/practice") as ws:
+                message = ws.receive_json()
+                latencies.append((time.perf_counter() - started) * 1000)
+                if message.get("type") != "ready":
+                    raise RuntimeError(f"Respuesta inesperada: {message}")
+            if cold:
+                client.portal.call(teardown_kernel_singleton)
+        stats = kernel_pool_stats()
+    return {
+        "mode": "cold" if cold else "pooled",
+        "connections": connections,
+        "first_ms": round(latencies[0], 2),
+        "median_ms": round(statistics.median(latencies), 2),
+        "p95_ms": round(sorted(latencies)[int(0.95 * (len(latencies) - 1))], 2),
+        "warmups": stats["warmups"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--connections", type=int, default=10)
+    parser.add_argument("--cold", action="store_true", help="Liberar el kernel tras cada conexión")
+    parser.add_argument("--json", action="store_true", help="Salida JSON")
+    args = parser.parse_args()
+
+    row = run(max(1, args.connections), args.cold)
+    if args.json:
+        print(json.dumps(row, indent=2))
+        return
+    print(f"{'modo':<8} {'conex.':>6} {'primera':>10} {'mediana':>10} {'p95':>10} {'warmups':>8}")
+    print(
+        f"{row['mode']:<8} {row['connections']:>6} {row['first_ms']:>8.1f}ms "
+        f"{row['median_ms']:>8.1f}ms {row['p95_ms']:>8.1f}ms {row['warmups']:>8}"
+    )
+
+
+if __name__ == "__main__":
+    main()